@@ -0,0 +1,25 @@
+"""Record the number of indexed vector chunks on each document."""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000003"
+down_revision = "20260413_000002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the nullable chunk_count column to the documents table.
+
+    Existing rows stay NULL because their chunk totals are only known to
+    Chroma; retrieval falls back to counting them there until re-ingested.
+    """
+    op.add_column("documents", sa.Column("chunk_count", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove the chunk_count column from the documents table."""
+    op.drop_column("documents", "chunk_count")
@@ -0,0 +1,52 @@
+"""Add the durable ingestion_jobs queue table."""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000004"
+down_revision = "20261018_000003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the ingestion_jobs table backing background document ingestion."""
+    op.create_table(
+        "ingestion_jobs",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            nullable=False,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("document_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("pdf_bytes", sa.LargeBinary(), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default=sa.text("'queued'")),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.ForeignKeyConstraint(["document_id"], ["documents.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("document_id"),
+    )
+    op.create_index("idx_ingestion_jobs_status", "ingestion_jobs", ["status"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the ingestion_jobs table."""
+    op.drop_index("idx_ingestion_jobs_status", table_name="ingestion_jobs")
+    op.drop_table("ingestion_jobs")
@@ -0,0 +1,80 @@
+"""Store moderation keywords in Postgres with a change version counter."""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000005"
+down_revision = "20261018_000004"
+branch_labels = None
+depends_on = None
+
+# Frozen copy of src.moderation.keywords at the time of this revision, so the
+# seeded rows do not change when the built-in list is edited later.
+_SEED_KEYWORDS = [
+    # Violence
+    "kill", "murder", "assassinate", "stab", "shoot", "bomb", "explode",
+    "massacre", "slaughter", "torture", "behead", "strangle", "suffocate",
+    "execute", "genocide", "terrorism", "terrorist", "attack plan",
+    # Weapons
+    "how to make a bomb", "build a weapon", "make a gun", "illegal weapon",
+    "silencer", "pipe bomb", "molotov", "landmine", "nerve agent", "sarin",
+    # Self-harm
+    "how to kill myself", "how to commit suicide", "suicide method",
+    "self harm", "cut myself", "end my life", "overdose on",
+    # Exploitation
+    "child pornography", "child porn", "csam", "lolita", "underage sex",
+    "minor sex", "exploit children",
+    # Illegal activities
+    "how to hack", "ddos attack", "ransomware", "steal credit card",
+    "make meth", "make heroin", "synthesize drugs", "drug synthesis",
+    "launder money", "money laundering", "human trafficking",
+    # Hate
+    "ethnic cleansing", "white supremacy", "nazi", "jihad", "infidel kill",
+]
+
+
+def upgrade() -> None:
+    """Create the keyword tables and seed them with the built-in list."""
+    keywords_table = op.create_table(
+        "moderation_keywords",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            nullable=False,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("keyword", sa.String(length=255), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("keyword"),
+    )
+    version_table = op.create_table(
+        "moderation_keyword_version",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    keywords = list(dict.fromkeys(keyword.strip().lower() for keyword in _SEED_KEYWORDS))
+    op.bulk_insert(keywords_table, [{"keyword": keyword} for keyword in keywords])
+    op.bulk_insert(version_table, [{"id": 1, "version": 1}])
+
+
+def downgrade() -> None:
+    """Drop the keyword tables."""
+    op.drop_table("moderation_keyword_version")
+    op.drop_table("moderation_keywords")
@@ -0,0 +1,61 @@
+"""Maintain last activity and message counts on conversations."""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000006"
+down_revision = "20261018_000005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add activity columns, backfill them from messages, and index them.
+
+    The composite index matches the dashboard's keyset ordering so a page is
+    read straight off the index instead of aggregating every message.
+    """
+    op.add_column(
+        "conversations",
+        sa.Column(
+            "last_activity_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+    )
+    op.add_column(
+        "conversations",
+        sa.Column("message_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute("UPDATE conversations SET last_activity_at = created_at")
+    op.execute(
+        """
+        UPDATE conversations AS c
+        SET last_activity_at = s.last_activity_at,
+            message_count = s.message_count
+        FROM (
+            SELECT conversation_id,
+                   max(created_at) AS last_activity_at,
+                   count(*) AS message_count
+            FROM messages
+            GROUP BY conversation_id
+        ) AS s
+        WHERE s.conversation_id = c.id
+        """
+    )
+    op.create_index(
+        "idx_conversations_last_activity",
+        "conversations",
+        [sa.text("last_activity_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the activity index and columns."""
+    op.drop_index("idx_conversations_last_activity", table_name="conversations")
+    op.drop_column("conversations", "message_count")
+    op.drop_column("conversations", "last_activity_at")
@@ -0,0 +1,50 @@
+"""Denormalize the last message preview for the conversation sidebar."""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000007"
+down_revision = "20261018_000006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add and backfill last_message_preview and index sidebar ordering.
+
+    The composite ``(user_id, last_activity_at DESC, id DESC)`` index serves
+    both the ordered sidebar listing and plain ``user_id`` lookups, so it
+    replaces ``idx_conversations_user_id``.
+    """
+    op.add_column(
+        "conversations",
+        sa.Column("last_message_preview", sa.String(length=255), nullable=True),
+    )
+    op.execute(
+        """
+        UPDATE conversations AS c
+        SET last_message_preview = left(latest.content, 255)
+        FROM (
+            SELECT DISTINCT ON (conversation_id) conversation_id, content
+            FROM messages
+            ORDER BY conversation_id, created_at DESC, display_id DESC
+        ) AS latest
+        WHERE latest.conversation_id = c.id
+        """
+    )
+    op.create_index(
+        "idx_conversations_user_activity",
+        "conversations",
+        ["user_id", sa.text("last_activity_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+    op.drop_index("idx_conversations_user_id", table_name="conversations")
+
+
+def downgrade() -> None:
+    """Restore the plain user_id index and drop the preview column."""
+    op.create_index("idx_conversations_user_id", "conversations", ["user_id"], unique=False)
+    op.drop_index("idx_conversations_user_activity", table_name="conversations")
+    op.drop_column("conversations", "last_message_preview")
@@ -0,0 +1,35 @@
+"""Index moderation alarms for the paginated security alarm feed."""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000008"
+down_revision = "20261018_000007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create keyset indexes for the unfiltered and filtered alarm feeds.
+
+    Every index ends in ``(created_at DESC, id DESC)`` so a filtered page is
+    read in feed order straight off the index. The per-user index also
+    serves plain ``user_id`` lookups, so it replaces ``idx_alarm_user_id``.
+    """
+    feed_order = [sa.text("created_at DESC"), sa.text("id DESC")]
+    op.create_index("idx_alarm_created_at", "alarm", feed_order, unique=False)
+    op.create_index("idx_alarm_filter_type_created_at", "alarm", ["filter_type", *feed_order], unique=False)
+    op.create_index("idx_alarm_provider_created_at", "alarm", ["provider", *feed_order], unique=False)
+    op.create_index("idx_alarm_user_created_at", "alarm", ["user_id", *feed_order], unique=False)
+    op.drop_index("idx_alarm_user_id", table_name="alarm")
+
+
+def downgrade() -> None:
+    """Restore the plain user_id index and drop the feed indexes."""
+    op.create_index("idx_alarm_user_id", "alarm", ["user_id"], unique=False)
+    op.drop_index("idx_alarm_user_created_at", table_name="alarm")
+    op.drop_index("idx_alarm_provider_created_at", table_name="alarm")
+    op.drop_index("idx_alarm_filter_type_created_at", table_name="alarm")
+    op.drop_index("idx_alarm_created_at", table_name="alarm")
@@ -0,0 +1,58 @@
+"""Add the export_jobs table for background audit exports."""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000009"
+down_revision = "20261018_000008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the export_jobs table tracking audit export progress and output."""
+    op.create_table(
+        "export_jobs",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            nullable=False,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column("requested_by", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default=sa.text("'queued'")),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("created_from", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_to", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("conversations_exported", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("messages_exported", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("alarms_exported", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("file_path", sa.Text(), nullable=True),
+        sa.Column("file_size", sa.BigInteger(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["requested_by"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("idx_export_jobs_status", "export_jobs", ["status"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the export_jobs table."""
+    op.drop_index("idx_export_jobs_status", table_name="export_jobs")
+    op.drop_table("export_jobs")
@@ -0,0 +1,24 @@
+"""Index messages by creation time for the dashboard activity counter."""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000010"
+down_revision = "20261018_000009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the index behind the last-24-hours message count.
+
+    Without it the security summary's ``recent_activity`` counter scans the
+    whole ``messages`` table on every refresh.
+    """
+    op.create_index("idx_messages_created_at", "messages", ["created_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the message creation-time index."""
+    op.drop_index("idx_messages_created_at", table_name="messages")
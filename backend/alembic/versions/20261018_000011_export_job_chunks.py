@@ -0,0 +1,36 @@
+"""Store finished audit export files in Postgres instead of local disk."""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000011"
+down_revision = "20261018_000010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create export_job_chunks and drop the local file path.
+
+    Files written to one replica's disk could not be downloaded through
+    any other replica. Exports that completed before this revision keep
+    their row but have no stored file.
+    """
+    op.create_table(
+        "export_job_chunks",
+        sa.Column("job_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(["job_id"], ["export_jobs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("job_id", "seq"),
+    )
+    op.drop_column("export_jobs", "file_path")
+
+
+def downgrade() -> None:
+    """Restore the file path column and drop stored export files."""
+    op.add_column("export_jobs", sa.Column("file_path", sa.Text(), nullable=True))
+    op.drop_table("export_job_chunks")
@@ -1,4 +1,4 @@
-"""HTTP router for admin-only user management."""
+"""HTTP router for admin-only user and moderation keyword management."""
 from __future__ import annotations
 
 from uuid import UUID
@@ -7,10 +7,17 @@ from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_db
+from src.repo.moderation_keyword_repo import ModerationKeywordRepository
 from src.repo.user_repo import UserRepository
-from src.schemas.admin_schema import AdminUserOut, AdminUserRoleUpdateRequest
+from src.schemas.admin_schema import (
+    AdminUserOut,
+    AdminUserRoleUpdateRequest,
+    ModerationKeywordListOut,
+    ModerationKeywordsRequest,
+)
 from src.security.jwt import AuthenticatedUser, get_current_user_with_role
 from src.service.admin_service import AdminService
+from src.service.moderation_service import ModerationService
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -20,6 +27,11 @@ def get_admin_service(session: AsyncSession = Depends(get_db)) -> AdminService:
     return AdminService(UserRepository(session))
 
 
+def get_moderation_service(session: AsyncSession = Depends(get_db)) -> ModerationService:
+    """Dependency factory for moderation keyword management wiring."""
+    return ModerationService(ModerationKeywordRepository(session))
+
+
 @router.get("/users", response_model=list[AdminUserOut])
 async def list_admin_users(
     auth: AuthenticatedUser = Depends(get_current_user_with_role),
@@ -49,3 +61,43 @@ async def update_admin_user_role(
 ) -> AdminUserOut:
     """Persist an inline admin-table role change."""
     return await service.update_user_role(auth, user_id, body.role)
+
+
+@router.get("/moderation/keywords", response_model=ModerationKeywordListOut)
+async def list_moderation_keywords(
+    auth: AuthenticatedUser = Depends(get_current_user_with_role),
+    service: ModerationService = Depends(get_moderation_service),
+) -> ModerationKeywordListOut:
+    """Return the database-managed moderation keyword list."""
+    return await service.list_keywords(auth)
+
+
+@router.post("/moderation/keywords", response_model=ModerationKeywordListOut)
+async def add_moderation_keywords(
+    body: ModerationKeywordsRequest,
+    auth: AuthenticatedUser = Depends(get_current_user_with_role),
+    service: ModerationService = Depends(get_moderation_service),
+) -> ModerationKeywordListOut:
+    """Add keywords; every backend process picks them up without a restart."""
+    return await service.add_keywords(auth, body.keywords)
+
+
+@router.put("/moderation/keywords", response_model=ModerationKeywordListOut)
+async def replace_moderation_keywords(
+    body: ModerationKeywordsRequest,
+    auth: AuthenticatedUser = Depends(get_current_user_with_role),
+    service: ModerationService = Depends(get_moderation_service),
+) -> ModerationKeywordListOut:
+    """Replace the whole keyword list in one atomic update."""
+    return await service.replace_keywords(auth, body.keywords)
+
+
+@router.delete("/moderation/keywords/{keyword}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_moderation_keyword(
+    keyword: str,
+    auth: AuthenticatedUser = Depends(get_current_user_with_role),
+    service: ModerationService = Depends(get_moderation_service),
+) -> Response:
+    """Remove a single keyword from the list."""
+    await service.remove_keyword(auth, keyword)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -15,17 +15,25 @@ from src.core.database import get_db
 from src.schemas.chat_schema import (
     CreateConversationRequest,
     ConversationListItemResponse,
+    ConversationListQuery,
     ConversationResponse,
     HistoricChatDashboardQuery,
     HistoricChatDashboardResponse,
+    HistoricChatExportQuery,
     SecurityAlarmEventResponse,
+    SecurityAlarmQuery,
+    SecurityExportJobResponse,
+    SecurityExportRequest,
     SendMessageRequest,
     MessageResponse,
 )
 from src.repo.conversation_repo import ConversationRepository
 from src.repo.document_repo import DocumentRepository
+from src.repo.export_job_repo import ExportJobRepository
 from src.repo.flagged_event_repo import FlaggedEventRepository
+from src.service.alarm_stream_service import live_alarm_stream
 from src.service.chat_service import ChatService
+from src.service.export_service import ExportService
 from src.service.rag_service import RAGService
 from src.security.jwt import get_current_security_user, get_current_user_with_role, AuthenticatedUser
 from src.core.logger import get_logger
@@ -56,6 +64,18 @@ def get_chat_service(
     )
 
 
+def get_export_service(session: AsyncSession = Depends(get_db)) -> ExportService:
+    """Dependency injection factory for the ExportService layer.
+
+    Args:
+        session (AsyncSession): The injected database session dependency.
+
+    Returns:
+        ExportService: An initialized instance of the ExportService.
+    """
+    return ExportService(ExportJobRepository(session))
+
+
 @router.post("/conversations", response_model=ConversationResponse, status_code=status.HTTP_201_CREATED)
 async def create_conversation(
     request: CreateConversationRequest,
@@ -83,12 +103,31 @@ async def create_conversation(
 
 @router.get("/conversations", response_model=list[ConversationListItemResponse])
 async def list_conversations(
+    response: Response,
+    query: ConversationListQuery = Depends(),
     service: ChatService = Depends(get_chat_service),
     auth: AuthenticatedUser = Depends(get_current_user_with_role),
 ):
-    """Return the authenticated user's conversation sidebar summaries."""
+    """Return the authenticated user's conversation sidebar summaries.
+
+    The body stays a plain list. When ``limit`` is given and more
+    conversations remain, the cursor for the next page is returned in the
+    ``X-Next-Cursor`` response header.
+
+    Args:
+        response (Response): Outgoing response used to set the cursor header.
+        query (ConversationListQuery): Optional page size and cursor.
+        service (ChatService): Injected chat service.
+        auth (AuthenticatedUser): Authenticated user context.
+
+    Returns:
+        list[ConversationListItemResponse]: Conversation summaries.
+    """
     logger.info(f"Received list conversations request from user {auth.user_id}")
-    return await service.list_conversations(auth.user_id)
+    items, next_cursor = await service.list_conversations(auth.user_id, query)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return items
 
 
 @router.post(
@@ -202,18 +241,225 @@ async def get_security_historic_chat_dashboard(
         recent activity first, plus dashboard summary metrics.
     """
     logger.info(
-        "Received security historic chat dashboard request limit=%s offset=%s",
+        "Received security historic chat dashboard request limit=%s offset=%s cursor=%s",
         query.limit,
         query.offset,
+        query.cursor,
     )
     return await service.get_security_chat_histories(query)
 
 
+@router.get(
+    "/security/histories/export",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": (
+                "Newline-delimited JSON. Each conversation is a `type: conversation` record followed by its "
+                "`type: message` records; the final `type: end` record carries `next_cursor`."
+            ),
+            "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+        },
+    },
+)
+async def export_security_historic_chats(
+    query: HistoricChatExportQuery = Depends(),
+    service: ChatService = Depends(get_chat_service),
+    _: str = Depends(get_current_security_user),
+):
+    """Stream historic chat transcripts for a security review as NDJSON.
+
+    Args:
+        query (HistoricChatExportQuery): Selection and truncation controls.
+        service (ChatService): Injected chat service.
+        _ (str): Authenticated security user identifier.
+
+    Returns:
+        StreamingResponse: NDJSON transcript records.
+    """
+    logger.info(
+        "Received security historic chat export request limit=%s cursor=%s max_messages=%s max_chars=%s",
+        query.limit,
+        query.cursor,
+        query.max_messages_per_conversation,
+        query.max_message_chars,
+    )
+    records = await service.export_security_chat_histories(query)
+    return StreamingResponse(records, media_type="application/x-ndjson")
+
+
+@router.get(
+    "/security/alarms/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": (
+                "Server-Sent Events stream of new alarms. Each event has `event: alarm`, an `id` usable as "
+                "`since` on `/security/alarms`, and a `data` line holding one alarm object."
+            ),
+            "content": {"text/event-stream": {"schema": {"type": "string"}}},
+        },
+    },
+)
+async def stream_security_alarms(
+    _: str = Depends(get_current_security_user),
+):
+    """Push moderation alarms to the security dashboard as they are recorded.
+
+    Only alarms committed after the stream opens are sent. Clients fetch
+    the current page from ``/security/alarms`` first, and after a reconnect
+    catch up by passing the last received event id as ``since``.
+
+    Args:
+        _ (str): Authenticated security user identifier.
+
+    Returns:
+        StreamingResponse: Server-sent event stream of alarm events.
+    """
+    logger.info("Received security alarm stream request")
+    return StreamingResponse(
+        live_alarm_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/security/alarms", response_model=list[SecurityAlarmEventResponse])
 async def get_security_alarm_dashboard(
+    response: Response,
+    query: SecurityAlarmQuery = Depends(),
     service: ChatService = Depends(get_chat_service),
     _: str = Depends(get_current_security_user),
 ):
-    """Return persisted moderation alarm rows for the security flagging dashboard."""
-    logger.info("Received security alarm dashboard request")
-    return await service.get_security_alarm_events()
+    """Return a page of moderation alarms for the security flagging dashboard.
+
+    The body is a list of alarms, newest first. ``X-Next-Cursor`` is set
+    when older alarms remain, and ``X-Latest-Cursor`` is the value to send
+    as ``since`` on the next poll so only new alarms are fetched. Such a
+    poll may repeat alarms from the last few seconds; dedupe them by id.
+
+    Args:
+        response (Response): Outgoing response used to set cursor headers.
+        query (SecurityAlarmQuery): Pagination and filter controls.
+        service (ChatService): Injected chat service.
+        _ (str): Authenticated security user identifier.
+
+    Returns:
+        list[SecurityAlarmEventResponse]: The alarm page.
+    """
+    logger.info(
+        "Received security alarm dashboard request limit=%s cursor=%s since=%s",
+        query.limit,
+        query.cursor,
+        query.since,
+    )
+    items, next_cursor, latest_cursor = await service.get_security_alarm_events(query)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    if latest_cursor is not None:
+        response.headers["X-Latest-Cursor"] = latest_cursor
+    return items
+
+
+@router.post(
+    "/security/exports",
+    response_model=SecurityExportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def request_security_export(
+    body: SecurityExportRequest,
+    service: ExportService = Depends(get_export_service),
+    security_user_id: str = Depends(get_current_security_user),
+):
+    """Queue a compressed audit export of conversations, messages and alarms.
+
+    The export runs in the background; poll ``/security/exports/{id}`` for
+    progress and download the file once its status is ``completed``.
+
+    Args:
+        body (SecurityExportRequest): User and time range filters.
+        service (ExportService): Injected export service.
+        security_user_id (str): Authenticated security user identifier.
+
+    Returns:
+        SecurityExportJobResponse: The queued export.
+    """
+    logger.info(
+        "Received security export request user_id=%s created_from=%s created_to=%s",
+        body.user_id,
+        body.created_from,
+        body.created_to,
+    )
+    return await service.request_export(security_user_id, body)
+
+
+@router.get("/security/exports", response_model=list[SecurityExportJobResponse])
+async def list_security_exports(
+    service: ExportService = Depends(get_export_service),
+    _: str = Depends(get_current_security_user),
+):
+    """Return the most recently requested audit exports, newest first.
+
+    Args:
+        service (ExportService): Injected export service.
+        _ (str): Authenticated security user identifier.
+
+    Returns:
+        list[SecurityExportJobResponse]: Recent exports with their progress.
+    """
+    return await service.list_exports()
+
+
+@router.get("/security/exports/{export_id}", response_model=SecurityExportJobResponse)
+async def get_security_export(
+    export_id: str,
+    service: ExportService = Depends(get_export_service),
+    _: str = Depends(get_current_security_user),
+):
+    """Return the status and progress of one audit export.
+
+    Args:
+        export_id (str): UUID of the export.
+        service (ExportService): Injected export service.
+        _ (str): Authenticated security user identifier.
+
+    Returns:
+        SecurityExportJobResponse: The export's current state.
+    """
+    return await service.get_export(export_id)
+
+
+@router.get(
+    "/security/exports/{export_id}/download",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": (
+                "Gzip-compressed JSON Lines. Each line is a `conversation`, `message` or `alarm` record "
+                "identified by its `type` field."
+            ),
+            "content": {"application/gzip": {"schema": {"type": "string", "format": "binary"}}},
+        },
+    },
+)
+async def download_security_export(
+    export_id: str,
+    service: ExportService = Depends(get_export_service),
+    _: str = Depends(get_current_security_user),
+):
+    """Download the file of a completed audit export.
+
+    Args:
+        export_id (str): UUID of the export.
+        service (ExportService): Injected export service.
+        _ (str): Authenticated security user identifier.
+
+    Returns:
+        StreamingResponse: The ``.jsonl.gz`` export file.
+    """
+    chunks = await service.stream_export_file(export_id)
+    return StreamingResponse(
+        chunks,
+        media_type="application/gzip",
+        headers={"Content-Disposition": f'attachment; filename="aegis-export-{export_id}.jsonl.gz"'},
+    )
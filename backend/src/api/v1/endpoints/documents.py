@@ -9,9 +9,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.core.database import get_db
 from src.core.logger import get_logger
 from src.repo.document_repo import DocumentRepository
-from src.schemas.document_schema import DocumentOut, DocumentUpdateRequest
+from src.repo.ingestion_job_repo import IngestionJobRepository
+from src.schemas.document_schema import DocumentOut, DocumentUpdateRequest, IngestionStatusOut
 from src.security.jwt import get_current_user_with_role, AuthenticatedUser
-from src.service.document_service import DocumentService
+from src.service.document_service import DocumentService, get_ingestion_queue
 from src.service.rag_service import RAGService
 from src.api.dependencies.rag import get_rag_service
 
@@ -35,7 +36,7 @@ def _require_role(auth: AuthenticatedUser, allowed: set[str]) -> None:
         )
 
 
-@router.post("", response_model=DocumentOut, status_code=status.HTTP_201_CREATED)
+@router.post("", response_model=DocumentOut, status_code=status.HTTP_202_ACCEPTED)
 async def upload_document(
     file: UploadFile = File(...),
     title: str = Form(default=""),
@@ -47,7 +48,9 @@ async def upload_document(
 ):
     """Upload a PDF and assign which roles may access it.
 
-    Only admin users may upload documents.
+    Only admin users may upload documents. The upload is accepted with the
+    document in ``processing`` status and indexed by a background worker;
+    poll ``GET /documents/{doc_id}/ingestion`` for progress.
 
     - **file**: PDF file (max 20 MB).
     - **title**: Display title for the document.
@@ -58,7 +61,7 @@ async def upload_document(
 
     if not file.filename or not file.filename.lower().endswith(".pdf"):
         raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
             detail="Only PDF files are supported.",
         )
 
@@ -73,7 +76,7 @@ async def upload_document(
     invalid_roles = sorted(set(roles) - _DOCUMENT_ROLES)
     if invalid_roles:
         raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
             detail=(
                 "Invalid allowed_roles value(s): "
                 f"{', '.join(invalid_roles)}. Valid roles are: {', '.join(sorted(_DOCUMENT_ROLES))}."
@@ -83,20 +86,15 @@ async def upload_document(
 
     logger.info(f"Admin {auth.user_id} uploading '{file.filename}' roles={roles}")
 
-    svc = DocumentService(DocumentRepository(db), rag)
-    try:
-        doc = await svc.ingest_document(
-            title=doc_title,
-            description=description,
-            filename=file.filename,
-            pdf_bytes=pdf_bytes,
-            uploaded_by=auth.user_id,
-            allowed_roles=roles,
-        )
-    except ValueError as exc:
-        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
-    except RuntimeError as exc:
-        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc))
+    svc = DocumentService(DocumentRepository(db), rag, IngestionJobRepository(db))
+    doc = await svc.enqueue_document(
+        title=doc_title,
+        description=description,
+        filename=file.filename,
+        pdf_bytes=pdf_bytes,
+        uploaded_by=auth.user_id,
+        allowed_roles=roles,
+    )
 
     return _to_out(doc)
 
@@ -119,6 +117,39 @@ async def list_documents(
     return [_to_out(d) for d in docs]
 
 
+@router.get("/{doc_id}/ingestion", response_model=IngestionStatusOut)
+async def get_ingestion_status(
+    doc_id: str,
+    auth: AuthenticatedUser = Depends(get_current_user_with_role),
+    db: AsyncSession = Depends(get_db),
+):
+    """Report background ingestion progress for a document.
+
+    Admins and security officers may poll this after an upload. Live page
+    and chunk counters are included while a worker in this process is
+    indexing the document.
+    """
+    _require_role(auth, _AUDIT_ROLES)
+
+    doc = await DocumentRepository(db).get_by_id(doc_id)
+    if doc is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document not found.")
+
+    job = await IngestionJobRepository(db).get_by_document_id(doc_id)
+    if job is None:
+        return IngestionStatusOut(document_id=doc_id, document_status=doc.status, job_status=None)
+
+    progress = get_ingestion_queue().progress(str(job.id)) or {}
+    return IngestionStatusOut(
+        document_id=doc_id,
+        document_status=doc.status,
+        job_status=job.status,
+        attempts=job.attempts,
+        error=job.error,
+        **progress,
+    )
+
+
 @router.put("/{doc_id}", response_model=DocumentOut)
 async def update_document(
     doc_id: str,
@@ -187,6 +218,7 @@ def _to_out(doc) -> DocumentOut:
         uploaded_by=str(doc.uploaded_by),
         allowed_roles=doc.allowed_roles or [],
         chroma_doc_id=doc.chroma_doc_id,
+        chunk_count=doc.chunk_count,
         created_at=doc.created_at,
         updated_at=doc.updated_at,
     )
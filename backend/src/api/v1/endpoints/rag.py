@@ -6,9 +6,9 @@ generating raw embedding vectors.
 """
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from src.schemas.rag_schema import EmbedRequest, EmbedResponse
+from src.schemas.rag_schema import EmbedRequest, EmbedResponse, EmbeddingCacheStatsResponse
 from src.security.jwt import get_current_user
-from src.service.rag_service import _get_embeddings, _EMBEDDING_MODEL
+from src.service.rag_service import _get_embeddings, _EMBEDDING_MODEL, embedding_cache_stats
 from src.core.logger import get_logger
 
 logger = get_logger("RAG_API")
@@ -24,7 +24,8 @@ async def create_embeddings(
     """Generate embeddings for one or more text inputs.
 
     Accepts a single string or a list of strings and returns the corresponding
-    embedding vectors using the local all-MiniLM-L6-v2 ONNX model.
+    embedding vectors using the local all-MiniLM-L6-v2 ONNX model. Inputs
+    that were embedded before are served from the embedding cache.
 
     Args:
         body (EmbedRequest): Input payload containing one or more texts to
@@ -41,7 +42,7 @@ async def create_embeddings(
     texts = [body.input] if isinstance(body.input, str) else body.input
     if not texts:
         raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
             detail="input must not be empty.",
         )
 
@@ -51,3 +52,11 @@ async def create_embeddings(
         raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
 
     return EmbedResponse(embeddings=vectors, model=_EMBEDDING_MODEL)
+
+
+@router.get("/embeddings/cache", response_model=EmbeddingCacheStatsResponse)
+async def get_embedding_cache_stats(
+    _: str = Depends(get_current_user),
+):
+    """Return embedding cache hit and miss counters for capacity sizing."""
+    return EmbeddingCacheStatsResponse(**embedding_cache_stats())
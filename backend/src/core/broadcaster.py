@@ -0,0 +1,148 @@
+"""In-process fan-out of live events to streaming subscribers.
+
+Each connected stream holds a :class:`Subscription` with its own bounded
+queue. :meth:`Broadcaster.publish` is synchronous and never waits on a
+subscriber: one that falls a full queue behind is closed instead of
+stalling everyone else, and its client reconnects and catches up from the
+paginated endpoint. The same applies to every subscriber when the event
+source itself may have missed events.
+"""
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Generic, TypeVar
+
+from src.core.config import settings
+from src.core.logger import get_logger
+
+logger = get_logger("BROADCASTER")
+
+T = TypeVar("T")
+
+
+class Subscription(Generic[T]):
+    """One subscriber's queue of pending events.
+
+    Attributes:
+        lagged (bool): Whether the subscription was closed because it
+            may have missed events.
+    """
+
+    def __init__(self, max_queue: int) -> None:
+        """Initialize an empty subscription.
+
+        Args:
+            max_queue (int): Maximum events buffered for this subscriber.
+        """
+        # One extra slot so the close marker always fits after an overflow.
+        self._queue: asyncio.Queue[T | None] = asyncio.Queue(max_queue + 1)
+        self._max_queue = max_queue
+        self.lagged = False
+
+    def _offer(self, item: T) -> bool:
+        """Queue an event, closing the subscription if it is full.
+
+        Returns:
+            bool: False if the subscription overflowed and was closed.
+        """
+        if self._queue.qsize() >= self._max_queue:
+            self._close()
+            return False
+        self._queue.put_nowait(item)
+        return True
+
+    def _close(self) -> None:
+        """Drop pending events and wake the reader with the close marker."""
+        self.lagged = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+    async def get(self, timeout: float) -> T | None:
+        """Wait for the next event.
+
+        Args:
+            timeout (float): Seconds to wait before giving up.
+
+        Returns:
+            T | None: The event, or None if the timeout elapsed or the
+            subscription was closed (check :attr:`lagged`).
+        """
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class Broadcaster(Generic[T]):
+    """Deliver each published event to every current subscriber.
+
+    Attributes:
+        max_queue (int): Events buffered per subscriber before it is closed.
+    """
+
+    def __init__(self, max_queue: int) -> None:
+        """Initialize a broadcaster with no subscribers.
+
+        Args:
+            max_queue (int): Events buffered per subscriber.
+        """
+        self.max_queue = max_queue
+        self._subscriptions: set[Subscription[T]] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of currently subscribed streams."""
+        return len(self._subscriptions)
+
+    @contextmanager
+    def subscribe(self) -> Iterator[Subscription[T]]:
+        """Subscribe for the duration of a ``with`` block.
+
+        Yields:
+            Subscription[T]: Queue receiving events published from now on.
+        """
+        subscription: Subscription[T] = Subscription(self.max_queue)
+        self._subscriptions.add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, item: T) -> None:
+        """Deliver an event to every subscriber without waiting.
+
+        Args:
+            item (T): The event.
+        """
+        for subscription in list(self._subscriptions):
+            if not subscription._offer(item):
+                self._subscriptions.discard(subscription)
+                logger.warning("Closed a live stream subscriber that fell too far behind")
+
+    def close_all(self) -> None:
+        """Close every current subscriber so its client reconnects and catches up.
+
+        Used when events may have been lost upstream of the broadcaster.
+        """
+        subscriptions = list(self._subscriptions)
+        self._subscriptions.clear()
+        for subscription in subscriptions:
+            subscription._close()
+        if subscriptions:
+            logger.warning(f"Closed {len(subscriptions)} live stream subscriber(s) after a gap in events")
+
+
+_alarm_broadcaster: Broadcaster | None = None
+
+
+def get_alarm_broadcaster() -> Broadcaster:
+    """Return the shared broadcaster for live moderation alarms.
+
+    Returns:
+        Broadcaster: Process-wide alarm broadcaster.
+    """
+    global _alarm_broadcaster
+    if _alarm_broadcaster is None:
+        _alarm_broadcaster = Broadcaster(settings.ALARM_STREAM_QUEUE_SIZE)
+    return _alarm_broadcaster
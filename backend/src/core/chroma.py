@@ -5,6 +5,9 @@ it owns connection configuration, lazy initialization, and dependency
 access for the shared Chroma collection used by the RAG pipeline.
 """
 import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 import chromadb
 from chromadb.api.async_api import AsyncClientAPI, AsyncCollection
@@ -12,10 +15,64 @@ from chromadb.config import Settings as ChromaSettings
 
 from src.core.config import settings
 from src.core.logger import get_logger
+from src.core.metrics import CHROMA_ERRORS_TOTAL, CHROMA_REQUEST_SECONDS
 
 logger = get_logger("CHROMA_CORE")
 
 
+async def _timed_call(operation: str, call: Callable[[], Awaitable[object]]) -> object:
+    """Await a Chroma call, recording its latency and any failure.
+
+    Args:
+        operation (str): Operation label, e.g. ``query``.
+        call (Callable[[], Awaitable[object]]): Starts the call.
+
+    Returns:
+        object: The call's result.
+    """
+    started_at = time.perf_counter()
+    try:
+        return await call()
+    except Exception:
+        CHROMA_ERRORS_TOTAL.inc(operation=operation)
+        raise
+    finally:
+        CHROMA_REQUEST_SECONDS.observe(time.perf_counter() - started_at, operation=operation)
+
+
+class InstrumentedCollection:
+    """Proxy for an ``AsyncCollection`` that times its remote calls.
+
+    Data operations are recorded in the Chroma latency and error metrics;
+    every other attribute is passed through unchanged.
+    """
+
+    _TIMED_OPERATIONS = frozenset({"add", "count", "delete", "get", "peek", "query", "update", "upsert"})
+
+    def __init__(self, collection: AsyncCollection) -> None:
+        """Wrap a collection handle.
+
+        Args:
+            collection (AsyncCollection): The collection to instrument.
+        """
+        self._collection = collection
+
+    @property
+    def wrapped(self) -> AsyncCollection:
+        """The underlying, uninstrumented collection."""
+        return self._collection
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._collection, name)
+        if name not in self._TIMED_OPERATIONS:
+            return attribute
+
+        async def timed(*args: object, **kwargs: object) -> object:
+            return await _timed_call(name, lambda: attribute(*args, **kwargs))
+
+        return timed
+
+
 class ChromaManager:
     """Manage lazy access to the configured remote Chroma collection.
 
@@ -25,8 +82,8 @@ class ChromaManager:
 
     Attributes:
         _client (AsyncClientAPI | None): Cached remote Chroma HTTP client.
-        _collection (AsyncCollection | None): Cached collection handle created
-            from the configured collection name.
+        _collection (InstrumentedCollection | None): Cached, instrumented
+            collection handle created from the configured collection name.
         _init_lock (asyncio.Lock): Lock preventing concurrent first-time
             initialization from racing during startup traffic.
     """
@@ -34,7 +91,7 @@ class ChromaManager:
     def __init__(self) -> None:
         """Initialize an empty Chroma manager with no active connection."""
         self._client: AsyncClientAPI | None = None
-        self._collection: AsyncCollection | None = None
+        self._collection: InstrumentedCollection | None = None
         self._init_lock = asyncio.Lock()
 
     @property
@@ -76,12 +133,12 @@ class ChromaManager:
             "Check CHROMA_HOST, CHROMA_PORT, and CHROMA_SSL."
         )
 
-    async def get_collection(self) -> AsyncCollection:
+    async def get_collection(self) -> InstrumentedCollection:
         """Return the configured Chroma collection, connecting lazily once.
 
         Returns:
-            AsyncCollection: Shared Chroma collection handle for the configured
-            collection name.
+            InstrumentedCollection: Shared Chroma collection handle for the
+            configured collection name, with data calls timed.
 
         Raises:
             RuntimeError: If the Chroma client cannot connect or the collection
@@ -99,16 +156,18 @@ class ChromaManager:
                     "Connecting to remote Chroma collection "
                     f"{settings.CHROMA_COLLECTION_NAME} at {self.endpoint}"
                 )
-                self._client = await chromadb.AsyncHttpClient(
+                client = await _timed_call("connect", lambda: chromadb.AsyncHttpClient(
                     host=settings.CHROMA_HOST,
                     port=settings.CHROMA_PORT,
                     ssl=settings.CHROMA_SSL,
                     settings=ChromaSettings(anonymized_telemetry=False),
-                )
-                self._collection = await self._client.get_or_create_collection(
+                ))
+                collection = await _timed_call("get_or_create_collection", lambda: client.get_or_create_collection(
                     name=settings.CHROMA_COLLECTION_NAME,
                     metadata={"hnsw:space": "cosine"},
-                )
+                ))
+                self._client = client
+                self._collection = InstrumentedCollection(collection)
             except Exception as exc:
                 raise self.unavailable_error("connection", exc) from exc
 
@@ -46,6 +46,98 @@ class Settings(BaseSettings):
         default=30,
         description="Token expiration time in minutes.",
     )
+    PASSWORD_HASH_WORKERS: int = Field(
+        default=2,
+        ge=1,
+        description="Threads dedicated to bcrypt hashing and verification.",
+    )
+    PASSWORD_HASH_MAX_QUEUE: int = Field(
+        default=32,
+        ge=0,
+        description="Password operations allowed to wait for a bcrypt thread before returning 503.",
+    )
+    CHAT_CONTEXT_CACHE_SIZE: int = Field(
+        default=1_000,
+        ge=0,
+        description="Conversations whose serialized history is cached in memory. Set to 0 to disable.",
+    )
+    CHAT_CONTEXT_MAX_TOKENS: int = Field(
+        default=8_000,
+        ge=1,
+        description="Default token budget for history and RAG context sent to the provider.",
+    )
+    CHAT_MODEL_TOKEN_BUDGETS: dict[str, int] = Field(
+        default_factory=dict,
+        description=(
+            "Per-model overrides of CHAT_CONTEXT_MAX_TOKENS as a JSON object, "
+            'e.g. {"llama-3.1-8b-instant": 6000}.'
+        ),
+    )
+    CHAT_WRITE_BEHIND_BATCH_SIZE: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum completed chat turns written to Postgres per write-behind batch.",
+    )
+    CHAT_WRITE_BEHIND_FLUSH_MS: float = Field(
+        default=50.0,
+        ge=0,
+        description="Milliseconds the write-behind queue collects chat turns before flushing.",
+    )
+    CHAT_TOKENIZER_FILE: str = Field(
+        default="",
+        description=(
+            "Optional Hugging Face tokenizer.json used to count message tokens. "
+            "Leave empty to estimate from character length."
+        ),
+    )
+    SECURITY_SUMMARY_MAX_AGE_SECONDS: float = Field(
+        default=30.0,
+        ge=0,
+        description=(
+            "Maximum age in seconds of the security dashboard summary counters. "
+            "Set to 0 to recompute them on every request."
+        ),
+    )
+    SECURITY_ALARM_FEED_OVERLAP_SECONDS: float = Field(
+        default=30.0,
+        ge=0,
+        description=(
+            "Seconds of alarms behind a ``since`` cursor that are read again, so alarms "
+            "committed after a later one was served are not skipped."
+        ),
+    )
+    ALARM_STREAM_QUEUE_SIZE: int = Field(
+        default=100,
+        ge=1,
+        description="Live alarm events buffered per stream before a slow client is disconnected.",
+    )
+    ALARM_STREAM_HEARTBEAT_SECONDS: float = Field(
+        default=15.0,
+        gt=0,
+        description="Seconds between keep-alive comments on an idle live alarm stream.",
+    )
+    EXPORT_WORKERS: int = Field(
+        default=1,
+        ge=1,
+        description="Number of background audit exports allowed to run concurrently.",
+    )
+    SERVER_TIMING_ENABLED: bool = Field(
+        default=False,
+        description=(
+            "When True, responses carry a Server-Timing header with the duration of each "
+            "chat hot-path stage completed before the response started."
+        ),
+    )
+    PRINCIPAL_CACHE_SIZE: int = Field(
+        default=10_000,
+        ge=0,
+        description="Maximum authenticated users whose role is cached in memory. Set to 0 to disable.",
+    )
+    PRINCIPAL_CACHE_TTL_SECONDS: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds a cached user role is trusted before Postgres is consulted again.",
+    )
     ENVIRONMENT: str = Field(
         default="development",
         description="The current environment (e.g., development, production, testing).",
@@ -67,6 +159,30 @@ class Settings(BaseSettings):
             "local responses for end-to-end testing."
         ),
     )
+    PROVIDER_HTTP_MAX_CONNECTIONS: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum concurrent connections per provider HTTP client.",
+    )
+    PROVIDER_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        default=20,
+        ge=0,
+        description="Maximum idle keep-alive connections retained per provider HTTP client.",
+    )
+    PROVIDER_HTTP_KEEPALIVE_EXPIRY: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds an idle provider connection is kept open before being closed.",
+    )
+    PROVIDER_HTTP_TIMEOUT: float = Field(
+        default=60.0,
+        gt=0,
+        description="Timeout in seconds applied to provider HTTP requests.",
+    )
+    PROVIDER_HTTP2: bool = Field(
+        default=True,
+        description="Whether provider HTTP clients negotiate HTTP/2 when the upstream supports it.",
+    )
     CHROMA_HOST: str = Field(
         default="localhost",
         description="Hostname for the remote Chroma server.",
@@ -83,6 +199,68 @@ class Settings(BaseSettings):
         default="rag_documents",
         description="Collection name used for RAG document storage.",
     )
+    EMBEDDING_CACHE_SIZE: int = Field(
+        default=4096,
+        ge=0,
+        description="Maximum number of embedding vectors cached in memory. Set to 0 to disable.",
+    )
+    EMBEDDING_CACHE_PATH: str = Field(
+        default="",
+        description=(
+            "Optional SQLite file used as a persistent embedding cache tier. "
+            "Leave empty to cache in memory only."
+        ),
+    )
+    EMBEDDING_WORKERS: int = Field(
+        default=2,
+        ge=1,
+        description="Threads in the dedicated executor that runs the local embedding model.",
+    )
+    EMBEDDING_BATCH_WINDOW_MS: float = Field(
+        default=5.0,
+        ge=0,
+        description="Milliseconds to collect concurrent embedding requests into one batch.",
+    )
+    EMBEDDING_MAX_BATCH_SIZE: int = Field(
+        default=64,
+        ge=1,
+        description="Number of queued texts that flushes an embedding batch immediately.",
+    )
+    INGEST_BATCH_SIZE: int = Field(
+        default=64,
+        ge=1,
+        description="Number of chunks embedded and upserted to Chroma per ingestion batch.",
+    )
+    PDF_EXTRACT_WORKERS: int = Field(
+        default=2,
+        ge=0,
+        description=(
+            "Worker processes extracting PDF text in parallel across pages and uploads. "
+            "Set to 0 to extract on a single background thread instead."
+        ),
+    )
+    PDF_EXTRACT_PAGES_PER_TASK: int = Field(
+        default=8,
+        ge=1,
+        description="Pages extracted per PDF extraction pool task.",
+    )
+    INGEST_WORKERS: int = Field(
+        default=2,
+        ge=1,
+        description="Number of background workers indexing uploaded documents concurrently.",
+    )
+    MODERATION_KEYWORDS_FILE: str = Field(
+        default="",
+        description=(
+            "Optional file of extra moderation keywords, one per line, always added to "
+            "the built-in or database-managed list. Leave empty to disable."
+        ),
+    )
+    MODERATION_KEYWORDS_REFRESH_SECONDS: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds between checks of the database moderation keyword list version.",
+    )
     MFA_ENABLED: bool = Field(
         default=False,
         description="When True, Duo MFA is required at login.",
@@ -0,0 +1,51 @@
+"""Token-budget windowing for provider chat payloads.
+
+Long conversations are trimmed to their most recent turns before they are
+sent upstream, so request size — and with it upstream latency and cost —
+stays bounded no matter how long a chat grows. Budgets are configured per
+model, falling back to ``CHAT_CONTEXT_MAX_TOKENS``.
+"""
+from src.core.config import settings
+from src.core.conversation_cache import ChatMessage
+
+
+def context_budget(model: str) -> int:
+    """Return the prompt token budget for a provider model.
+
+    Args:
+        model (str): The model name locked on the conversation.
+
+    Returns:
+        int: Maximum prompt tokens to send for this model.
+    """
+    return settings.CHAT_MODEL_TOKEN_BUDGETS.get(model, settings.CHAT_CONTEXT_MAX_TOKENS)
+
+
+def fit_to_budget(
+    messages: list[ChatMessage],
+    token_counts: list[int],
+    max_tokens: int,
+) -> list[ChatMessage]:
+    """Keep the most recent messages that fit within a token budget.
+
+    Older turns are dropped first. The newest message is always kept so the
+    provider still sees the prompt being answered, even if it alone exceeds
+    the budget.
+
+    Args:
+        messages (list[ChatMessage]): Conversation history, oldest first.
+        token_counts (list[int]): Prompt tokens of each message.
+        max_tokens (int): Token budget for the returned history.
+
+    Returns:
+        list[ChatMessage]: The retained suffix of ``messages``.
+    """
+    used = 0
+    start = len(messages)
+    while start > 0:
+        cost = token_counts[start - 1]
+        if used + cost > max_tokens and start < len(messages):
+            break
+        used += cost
+        start -= 1
+    return messages[start:]
@@ -0,0 +1,126 @@
+"""In-process cache of serialized conversation history.
+
+Building the provider payload used to load every message row of a
+conversation on each turn, so long chats got slower with every message.
+This cache keeps the already-serialized ``{"role", "content"}`` list per
+conversation, with each message's token count and the ``display_id`` of
+the newest message it contains. A turn then only fetches the rows written
+after that cursor — normally just the message that was committed a moment
+earlier — and appends them. Because the cursor comes from Postgres,
+messages written by another process are picked up on the next turn.
+
+``display_id`` is allocated at insert, not at commit, so a turn that
+commits after a newer one can land below the cursor. The entry therefore
+also records how many stored messages it holds; when that falls short of
+the conversation's ``message_count`` the history is reloaded in full.
+"""
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from src.core.config import settings
+
+ChatMessage = dict[str, str]
+
+
+@dataclass
+class ConversationHistory:
+    """Serialized history of one conversation.
+
+    Attributes:
+        cursor (int): ``display_id`` of the newest message included.
+        messages (list[ChatMessage]): ``{"role", "content"}`` dicts in order.
+        token_counts (list[int]): Prompt tokens of each entry in ``messages``.
+        stored_count (int): Number of stored message rows included.
+        message_ids (set[uuid.UUID]): Ids of the stored message rows included.
+    """
+
+    cursor: int = 0
+    messages: list[ChatMessage] = field(default_factory=list)
+    token_counts: list[int] = field(default_factory=list)
+    stored_count: int = 0
+    message_ids: set[uuid.UUID] = field(default_factory=set)
+
+    def copy(self) -> "ConversationHistory":
+        """Return a copy whose collections can be extended independently."""
+        return ConversationHistory(
+            self.cursor,
+            list(self.messages),
+            list(self.token_counts),
+            self.stored_count,
+            set(self.message_ids),
+        )
+
+
+class ConversationContextCache:
+    """Bounded LRU map from conversation id to its serialized history.
+
+    Attributes:
+        max_conversations (int): Maximum number of cached conversations.
+            ``0`` disables caching.
+    """
+
+    def __init__(self, max_conversations: int) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_conversations (int): Maximum number of cached conversations.
+        """
+        self.max_conversations = max_conversations
+        self._entries: OrderedDict[str, ConversationHistory] = OrderedDict()
+
+    def get(self, conversation_id: str) -> ConversationHistory | None:
+        """Return a copy of the cached history for a conversation.
+
+        Args:
+            conversation_id (str): The conversation's UUID string.
+
+        Returns:
+            ConversationHistory | None: The cached history, or None.
+        """
+        entry = self._entries.get(conversation_id)
+        if entry is None:
+            return None
+        self._entries.move_to_end(conversation_id)
+        return entry.copy()
+
+    def put(self, conversation_id: str, history: ConversationHistory) -> None:
+        """Store a conversation's history, evicting the least recently used.
+
+        Args:
+            conversation_id (str): The conversation's UUID string.
+            history (ConversationHistory): Serialized history and its cursor.
+        """
+        if self.max_conversations <= 0:
+            return
+        self._entries[conversation_id] = history.copy()
+        self._entries.move_to_end(conversation_id)
+        while len(self._entries) > self.max_conversations:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, conversation_id: str) -> None:
+        """Drop a conversation's cached history, e.g. after deletion.
+
+        Args:
+            conversation_id (str): The conversation's UUID string.
+        """
+        self._entries.pop(str(conversation_id), None)
+
+    def clear(self) -> None:
+        """Drop every cached conversation."""
+        self._entries.clear()
+
+
+_conversation_cache: ConversationContextCache | None = None
+
+
+def get_conversation_cache() -> ConversationContextCache:
+    """Return the shared conversation cache configured from settings.
+
+    Returns:
+        ConversationContextCache: Process-wide cache used by the chat service.
+    """
+    global _conversation_cache
+    if _conversation_cache is None:
+        _conversation_cache = ConversationContextCache(settings.CHAT_CONTEXT_CACHE_SIZE)
+    return _conversation_cache
@@ -0,0 +1,49 @@
+"""Opaque keyset pagination cursors.
+
+Paginated listings order rows by a ``(timestamp, id)`` keyset. The key of a
+page's boundary row is handed to clients as an unpadded URL-safe base64
+string, so they can resume without the server holding any state and
+without depending on the key's format.
+"""
+import base64
+import uuid
+from datetime import datetime
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(timestamp: datetime, row_id: uuid.UUID) -> str:
+    """Encode a ``(timestamp, id)`` keyset as an opaque URL-safe cursor.
+
+    Args:
+        timestamp (datetime): Ordering timestamp of the boundary row.
+        row_id (uuid.UUID): Id of the boundary row.
+
+    Returns:
+        str: The cursor string.
+    """
+    raw = f"{timestamp.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor (str): The cursor string from the client.
+
+    Returns:
+        tuple[datetime, uuid.UUID]: The keyset of the boundary row.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(timestamp), uuid.UUID(row_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
@@ -6,7 +6,9 @@ for acquiring async sessions in FastAPI endpoints.
 """
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import QueuePool
 from src.core.config import settings
+from src.core.metrics import DB_POOL_CONNECTIONS, registry
 
 # Global async database engine created from the configuration URL
 engine = create_async_engine(settings.DATABASE_URL, echo=False)
@@ -16,6 +18,21 @@ async_session_maker = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
+
+def _collect_pool_usage() -> None:
+    """Publish connection pool utilisation on the metrics endpoint."""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return
+    DB_POOL_CONNECTIONS.set(pool.size(), state="size")
+    DB_POOL_CONNECTIONS.set(pool.checkedout(), state="checked_out")
+    DB_POOL_CONNECTIONS.set(pool.checkedin(), state="idle")
+    DB_POOL_CONNECTIONS.set(max(pool.overflow(), 0), state="overflow")
+
+
+registry.add_collector(_collect_pool_usage)
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency provider yielding asynchronous database sessions.
     
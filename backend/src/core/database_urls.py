@@ -57,3 +57,9 @@ def to_sync_database_url(database_url: str) -> str:
     }
     drivername = driver_overrides.get(url.drivername, url.drivername)
     return url.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+def to_asyncpg_dsn(database_url: str) -> str:
+    """Convert an application URL into a DSN for a raw asyncpg connection."""
+    url = make_url(normalize_async_database_url(database_url))
+    return url.set(drivername="postgresql").render_as_string(hide_password=False)
@@ -0,0 +1,265 @@
+"""Content-addressed cache for locally computed embedding vectors.
+
+Embedding the same text with the same model always yields the same vector,
+so results are cached under a hash of the model name and the normalized
+text. A bounded in-process LRU serves hot entries; an optional SQLite file
+provides a second tier that survives restarts and can be shared by every
+worker on the same host.
+"""
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+
+from src.core.config import settings
+from src.core.logger import get_logger
+
+logger = get_logger("EMBEDDING_CACHE")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so trivially different inputs share a cache entry.
+
+    Applies Unicode NFC normalization, trims surrounding whitespace, and
+    collapses internal whitespace runs. The tokenizer splits on whitespace,
+    so these variants embed identically.
+
+    Args:
+        text (str): Raw text submitted for embedding.
+
+    Returns:
+        str: Canonical form of the text used to derive cache keys.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def cache_key(model_name: str, text: str) -> str:
+    """Build the content-addressed cache key for a model and text pair.
+
+    Args:
+        model_name (str): Embedding model identifier.
+        text (str): Raw text submitted for embedding.
+
+    Returns:
+        str: Hex SHA-256 digest of the model name and normalized text.
+    """
+    digest = hashlib.sha256()
+    digest.update(model_name.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(normalize_text(text).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class _DiskTier:
+    """SQLite-backed persistent tier for cached embedding vectors.
+
+    Vectors are stored as packed float32 arrays, which is lossless for the
+    float32 output of the ONNX model.
+
+    Attributes:
+        path (Path): Location of the SQLite database file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Open (or create) the SQLite cache file.
+
+        Args:
+            path (Path): Location of the SQLite database file.
+        """
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """Return stored vectors for whichever keys are present.
+
+        Args:
+            keys (list[str]): Cache keys to look up.
+
+        Returns:
+            dict[str, list[float]]: Vectors keyed by cache key for hits only.
+        """
+        if not keys:
+            return {}
+        placeholders = ",".join("?" for _ in keys)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                keys,
+            ).fetchall()
+        found: dict[str, list[float]] = {}
+        for key, blob in rows:
+            vector = array("f")
+            vector.frombytes(blob)
+            found[key] = vector.tolist()
+        return found
+
+    def put_many(self, items: dict[str, list[float]]) -> None:
+        """Persist vectors, replacing any existing entries.
+
+        Args:
+            items (dict[str, list[float]]): Vectors keyed by cache key.
+        """
+        if not items:
+            return
+        rows = [(key, array("f", vector).tobytes()) for key, vector in items.items()]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class EmbeddingCache:
+    """Two-tier embedding cache with hit and miss accounting.
+
+    Attributes:
+        max_entries (int): Maximum number of vectors kept in memory. Zero
+            disables the in-process tier.
+        hits (int): Lookups served from memory.
+        disk_hits (int): Lookups served from the on-disk tier.
+        misses (int): Lookups that required computing a new embedding.
+    """
+
+    def __init__(self, max_entries: int, disk_path: str | Path | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum number of vectors kept in memory.
+            disk_path (str | Path | None): Optional SQLite file for the
+                persistent tier. When omitted only the in-process tier is used.
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, ...]] = OrderedDict()
+        self._disk = _DiskTier(Path(disk_path)) if disk_path else None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _remember(self, key: str, vector: list[float]) -> None:
+        """Insert a vector into the in-process LRU, evicting the oldest entry."""
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = tuple(vector)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_many(self, keys: list[str]) -> list[list[float] | None]:
+        """Look up vectors for a batch of cache keys.
+
+        Args:
+            keys (list[str]): Cache keys produced by ``cache_key``.
+
+        Returns:
+            list[list[float] | None]: Cached vectors aligned with ``keys``,
+            with ``None`` for misses.
+        """
+        results: list[list[float] | None] = [None] * len(keys)
+        pending: list[int] = []
+        for index, key in enumerate(keys):
+            vector = self._entries.get(key)
+            if vector is None:
+                pending.append(index)
+                continue
+            self._entries.move_to_end(key)
+            self.hits += 1
+            results[index] = list(vector)
+
+        if pending and self._disk is not None:
+            pending_keys = list({keys[index] for index in pending})
+            try:
+                found = await asyncio.to_thread(self._disk.get_many, pending_keys)
+            except sqlite3.Error as exc:
+                logger.warning(f"Embedding disk cache read failed: {exc}")
+                found = {}
+            still_pending: list[int] = []
+            for index in pending:
+                vector = found.get(keys[index])
+                if vector is None:
+                    still_pending.append(index)
+                    continue
+                self.disk_hits += 1
+                self._remember(keys[index], vector)
+                results[index] = list(vector)
+            pending = still_pending
+
+        self.misses += len(pending)
+        return results
+
+    async def put_many(self, items: dict[str, list[float]]) -> None:
+        """Store freshly computed vectors in every enabled tier.
+
+        Args:
+            items (dict[str, list[float]]): Vectors keyed by cache key.
+        """
+        for key, vector in items.items():
+            self._remember(key, vector)
+        if self._disk is not None and items:
+            try:
+                await asyncio.to_thread(self._disk.put_many, items)
+            except sqlite3.Error as exc:
+                logger.warning(f"Embedding disk cache write failed: {exc}")
+
+    def stats(self) -> dict[str, int]:
+        """Return counters used to size the cache.
+
+        Returns:
+            dict[str, int]: Hit, disk-hit, and miss counts plus the current
+            and maximum number of in-memory entries.
+        """
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+        }
+
+    def close(self) -> None:
+        """Release the on-disk tier, if any."""
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+
+
+_embedding_cache: EmbeddingCache | None = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Return the shared embedding cache configured from settings.
+
+    Returns:
+        EmbeddingCache: Process-wide cache used by the RAG embedding path.
+    """
+    global _embedding_cache
+    if _embedding_cache is None:
+        _embedding_cache = EmbeddingCache(
+            max_entries=settings.EMBEDDING_CACHE_SIZE,
+            disk_path=settings.EMBEDDING_CACHE_PATH or None,
+        )
+    return _embedding_cache
+
+
+def reset_embedding_cache() -> None:
+    """Discard the shared cache, primarily for test isolation."""
+    global _embedding_cache
+    if _embedding_cache is not None:
+        _embedding_cache.close()
+    _embedding_cache = None
@@ -0,0 +1,168 @@
+"""Micro-batching scheduler for local embedding model calls.
+
+Concurrent requests that each need a handful of embeddings (typically one
+query per chat turn) are collected for a short window and sent to the model
+as a single batch on a dedicated, bounded thread pool. Batching amortizes the
+per-invocation ONNX overhead, and the dedicated pool keeps embedding work
+from starving other ``asyncio.to_thread`` users of the default executor.
+"""
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core.logger import get_logger
+
+logger = get_logger("EMBEDDING_SCHEDULER")
+
+EmbedFn = Callable[[list[str]], list[list[float]]]
+
+
+class EmbeddingScheduler:
+    """Coalesce concurrent embedding requests into batched model calls.
+
+    Attributes:
+        max_workers (int): Number of threads in the dedicated executor.
+        batch_window (float): Seconds to wait for more requests before a
+            partially filled batch is flushed.
+        max_batch_size (int): Number of texts that triggers an immediate
+            flush without waiting for the window to elapse.
+        batches (int): Number of model invocations issued so far.
+        texts (int): Number of texts embedded so far.
+    """
+
+    def __init__(
+        self,
+        embed_fn: EmbedFn,
+        max_workers: int,
+        batch_window_ms: float,
+        max_batch_size: int,
+    ) -> None:
+        """Initialize the scheduler without starting any threads.
+
+        Args:
+            embed_fn (EmbedFn): Blocking function embedding a list of texts.
+            max_workers (int): Number of threads in the dedicated executor.
+            batch_window_ms (float): Milliseconds to collect requests before
+                flushing a batch.
+            max_batch_size (int): Number of texts that flushes a batch early.
+        """
+        self._embed_fn = embed_fn
+        self.max_workers = max_workers
+        self.batch_window = batch_window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self._executor: ThreadPoolExecutor | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: list[tuple[list[str], asyncio.Future]] = []
+        self._pending_count = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._in_flight = 0
+        self.batches = 0
+        self.texts = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the dedicated executor, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="embedding",
+            )
+        return self._executor
+
+    @property
+    def pending(self) -> int:
+        """Number of texts waiting for a batch or being embedded."""
+        return self._pending_count + self._in_flight
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts as part of the next scheduled batch.
+
+        Args:
+            texts (list[str]): Text inputs to embed.
+
+        Returns:
+            list[list[float]]: Embedding vectors aligned with ``texts``.
+
+        Raises:
+            Exception: Whatever the underlying embedding function raised for
+                the batch containing these texts.
+        """
+        if not texts:
+            return []
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Pending state from a previous (closed) event loop can never flush.
+            self._loop = loop
+            self._pending = []
+            self._pending_count = 0
+            self._flush_handle = None
+
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((texts, future))
+        self._pending_count += len(texts)
+
+        if self._pending_count >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Hand every pending request to a background batch task."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch = self._pending
+        self._pending = []
+        self._pending_count = 0
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: list[tuple[list[str], asyncio.Future]]) -> None:
+        """Run one model invocation and resolve each caller's future.
+
+        Requests whose callers were cancelled while waiting for the batch
+        are dropped first, and no model call is made if none remain.
+
+        Args:
+            batch (list[tuple[list[str], asyncio.Future]]): Pending requests
+                and the futures their callers are awaiting.
+        """
+        batch = [(request_texts, future) for request_texts, future in batch if not future.done()]
+        if not batch:
+            return
+        texts = [text for request_texts, _ in batch for text in request_texts]
+        loop = asyncio.get_running_loop()
+        self._in_flight += len(texts)
+        try:
+            vectors = await loop.run_in_executor(self._get_executor(), self._embed_fn, texts)
+        except Exception as exc:
+            logger.error(f"Embedding batch of {len(texts)} texts failed: {exc}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        finally:
+            self._in_flight -= len(texts)
+
+        self.batches += 1
+        self.texts += len(texts)
+        offset = 0
+        for request_texts, future in batch:
+            end = offset + len(request_texts)
+            if not future.done():
+                future.set_result(vectors[offset:end])
+            offset = end
+
+    def shutdown(self) -> None:
+        """Stop the dedicated executor, waiting for in-flight batches."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
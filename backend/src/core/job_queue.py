@@ -0,0 +1,177 @@
+"""In-process worker pool for durable background jobs.
+
+Jobs are persisted as rows in a Postgres table (the durable backend) and
+their IDs are handed to this queue. A fixed number of asyncio workers pull
+job IDs and run the injected handler, so HTTP requests return as soon as
+the job is stored instead of waiting for the work itself. Jobs left behind
+by a restart are re-submitted from the table. Document ingestion and audit
+exports each run their own pool.
+"""
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import timedelta
+
+from src.core.logger import get_logger
+
+logger = get_logger("JOB_QUEUE")
+
+ProgressCallback = Callable[[int, int, int], None]
+JobHandler = Callable[[str, ProgressCallback], Awaitable[None]]
+
+# Running jobs without a heartbeat for this long belonged to a dead worker.
+STALE_JOB_AFTER = timedelta(minutes=15)
+# Running jobs refresh their row this often, well inside STALE_JOB_AFTER.
+HEARTBEAT_INTERVAL = timedelta(minutes=1)
+
+
+class JobQueue:
+    """Run persisted jobs on a bounded pool of asyncio workers.
+
+    Workers are started lazily on the first submission so the queue is always
+    bound to the running event loop.
+
+    Attributes:
+        workers (int): Number of jobs processed concurrently.
+    """
+
+    def __init__(self, handler: JobHandler, workers: int, name: str) -> None:
+        """Initialize the queue without starting any workers.
+
+        Args:
+            handler (JobHandler): Coroutine function processing one job ID and
+                reporting progress through the supplied callback.
+            workers (int): Number of concurrent worker tasks.
+            name (str): Kind of job processed, used in task names and logs.
+        """
+        self._handler = handler
+        self.workers = workers
+        self.name = name
+        self._queue: asyncio.Queue[str] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._progress: dict[str, dict[str, int]] = {}
+        self._active = 0
+
+    def _ensure_started(self) -> asyncio.Queue[str]:
+        """Start the worker tasks on the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._queue is None:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._tasks = [
+                loop.create_task(self._worker(index), name=f"{self.name}-worker-{index}")
+                for index in range(self.workers)
+            ]
+            logger.info(f"Started {self.workers} {self.name} workers")
+        return self._queue
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs waiting for a worker or currently running."""
+        queued = self._queue.qsize() if self._queue is not None else 0
+        return queued + self._active
+
+    def submit(self, job_id: str) -> None:
+        """Schedule a persisted job for background processing.
+
+        Args:
+            job_id (str): Primary key of the persisted job.
+        """
+        self._ensure_started().put_nowait(job_id)
+
+    def progress(self, job_id: str) -> dict[str, int] | None:
+        """Return live progress for a job running in this process.
+
+        Args:
+            job_id (str): Primary key of the persisted job.
+
+        Returns:
+            dict[str, int] | None: ``pages_processed``, ``page_count`` and
+            ``chunks_stored`` counters, or None if the job is not running here.
+        """
+        return self._progress.get(job_id)
+
+    async def join(self) -> None:
+        """Wait until every submitted job has been processed."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def _worker(self, index: int) -> None:
+        """Process job IDs until cancelled.
+
+        Args:
+            index (int): Worker number, used for log context.
+        """
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            job_id = await queue.get()
+
+            def _report(pages_processed: int, page_count: int, chunks_stored: int) -> None:
+                self._progress[job_id] = {
+                    "pages_processed": pages_processed,
+                    "page_count": page_count,
+                    "chunks_stored": chunks_stored,
+                }
+
+            self._active += 1
+            try:
+                await self._handler(job_id, _report)
+            except Exception as exc:
+                logger.error(f"{self.name.capitalize()} worker {index} failed job {job_id}: {exc}", exc_info=True)
+            finally:
+                self._active -= 1
+                self._progress.pop(job_id, None)
+                queue.task_done()
+
+    async def stop(self) -> None:
+        """Cancel the worker tasks.
+
+        Handlers hand the job they were running back to its table when
+        cancelled, so unfinished jobs stay queued in Postgres.
+        """
+        tasks = self._tasks
+        owned = self._loop is asyncio.get_running_loop()
+        self._tasks = []
+        self._queue = None
+        self._loop = None
+        if not owned:
+            # Workers bound to a previous loop died with it.
+            return
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@asynccontextmanager
+async def keep_alive(beat: Callable[[], Awaitable[None]], label: str) -> AsyncIterator[None]:
+    """Call ``beat`` every ``HEARTBEAT_INTERVAL`` while the block runs.
+
+    Keeps recovery on other replicas from mistaking a long job for one
+    abandoned by a dead worker. The heartbeat is stopped by an event rather
+    than cancelled, so it never abandons a commit on a shared session.
+
+    Args:
+        beat (Callable[[], Awaitable[None]]): Refreshes the running job's row.
+        label (str): Job description used in failure logs.
+    """
+    stop = asyncio.Event()
+
+    async def _run() -> None:
+        while True:
+            try:
+                await asyncio.wait_for(stop.wait(), HEARTBEAT_INTERVAL.total_seconds())
+                return
+            except asyncio.TimeoutError:
+                try:
+                    await beat()
+                except Exception as exc:
+                    logger.warning(f"Heartbeat for {label} failed: {exc}")
+
+    task = asyncio.ensure_future(_run())
+    try:
+        yield
+    finally:
+        stop.set()
+        await task
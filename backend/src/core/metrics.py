@@ -0,0 +1,411 @@
+"""In-process metrics exposed in the Prometheus text format.
+
+Counters, gauges and histograms are kept in this process's memory and
+rendered by the ``/metrics`` endpoint for a Prometheus server to scrape.
+Each replica reports its own series and the scraper aggregates them.
+Metrics are only updated from the event loop, so no locking is needed.
+Point-in-time values such as connection pool usage and executor queue
+depths are read by collectors that run on every scrape.
+
+Every HTTP request is counted and timed per route template by
+:class:`RequestMetricsMiddleware`; a streamed response is timed until its
+body is complete.
+
+Chat turns report the duration of each stage of their hot path with
+:func:`timed_stage`. When ``SERVER_TIMING_ENABLED`` is set, the stages a
+request completed before its response started are also returned to the
+client in a ``Server-Timing`` header. Stages of a streamed body, such as the
+provider stream itself, finish after the headers are sent and only appear
+in the histograms.
+"""
+import abc
+import math
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TypeVar
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; spans a cache hit through a slow provider stream.
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Render a ``{name="value",...}`` label set, or nothing when empty."""
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return f"{{{pairs}}}"
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value, using Prometheus spellings for infinities."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric(abc.ABC):
+    """Shared label handling for one named metric family.
+
+    Attributes:
+        name (str): Metric family name.
+        documentation (str): ``# HELP`` text.
+        labelnames (tuple[str, ...]): Names of the labels every sample carries.
+    """
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _label_values(self, labels: dict[str, str]) -> LabelValues:
+        """Order label values by ``labelnames``.
+
+        Raises:
+            ValueError: If the labels do not match ``labelnames`` exactly.
+        """
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abc.abstractmethod
+    def samples(self) -> Iterator[str]:
+        """Yield the family's sample lines."""
+
+    def render(self) -> list[str]:
+        """Return the family's ``HELP``/``TYPE`` header and samples."""
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self.samples(),
+        ]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count per label set."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Add ``amount`` to the counter for the given labels.
+
+        Args:
+            amount (float): Non-negative increment.
+            **labels (str): Value for each of ``labelnames``.
+        """
+        key = self._label_values(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Return the current count for the given labels."""
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def samples(self) -> Iterator[str]:
+        """Yield one line per label set with its current count."""
+        for key, value in sorted(self._values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets per label set.
+
+    Attributes:
+        buckets (tuple[float, ...]): Upper bounds, ending with ``+Inf``.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        bounds = sorted(float(bound) for bound in buckets)
+        if not bounds or not math.isinf(bounds[-1]):
+            bounds.append(math.inf)
+        self.buckets = tuple(bounds)
+        # Per label set: non-cumulative bucket counts, sum, count.
+        self._series: dict[LabelValues, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation.
+
+        Args:
+            value (float): Observed value, e.g. seconds.
+            **labels (str): Value for each of ``labelnames``.
+        """
+        key = self._label_values(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = ([0] * len(self.buckets), [0.0, 0.0])
+        counts, totals = series
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[index] += 1
+                break
+        totals[0] += value
+        totals[1] += 1
+
+    def count(self, **labels: str) -> int:
+        """Return how many values were observed for the given labels."""
+        series = self._series.get(self._label_values(labels))
+        return 0 if series is None else int(series[1][1])
+
+    def samples(self) -> Iterator[str]:
+        """Yield cumulative ``_bucket`` lines plus ``_sum`` and ``_count`` per label set."""
+        for key, (counts, (total, count)) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels((*self.labelnames, "le"), (*key, _format_value(bound)))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {_format_value(count)}"
+
+
+class Gauge(_Metric):
+    """Current value per label set, overwritten on each update."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge for the given labels.
+
+        Args:
+            value (float): Current value.
+            **labels (str): Value for each of ``labelnames``.
+        """
+        self._values[self._label_values(labels)] = value
+
+    def value(self, **labels: str) -> float:
+        """Return the current value for the given labels."""
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def samples(self) -> Iterator[str]:
+        """Yield one line per label set with its latest value."""
+        for key, value in sorted(self._values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+M = TypeVar("M", bound=_Metric)
+
+
+class MetricsRegistry:
+    """Ordered collection of metric families rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    def register(self, metric: M) -> M:
+        """Add a metric family.
+
+        Raises:
+            ValueError: If a family with the same name is already registered.
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def add_collector(self, collect: Callable[[], None]) -> None:
+        """Run ``collect`` before every render, e.g. to refresh gauges.
+
+        Args:
+            collect (Callable[[], None]): Function updating registered metrics.
+        """
+        self._collectors.append(collect)
+
+    def render(self) -> str:
+        """Return every family in the Prometheus text exposition format."""
+        for collect in self._collectors:
+            collect()
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+CHAT_STAGE_SECONDS = registry.register(Histogram(
+    "aegis_chat_stage_seconds",
+    "Duration of each stage of the chat hot path.",
+    ("stage",),
+))
+PROVIDER_FIRST_CHUNK_SECONDS = registry.register(Histogram(
+    "aegis_provider_first_chunk_seconds",
+    "Time from calling an AI provider to receiving its first streamed chunk.",
+    ("provider",),
+))
+PROVIDER_STREAM_SECONDS = registry.register(Histogram(
+    "aegis_provider_stream_seconds",
+    "Total duration of AI provider response streams.",
+    ("provider",),
+))
+
+HTTP_REQUESTS_TOTAL = registry.register(Counter(
+    "aegis_http_requests_total",
+    "HTTP requests handled, by route template and response status.",
+    ("method", "route", "status"),
+))
+HTTP_REQUEST_SECONDS = registry.register(Histogram(
+    "aegis_http_request_duration_seconds",
+    "HTTP request duration until the response body is complete.",
+    ("method", "route"),
+))
+PROVIDER_ERRORS_TOTAL = registry.register(Counter(
+    "aegis_provider_errors_total",
+    "AI provider streams that ended in an error, by kind.",
+    ("provider", "error"),
+))
+CHROMA_REQUEST_SECONDS = registry.register(Histogram(
+    "aegis_chroma_request_seconds",
+    "Duration of Chroma client calls, by operation.",
+    ("operation",),
+))
+CHROMA_ERRORS_TOTAL = registry.register(Counter(
+    "aegis_chroma_errors_total",
+    "Chroma client calls that raised, by operation.",
+    ("operation",),
+))
+DB_POOL_CONNECTIONS = registry.register(Gauge(
+    "aegis_db_pool_connections",
+    "Database connections in the SQLAlchemy pool, by state.",
+    ("state",),
+))
+EXECUTOR_QUEUE_DEPTH = registry.register(Gauge(
+    "aegis_executor_queue_depth",
+    "Work items submitted to a background executor or queue and not yet finished.",
+    ("executor",),
+))
+
+_request_timings: ContextVar[list[tuple[str, float]] | None] = ContextVar("request_timings", default=None)
+
+
+def record_stage(stage: str, seconds: float) -> None:
+    """Record how long a chat hot-path stage took.
+
+    Args:
+        stage (str): Stage name, e.g. ``history`` or ``embedding``.
+        seconds (float): Elapsed time.
+    """
+    CHAT_STAGE_SECONDS.observe(seconds, stage=stage)
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.append((stage, seconds))
+
+
+@contextmanager
+def timed_stage(stage: str) -> Iterator[None]:
+    """Time the enclosed block as a chat hot-path stage, even if it raises.
+
+    Args:
+        stage (str): Stage name.
+    """
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(stage, time.perf_counter() - started_at)
+
+
+def render_metrics() -> str:
+    """Return all of this process's metrics in the Prometheus text format."""
+    return registry.render()
+
+
+class ServerTimingMiddleware:
+    """ASGI middleware adding a ``Server-Timing`` header of recorded stages.
+
+    Stages recorded with :func:`record_stage` while a request is handled,
+    up to the moment its response starts, are listed with their duration in
+    milliseconds.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings: list[tuple[str, float]] = []
+        token = _request_timings.set(timings)
+
+        async def send_with_timings(message: Message) -> None:
+            if message["type"] == "http.response.start" and timings:
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    ", ".join(f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in timings),
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timings)
+        finally:
+            _request_timings.reset(token)
+
+
+def _route_template(scope: Scope) -> str:
+    """Return the matched route's path template, bounding label cardinality."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class RequestMetricsMiddleware:
+    """ASGI middleware counting and timing HTTP requests per route template."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            method = scope["method"]
+            route = _route_template(scope)
+            HTTP_REQUESTS_TOTAL.inc(method=method, route=route, status=str(status_code))
+            HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started_at, method=method, route=route)
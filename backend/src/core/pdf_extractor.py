@@ -0,0 +1,217 @@
+"""Process-pool PDF text extraction for document ingestion.
+
+``pypdf`` text extraction is pure-Python CPU work that holds the GIL, so
+running it on threads still serializes every upload behind one core. This
+module fans page ranges out to a shared ``ProcessPoolExecutor`` and streams
+the extracted text back in page order, which lets a single backend
+container use all of its cores during bulk onboarding while the event loop
+stays responsive.
+
+Each upload is copied once into a ``multiprocessing.shared_memory`` block
+and tasks only carry the block's name and a page range. A worker parses the
+PDF the first time it sees the block and keeps the parsed reader for the
+upload's later ranges, so a document is neither pickled per task nor
+re-parsed per range.
+
+The worker functions are module-level so they can be pickled into child
+processes; this module deliberately avoids importing application settings.
+"""
+import asyncio
+import multiprocessing
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from multiprocessing.shared_memory import SharedMemory
+
+from pypdf import PdfReader
+
+from src.core.logger import get_logger
+
+logger = get_logger("PDF_EXTRACTOR")
+
+# Parsed readers kept per worker; concurrent uploads interleave their ranges.
+_READER_CACHE_SIZE = 4
+_readers: OrderedDict[str, PdfReader] = OrderedDict()
+
+
+def _get_reader(block_name: str, size: int) -> PdfReader:
+    """Return the parsed PDF held in a shared memory block, parsing it once.
+
+    Args:
+        block_name (str): Name of the shared memory block holding the PDF.
+        size (int): Length of the PDF in bytes.
+
+    Returns:
+        PdfReader: Reader cached for later page ranges of the same upload.
+    """
+    reader = _readers.get(block_name)
+    if reader is not None:
+        _readers.move_to_end(block_name)
+        return reader
+    block = SharedMemory(name=block_name)
+    try:
+        pdf_bytes = bytes(block.buf[:size])
+    finally:
+        block.close()
+    reader = PdfReader(BytesIO(pdf_bytes))
+    _readers[block_name] = reader
+    while len(_readers) > _READER_CACHE_SIZE:
+        _readers.popitem(last=False)
+    return reader
+
+
+def _count_pages(block_name: str, size: int) -> int:
+    """Return the number of pages in a PDF.
+
+    Args:
+        block_name (str): Name of the shared memory block holding the PDF.
+        size (int): Length of the PDF in bytes.
+
+    Returns:
+        int: Page count.
+    """
+    return len(_get_reader(block_name, size).pages)
+
+
+def _extract_page_range(block_name: str, size: int, start: int, stop: int) -> list[str]:
+    """Extract text from a contiguous range of PDF pages.
+
+    Args:
+        block_name (str): Name of the shared memory block holding the PDF.
+        size (int): Length of the PDF in bytes.
+        start (int): Zero-based index of the first page to extract.
+        stop (int): Index one past the last page to extract.
+
+    Returns:
+        list[str]: Extracted text per page, empty for pages without text.
+    """
+    reader = _get_reader(block_name, size)
+    return [reader.pages[index].extract_text() or "" for index in range(start, stop)]
+
+
+class PdfExtractor:
+    """Extract PDF page text on a shared pool of worker processes.
+
+    Each upload keeps at most ``max_workers`` page-range tasks in flight, so
+    one large document can occupy every worker while concurrent uploads
+    interleave their tasks on the same pool.
+
+    Attributes:
+        max_workers (int): Number of worker processes. ``0`` extracts on a
+            single background thread instead of spawning processes.
+        pages_per_task (int): Number of pages extracted per pool task.
+    """
+
+    def __init__(self, max_workers: int, pages_per_task: int) -> None:
+        """Initialize the extractor without starting any workers.
+
+        Args:
+            max_workers (int): Number of worker processes, or ``0`` to use a
+                single thread.
+            pages_per_task (int): Number of pages extracted per pool task.
+        """
+        self.max_workers = max_workers
+        self.pages_per_task = pages_per_task
+        self._executor: Executor | None = None
+
+    def _get_executor(self) -> Executor:
+        """Return the worker pool, creating it on first use."""
+        if self._executor is None:
+            if self.max_workers > 0:
+                # Forking a process that runs an event loop and worker threads is
+                # unsafe, so children are started fresh.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-extract")
+        return self._executor
+
+    async def iter_pages(self, pdf_bytes: bytes) -> AsyncIterator[tuple[int, int, str]]:
+        """Extract page text in parallel and yield it in page order.
+
+        Args:
+            pdf_bytes (bytes): Raw PDF content.
+
+        Yields:
+            tuple[int, int, str]: One-based page number, total page count,
+            and the page's extracted text.
+
+        Raises:
+            Exception: Whatever ``pypdf`` raised while parsing the PDF.
+        """
+        block = SharedMemory(create=True, size=max(1, len(pdf_bytes)))
+        try:
+            block.buf[:len(pdf_bytes)] = pdf_bytes
+            async for page in self._iter_block_pages(block.name, len(pdf_bytes)):
+                yield page
+        finally:
+            block.close()
+            block.unlink()
+
+    async def _iter_block_pages(self, block_name: str, size: int) -> AsyncIterator[tuple[int, int, str]]:
+        """Extract the pages of a PDF already copied into shared memory.
+
+        Args:
+            block_name (str): Name of the shared memory block holding the PDF.
+            size (int): Length of the PDF in bytes.
+
+        Yields:
+            tuple[int, int, str]: One-based page number, total page count,
+            and the page's extracted text.
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        try:
+            page_count = await loop.run_in_executor(executor, _count_pages, block_name, size)
+        except BrokenProcessPool:
+            self._discard_broken_pool()
+            raise
+
+        ranges = iter(
+            (start, min(start + self.pages_per_task, page_count))
+            for start in range(0, page_count, self.pages_per_task)
+        )
+        in_flight: deque[asyncio.Future] = deque()
+
+        def _submit_next() -> None:
+            page_range = next(ranges, None)
+            if page_range is not None:
+                in_flight.append(
+                    loop.run_in_executor(executor, _extract_page_range, block_name, size, *page_range)
+                )
+
+        for _ in range(max(1, self.max_workers)):
+            _submit_next()
+
+        page_number = 0
+        try:
+            while in_flight:
+                texts = await in_flight.popleft()
+                _submit_next()
+                for text in texts:
+                    page_number += 1
+                    yield page_number, page_count, text
+        except BrokenProcessPool:
+            self._discard_broken_pool()
+            raise
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    def _discard_broken_pool(self) -> None:
+        """Drop a pool whose worker died so the next upload gets a fresh one."""
+        logger.error("PDF extraction worker died; recreating the process pool")
+        executor = self._executor
+        self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        """Stop the worker pool, waiting for in-flight extractions."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -0,0 +1,113 @@
+"""Pooled outbound HTTP clients for the external LLM providers.
+
+This module mirrors the role of ``chroma.py`` for provider traffic: it owns
+one long-lived ``httpx.AsyncClient`` per provider so keep-alive connections
+(and their TCP/TLS handshakes) are reused across chat turns instead of being
+rebuilt for every streamed message. The FastAPI lifespan closes the pool on
+shutdown.
+"""
+import asyncio
+
+import httpx
+
+from src.core.config import settings
+from src.core.logger import get_logger
+
+logger = get_logger("PROVIDER_CLIENTS")
+
+
+class ProviderClientPool:
+    """Manage lazily created, long-lived HTTP clients keyed by provider.
+
+    Each provider talks to a single upstream host, so keeping one client per
+    provider gives every upstream its own bounded connection pool while
+    letting concurrent streams to the same provider share connections.
+
+    Attributes:
+        _clients (dict[str, httpx.AsyncClient]): Cached clients keyed by
+            provider name.
+        _lock (asyncio.Lock): Lock guarding client creation and shutdown.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty pool with no open clients."""
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _build_client() -> httpx.AsyncClient:
+        """Create a provider client configured from application settings.
+
+        Returns:
+            httpx.AsyncClient: Client with pool limits, keep-alive expiry,
+            request timeout, and HTTP/2 negotiation applied.
+        """
+        limits = httpx.Limits(
+            max_connections=settings.PROVIDER_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.PROVIDER_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.PROVIDER_HTTP_KEEPALIVE_EXPIRY,
+        )
+        return httpx.AsyncClient(
+            http2=settings.PROVIDER_HTTP2,
+            limits=limits,
+            timeout=settings.PROVIDER_HTTP_TIMEOUT,
+        )
+
+    async def get_client(self, provider: str) -> httpx.AsyncClient:
+        """Return the shared client for a provider, creating it once.
+
+        Args:
+            provider (str): Provider name such as 'groq', 'gemini', or 'deepseek'.
+
+        Returns:
+            httpx.AsyncClient: Long-lived client reused for every request to
+            the provider.
+        """
+        client = self._clients.get(provider)
+        if client is not None and not client.is_closed:
+            return client
+
+        async with self._lock:
+            client = self._clients.get(provider)
+            if client is None or client.is_closed:
+                logger.info(f"Opening pooled HTTP client for provider={provider}")
+                client = self._build_client()
+                self._clients[provider] = client
+            return client
+
+    async def aclose(self) -> None:
+        """Close every open client and drop them from the pool.
+
+        The pool stays usable afterwards; the next ``get_client`` call opens a
+        fresh client.
+        """
+        async with self._lock:
+            clients = list(self._clients.items())
+            self._clients.clear()
+
+        for provider, client in clients:
+            logger.info(f"Closing pooled HTTP client for provider={provider}")
+            await client.aclose()
+
+
+_provider_client_pool: ProviderClientPool | None = None
+
+
+def get_provider_client_pool() -> ProviderClientPool:
+    """Return the shared provider client pool instance.
+
+    Returns:
+        ProviderClientPool: Process-wide pool used by the provider dispatcher.
+    """
+    global _provider_client_pool
+    if _provider_client_pool is None:
+        _provider_client_pool = ProviderClientPool()
+    return _provider_client_pool
+
+
+async def close_provider_client_pool() -> None:
+    """Close and discard the shared pool, typically on application shutdown."""
+    global _provider_client_pool
+    if _provider_client_pool is not None:
+        await _provider_client_pool.aclose()
+    _provider_client_pool = None
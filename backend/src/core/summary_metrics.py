@@ -0,0 +1,141 @@
+"""Cached top-line counters for the security chat dashboard.
+
+The dashboard summary (conversations, messages, messages in the last day
+and distinct users) takes several table scans to compute, and used to be
+recomputed on every dashboard request. This module keeps the last computed
+snapshot per process and serves it while it is younger than
+``SECURITY_SUMMARY_MAX_AGE_SECONDS``, so a dashboard request normally reads
+the counters in constant time.
+
+Refreshes happen only on demand (stale-while-revalidate): a request that
+finds the snapshot past half its bound still gets it immediately but
+starts a recomputation in the background, so an open dashboard keeps the
+counters fresh while an idle deployment runs no summary queries at all.
+A snapshot past the full bound is never served; the request recomputes
+it, with concurrent requests sharing that one computation.
+"""
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from src.core.config import settings
+from src.core.logger import get_logger
+
+logger = get_logger("SUMMARY_METRICS")
+
+SummaryCounts = dict[str, int]
+
+
+class SummaryMetricsCache:
+    """Single snapshot of dashboard counters with a staleness bound.
+
+    Attributes:
+        max_age (float): Seconds a snapshot may be served after it was
+            computed. ``0`` disables caching.
+    """
+
+    def __init__(self, max_age_seconds: float) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_age_seconds (float): Seconds a snapshot stays servable.
+        """
+        self.max_age = max_age_seconds
+        self._snapshot: SummaryCounts | None = None
+        self._computed_at = 0.0
+        self._refreshing: asyncio.Task | None = None
+
+    def _age(self) -> float:
+        """Seconds since the current snapshot started computing."""
+        return time.monotonic() - self._computed_at
+
+    def peek(self) -> SummaryCounts | None:
+        """Return the snapshot if it is within the staleness bound.
+
+        Returns:
+            SummaryCounts | None: A copy of the counters, or None if absent
+            or stale.
+        """
+        if self._snapshot is None or self._age() > self.max_age:
+            return None
+        return dict(self._snapshot)
+
+    async def get(self, load: Callable[[], Awaitable[SummaryCounts]]) -> SummaryCounts:
+        """Return fresh counters, recomputing them only when needed.
+
+        Snapshots older than half of ``max_age`` are still returned, but
+        trigger a background refresh so the next request finds fresh ones.
+
+        Args:
+            load (Callable[[], Awaitable[SummaryCounts]]): Coroutine function
+                computing the counters from the database.
+
+        Returns:
+            SummaryCounts: Counters no older than ``max_age`` seconds.
+        """
+        snapshot = self.peek()
+        if snapshot is None:
+            return await self.refresh(load)
+        if self._age() > self.max_age / 2:
+            self._start_refresh(load)
+        return snapshot
+
+    async def refresh(self, load: Callable[[], Awaitable[SummaryCounts]]) -> SummaryCounts:
+        """Recompute and store the counters.
+
+        Callers arriving while a refresh is already running on the same
+        event loop wait for it instead of starting another.
+
+        Args:
+            load (Callable[[], Awaitable[SummaryCounts]]): Coroutine function
+                computing the counters from the database.
+
+        Returns:
+            SummaryCounts: The newly computed counters.
+        """
+        return dict(await asyncio.shield(self._start_refresh(load)))
+
+    def _start_refresh(self, load: Callable[[], Awaitable[SummaryCounts]]) -> asyncio.Task:
+        """Return the running refresh task, starting one if none is running."""
+        task = self._refreshing
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.get_running_loop().create_task(self._compute(load))
+            task.add_done_callback(_log_refresh_failure)
+            self._refreshing = task
+        return task
+
+    async def _compute(self, load: Callable[[], Awaitable[SummaryCounts]]) -> SummaryCounts:
+        """Run the loader and store its result as the current snapshot."""
+        started_at = time.monotonic()
+        counts = await load()
+        if self.max_age > 0:
+            # Age is measured from the start so the bound covers the query time.
+            self._snapshot = dict(counts)
+            self._computed_at = started_at
+        return counts
+
+    def clear(self) -> None:
+        """Drop the stored snapshot."""
+        self._snapshot = None
+        self._computed_at = 0.0
+
+
+def _log_refresh_failure(task: asyncio.Task) -> None:
+    """Log failed refreshes, including background ones nobody awaits."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Security summary refresh failed: {task.exception()}")
+
+
+_summary_cache: SummaryMetricsCache | None = None
+
+
+def get_summary_cache() -> SummaryMetricsCache:
+    """Return the shared dashboard summary cache configured from settings.
+
+    Returns:
+        SummaryMetricsCache: Process-wide cache used by the chat service.
+    """
+    global _summary_cache
+    if _summary_cache is None:
+        _summary_cache = SummaryMetricsCache(settings.SECURITY_SUMMARY_MAX_AGE_SECONDS)
+    return _summary_cache
@@ -0,0 +1,87 @@
+"""Token counting for chat messages.
+
+Counts are stored on each message and used to keep provider payloads
+within a per-model budget. When ``CHAT_TOKENIZER_FILE`` points at a
+Hugging Face ``tokenizer.json`` (for example the Llama 3 tokenizer used by
+the default Groq models), text is tokenized with the ``tokenizers``
+library. Otherwise — or if that library is unavailable — counts fall back
+to a character-length estimate, which is close enough for budgeting.
+"""
+from src.core.config import settings
+from src.core.conversation_cache import ChatMessage
+from src.core.logger import get_logger
+
+logger = get_logger("TOKENIZER")
+
+# Rough average for English text across the supported providers' tokenizers.
+_CHARS_PER_TOKEN = 4
+# Per-message overhead for the role and chat-template separators.
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+class TokenCounter:
+    """Count tokens with a configured tokenizer or a character estimate.
+
+    Attributes:
+        tokenizer_file (str): Path of the ``tokenizer.json`` in use, or an
+            empty string when counts are estimated.
+    """
+
+    def __init__(self, tokenizer_file: str = "") -> None:
+        """Load the tokenizer, falling back to estimation on failure.
+
+        Args:
+            tokenizer_file (str): Path to a Hugging Face ``tokenizer.json``.
+                Empty to estimate from character length.
+        """
+        self.tokenizer_file = ""
+        self._tokenizer = None
+        if not tokenizer_file:
+            return
+        try:
+            from tokenizers import Tokenizer
+
+            self._tokenizer = Tokenizer.from_file(tokenizer_file)
+            self.tokenizer_file = tokenizer_file
+            logger.info(f"Loaded chat tokenizer from {tokenizer_file}")
+        except Exception as exc:
+            logger.warning(f"Could not load tokenizer '{tokenizer_file}' ({exc}) — estimating token counts")
+
+    def count_text(self, text: str) -> int:
+        """Return the number of tokens in a piece of text.
+
+        Args:
+            text (str): Text to count.
+
+        Returns:
+            int: Token count.
+        """
+        if self._tokenizer is not None:
+            return len(self._tokenizer.encode(text, add_special_tokens=False).ids)
+        return -(-len(text) // _CHARS_PER_TOKEN)
+
+    def count_message(self, message: ChatMessage) -> int:
+        """Return the prompt tokens a chat message uses, including overhead.
+
+        Args:
+            message (ChatMessage): A ``{"role", "content"}`` message.
+
+        Returns:
+            int: Token count.
+        """
+        return MESSAGE_OVERHEAD_TOKENS + self.count_text(message["content"])
+
+
+_token_counter: TokenCounter | None = None
+
+
+def get_token_counter() -> TokenCounter:
+    """Return the shared token counter configured from settings.
+
+    Returns:
+        TokenCounter: Process-wide counter used by the chat service.
+    """
+    global _token_counter
+    if _token_counter is None:
+        _token_counter = TokenCounter(settings.CHAT_TOKENIZER_FILE)
+    return _token_counter
@@ -0,0 +1,166 @@
+"""Write-behind queue for batching background database writes.
+
+Callers hand items to :meth:`WriteBehindQueue.submit`, which is synchronous
+and never waits on the database, so it is safe to call from a streaming
+response that is being torn down after a client disconnect. A single
+background task drains the queue, collecting items for a short window and
+passing them to the injected flush coroutine in batches. :meth:`stop`
+flushes everything still queued before returning, so nothing accepted is
+lost on a graceful shutdown.
+"""
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+from src.core.logger import get_logger
+
+logger = get_logger("WRITE_BEHIND")
+
+T = TypeVar("T")
+
+
+class WriteBehindQueue(Generic[T]):
+    """Batch submitted items and flush them on a background task.
+
+    Attributes:
+        max_batch_size (int): Maximum items passed to one flush.
+        flush_interval (float): Seconds to wait for more items after the
+            first one arrives before flushing a partial batch.
+        flushed (int): Number of items flushed successfully.
+        failed (int): Number of items dropped after their flush failed.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[list[T]], Awaitable[None]],
+        max_batch_size: int,
+        flush_interval_ms: float,
+    ) -> None:
+        """Initialize the queue without starting the background task.
+
+        Args:
+            flush (Callable[[list[T]], Awaitable[None]]): Coroutine function
+                persisting one batch.
+            max_batch_size (int): Maximum items passed to one flush.
+            flush_interval_ms (float): Milliseconds to collect items before
+                flushing a partial batch.
+        """
+        self._flush = flush
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self._queue: asyncio.Queue[T] | None = None
+        self._task: asyncio.Task | None = None
+        self._current_flush: asyncio.Task | None = None
+        # Accepted items not yet flushed, mirroring the queue plus the batch in flight.
+        self._unflushed: deque[T] = deque()
+        self.flushed = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the background task is accepting items on this loop."""
+        if self._task is None or self._task.done():
+            return False
+        try:
+            return self._task.get_loop() is asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+    def start(self) -> None:
+        """Start the background flush task on the running event loop."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="write-behind")
+
+    def submit(self, item: T) -> None:
+        """Queue an item for the next batch.
+
+        Args:
+            item (T): Item to persist.
+
+        Raises:
+            RuntimeError: If the queue has not been started.
+        """
+        if self._queue is None or not self.running:
+            raise RuntimeError("Write-behind queue is not running")
+        self._queue.put_nowait(item)
+        self._unflushed.append(item)
+
+    def pending(self) -> list[T]:
+        """Return items accepted but not yet flushed, oldest first."""
+        return list(self._unflushed)
+
+    async def join(self) -> None:
+        """Wait until every submitted item has been flushed."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def _run(self) -> None:
+        """Collect and flush batches until cancelled."""
+        assert self._queue is not None
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            # Shielded so stopping never interrupts a write mid-transaction
+            self._current_flush = loop.create_task(self._flush_batch(batch))
+            try:
+                await asyncio.shield(self._current_flush)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _flush_batch(self, batch: list[T]) -> None:
+        """Flush one batch, retrying items individually if it fails.
+
+        Args:
+            batch (list[T]): Items to persist.
+        """
+        try:
+            await self._flush(batch)
+            self.flushed += len(batch)
+        except Exception as exc:
+            logger.warning(f"Write-behind batch of {len(batch)} failed ({exc}) — retrying items individually")
+            for item in batch:
+                try:
+                    await self._flush([item])
+                    self.flushed += 1
+                except Exception as item_exc:
+                    self.failed += 1
+                    logger.error(f"Dropping write-behind item after failed flush: {item_exc}", exc_info=True)
+        finally:
+            for _ in batch:
+                self._unflushed.popleft()
+
+    async def stop(self) -> None:
+        """Flush every accepted item, then stop the background task."""
+        task = self._task
+        self._task = None
+        self._queue = None
+        if task is None:
+            return
+        if task.get_loop() is not asyncio.get_running_loop():
+            # The task died with a previous event loop.
+            self._unflushed.clear()
+            return
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        if self._current_flush is not None:
+            await asyncio.gather(self._current_flush, return_exceptions=True)
+            self._current_flush = None
+        # Items still collecting for a batch or never picked up
+        leftovers = list(self._unflushed)
+        for start in range(0, len(leftovers), self.max_batch_size):
+            await self._flush_batch(leftovers[start:start + self.max_batch_size])
+        logger.info(f"Write-behind queue stopped after flushing {self.flushed} items")
@@ -3,13 +3,22 @@
 This module initializes the FastAPI application, mounts all routers,
 and manages application-wide lifecycle events (startup/shutdown).
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from src.core.config import settings
 from src.core.database import engine
 from src.core.database_migrations import verify_database_schema_current
+from src.core.metrics import CONTENT_TYPE, RequestMetricsMiddleware, ServerTimingMiddleware, render_metrics
+from src.core.provider_clients import close_provider_client_pool
+from src.service.alarm_stream_service import start_alarm_listener, stop_alarm_listener
+from src.service.chat_service import start_turn_writer, stop_turn_writer
+from src.service.document_service import recover_ingestion_jobs, shutdown_ingestion_queue
+from src.service.export_service import recover_export_jobs, shutdown_export_queue
+from src.service.moderation_service import start_keyword_refresh, stop_keyword_refresh
+from src.service.rag_service import shutdown_embedding_scheduler, shutdown_pdf_extractor
+from src.security.password import shutdown_password_hash_pool
 from src.api.v1.endpoints import auth
 from src.api.v1.endpoints import admin
 from src.api.v1.endpoints import chat
@@ -24,9 +33,14 @@ logger = get_logger("MAIN")
 async def lifespan(app: FastAPI):
     """Event lifecycle context manager handling startup and shutdown routines.
     
-    Initializes the database engine and establishes connection pooling upon
-    server start. Safely unbinds and disposes open connection resources when 
-    the application server terminates.
+    On startup, verifies the database schema, resumes document ingestion
+    and audit export jobs left queued by a previous process, and starts the
+    moderation keyword refresher, the chat write-behind queue and the live
+    alarm listener.
+
+    On shutdown, flushes pending chat messages, stops the background
+    workers and disposes database connections, pooled provider HTTP clients
+    and the executor pools.
     
     Args:
         app (FastAPI): The active FastAPI application instance.
@@ -35,10 +49,33 @@ async def lifespan(app: FastAPI):
     if settings.ENVIRONMENT.lower() != "test":
         await verify_database_schema_current(engine, settings.DATABASE_URL)
         logger.info("Database schema matches the current Alembic head revision.")
+        recovered = await recover_ingestion_jobs()
+        logger.info(f"Resumed {recovered} pending document ingestion jobs.")
+        recovered_exports = await recover_export_jobs()
+        logger.info(f"Resumed {recovered_exports} pending audit export jobs.")
+        start_keyword_refresh()
+        start_turn_writer()
+        await start_alarm_listener()
     yield
     # Safely dispose engine connections immediately upon application shutdown
     logger.info("Shutting down application, disposing database connections...")
+    logger.info("Flushing pending chat messages...")
+    await stop_turn_writer()
+    logger.info("Stopping document ingestion workers...")
+    await shutdown_ingestion_queue()
+    logger.info("Stopping audit export workers...")
+    await shutdown_export_queue()
+    await stop_keyword_refresh()
+    await stop_alarm_listener()
     await engine.dispose()
+    logger.info("Closing pooled provider HTTP clients...")
+    await close_provider_client_pool()
+    logger.info("Stopping embedding workers...")
+    shutdown_embedding_scheduler()
+    logger.info("Stopping PDF extraction workers...")
+    shutdown_pdf_extractor()
+    logger.info("Stopping password hashing workers...")
+    shutdown_password_hash_pool()
 
 app = FastAPI(
     title="AegisAI API",
@@ -64,6 +101,12 @@ async def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Prometheus scrape target exposing this process's metrics."""
+    return Response(render_metrics(), media_type=CONTENT_TYPE)
+
+
 def get_cors_middleware_kwargs() -> dict[str, object]:
     """Build the CORS middleware configuration from environment-backed settings."""
     return {
@@ -73,10 +116,15 @@ def get_cors_middleware_kwargs() -> dict[str, object]:
         "allow_credentials": False,
         "allow_methods": ["*"],
         "allow_headers": ["*"],
+        # Pagination cursors returned by the sidebar and security alarm feed.
+        "expose_headers": ["X-Next-Cursor", "X-Latest-Cursor"],
     }
 
 
 app.add_middleware(CORSMiddleware, **get_cors_middleware_kwargs())
+app.add_middleware(RequestMetricsMiddleware)
+if settings.SERVER_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware)
 
 app.include_router(auth.router, prefix="/api/v1")
 app.include_router(admin.router, prefix="/api/v1")
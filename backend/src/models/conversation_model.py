@@ -4,11 +4,14 @@ This module defines the Conversation and Message models representing
 AI chat sessions and their individual message exchanges.
 """
 import uuid
-from sqlalchemy import Column, String, ForeignKey, Text, DateTime, BigInteger, Identity, Integer, Uuid
+from sqlalchemy import Column, String, ForeignKey, Text, DateTime, BigInteger, Identity, Index, Integer, Uuid
 from sqlalchemy.sql import func
 
 from src.models.user_model import Base
 
+# Characters of the latest message kept on the conversation for the sidebar.
+LAST_MESSAGE_PREVIEW_LENGTH = 255
+
 
 class Conversation(Base):
     """Database model representing an AI chat conversation session.
@@ -21,8 +24,13 @@ class Conversation(Base):
         provider (str): The AI provider locked at creation (groq, gemini, deepseek).
         model (str): The model name locked at creation.
         tokens_used (int): Cumulative token count across all messages.
+        message_count (int): Number of persisted messages, maintained on insert.
+        last_message_preview (str | None): Leading characters of the latest
+            message, maintained on insert for the sidebar.
         created_at (datetime): Timestamp of conversation creation.
         updated_at (datetime): Timestamp of last conversation update.
+        last_activity_at (datetime): Timestamp of the latest message, or the
+            creation time when empty. Maintained on insert.
     """
 
     __tablename__ = "conversations"
@@ -34,8 +42,16 @@ class Conversation(Base):
     provider = Column(String(50), nullable=False)
     model = Column(String(100), nullable=False)
     tokens_used = Column(BigInteger, nullable=False, default=0)
+    message_count = Column(Integer, nullable=False, default=0, server_default="0")
+    last_message_preview = Column(String(255), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    last_activity_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("idx_conversations_last_activity", last_activity_at.desc(), id.desc()),
+        Index("idx_conversations_user_activity", user_id, last_activity_at.desc(), id.desc()),
+    )
 
 
 class Message(Base):
@@ -60,3 +76,5 @@ class Message(Base):
     content = Column(Text, nullable=False)
     token_count = Column(Integer, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (Index("idx_messages_created_at", created_at),)
@@ -5,7 +5,7 @@ Users may only access documents whose allowed_roles list includes their role.
 """
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, BigInteger, Uuid, ARRAY, Text, ForeignKey, DateTime
+from sqlalchemy import Column, String, BigInteger, Integer, Uuid, ARRAY, Text, ForeignKey, DateTime
 from src.models.user_model import Base
 
 
@@ -22,10 +22,12 @@ class Document(Base):
         description (str): Optional description.
         filename (str): Original PDF filename.
         file_size (int): File size in bytes.
-        status (str): One of 'active', 'processing', 'archived'.
+        status (str): One of 'active', 'processing', 'failed', 'archived'.
         uploaded_by (uuid.UUID): FK to the user who uploaded the document.
         allowed_roles (list[str]): Roles permitted to access this document.
         chroma_doc_id (str | None): Corresponding doc_id in the ChromaDB vector store.
+        chunk_count (int | None): Number of vector chunks indexed in ChromaDB,
+            or None when unknown (documents ingested before it was recorded).
         created_at (datetime): Creation timestamp.
         updated_at (datetime): Last update timestamp.
     """
@@ -40,5 +42,6 @@ class Document(Base):
     uploaded_by = Column(Uuid(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     allowed_roles = Column(ARRAY(String), nullable=False, default=list)
     chroma_doc_id = Column(String(255), nullable=True)
+    chunk_count = Column(Integer, nullable=True)
     created_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow)
     updated_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow, onupdate=_utcnow)
@@ -0,0 +1,69 @@
+"""SQLAlchemy ORM model for the export_jobs table.
+
+Each row is a background export of conversations, messages and alarms to a
+compressed JSON Lines file, requested by a security user for an audit.
+Progress counters are written to the row while the export runs so any API
+process can report them. The file itself is stored in ``export_job_chunks``
+so any API process can also serve it.
+"""
+import uuid
+from datetime import datetime, timezone
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, Integer, LargeBinary, String, Text, Uuid
+from src.models.user_model import Base
+
+
+def _utcnow():
+    return datetime.now(timezone.utc)
+
+
+class ExportJob(Base):
+    """Database model for a queued, running or finished audit export.
+
+    Attributes:
+        id (uuid.UUID): Primary key.
+        requested_by (uuid.UUID): FK to the security user who requested it.
+        status (str): One of 'queued', 'running', 'completed', 'failed'.
+        user_id (uuid.UUID | None): Only export this user's data, if set.
+        created_from (datetime | None): Inclusive lower bound on record time.
+        created_to (datetime | None): Exclusive upper bound on record time.
+        conversations_exported (int): Conversation records written so far.
+        messages_exported (int): Message records written so far.
+        alarms_exported (int): Alarm records written so far.
+        file_size (int | None): Size of the finished file in bytes.
+        error (str | None): Failure reason for failed exports.
+        created_at (datetime): Creation timestamp.
+        updated_at (datetime): Last update timestamp.
+        completed_at (datetime | None): When the export finished.
+    """
+    __tablename__ = "export_jobs"
+    __table_args__ = (Index("idx_export_jobs_status", "status"),)
+
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    requested_by = Column(Uuid(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    status = Column(String(20), nullable=False, default="queued")
+    user_id = Column(Uuid(as_uuid=True), nullable=True)
+    created_from = Column(DateTime(timezone=True), nullable=True)
+    created_to = Column(DateTime(timezone=True), nullable=True)
+    conversations_exported = Column(Integer, nullable=False, default=0)
+    messages_exported = Column(Integer, nullable=False, default=0)
+    alarms_exported = Column(Integer, nullable=False, default=0)
+    file_size = Column(BigInteger, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow, onupdate=_utcnow)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class ExportJobChunk(Base):
+    """Database model for one consecutive slice of an export's gzip file.
+
+    Attributes:
+        job_id (uuid.UUID): FK to the export the slice belongs to.
+        seq (int): Position of the slice in the file, starting at 0.
+        data (bytes): The compressed bytes.
+    """
+    __tablename__ = "export_job_chunks"
+
+    job_id = Column(Uuid(as_uuid=True), ForeignKey("export_jobs.id", ondelete="CASCADE"), primary_key=True)
+    seq = Column(Integer, primary_key=True)
+    data = Column(LargeBinary, nullable=False)
@@ -4,7 +4,7 @@ Records every message blocked by either the keyword filter or a provider's
 built-in content policy, along with contextual metadata for audit purposes.
 """
 import uuid
-from sqlalchemy import Column, String, Text, DateTime, Uuid, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, Uuid, ForeignKey, Index
 from sqlalchemy.sql import func
 
 from src.models.user_model import Base
@@ -20,7 +20,7 @@ class Alarm(Base):
         message_content (str): The exact user message that was flagged.
         filter_type (str): Which layer caught it — 'keyword' or 'provider'.
         provider (str): The AI provider for the conversation.
-        reason (str | None): Optional human-readable description (reserved for future use).
+        reason (str | None): Optional human-readable description, e.g. the matched keyword.
         created_at (datetime): Timestamp of the alarm event.
     """
 
@@ -34,3 +34,11 @@ class Alarm(Base):
     provider = Column(String(50), nullable=False)
     reason = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Feed order is (created_at DESC, id DESC), optionally within one filter value.
+        Index("idx_alarm_created_at", created_at.desc(), id.desc()),
+        Index("idx_alarm_filter_type_created_at", filter_type, created_at.desc(), id.desc()),
+        Index("idx_alarm_provider_created_at", provider, created_at.desc(), id.desc()),
+        Index("idx_alarm_user_created_at", user_id, created_at.desc(), id.desc()),
+    )
@@ -0,0 +1,45 @@
+"""SQLAlchemy ORM model for the ingestion_jobs table.
+
+Each row is a durable work item for the background document ingestion
+queue. The uploaded PDF is held here until a worker has indexed it, so
+queued uploads survive an application restart.
+"""
+import uuid
+from datetime import datetime, timezone
+from sqlalchemy import Column, String, Integer, LargeBinary, Text, Uuid, ForeignKey, DateTime, Index
+from src.models.user_model import Base
+
+
+def _utcnow():
+    return datetime.now(timezone.utc)
+
+
+class IngestionJob(Base):
+    """Database model for a queued or completed document ingestion.
+
+    Attributes:
+        id (uuid.UUID): Primary key.
+        document_id (uuid.UUID): FK to the document being ingested.
+        pdf_bytes (bytes | None): Raw PDF content, cleared once ingested.
+        status (str): One of 'queued', 'running', 'completed', 'failed'.
+        attempts (int): Number of times a worker has claimed the job.
+        error (str | None): Failure reason for failed jobs.
+        created_at (datetime): Creation timestamp.
+        updated_at (datetime): Last update timestamp.
+    """
+    __tablename__ = "ingestion_jobs"
+    __table_args__ = (Index("idx_ingestion_jobs_status", "status"),)
+
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    document_id = Column(
+        Uuid(as_uuid=True),
+        ForeignKey("documents.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
+    pdf_bytes = Column(LargeBinary, nullable=True)
+    status = Column(String(20), nullable=False, default="queued")
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow, onupdate=_utcnow)
@@ -0,0 +1,44 @@
+"""SQLAlchemy ORM models for database-managed moderation keywords.
+
+The keyword table is the source of truth for the pre-send keyword filter.
+A single-row version counter is bumped on every change so each backend
+process can detect edits with one cheap query and recompile its matcher.
+"""
+import uuid
+from datetime import datetime, timezone
+from sqlalchemy import Column, String, Integer, BigInteger, Uuid, DateTime
+from src.models.user_model import Base
+
+
+def _utcnow():
+    return datetime.now(timezone.utc)
+
+
+class ModerationKeyword(Base):
+    """Database model for a single harmful keyword or phrase.
+
+    Attributes:
+        id (uuid.UUID): Primary key.
+        keyword (str): Lowercased keyword or phrase, unique.
+        created_at (datetime): Creation timestamp.
+    """
+    __tablename__ = "moderation_keywords"
+
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    keyword = Column(String(255), nullable=False, unique=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow)
+
+
+class ModerationKeywordVersion(Base):
+    """Single-row counter incremented whenever the keyword list changes.
+
+    Attributes:
+        id (int): Always 1.
+        version (int): Monotonic keyword list version.
+        updated_at (datetime): Time of the last keyword change.
+    """
+    __tablename__ = "moderation_keyword_version"
+
+    id = Column(Integer, primary_key=True, default=1)
+    version = Column(BigInteger, nullable=False, default=1)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow, onupdate=_utcnow)
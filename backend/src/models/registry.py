@@ -7,7 +7,10 @@ Alembic autogeneration, and tests all operate on the same complete
 from src.models.user_model import Base
 from src.models import conversation_model as _conversation_model  # noqa: F401
 from src.models import document_model as _document_model  # noqa: F401
+from src.models import export_job_model as _export_job_model  # noqa: F401
 from src.models import flagged_event_model as _flagged_event_model  # noqa: F401
+from src.models import ingestion_job_model as _ingestion_job_model  # noqa: F401
+from src.models import moderation_keyword_model as _moderation_keyword_model  # noqa: F401
 
 metadata = Base.metadata
 
@@ -1,26 +1,100 @@
 """Keyword-based pre-send content filter.
 
 Checks user messages against a list of harmful keywords before the message
-is forwarded to any AI provider. Matching is case-insensitive.
+is forwarded to any AI provider. Matching is case-insensitive. The keyword
+list is compiled once into a single-pass matcher, so the per-message cost
+does not grow with the number of keywords.
+
+The built-in list is active until the database-managed list is loaded by
+``install_keywords``. Each install compiles a fresh matcher and swaps it in
+with a single reference assignment, so concurrent checks always see either
+the old or the new list in full. The version check and the swap happen
+under one lock, so installs racing on worker threads cannot replace a
+newer list with an older one.
 """
-import re
+import threading
 
+from src.core.config import settings
+from src.moderation.keyword_matcher import KeywordMatcher, load_keywords
 from src.moderation.keywords import HARMFUL_KEYWORDS
 
 MODERATION_RESPONSE = "That's Dangerous"
 
+_FILE_KEYWORDS: list[str] = (
+    load_keywords(settings.MODERATION_KEYWORDS_FILE) if settings.MODERATION_KEYWORDS_FILE else []
+)
+
+_install_lock = threading.Lock()
+# (keyword list version, compiled matcher); version None means the built-in list.
+_active: tuple[int | None, KeywordMatcher] = (
+    None,
+    KeywordMatcher([*HARMFUL_KEYWORDS, *_FILE_KEYWORDS]),
+)
+
+
+def keyword_version() -> int | None:
+    """Return the version of the installed keyword list.
+
+    Returns:
+        int | None: Database keyword list version, or None while the
+        built-in list is active.
+    """
+    return _active[0]
+
+
+def install_keywords(keywords: list[str], version: int) -> bool:
+    """Compile and atomically activate a database keyword list.
+
+    Keywords from ``MODERATION_KEYWORDS_FILE`` are always included. Older
+    versions than the one already installed are ignored.
+
+    Args:
+        keywords (list[str]): Keywords loaded from the database.
+        version (int): Version counter the keywords were read at.
+
+    Returns:
+        bool: True if the new list was installed.
+    """
+    global _active
+    matcher = KeywordMatcher([*keywords, *_FILE_KEYWORDS])
+    with _install_lock:
+        current = _active[0]
+        if current is not None and version <= current:
+            return False
+        _active = (version, matcher)
+    return True
+
+
+def reset_keywords() -> None:
+    """Reinstall the built-in keyword list, discarding any database list."""
+    global _active
+    matcher = KeywordMatcher([*HARMFUL_KEYWORDS, *_FILE_KEYWORDS])
+    with _install_lock:
+        _active = (None, matcher)
 
-def is_harmful(text: str) -> bool:
-    """Returns True if the text contains any harmful keyword on a word boundary.
+
+def find_harmful_keyword(text: str) -> str | None:
+    """Returns the harmful keyword found in the text on a word boundary.
 
     Uses word-boundary matching to avoid false positives from words that contain
     a keyword as a substring (e.g. 'skill' matching 'kill').
 
+    Args:
+        text (str): The user message to check.
+
+    Returns:
+        str | None: The matched keyword, or None if the text is clean.
+    """
+    return _active[1].find(text)
+
+
+def is_harmful(text: str) -> bool:
+    """Returns True if the text contains any harmful keyword on a word boundary.
+
     Args:
         text (str): The user message to check.
 
     Returns:
         bool: True if a harmful keyword is found, False otherwise.
     """
-    lowered = text.lower()
-    return any(re.search(rf"\b{re.escape(keyword)}\b", lowered) for keyword in HARMFUL_KEYWORDS)
+    return find_harmful_keyword(text) is not None
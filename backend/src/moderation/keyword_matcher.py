@@ -0,0 +1,119 @@
+"""Compiled multi-keyword matcher for content moderation.
+
+Builds an Aho–Corasick automaton over the lowercased keyword list once, so
+scanning a message costs a single pass over its characters no matter how
+many keywords are configured. Matches are only reported on regex-style word
+boundaries (``\\b``), preserving the behaviour of the original per-keyword
+``re.search`` filter: 'skill' does not match 'kill'.
+"""
+from collections import deque
+from pathlib import Path
+
+
+def _is_word_char(char: str) -> bool:
+    """Return True for characters matched by the regex ``\\w`` class."""
+    return char.isalnum() or char == "_"
+
+
+def _is_boundary(text: str, index: int) -> bool:
+    """Return True if a regex ``\\b`` would match before ``text[index]``.
+
+    Args:
+        text (str): Text being scanned.
+        index (int): Position between two characters (0..len(text)).
+
+    Returns:
+        bool: Whether exactly one side of the position is a word character.
+    """
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+def load_keywords(path: str | Path) -> list[str]:
+    """Read a keyword list file with one term per line.
+
+    Blank lines and lines starting with ``#`` are ignored.
+
+    Args:
+        path (str | Path): Location of the keyword file.
+
+    Returns:
+        list[str]: Keywords in file order.
+    """
+    with open(path, encoding="utf-8") as handle:
+        stripped = (line.strip() for line in handle)
+        return [line for line in stripped if line and not line.startswith("#")]
+
+
+class KeywordMatcher:
+    """Case-insensitive, word-bounded matcher for a fixed keyword set.
+
+    Attributes:
+        keywords (tuple[str, ...]): Distinct lowercased keywords compiled
+            into the automaton.
+    """
+
+    def __init__(self, keywords: list[str]) -> None:
+        """Compile the keywords into an Aho–Corasick automaton.
+
+        Args:
+            keywords (list[str]): Terms to match. Case and surrounding
+                whitespace are ignored; empty entries are skipped.
+        """
+        self.keywords = tuple(dict.fromkeys(k.strip().lower() for k in keywords if k.strip()))
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Keyword indices ending at each state, including via failure links.
+        self._output: list[list[int]] = [[]]
+
+        for keyword_index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(keyword_index)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+    def __len__(self) -> int:
+        """Return the number of distinct compiled keywords."""
+        return len(self.keywords)
+
+    def find(self, text: str) -> str | None:
+        """Return the first keyword found in the text on word boundaries.
+
+        Args:
+            text (str): Message to scan.
+
+        Returns:
+            str | None: The matched keyword, or None if the text is clean.
+        """
+        lowered = text.lower()
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for end, char in enumerate(lowered, start=1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword_index in output[state]:
+                keyword = self.keywords[keyword_index]
+                start = end - len(keyword)
+                if _is_boundary(lowered, start) and _is_boundary(lowered, end):
+                    return keyword
+        return None
@@ -3,6 +3,10 @@
 This module routes streaming requests to the correct provider module
 (Groq, Gemini, or DeepSeek) based on the conversation's locked provider.
 """
+import time
+from contextlib import aclosing
+
+import httpx
 from fastapi import HTTPException, status
 
 from src.providers import groq as _groq
@@ -10,7 +14,10 @@ from src.providers import gemini as _gemini
 from src.providers import deepseek as _deepseek
 from src.providers import mock_provider as _mock_provider
 from src.core.config import settings
+from src.core.metrics import PROVIDER_ERRORS_TOTAL, PROVIDER_FIRST_CHUNK_SECONDS, PROVIDER_STREAM_SECONDS
+from src.core.provider_clients import get_provider_client_pool
 from src.core.logger import get_logger
+from src.moderation.exceptions import ContentPolicyError
 
 logger = get_logger("PROVIDERS")
 
@@ -21,6 +28,19 @@ _PROVIDER_MODULES = {
 }
 
 
+def _error_kind(exc: Exception) -> str:
+    """Classify a provider failure into a low-cardinality metric label."""
+    if isinstance(exc, ContentPolicyError):
+        return "content_policy"
+    if isinstance(exc, httpx.TimeoutException):
+        return "timeout"
+    if isinstance(exc, httpx.HTTPStatusError):
+        return f"http_{exc.response.status_code // 100}xx"
+    if isinstance(exc, httpx.TransportError):
+        return "transport"
+    return "other"
+
+
 def validate_provider(provider: str) -> None:
     """Validates that the provider is known and its API key is configured.
 
@@ -53,7 +73,36 @@ async def stream_from_provider(provider: str, model: str, messages: list[dict]):
     """Dispatches a streaming request to the specified AI provider.
 
     Assumes validate_provider() has already been called. Streams text chunks
-    from the provider's response.
+    from the provider's response over the provider's pooled HTTP client,
+    recording the time to the first chunk, the total stream duration and
+    the kind of any error the stream ends with.
+
+    Args:
+        provider (str): One of 'groq', 'gemini', or 'deepseek'.
+        model (str): The model name string to send to the provider.
+        messages (list[dict]): List of {'role': ..., 'content': ...} dicts.
+
+    Yields:
+        str: Text chunks from the provider's streaming response.
+    """
+    started_at = time.perf_counter()
+    first_chunk = True
+    try:
+        async with aclosing(_open_stream(provider, model, messages)) as chunks:
+            async for chunk in chunks:
+                if first_chunk:
+                    PROVIDER_FIRST_CHUNK_SECONDS.observe(time.perf_counter() - started_at, provider=provider)
+                    first_chunk = False
+                yield chunk
+    except Exception as exc:
+        PROVIDER_ERRORS_TOTAL.inc(provider=provider, error=_error_kind(exc))
+        raise
+    finally:
+        PROVIDER_STREAM_SECONDS.observe(time.perf_counter() - started_at, provider=provider)
+
+
+async def _open_stream(provider: str, model: str, messages: list[dict]):
+    """Select the provider module, or the mock provider, and stream from it.
 
     Args:
         provider (str): One of 'groq', 'gemini', or 'deepseek'.
@@ -71,6 +120,7 @@ async def stream_from_provider(provider: str, model: str, messages: list[dict]):
 
     module, get_key = _PROVIDER_MODULES[provider]
     api_key = get_key()
+    client = await get_provider_client_pool().get_client(provider)
     logger.info(f"Streaming from provider={provider} model={model}")
-    async for chunk in module.stream(messages, model, api_key):
+    async for chunk in module.stream(messages, model, api_key, client):
         yield chunk
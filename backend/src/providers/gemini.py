@@ -34,7 +34,12 @@ def _to_gemini_contents(messages: list[dict]) -> list[dict]:
     return result
 
 
-async def stream(messages: list[dict], model: str, api_key: str):
+async def stream(
+    messages: list[dict],
+    model: str,
+    api_key: str,
+    client: httpx.AsyncClient,
+):
     """Streams a chat completion response from Google Gemini via raw HTTP SSE.
 
     Converts the message history to Gemini's format, sends the request,
@@ -44,6 +49,7 @@ async def stream(messages: list[dict], model: str, api_key: str):
         messages (list[dict]): List of {'role': ..., 'content': ...} dicts.
         model (str): The Gemini model name (e.g. 'gemini-2.0-flash-lite').
         api_key (str): The Google Gemini API key.
+        client (httpx.AsyncClient): Pooled provider client reused across requests.
 
     Yields:
         str: Text content chunks from the streaming response.
@@ -52,33 +58,32 @@ async def stream(messages: list[dict], model: str, api_key: str):
         ContentPolicyError: If Gemini's safety filters block the request.
     """
     url = _BASE_URL.format(model=model)
-    async with httpx.AsyncClient(timeout=60) as client:
-        async with client.stream(
-            "POST",
-            url,
-            params={"alt": "sse", "key": api_key},
-            headers={"Content-Type": "application/json"},
-            json={"contents": _to_gemini_contents(messages)},
-        ) as response:
-            if response.status_code == 400:
-                body = (await response.aread()).decode("utf-8", errors="ignore").lower()
-                if any(marker in body for marker in _CONTENT_POLICY_MARKERS):
-                    raise ContentPolicyError("Gemini content policy violation")
+    async with client.stream(
+        "POST",
+        url,
+        params={"alt": "sse", "key": api_key},
+        headers={"Content-Type": "application/json"},
+        json={"contents": _to_gemini_contents(messages)},
+    ) as response:
+        if response.status_code == 400:
+            body = (await response.aread()).decode("utf-8", errors="ignore").lower()
+            if any(marker in body for marker in _CONTENT_POLICY_MARKERS):
+                raise ContentPolicyError("Gemini content policy violation")
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise httpx.HTTPStatusError(
+                f"Gemini API error: {e.response.status_code}",
+                request=e.request,
+                response=e.response,
+            ) from None
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
             try:
-                response.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                raise httpx.HTTPStatusError(
-                    f"Gemini API error: {e.response.status_code}",
-                    request=e.request,
-                    response=e.response,
-                ) from None
-            async for line in response.aiter_lines():
-                if not line.startswith("data: "):
-                    continue
-                try:
-                    data = json.loads(line[6:])
-                    text = data["candidates"][0]["content"]["parts"][0]["text"]
-                    if text:
-                        yield text
-                except (json.JSONDecodeError, KeyError, IndexError):
-                    continue
+                data = json.loads(line[6:])
+                text = data["candidates"][0]["content"]["parts"][0]["text"]
+                if text:
+                    yield text
+            except (json.JSONDecodeError, KeyError, IndexError):
+                continue
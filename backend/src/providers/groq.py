@@ -17,7 +17,12 @@ _BASE_URL = "https://api.groq.com/openai/v1/chat/completions"
 _CONTENT_POLICY_MARKERS = ("content_filter", "content_policy", "policy_violation", "moderation")
 
 
-async def stream(messages: list[dict], model: str, api_key: str):
+async def stream(
+    messages: list[dict],
+    model: str,
+    api_key: str,
+    client: httpx.AsyncClient,
+):
     """Streams a chat completion response from Groq via raw HTTP SSE.
 
     Sends the message history to Groq and yields text chunks as they
@@ -27,6 +32,7 @@ async def stream(messages: list[dict], model: str, api_key: str):
         messages (list[dict]): List of {'role': ..., 'content': ...} dicts.
         model (str): The Groq model name (e.g. 'llama-3.3-70b-versatile').
         api_key (str): The Groq API key.
+        client (httpx.AsyncClient): Pooled provider client reused across requests.
 
     Yields:
         str: Text content chunks from the streaming response.
@@ -34,31 +40,30 @@ async def stream(messages: list[dict], model: str, api_key: str):
     Raises:
         ContentPolicyError: If Groq's content filter blocks the request.
     """
-    async with httpx.AsyncClient(timeout=60) as client:
-        async with client.stream(
-            "POST",
-            _BASE_URL,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            json={"model": model, "messages": messages, "stream": True},
-        ) as response:
-            if response.status_code == 400:
-                body = (await response.aread()).decode("utf-8", errors="ignore").lower()
-                if any(marker in body for marker in _CONTENT_POLICY_MARKERS):
-                    raise ContentPolicyError("Groq content policy violation")
-            response.raise_for_status()
-            async for line in response.aiter_lines():
-                if not line.startswith("data: "):
-                    continue
-                chunk = line[6:]
-                if chunk.strip() == "[DONE]":
-                    return
-                try:
-                    data = json.loads(chunk)
-                    content = data["choices"][0]["delta"].get("content") or ""
-                    if content:
-                        yield content
-                except (json.JSONDecodeError, KeyError, IndexError):
-                    continue
+    async with client.stream(
+        "POST",
+        _BASE_URL,
+        headers={
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        },
+        json={"model": model, "messages": messages, "stream": True},
+    ) as response:
+        if response.status_code == 400:
+            body = (await response.aread()).decode("utf-8", errors="ignore").lower()
+            if any(marker in body for marker in _CONTENT_POLICY_MARKERS):
+                raise ContentPolicyError("Groq content policy violation")
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            chunk = line[6:]
+            if chunk.strip() == "[DONE]":
+                return
+            try:
+                data = json.loads(chunk)
+                content = data["choices"][0]["delta"].get("content") or ""
+                if content:
+                    yield content
+            except (json.JSONDecodeError, KeyError, IndexError):
+                continue
@@ -4,19 +4,105 @@ This module isolates all SQLAlchemy ORM queries related to the chat
 feature from the rest of the application, following the layered architecture.
 """
 import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import delete, func, update
+from sqlalchemy import Row, and_, delete, func, insert, literal, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from src.models.conversation_model import Conversation, Message
+from src.models.conversation_model import LAST_MESSAGE_PREVIEW_LENGTH, Conversation, Message
 from src.models.flagged_event_model import Alarm
 from src.models.user_model import User
+from src.repo.flagged_event_repo import notify_alarms
 from src.core.logger import get_logger
 
 logger = get_logger("CONVERSATION_REPOSITORY")
 
+# Rows fetched per round trip from the export's server-side cursor.
+_EXPORT_FETCH_SIZE = 500
+
+
+@dataclass
+class ConversationTurn:
+    """Writes staged for one chat turn and flushed in a single transaction.
+
+    Message ids are assigned when a row is staged, so a turn still waiting
+    to be written can be matched against rows already read back.
+
+    Attributes:
+        conversation_id (uuid.UUID): The conversation the turn belongs to.
+        messages (list[dict[str, object]]): Staged ``messages`` rows, in order.
+        alarms (list[dict[str, object]]): Staged ``alarm`` rows.
+        created_at (datetime | None): When the turn was submitted for writing,
+            set by :meth:`stamp`.
+    """
+
+    conversation_id: uuid.UUID
+    messages: list[dict[str, object]] = field(default_factory=list)
+    alarms: list[dict[str, object]] = field(default_factory=list)
+    created_at: datetime | None = None
+
+    def stamp(self, at: datetime | None = None) -> None:
+        """Date every staged row with the time the turn was submitted.
+
+        Rows then keep their submission order and time however long they
+        wait in the write-behind queue.
+
+        Args:
+            at (datetime | None): Submission time; defaults to now.
+        """
+        self.created_at = at or datetime.now(timezone.utc)
+        for row in (*self.messages, *self.alarms):
+            row["created_at"] = self.created_at
+
+    def add_message(self, role: str, content: str, token_count: int | None = None) -> None:
+        """Stage a message for insertion.
+
+        Args:
+            role (str): The speaker role ('user', 'assistant', or 'system').
+            content (str): The message content.
+            token_count (int | None): Prompt tokens of the message.
+        """
+        self.messages.append(
+            {
+                "id": uuid.uuid4(),
+                "conversation_id": self.conversation_id,
+                "role": role,
+                "content": content,
+                "token_count": token_count,
+            }
+        )
+
+    def add_alarm(
+        self,
+        user_id: uuid.UUID,
+        message_content: str,
+        filter_type: str,
+        provider: str,
+        reason: str | None = None,
+    ) -> None:
+        """Stage a moderation alarm for insertion.
+
+        Args:
+            user_id (uuid.UUID): The user who sent the flagged message.
+            message_content (str): The exact flagged user message.
+            filter_type (str): 'keyword' or 'provider'.
+            provider (str): The AI provider name.
+            reason (str | None): Optional human-readable description.
+        """
+        self.alarms.append(
+            {
+                "user_id": user_id,
+                "conversation_id": self.conversation_id,
+                "message_content": message_content,
+                "filter_type": filter_type,
+                "provider": provider,
+                "reason": reason,
+            }
+        )
+
 
 class ConversationRepository:
     """Repository handling all CRUD interactions for Conversation and Message models.
@@ -87,65 +173,50 @@ class ConversationRepository:
             logger.info("Conversation not found or not owned by user")
         return convo
 
-    async def list_conversations(self, user_id: str) -> list[dict[str, object]]:
-        """Retrieves all conversations for a user with sidebar summary metadata.
+    async def list_conversations(
+        self,
+        user_id: str,
+        limit: int | None = None,
+        after: tuple[datetime, uuid.UUID] | None = None,
+    ) -> list[dict[str, object]]:
+        """Retrieves a user's conversations with sidebar summary metadata.
+
+        Reads only the ``conversations`` table: the preview, message count
+        and activity timestamp are maintained on insert, and rows come back
+        in ``idx_conversations_user_activity`` order.
 
         Args:
             user_id (str): The UUID string of the owner.
+            limit (int | None): Maximum rows to return, or None for all.
+            after (tuple[datetime, uuid.UUID] | None): Keyset
+                ``(last_activity_at, id)`` of the previous page's last row.
 
         Returns:
             list[dict[str, object]]: Normalized sidebar rows ordered by the
             latest conversation activity.
         """
         logger.info(f"Listing conversations for user {user_id}")
-
-        latest_msg_sub = (
-            select(
-                Message.conversation_id,
-                Message.content.label("last_message"),
-                func.row_number().over(
-                    partition_by=Message.conversation_id,
-                    order_by=(Message.created_at.desc(), Message.id.desc()),
-                ).label("rn"),
-            )
-            .subquery()
-        )
-
-        activity_sub = (
-            select(
-                Message.conversation_id,
-                func.max(Message.created_at).label("last_activity_at"),
-                func.count(Message.id).label("message_count"),
-            )
-            .group_by(Message.conversation_id)
-            .subquery()
-        )
-
-        last_activity_expr = func.coalesce(
-            activity_sub.c.last_activity_at,
-            Conversation.created_at,
-        )
-
-        result = await self.session.execute(
+        query = (
             select(
                 Conversation.id,
                 Conversation.title,
                 Conversation.provider,
                 Conversation.model,
                 Conversation.created_at,
-                last_activity_expr.label("updated_at"),
-                latest_msg_sub.c.last_message,
-                func.coalesce(activity_sub.c.message_count, 0).label("message_count"),
+                Conversation.last_activity_at,
+                Conversation.last_message_preview,
+                Conversation.message_count,
             )
-            .outerjoin(
-                latest_msg_sub,
-                (Conversation.id == latest_msg_sub.c.conversation_id)
-                & (latest_msg_sub.c.rn == 1),
-            )
-            .outerjoin(activity_sub, Conversation.id == activity_sub.c.conversation_id)
             .where(Conversation.user_id == uuid.UUID(user_id))
-            .order_by(last_activity_expr.desc(), Conversation.created_at.desc())
+            .order_by(Conversation.last_activity_at.desc(), Conversation.id.desc())
         )
+        if after is not None:
+            query = query.where(
+                tuple_(Conversation.last_activity_at, Conversation.id) < tuple_(*after)
+            )
+        if limit is not None:
+            query = query.limit(limit)
+        result = await self.session.execute(query)
 
         rows = [
             {
@@ -153,9 +224,9 @@ class ConversationRepository:
                 "title": row.title,
                 "provider": row.provider,
                 "model": row.model,
-                "last_message": row.last_message,
+                "last_message": row.last_message_preview,
                 "created_at": row.created_at,
-                "updated_at": row.updated_at,
+                "updated_at": row.last_activity_at,
                 "message_count": int(row.message_count or 0),
             }
             for row in result.all()
@@ -163,31 +234,77 @@ class ConversationRepository:
         logger.info(f"Retrieved {len(rows)} conversations for user {user_id}")
         return rows
 
-    async def add_message(
-        self, conversation_id: uuid.UUID, role: str, content: str
-    ) -> Message:
-        """Inserts a new message into a conversation.
+    async def commit_turn(self, turn: ConversationTurn) -> list[Message]:
+        """Flush a turn's staged messages, alarms and activity bump at once.
 
         Args:
-            conversation_id (uuid.UUID): The UUID of the parent conversation.
-            role (str): The speaker role ('user', 'assistant', or 'system').
-            content (str): The message content.
+            turn (ConversationTurn): The staged writes.
 
         Returns:
-            Message: The newly created Message model.
+            list[Message]: The inserted messages in staging order.
         """
-        logger.info(f"Adding {role} message to conversation {conversation_id}")
-        msg = Message(conversation_id=conversation_id, role=role, content=content)
-        self.session.add(msg)
-        await self.session.execute(
-            update(Conversation)
-            .where(Conversation.id == conversation_id)
-            .values(updated_at=func.now())
+        return await self.commit_turns([turn])
+
+    async def commit_turns(self, turns: list[ConversationTurn]) -> list[Message]:
+        """Flush staged writes for one or more turns in a single transaction.
+
+        Messages are inserted in one multi-row ``INSERT ... RETURNING`` so
+        generated columns come back without a refresh round-trip, and each
+        conversation's activity timestamps, message/token counters and
+        last-message preview are updated in the same transaction. Rows are
+        dated with their turn's submission time (turns not yet stamped are
+        stamped now), and ``last_activity_at`` only moves forward, so a turn
+        flushed late cannot reorder a conversation. Listeners are notified of
+        new alarms when the transaction commits.
+
+        Args:
+            turns (list[ConversationTurn]): Staged writes, oldest first.
+
+        Returns:
+            list[Message]: The inserted messages in staging order.
+        """
+        for turn in turns:
+            if turn.created_at is None:
+                turn.stamp()
+        message_rows = [row for turn in turns for row in turn.messages]
+        alarm_rows = [row for turn in turns for row in turn.alarms]
+        logger.info(
+            f"Committing {len(turns)} turns: {len(message_rows)} messages, {len(alarm_rows)} alarms"
         )
+        messages: list[Message] = []
+        if message_rows:
+            result = await self.session.scalars(
+                insert(Message).returning(Message, sort_by_parameter_order=True), message_rows
+            )
+            messages = list(result.all())
+        if alarm_rows:
+            alarm_ids = await self.session.scalars(insert(Alarm).returning(Alarm.id), alarm_rows)
+            await notify_alarms(self.session, list(alarm_ids.all()))
+
+        # conversation_id -> (messages added, tokens added, latest content, latest time)
+        totals: dict[uuid.UUID, tuple[int, int, str, datetime]] = {}
+        for row in message_rows:
+            count, tokens, _, latest_at = totals.get(row["conversation_id"], (0, 0, "", row["created_at"]))
+            totals[row["conversation_id"]] = (
+                count + 1,
+                tokens + int(row["token_count"] or 0),
+                str(row["content"]),
+                max(latest_at, row["created_at"]),
+            )
+        for conversation_id, (count, tokens, latest, latest_at) in totals.items():
+            await self.session.execute(
+                update(Conversation)
+                .where(Conversation.id == conversation_id)
+                .values(
+                    updated_at=func.now(),
+                    last_activity_at=func.greatest(Conversation.last_activity_at, latest_at),
+                    message_count=Conversation.message_count + count,
+                    tokens_used=Conversation.tokens_used + tokens,
+                    last_message_preview=latest[:LAST_MESSAGE_PREVIEW_LENGTH],
+                )
+            )
         await self.session.commit()
-        await self.session.refresh(msg)
-        logger.info(f"Message added: {msg.id}")
-        return msg
+        return messages
 
     async def delete_conversation(self, conversation_id: str, user_id: str) -> bool:
         """Deletes a conversation and all associated messages.
@@ -228,43 +345,62 @@ class ConversationRepository:
         result = await self.session.execute(
             select(Message)
             .where(Message.conversation_id == conversation_id)
-            .order_by(Message.created_at)
+            .order_by(Message.created_at, Message.display_id)
         )
         messages = list(result.scalars().all())
         logger.info(f"Found {len(messages)} messages")
         return messages
 
+    async def get_messages_after(
+        self, conversation_id: uuid.UUID, after_display_id: int
+    ) -> list[Message]:
+        """Retrieves messages written after a known message, in insert order.
+
+        Args:
+            conversation_id (uuid.UUID): The UUID of the conversation.
+            after_display_id (int): ``display_id`` of the newest message the
+                caller already has.
+
+        Returns:
+            list[Message]: Newer messages ordered by ``display_id``.
+        """
+        result = await self.session.execute(
+            select(Message)
+            .where(
+                Message.conversation_id == conversation_id,
+                Message.display_id > after_display_id,
+            )
+            .order_by(Message.display_id)
+        )
+        messages = list(result.scalars().all())
+        logger.info(f"Found {len(messages)} new messages for conversation {conversation_id}")
+        return messages
+
     async def get_historic_chat_page(
         self,
         limit: int,
-        offset: int,
-    ) -> tuple[int, list[dict[str, object]]]:
-        """Return a paginated page of persisted conversations across all users.
+        offset: int = 0,
+        after: tuple[datetime, uuid.UUID] | None = None,
+    ) -> list[dict[str, object]]:
+        """Return a page of persisted conversations across all users.
 
-        Conversations are ordered by most recent activity, where activity is
-        defined as the latest message timestamp or the conversation creation
-        time when no messages exist yet.
+        Conversations are ordered by most recent activity using the
+        maintained ``last_activity_at`` column, with the id as a tie-breaker,
+        so pages are read from ``idx_conversations_last_activity``. Pass the
+        last row's ``(last_activity_at, conversation_id)`` as ``after`` for
+        keyset pagination; ``offset`` is kept for compatibility.
 
         Args:
             limit (int): Maximum number of conversations to return.
-            offset (int): Number of conversations to skip.
+            offset (int): Number of conversations to skip when no keyset is given.
+            after (tuple[datetime, uuid.UUID] | None): Keyset of the last row
+                of the previous page.
 
         Returns:
-            tuple[int, list[dict[str, object]]]: Total conversation count and
-            a page of normalized conversation metadata rows.
+            list[dict[str, object]]: A page of normalized conversation rows.
         """
-        logger.info("Fetching historic chat page limit=%s offset=%s", limit, offset)
-        total_result = await self.session.execute(
-            select(func.count()).select_from(Conversation)
-        )
-        total = int(total_result.scalar_one() or 0)
-
-        last_activity_expr = func.coalesce(
-            func.max(Message.created_at),
-            Conversation.created_at,
-        )
-
-        result = await self.session.execute(
+        logger.info("Fetching historic chat page limit=%s offset=%s after=%s", limit, offset, after)
+        query = (
             select(
                 Conversation.id,
                 Conversation.title,
@@ -273,24 +409,20 @@ class ConversationRepository:
                 Conversation.provider,
                 Conversation.model,
                 Conversation.created_at,
-                last_activity_expr.label("last_activity_at"),
-                func.count(Message.id).label("message_count"),
+                Conversation.last_activity_at,
+                Conversation.message_count,
             )
             .join(User, Conversation.user_id == User.id)
-            .outerjoin(Message, Message.conversation_id == Conversation.id)
-            .group_by(
-                Conversation.id,
-                Conversation.title,
-                Conversation.user_id,
-                User.email,
-                Conversation.provider,
-                Conversation.model,
-                Conversation.created_at,
-            )
-            .order_by(last_activity_expr.desc(), Conversation.created_at.desc())
+            .order_by(Conversation.last_activity_at.desc(), Conversation.id.desc())
             .limit(limit)
-            .offset(offset)
         )
+        if after is not None:
+            query = query.where(
+                tuple_(Conversation.last_activity_at, Conversation.id) < tuple_(*after)
+            )
+        else:
+            query = query.offset(offset)
+        result = await self.session.execute(query)
 
         rows = []
         for row in result.all():
@@ -309,7 +441,7 @@ class ConversationRepository:
             )
 
         logger.info("Historic chat page returned %s conversations", len(rows))
-        return total, rows
+        return rows
 
     async def get_messages_for_conversations(
         self,
@@ -330,33 +462,246 @@ class ConversationRepository:
         result = await self.session.execute(
             select(Message)
             .where(Message.conversation_id.in_(conversation_ids))
-            .order_by(Message.conversation_id, Message.created_at)
+            .order_by(Message.conversation_id, Message.created_at, Message.display_id)
         )
         messages = list(result.scalars().all())
         logger.info("Found %s historic messages", len(messages))
         return messages
 
+    async def stream_historic_chat_export(
+        self,
+        limit: int,
+        after: tuple[datetime, uuid.UUID] | None = None,
+        max_messages: int | None = None,
+        max_chars: int | None = None,
+    ) -> AsyncIterator[Row]:
+        """Stream conversations with their messages for a transcript export.
+
+        Rows are fetched through a server-side cursor, so memory stays flat
+        however many messages are exported. Each row pairs a conversation
+        with one of its messages (message columns are NULL for an empty
+        conversation), ordered by conversation activity like the dashboard
+        and then chronologically within each conversation.
+
+        Args:
+            limit (int): Maximum number of conversations.
+            after (tuple[datetime, uuid.UUID] | None): Keyset
+                ``(last_activity_at, id)`` to resume after.
+            max_messages (int | None): Keep only each conversation's most
+                recent N messages.
+            max_chars (int | None): Truncate message content in the database
+                to this many characters.
+
+        Yields:
+            Row: Joined conversation and message columns, plus
+            ``content_truncated``.
+        """
+        logger.info(
+            "Streaming historic chat export limit=%s after=%s max_messages=%s max_chars=%s",
+            limit,
+            after,
+            max_messages,
+            max_chars,
+        )
+        page_query = (
+            select(
+                Conversation.id,
+                Conversation.title,
+                Conversation.user_id,
+                User.email,
+                Conversation.provider,
+                Conversation.model,
+                Conversation.created_at,
+                Conversation.last_activity_at,
+                Conversation.message_count,
+            )
+            .join(User, Conversation.user_id == User.id)
+            .order_by(Conversation.last_activity_at.desc(), Conversation.id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            page_query = page_query.where(
+                tuple_(Conversation.last_activity_at, Conversation.id) < tuple_(*after)
+            )
+        page = page_query.cte("export_page")
+
+        if max_chars is None:
+            content = Message.content
+            content_truncated = literal(False)
+        else:
+            content = func.substr(Message.content, 1, max_chars)
+            content_truncated = func.length(Message.content) > max_chars
+        messages = (
+            select(
+                Message.id,
+                Message.conversation_id,
+                Message.role,
+                content.label("content"),
+                content_truncated.label("content_truncated"),
+                Message.created_at,
+                Message.display_id,
+                func.row_number()
+                .over(
+                    partition_by=Message.conversation_id,
+                    order_by=(Message.created_at.desc(), Message.display_id.desc()),
+                )
+                .label("recency"),
+            )
+            .where(Message.conversation_id.in_(select(page.c.id)))
+            .subquery("export_messages")
+        )
+        join_on = messages.c.conversation_id == page.c.id
+        if max_messages is not None:
+            join_on = and_(join_on, messages.c.recency <= max_messages)
+
+        query = (
+            select(
+                page.c.id.label("conversation_id"),
+                page.c.title,
+                page.c.user_id,
+                page.c.email.label("user_email"),
+                page.c.provider,
+                page.c.model,
+                page.c.created_at,
+                page.c.last_activity_at,
+                page.c.message_count,
+                messages.c.id.label("message_id"),
+                messages.c.role,
+                messages.c.content,
+                messages.c.content_truncated,
+                messages.c.created_at.label("message_created_at"),
+            )
+            .select_from(page.outerjoin(messages, join_on))
+            .order_by(
+                page.c.last_activity_at.desc(),
+                page.c.id.desc(),
+                messages.c.created_at,
+                messages.c.display_id,
+            )
+            .execution_options(yield_per=_EXPORT_FETCH_SIZE)
+        )
+        result = await self.session.stream(query)
+        async for row in result:
+            yield row
+
+    async def stream_audit_conversations(
+        self,
+        user_id: uuid.UUID | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> AsyncIterator[Row]:
+        """Stream conversations active within a time range for an audit export.
+
+        A conversation is included when its lifetime overlaps the range, i.e.
+        it was created before ``created_to`` and last active at or after
+        ``created_from``. Rows come from a server-side cursor, oldest first.
+
+        Args:
+            user_id (uuid.UUID | None): Only this user's conversations.
+            created_from (datetime | None): Inclusive lower time bound.
+            created_to (datetime | None): Exclusive upper time bound.
+
+        Yields:
+            Row: Conversation columns plus ``user_email``.
+        """
+        query = (
+            select(
+                Conversation.id,
+                Conversation.title,
+                Conversation.user_id,
+                User.email.label("user_email"),
+                Conversation.provider,
+                Conversation.model,
+                Conversation.message_count,
+                Conversation.created_at,
+                Conversation.last_activity_at,
+            )
+            .join(User, Conversation.user_id == User.id)
+            .order_by(Conversation.created_at, Conversation.id)
+        )
+        if user_id is not None:
+            query = query.where(Conversation.user_id == user_id)
+        if created_from is not None:
+            query = query.where(Conversation.last_activity_at >= created_from)
+        if created_to is not None:
+            query = query.where(Conversation.created_at < created_to)
+        result = await self.session.stream(query.execution_options(yield_per=_EXPORT_FETCH_SIZE))
+        async for row in result:
+            yield row
+
+    async def stream_audit_messages(
+        self,
+        user_id: uuid.UUID | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> AsyncIterator[Row]:
+        """Stream messages written within a time range for an audit export.
+
+        Rows come from a server-side cursor in write order (``display_id``).
+
+        Args:
+            user_id (uuid.UUID | None): Only messages in this user's
+                conversations.
+            created_from (datetime | None): Inclusive lower time bound.
+            created_to (datetime | None): Exclusive upper time bound.
+
+        Yields:
+            Row: Message columns.
+        """
+        query = select(
+            Message.id,
+            Message.conversation_id,
+            Message.role,
+            Message.content,
+            Message.token_count,
+            Message.created_at,
+        ).order_by(Message.display_id)
+        if user_id is not None:
+            query = query.join(Conversation, Message.conversation_id == Conversation.id).where(
+                Conversation.user_id == user_id
+            )
+        if created_from is not None:
+            query = query.where(Message.created_at >= created_from)
+        if created_to is not None:
+            query = query.where(Message.created_at < created_to)
+        result = await self.session.stream(query.execution_options(yield_per=_EXPORT_FETCH_SIZE))
+        async for row in result:
+            yield row
+
     async def get_historic_chat_summary(self) -> dict[str, int]:
-        """Return top-line counts for the security historic chat dashboard."""
+        """Return top-line counts for the security historic chat dashboard.
+
+        All four counters come back in one round trip. The message total is
+        summed from the maintained ``message_count`` column rather than
+        counted over the messages table.
+
+        Returns:
+            dict[str, int]: ``total_histories``, ``total_messages``,
+            ``recent_activity`` (messages in the last 24 hours) and
+            ``unique_users``.
+        """
         logger.info("Fetching historic chat dashboard summary")
         day_ago = datetime.now(timezone.utc) - timedelta(days=1)
 
-        total_histories_result = await self.session.execute(
-            select(func.count()).select_from(Conversation)
+        recent_activity = (
+            select(func.count())
+            .select_from(Message)
+            .where(Message.created_at >= day_ago)
+            .scalar_subquery()
         )
-        total_messages_result = await self.session.execute(
-            select(func.count()).select_from(Message)
-        )
-        recent_activity_result = await self.session.execute(
-            select(func.count()).select_from(Message).where(Message.created_at >= day_ago)
-        )
-        unique_users_result = await self.session.execute(
-            select(func.count(func.distinct(Conversation.user_id))).select_from(Conversation)
+        result = await self.session.execute(
+            select(
+                func.count().label("total_histories"),
+                func.coalesce(func.sum(Conversation.message_count), 0).label("total_messages"),
+                recent_activity.label("recent_activity"),
+                func.count(func.distinct(Conversation.user_id)).label("unique_users"),
+            ).select_from(Conversation)
         )
+        row = result.one()
 
         return {
-            "total_histories": int(total_histories_result.scalar_one() or 0),
-            "total_messages": int(total_messages_result.scalar_one() or 0),
-            "recent_activity": int(recent_activity_result.scalar_one() or 0),
-            "unique_users": int(unique_users_result.scalar_one() or 0),
+            "total_histories": int(row.total_histories or 0),
+            "total_messages": int(row.total_messages or 0),
+            "recent_activity": int(row.recent_activity or 0),
+            "unique_users": int(row.unique_users or 0),
         }
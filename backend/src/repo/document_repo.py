@@ -72,6 +72,7 @@ class DocumentRepository:
         allowed_roles: list[str] | None = None,
         status: str | None = None,
         chroma_doc_id: str | None = None,
+        chunk_count: int | None = None,
     ) -> Document | None:
         """Partially update a document record."""
         doc = await self.get_by_id(doc_id)
@@ -87,6 +88,8 @@ class DocumentRepository:
             doc.status = status
         if chroma_doc_id is not None:
             doc.chroma_doc_id = chroma_doc_id
+        if chunk_count is not None:
+            doc.chunk_count = chunk_count
         await self.session.commit()
         await self.session.refresh(doc)
         logger.info(f"Updated document {doc_id}")
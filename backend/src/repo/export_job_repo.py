@@ -0,0 +1,103 @@
+"""Repository layer for background audit export jobs."""
+import uuid
+from datetime import datetime, timezone
+from sqlalchemy import delete, select
+
+from src.models.export_job_model import ExportJob, ExportJobChunk
+from src.repo.job_repo import JobRepository
+from src.core.logger import get_logger
+
+logger = get_logger("EXPORT_JOB_REPOSITORY")
+
+
+class ExportJobRepository(JobRepository[ExportJob]):
+    """Handles persistence, claiming, progress and file storage of export jobs."""
+
+    model = ExportJob
+
+    async def create(
+        self,
+        requested_by: str,
+        user_id: uuid.UUID | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> ExportJob:
+        """Insert a queued export job for the given filters."""
+        job = ExportJob(
+            requested_by=uuid.UUID(requested_by),
+            status="queued",
+            user_id=user_id,
+            created_from=created_from,
+            created_to=created_to,
+            conversations_exported=0,
+            messages_exported=0,
+            alarms_exported=0,
+        )
+        self.session.add(job)
+        await self.session.commit()
+        await self.session.refresh(job)
+        logger.info(f"Queued export job {job.id} requested by {requested_by}")
+        return job
+
+    async def get(self, job_id: uuid.UUID) -> ExportJob | None:
+        """Fetch an export job by id, if it exists."""
+        result = await self.session.execute(select(ExportJob).where(ExportJob.id == job_id))
+        return result.scalars().first()
+
+    async def list_recent(self, limit: int) -> list[ExportJob]:
+        """Return the most recently requested export jobs, newest first."""
+        result = await self.session.execute(
+            select(ExportJob).order_by(ExportJob.created_at.desc(), ExportJob.id.desc()).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def _prepare_run(self, job: ExportJob) -> None:
+        """Restart the export from scratch, dropping any partial file."""
+        job.conversations_exported = 0
+        job.messages_exported = 0
+        job.alarms_exported = 0
+        job.file_size = None
+        await self._delete_chunks(job.id)
+
+    async def _delete_chunks(self, job_id: uuid.UUID) -> None:
+        """Delete the stored file slices of an export in the open transaction."""
+        await self.session.execute(delete(ExportJobChunk).where(ExportJobChunk.job_id == job_id))
+
+    def add_chunk(self, job: ExportJob, seq: int, data: bytes) -> None:
+        """Stage the next slice of a job's file; it commits with the next progress update."""
+        self.session.add(ExportJobChunk(job_id=job.id, seq=seq, data=data))
+
+    async def get_chunk(self, job_id: uuid.UUID, seq: int) -> bytes | None:
+        """Return one slice of a stored export file, or None past its end."""
+        result = await self.session.execute(
+            select(ExportJobChunk.data).where(ExportJobChunk.job_id == job_id, ExportJobChunk.seq == seq)
+        )
+        return result.scalars().first()
+
+    async def update_progress(self, job: ExportJob, conversations: int, messages: int, alarms: int) -> None:
+        """Record how many records a running job has written so far.
+
+        Also serves as the job's heartbeat.
+        """
+        job.conversations_exported = conversations
+        job.messages_exported = messages
+        job.alarms_exported = alarms
+        await self.heartbeat(job)
+
+    async def complete(self, job: ExportJob, file_size: int) -> None:
+        """Mark a job completed with the size of its stored file."""
+        job.status = "completed"
+        job.file_size = file_size
+        job.error = None
+        job.completed_at = datetime.now(timezone.utc)
+        await self.session.commit()
+        logger.info(f"Completed export job {job.id} ({file_size} bytes)")
+
+    async def fail(self, job: ExportJob, error: str) -> None:
+        """Mark a job failed with a human-readable reason and drop its partial file."""
+        job.status = "failed"
+        job.error = error
+        job.completed_at = datetime.now(timezone.utc)
+        await self._delete_chunks(job.id)
+        await self.session.commit()
+        logger.info(f"Export job {job.id} failed: {error}")
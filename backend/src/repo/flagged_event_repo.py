@@ -1,6 +1,9 @@
 """Repository layer for moderation alarm event persistence."""
 import uuid
+from collections.abc import AsyncIterator
+from datetime import datetime
 
+from sqlalchemy import Row, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -10,6 +13,28 @@ from src.core.logger import get_logger
 
 logger = get_logger("ALARM_REPOSITORY")
 
+# Postgres NOTIFY channel carrying the ids of newly committed alarms.
+ALARM_NOTIFY_CHANNEL = "alarm_events"
+# Rows fetched per round trip when streaming alarms for an audit export.
+_EXPORT_FETCH_SIZE = 500
+# NOTIFY payloads are capped at 8000 bytes; a UUID plus separator is 37.
+_NOTIFY_IDS_PER_PAYLOAD = 200
+
+
+async def notify_alarms(session: AsyncSession, alarm_ids: list[uuid.UUID]) -> None:
+    """Queue a NOTIFY announcing new alarms in the session's transaction.
+
+    Postgres delivers the notification only when the transaction commits,
+    so listeners never hear about alarms that were rolled back.
+
+    Args:
+        session (AsyncSession): Session whose transaction inserted the alarms.
+        alarm_ids (list[uuid.UUID]): Ids of the inserted alarms.
+    """
+    for start in range(0, len(alarm_ids), _NOTIFY_IDS_PER_PAYLOAD):
+        payload = ",".join(str(alarm_id) for alarm_id in alarm_ids[start:start + _NOTIFY_IDS_PER_PAYLOAD])
+        await session.execute(select(func.pg_notify(ALARM_NOTIFY_CHANNEL, payload)))
+
 
 class FlaggedEventRepository:
     """Repository handling persistence of moderation alarm events.
@@ -21,42 +46,6 @@ class FlaggedEventRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    async def log_event(
-        self,
-        user_id: str,
-        conversation_id: str,
-        message_content: str,
-        filter_type: str,
-        provider: str,
-    ) -> Alarm:
-        """Inserts a new alarm record into the database.
-
-        Args:
-            user_id (str): UUID string of the user who sent the message.
-            conversation_id (str): UUID string of the conversation.
-            message_content (str): The exact flagged user message.
-            filter_type (str): 'keyword' or 'provider'.
-            provider (str): The AI provider name.
-
-        Returns:
-            Alarm: The newly created record.
-        """
-        logger.info(
-            f"Logging alarm: filter_type={filter_type} provider={provider} "
-            f"user={user_id} conversation={conversation_id}"
-        )
-        event = Alarm(
-            user_id=uuid.UUID(user_id),
-            conversation_id=uuid.UUID(conversation_id),
-            message_content=message_content,
-            filter_type=filter_type,
-            provider=provider,
-        )
-        self.session.add(event)
-        await self.session.commit()
-        await self.session.refresh(event)
-        return event
-
     async def get_all_events(self) -> list[Alarm]:
         """Returns all alarm events ordered by creation time."""
         result = await self.session.execute(
@@ -64,28 +53,134 @@ class FlaggedEventRepository:
         )
         return list(result.scalars().all())
 
-    async def get_dashboard_events(self) -> list[dict[str, object]]:
-        """Return alarm rows joined with user email for the live security dashboard."""
+    async def get_dashboard_events_by_ids(self, alarm_ids: list[uuid.UUID]) -> list[dict[str, object]]:
+        """Return specific alarm rows joined with user email, oldest first.
+
+        Args:
+            alarm_ids (list[uuid.UUID]): Ids of the alarms to load.
+
+        Returns:
+            list[dict[str, object]]: Normalized alarm rows that still exist.
+        """
         result = await self.session.execute(
             select(Alarm, User.email)
             .join(User, Alarm.user_id == User.id)
-            .order_by(Alarm.created_at.desc())
+            .where(Alarm.id.in_(alarm_ids))
+            .order_by(Alarm.created_at.asc(), Alarm.id.asc())
         )
+        return [_dashboard_row(alarm, user_email) for alarm, user_email in result.all()]
 
-        rows: list[dict[str, object]] = []
-        for alarm, user_email in result.all():
-            rows.append(
-                {
-                    "id": alarm.id,
-                    "user_id": alarm.user_id,
-                    "user_email": user_email,
-                    "conversation_id": alarm.conversation_id,
-                    "message_content": alarm.message_content,
-                    "filter_type": alarm.filter_type,
-                    "provider": alarm.provider,
-                    "reason": alarm.reason,
-                    "created_at": alarm.created_at,
-                }
+    async def get_dashboard_events(
+        self,
+        limit: int,
+        before: tuple[datetime, uuid.UUID] | None = None,
+        since: tuple[datetime, uuid.UUID] | None = None,
+        filter_type: str | None = None,
+        provider: str | None = None,
+        user_id: uuid.UUID | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+    ) -> list[dict[str, object]]:
+        """Return a page of alarm rows joined with user email for the security feed.
+
+        Rows are keyed by ``(created_at, id)``. By default the page is the
+        newest alarms, or those older than ``before``, newest first. With
+        ``since`` it is instead the oldest alarms newer than that key, oldest
+        first, so a live client can catch up without skipping rows.
+
+        Args:
+            limit (int): Maximum rows to return.
+            before (tuple[datetime, uuid.UUID] | None): Keyset of the previous
+                page's last row.
+            since (tuple[datetime, uuid.UUID] | None): Keyset of the newest
+                row the client already has.
+            filter_type (str | None): Only alarms from this moderation layer.
+            provider (str | None): Only alarms for this AI provider.
+            user_id (uuid.UUID | None): Only alarms raised by this user.
+            created_after (datetime | None): Inclusive lower time bound.
+            created_before (datetime | None): Exclusive upper time bound.
+
+        Returns:
+            list[dict[str, object]]: Normalized alarm rows.
+        """
+        keyset = tuple_(Alarm.created_at, Alarm.id)
+        query = select(Alarm, User.email).join(User, Alarm.user_id == User.id)
+        if filter_type is not None:
+            query = query.where(Alarm.filter_type == filter_type)
+        if provider is not None:
+            query = query.where(Alarm.provider == provider)
+        if user_id is not None:
+            query = query.where(Alarm.user_id == user_id)
+        if created_after is not None:
+            query = query.where(Alarm.created_at >= created_after)
+        if created_before is not None:
+            query = query.where(Alarm.created_at < created_before)
+        if since is not None:
+            query = query.where(keyset > tuple_(*since)).order_by(
+                Alarm.created_at.asc(), Alarm.id.asc()
             )
+        else:
+            if before is not None:
+                query = query.where(keyset < tuple_(*before))
+            query = query.order_by(Alarm.created_at.desc(), Alarm.id.desc())
+        result = await self.session.execute(query.limit(limit))
+
+        return [_dashboard_row(alarm, user_email) for alarm, user_email in result.all()]
+
+    async def stream_audit_events(
+        self,
+        user_id: uuid.UUID | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> AsyncIterator[Row]:
+        """Stream alarms raised within a time range for an audit export.
+
+        Rows come from a server-side cursor, oldest first.
+
+        Args:
+            user_id (uuid.UUID | None): Only alarms raised by this user.
+            created_from (datetime | None): Inclusive lower time bound.
+            created_to (datetime | None): Exclusive upper time bound.
+
+        Yields:
+            Row: Alarm columns plus ``user_email``.
+        """
+        query = (
+            select(
+                Alarm.id,
+                Alarm.user_id,
+                User.email.label("user_email"),
+                Alarm.conversation_id,
+                Alarm.message_content,
+                Alarm.filter_type,
+                Alarm.provider,
+                Alarm.reason,
+                Alarm.created_at,
+            )
+            .join(User, Alarm.user_id == User.id)
+            .order_by(Alarm.created_at, Alarm.id)
+        )
+        if user_id is not None:
+            query = query.where(Alarm.user_id == user_id)
+        if created_from is not None:
+            query = query.where(Alarm.created_at >= created_from)
+        if created_to is not None:
+            query = query.where(Alarm.created_at < created_to)
+        result = await self.session.stream(query.execution_options(yield_per=_EXPORT_FETCH_SIZE))
+        async for row in result:
+            yield row
+
 
-        return rows
+def _dashboard_row(alarm: Alarm, user_email: str) -> dict[str, object]:
+    """Normalize an alarm and its user's email into a dashboard row."""
+    return {
+        "id": alarm.id,
+        "user_id": alarm.user_id,
+        "user_email": user_email,
+        "conversation_id": alarm.conversation_id,
+        "message_content": alarm.message_content,
+        "filter_type": alarm.filter_type,
+        "provider": alarm.provider,
+        "reason": alarm.reason,
+        "created_at": alarm.created_at,
+    }
@@ -0,0 +1,92 @@
+"""Repository layer for the durable document ingestion job queue."""
+import uuid
+from datetime import datetime
+from sqlalchemy import select, update
+
+from src.models.ingestion_job_model import IngestionJob
+from src.repo.job_repo import JobRepository
+from src.core.logger import get_logger
+
+logger = get_logger("INGESTION_JOB_REPOSITORY")
+
+
+class IngestionJobRepository(JobRepository[IngestionJob]):
+    """Handles persistence and claiming of ingestion jobs."""
+
+    model = IngestionJob
+
+    async def create(self, document_id: str, pdf_bytes: bytes) -> IngestionJob:
+        """Insert a queued ingestion job holding the uploaded PDF."""
+        job = IngestionJob(
+            document_id=uuid.UUID(document_id),
+            pdf_bytes=pdf_bytes,
+            status="queued",
+            attempts=0,
+        )
+        self.session.add(job)
+        await self.session.commit()
+        await self.session.refresh(job)
+        logger.info(f"Queued ingestion job {job.id} for document {document_id}")
+        return job
+
+    async def get_by_document_id(self, document_id: str) -> IngestionJob | None:
+        """Fetch the ingestion job for a document, if one exists."""
+        result = await self.session.execute(
+            select(IngestionJob).where(IngestionJob.document_id == uuid.UUID(document_id))
+        )
+        return result.scalars().first()
+
+    async def _prepare_run(self, job: IngestionJob) -> None:
+        """Count the claim towards the job's attempt limit."""
+        job.attempts += 1
+
+    async def heartbeat(self, job: IngestionJob) -> None:
+        """Refresh a running job's ``updated_at``.
+
+        A failed beat is rolled back, as the job must still be completed
+        or failed on this session once indexing ends.
+        """
+        try:
+            await super().heartbeat(job)
+        except Exception:
+            await self.session.rollback()
+            await self.session.refresh(job)
+            raise
+
+    async def complete(self, job: IngestionJob) -> None:
+        """Mark a job completed and release its stored PDF bytes."""
+        job.status = "completed"
+        job.pdf_bytes = None
+        job.error = None
+        await self.session.commit()
+        logger.info(f"Completed ingestion job {job.id}")
+
+    async def fail(self, job: IngestionJob, error: str) -> None:
+        """Mark a job failed with a human-readable reason."""
+        job.status = "failed"
+        job.pdf_bytes = None
+        job.error = error
+        await self.session.commit()
+        logger.info(f"Ingestion job {job.id} failed: {error}")
+
+    async def fail_orphaned(self, job: IngestionJob, error: str) -> None:
+        """Mark a job failed after its document was deleted.
+
+        Deleting a document normally cascades to its job, so unlike
+        :meth:`fail` this tolerates the row already being gone.
+        """
+        await self.session.execute(
+            update(IngestionJob)
+            .where(IngestionJob.id == job.id)
+            .values(status="failed", pdf_bytes=None, error=error)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        logger.info(f"Ingestion job {job.id} failed: {error}")
+
+    async def requeue_recoverable(self, stale_before: datetime, max_attempts: int) -> list[str]:
+        """Return IDs of jobs a restarted worker pool should pick up.
+
+        Stale running jobs that have exhausted ``max_attempts`` stay put.
+        """
+        return await super().requeue_recoverable(stale_before, IngestionJob.attempts < max_attempts)
@@ -0,0 +1,99 @@
+"""Claiming and recovery shared by the durable background job tables."""
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import ColumnElement, and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+JobT = TypeVar("JobT")
+
+
+class JobRepository(Generic[JobT]):
+    """Base repository for a job table with ``status`` and ``updated_at`` columns.
+
+    Subclasses set :attr:`model` and extend :meth:`_prepare_run` with any
+    per-run reset of their own columns.
+
+    Attributes:
+        session (AsyncSession): The active async SQLAlchemy session.
+    """
+
+    model: Any
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def claim(self, job_id: str) -> JobT | None:
+        """Atomically move a queued job to running.
+
+        Row locking with ``SKIP LOCKED`` guarantees that only one worker,
+        across every backend replica, runs a given job.
+
+        Returns:
+            JobT | None: The claimed job, or None if it no longer exists or
+            another worker already claimed it.
+        """
+        result = await self.session.execute(
+            select(self.model)
+            .where(self.model.id == uuid.UUID(job_id), self.model.status == "queued")
+            .with_for_update(skip_locked=True)
+        )
+        job = result.scalars().first()
+        if job is None:
+            await self.session.rollback()
+            return None
+        job.status = "running"
+        await self._prepare_run(job)
+        await self.session.commit()
+        await self.session.refresh(job)
+        return job
+
+    async def _prepare_run(self, job: JobT) -> None:
+        """Reset per-run state on a job being claimed, before it is committed."""
+
+    async def heartbeat(self, job: JobT) -> None:
+        """Refresh a running job's ``updated_at`` so it is not treated as stale."""
+        job.updated_at = datetime.now(timezone.utc)
+        await self.session.commit()
+
+    async def release(self, job_id: uuid.UUID) -> None:
+        """Put a running job back in the queue, e.g. when its worker is stopped."""
+        await self.session.execute(
+            update(self.model)
+            .where(self.model.id == job_id, self.model.status == "running")
+            .values(status="queued")
+        )
+        await self.session.commit()
+
+    async def requeue_recoverable(self, stale_before: datetime, *conditions: ColumnElement[bool]) -> list[str]:
+        """Return IDs of jobs a restarted worker pool should pick up.
+
+        Queued jobs are always recoverable. Running jobs are heartbeated by
+        their worker, so one whose last update is older than ``stale_before``
+        belonged to a worker that died mid-job and is reset to queued.
+
+        Args:
+            stale_before (datetime): Heartbeat cutoff for running jobs.
+            *conditions (ColumnElement[bool]): Extra requirements a stale
+                running job must meet to be requeued.
+
+        Returns:
+            list[str]: IDs of the recoverable jobs, oldest first.
+        """
+        result = await self.session.execute(
+            select(self.model)
+            .where(
+                or_(
+                    self.model.status == "queued",
+                    and_(self.model.status == "running", self.model.updated_at < stale_before, *conditions),
+                )
+            )
+            .order_by(self.model.created_at)
+            .with_for_update(skip_locked=True)
+        )
+        jobs = list(result.scalars().all())
+        for job in jobs:
+            job.status = "queued"
+        await self.session.commit()
+        return [str(job.id) for job in jobs]
@@ -0,0 +1,101 @@
+"""Repository layer for database-managed moderation keywords."""
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.moderation_keyword_model import ModerationKeyword, ModerationKeywordVersion
+from src.core.logger import get_logger
+
+logger = get_logger("MODERATION_KEYWORD_REPOSITORY")
+
+_VERSION_ROW_ID = 1
+# Keeps each INSERT well under the Postgres bind-parameter limit.
+_INSERT_BATCH_SIZE = 1000
+
+
+class ModerationKeywordRepository:
+    """Handles keyword list persistence and its change version counter.
+
+    Every mutation bumps the version in the same transaction, so a reader
+    that sees a new version is guaranteed to see the matching keyword list.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_version(self) -> int | None:
+        """Return the current keyword list version, or None if never set."""
+        result = await self.session.execute(
+            select(ModerationKeywordVersion.version).where(
+                ModerationKeywordVersion.id == _VERSION_ROW_ID
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def list_keywords(self) -> list[str]:
+        """Return every stored keyword in alphabetical order."""
+        result = await self.session.execute(
+            select(ModerationKeyword.keyword).order_by(ModerationKeyword.keyword)
+        )
+        return list(result.scalars().all())
+
+    async def add_keywords(self, keywords: list[str]) -> list[str]:
+        """Insert keywords, ignoring ones that already exist.
+
+        Returns:
+            list[str]: The keywords that were newly inserted.
+        """
+        added: list[str] = []
+        for start in range(0, len(keywords), _INSERT_BATCH_SIZE):
+            batch = keywords[start:start + _INSERT_BATCH_SIZE]
+            result = await self.session.execute(
+                insert(ModerationKeyword)
+                .values([{"keyword": keyword} for keyword in batch])
+                .on_conflict_do_nothing(index_elements=[ModerationKeyword.keyword])
+                .returning(ModerationKeyword.keyword)
+            )
+            added.extend(result.scalars().all())
+        if added:
+            await self._bump_version()
+        await self.session.commit()
+        logger.info(f"Added {len(added)} moderation keywords")
+        return added
+
+    async def replace_keywords(self, keywords: list[str]) -> None:
+        """Atomically replace the whole keyword list."""
+        await self.session.execute(delete(ModerationKeyword))
+        for start in range(0, len(keywords), _INSERT_BATCH_SIZE):
+            batch = keywords[start:start + _INSERT_BATCH_SIZE]
+            await self.session.execute(
+                insert(ModerationKeyword).values([{"keyword": keyword} for keyword in batch])
+            )
+        await self._bump_version()
+        await self.session.commit()
+        logger.info(f"Replaced moderation keyword list with {len(keywords)} keywords")
+
+    async def remove_keyword(self, keyword: str) -> bool:
+        """Delete a keyword. Returns True if it existed."""
+        result = await self.session.execute(
+            delete(ModerationKeyword).where(ModerationKeyword.keyword == keyword)
+        )
+        if not result.rowcount:
+            await self.session.rollback()
+            return False
+        await self._bump_version()
+        await self.session.commit()
+        logger.info(f"Removed moderation keyword '{keyword}'")
+        return True
+
+    async def _bump_version(self) -> None:
+        """Increment the version counter, creating the row on first use."""
+        await self.session.execute(
+            insert(ModerationKeywordVersion)
+            .values(id=_VERSION_ROW_ID, version=1)
+            .on_conflict_do_update(
+                index_elements=[ModerationKeywordVersion.id],
+                set_={
+                    "version": ModerationKeywordVersion.version + 1,
+                    "updated_at": func.now(),
+                },
+            )
+        )
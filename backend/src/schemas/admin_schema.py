@@ -23,3 +23,16 @@ class AdminUserRoleUpdateRequest(BaseModel):
     """Request body for updating a user's role."""
 
     role: UserRoleLiteral = Field(description="The new role to assign to the user.")
+
+
+class ModerationKeywordListOut(BaseModel):
+    """Database-managed moderation keyword list and its version."""
+
+    version: int | None = Field(description="Keyword list version, bumped on every change.")
+    keywords: list[str] = Field(description="Lowercased keywords and phrases in alphabetical order.")
+
+
+class ModerationKeywordsRequest(BaseModel):
+    """Request body for adding or replacing moderation keywords."""
+
+    keywords: list[str] = Field(description="Keywords or phrases; case and surrounding whitespace are ignored.")
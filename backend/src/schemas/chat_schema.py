@@ -3,7 +3,9 @@
 Schemas act as the validation layer between external client requests
 and internal application services for the chat feature.
 """
+import uuid
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -35,6 +37,21 @@ class ConversationListItemResponse(BaseModel):
     message_count: int = Field(default=0, description="Number of persisted messages in the conversation.")
 
 
+class ConversationListQuery(BaseModel):
+    """Optional pagination controls for the conversation sidebar."""
+
+    limit: int | None = Field(
+        default=None,
+        ge=1,
+        le=200,
+        description="Maximum number of conversations to return. Omit to return all.",
+    )
+    cursor: str | None = Field(
+        default=None,
+        description="Opaque ``X-Next-Cursor`` value from a previous page.",
+    )
+
+
 class SendMessageRequest(BaseModel):
     """Schema for sending a message into a conversation."""
 
@@ -53,6 +70,10 @@ class HistoricChatDashboardQuery(BaseModel):
 
     limit: int = Field(default=10, ge=1, le=1000, description="Maximum number of histories to return.")
     offset: int = Field(default=0, ge=0, description="Number of histories to skip before returning results.")
+    cursor: str | None = Field(
+        default=None,
+        description="Opaque ``next_cursor`` from a previous page. Takes precedence over ``offset``.",
+    )
 
 
 class HistoricChatMessageResponse(BaseModel):
@@ -82,6 +103,65 @@ class HistoricChatHistoryItemResponse(BaseModel):
     )
 
 
+class HistoricChatExportQuery(BaseModel):
+    """Selection and truncation controls for the streaming transcript export."""
+
+    limit: int = Field(default=1000, ge=1, le=100_000, description="Maximum number of conversations to export.")
+    cursor: str | None = Field(
+        default=None,
+        description="Opaque ``next_cursor`` from a previous export's end record.",
+    )
+    max_messages_per_conversation: int | None = Field(
+        default=None,
+        ge=1,
+        description="Export only each conversation's most recent N messages. Omit for all.",
+    )
+    max_message_chars: int | None = Field(
+        default=None,
+        ge=1,
+        description="Truncate message content to this many characters. Omit for full content.",
+    )
+
+
+class HistoricChatExportConversationRecord(BaseModel):
+    """NDJSON export record opening one conversation's transcript."""
+
+    type: Literal["conversation"] = "conversation"
+    conversation_id: str = Field(description="The UUID of the conversation.")
+    title: str = Field(description="Human-readable conversation title.")
+    user_id: str = Field(description="The UUID of the user who owns the conversation.")
+    user_email: str = Field(description="The email of the user who owns the conversation.")
+    provider: str = Field(description="The AI provider assigned to the conversation.")
+    model: str = Field(description="The model assigned to the conversation.")
+    created_at: datetime = Field(description="When the conversation was created.")
+    last_activity_at: datetime = Field(description="Most recent message timestamp, or the creation time when empty.")
+    message_count: int = Field(description="Total number of persisted messages in the conversation.")
+    messages_truncated: bool = Field(description="Whether older messages were left out of the export.")
+
+
+class HistoricChatExportMessageRecord(BaseModel):
+    """NDJSON export record for one message, following its conversation record."""
+
+    type: Literal["message"] = "message"
+    conversation_id: str = Field(description="The UUID of the conversation.")
+    id: str = Field(description="The UUID of the persisted message.")
+    role: str = Field(description="The speaker role for this message.")
+    content: str = Field(description="The message content, possibly truncated.")
+    content_truncated: bool = Field(description="Whether the content was cut to ``max_message_chars``.")
+    created_at: datetime = Field(description="When this message was created.")
+
+
+class HistoricChatExportEndRecord(BaseModel):
+    """Final NDJSON export record."""
+
+    type: Literal["end"] = "end"
+    conversations: int = Field(description="Number of conversations exported.")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor to continue the export when ``limit`` was reached, otherwise null.",
+    )
+
+
 class HistoricChatDashboardSummaryResponse(BaseModel):
     """Summary cards displayed above the historic chat dashboard."""
 
@@ -101,11 +181,39 @@ class HistoricChatDashboardResponse(BaseModel):
     total: int = Field(description="Total number of conversation histories available.")
     limit: int = Field(description="Applied page size.")
     offset: int = Field(description="Applied offset.")
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the following page, or null on the last page.",
+    )
     summary: HistoricChatDashboardSummaryResponse = Field(
         description="Top-line historic chat dashboard statistics.",
     )
 
 
+class SecurityAlarmQuery(BaseModel):
+    """Pagination and filter controls for the security alarm feed."""
+
+    limit: int = Field(default=100, ge=1, le=1000, description="Maximum number of alarms to return.")
+    cursor: str | None = Field(
+        default=None,
+        description="Opaque ``X-Next-Cursor`` value; returns alarms older than that page.",
+    )
+    since: str | None = Field(
+        default=None,
+        description=(
+            "Opaque ``X-Latest-Cursor`` value; returns up to ``limit`` alarms newer than it, "
+            "plus up to ``limit`` from the few seconds before it that may have committed late, "
+            "so dedupe by id. "
+            "Takes precedence over ``cursor``."
+        ),
+    )
+    filter_type: str | None = Field(default=None, description="Only alarms from this moderation layer.")
+    provider: str | None = Field(default=None, description="Only alarms for this AI provider.")
+    user_id: uuid.UUID | None = Field(default=None, description="Only alarms raised by this user.")
+    created_after: datetime | None = Field(default=None, description="Only alarms created at or after this time.")
+    created_before: datetime | None = Field(default=None, description="Only alarms created before this time.")
+
+
 class SecurityAlarmEventResponse(BaseModel):
     """Schema representing a persisted moderation alarm event."""
 
@@ -118,3 +226,30 @@ class SecurityAlarmEventResponse(BaseModel):
     provider: str = Field(description="The AI provider assigned to the conversation.")
     reason: str | None = Field(default=None, description="Optional human-readable alarm reason.")
     created_at: datetime = Field(description="When the alarm record was created.")
+
+
+class SecurityExportRequest(BaseModel):
+    """Filters for a background audit export of conversations, messages and alarms."""
+
+    user_id: uuid.UUID | None = Field(default=None, description="Only export this user's data. Omit for all users.")
+    created_from: datetime | None = Field(default=None, description="Only records at or after this time.")
+    created_to: datetime | None = Field(default=None, description="Only records before this time.")
+
+
+class SecurityExportJobResponse(BaseModel):
+    """Status and progress of a background audit export."""
+
+    id: str = Field(description="The UUID of the export job.")
+    status: str = Field(description="Export status: queued, running, completed or failed.")
+    requested_by: str = Field(description="The UUID of the security user who requested the export.")
+    user_id: str | None = Field(default=None, description="User filter applied to the export, if any.")
+    created_from: datetime | None = Field(default=None, description="Inclusive lower time bound, if any.")
+    created_to: datetime | None = Field(default=None, description="Exclusive upper time bound, if any.")
+    conversations_exported: int = Field(description="Conversation records written so far.")
+    messages_exported: int = Field(description="Message records written so far.")
+    alarms_exported: int = Field(description="Alarm records written so far.")
+    file_size: int | None = Field(default=None, description="Size in bytes of the finished gzip file.")
+    error: str | None = Field(default=None, description="Failure reason for failed exports.")
+    created_at: datetime = Field(description="When the export was requested.")
+    updated_at: datetime = Field(description="When the export's status or progress last changed.")
+    completed_at: datetime | None = Field(default=None, description="When the export finished, if it has.")
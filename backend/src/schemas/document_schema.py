@@ -17,10 +17,11 @@ class DocumentOut(BaseModel):
     description: str = Field(description="Optional description.")
     filename: str = Field(description="Original PDF filename.")
     file_size: int = Field(description="File size in bytes.")
-    status: str = Field(description="Document status: active, processing, or archived.")
+    status: str = Field(description="Document status: active, processing, failed, or archived.")
     uploaded_by: str = Field(description="UUID of the user who uploaded the document.")
     allowed_roles: list[UserRoleLiteral] = Field(description="Roles permitted to access this document.")
     chroma_doc_id: str | None = Field(description="Corresponding ChromaDB doc_id, if indexed.")
+    chunk_count: int | None = Field(default=None, description="Number of indexed vector chunks, if known.")
     created_at: datetime = Field(description="Timestamp when the document was created.")
     updated_at: datetime = Field(description="Timestamp of the last update.")
 
@@ -37,3 +38,17 @@ class DocumentUpdateRequest(BaseModel):
     status: Literal["active", "archived", "processing"] | None = Field(
         default=None, description="Updated document status."
     )
+
+
+class IngestionStatusOut(BaseModel):
+    """Response schema for the background ingestion status of a document."""
+    document_id: str = Field(description="Document UUID.")
+    document_status: str = Field(description="Current document status.")
+    job_status: Literal["queued", "running", "completed", "failed"] | None = Field(
+        description="Ingestion job status, or null for documents ingested before background jobs existed."
+    )
+    attempts: int = Field(default=0, description="Number of times a worker has picked up the job.")
+    error: str | None = Field(default=None, description="Failure reason when the job failed.")
+    pages_processed: int | None = Field(default=None, description="Pages extracted so far while running.")
+    page_count: int | None = Field(default=None, description="Total pages in the PDF while running.")
+    chunks_stored: int | None = Field(default=None, description="Chunks written to the vector store so far.")
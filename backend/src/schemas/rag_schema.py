@@ -40,3 +40,13 @@ class EmbedResponse(BaseModel):
         description="Embedding vectors generated for each supplied text input."
     )
     model: str = Field(description="Embedding model identifier used to generate the vectors.")
+
+
+class EmbeddingCacheStatsResponse(BaseModel):
+    """Schema containing embedding cache counters used for sizing."""
+
+    hits: int = Field(description="Lookups served from the in-process cache.")
+    disk_hits: int = Field(description="Lookups served from the on-disk cache tier.")
+    misses: int = Field(description="Lookups that required running the embedding model.")
+    entries: int = Field(description="Vectors currently held in the in-process cache.")
+    max_entries: int = Field(description="Configured capacity of the in-process cache.")
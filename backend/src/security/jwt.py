@@ -14,6 +14,7 @@ from src.core.config import settings
 from src.core.database import get_db
 from src.core.logger import get_logger
 from src.models.user_model import ROLE_SECURITY
+from src.security.principal_cache import get_principal_cache
 
 logger = get_logger("SECURITY")
 
@@ -66,46 +67,73 @@ def decode_token(token: str) -> dict[str, Any]:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(_bearer_scheme),
-    db: AsyncSession = Depends(get_db),
-) -> str:
-    """Extracts and validates the authenticated user's ID from a Bearer token.
+@dataclass
+class AuthenticatedUser:
+    """Carries both the user ID and role extracted from a validated JWT."""
+    user_id: str
+    role: str
 
-    Decodes the JWT from the Authorization header, then confirms the user
-    still exists in the database before returning the user ID.
+
+async def _resolve_principal(token: str, db: AsyncSession) -> AuthenticatedUser:
+    """Validate a Bearer token and resolve the user's current role.
+
+    Recently verified users are served from the principal cache; otherwise
+    the user is confirmed to still exist in the database and then cached.
 
     Args:
-        credentials: The HTTP Bearer credentials from the Authorization header.
-        db: The async database session.
+        token (str): The encoded JWT from the Authorization header.
+        db (AsyncSession): The async database session.
 
     Returns:
-        str: The user ID (the 'sub' claim) extracted from the token payload.
+        AuthenticatedUser: Validated user_id and current role.
 
     Raises:
         HTTPException: 401 if the token is expired, invalid, or the user no longer exists.
     """
     from src.repo.user_repo import UserRepository
 
-    payload = decode_token(credentials.credentials)
+    payload = decode_token(token)
     user_id = payload.get("sub")
     if user_id is None:
         logger.warning("JWT payload missing 'sub' claim")
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
 
+    cache = get_principal_cache()
+    role = cache.get(user_id)
+    if role is not None:
+        return AuthenticatedUser(user_id=user_id, role=role)
+
     user = await UserRepository(db).get_by_id(user_id)
     if user is None:
         logger.warning(f"JWT references non-existent user {user_id}")
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
 
-    return user_id
+    cache.put(user_id, user.role)
+    return AuthenticatedUser(user_id=user_id, role=user.role)
 
 
-@dataclass
-class AuthenticatedUser:
-    """Carries both the user ID and role extracted from a validated JWT."""
-    user_id: str
-    role: str
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(_bearer_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> str:
+    """Extracts and validates the authenticated user's ID from a Bearer token.
+
+    Decodes the JWT from the Authorization header, then confirms the user
+    still exists (via the principal cache or the database) before returning
+    the user ID.
+
+    Args:
+        credentials: The HTTP Bearer credentials from the Authorization header.
+        db: The async database session.
+
+    Returns:
+        str: The user ID (the 'sub' claim) extracted from the token payload.
+
+    Raises:
+        HTTPException: 401 if the token is expired, invalid, or the user no longer exists.
+    """
+    principal = await _resolve_principal(credentials.credentials, db)
+    return principal.user_id
 
 
 async def get_current_user_with_role(
@@ -115,25 +143,12 @@ async def get_current_user_with_role(
     """Extracts user ID and role from a Bearer token.
 
     Returns:
-        AuthenticatedUser: Validated user_id and role from the JWT payload.
+        AuthenticatedUser: Validated user_id and the user's current role.
 
     Raises:
         HTTPException: 401 if the token is expired, invalid, or the user no longer exists.
     """
-    from src.repo.user_repo import UserRepository
-
-    payload = decode_token(credentials.credentials)
-    user_id = payload.get("sub")
-    if user_id is None:
-        logger.warning("JWT payload missing 'sub' claim")
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
-
-    user = await UserRepository(db).get_by_id(user_id)
-    if user is None:
-        logger.warning(f"JWT references non-existent user {user_id}")
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
-
-    return AuthenticatedUser(user_id=user_id, role=user.role)
+    return await _resolve_principal(credentials.credentials, db)
 
 
 async def get_current_security_user(
@@ -1,13 +1,28 @@
 """Cryptographic utilities for passwords.
 
 This module provides functions for hashing passwords with bcrypt and
-verifying plaintext passwords against hashes.
+verifying plaintext passwords against hashes. Async callers should use the
+``*_async`` variants, which run bcrypt on a dedicated, size-limited thread
+pool so a burst of logins cannot stall the event loop. When that pool and
+its waiting queue are full, they fail fast with 503 instead of queueing.
 """
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
+
 import bcrypt
+from fastapi import HTTPException, status
+
+from src.core.config import settings
 from src.core.logger import get_logger
+from src.core.metrics import EXECUTOR_QUEUE_DEPTH, registry
 
 logger = get_logger("SECURITY")
 
+_T = TypeVar("_T")
+
 def hash_password(password: str) -> str:
     """Hashes a plaintext password using bcrypt.
     
@@ -53,3 +68,153 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     else:
         logger.info("Password verification succeeded")
     return match
+
+
+class PasswordHashPool:
+    """Bounded executor for bcrypt work with a queue-depth limit.
+
+    Attributes:
+        max_workers (int): Threads hashing concurrently. bcrypt releases the
+            GIL, so these run in parallel with the event loop.
+        max_queue (int): Requests allowed to wait for a free thread before
+            new requests are rejected.
+        rejected (int): Requests refused because the pool was saturated.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int) -> None:
+        """Initialize the pool without starting any threads.
+
+        Args:
+            max_workers (int): Number of hashing threads.
+            max_queue (int): Maximum number of waiting requests.
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.rejected = 0
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of requests hashing or waiting for a free thread."""
+        return self._pending
+
+    def _release(self, future: Future) -> None:
+        """Count a submitted call as finished once its thread is done with it."""
+        with self._pending_lock:
+            self._pending -= 1
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the dedicated executor, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="bcrypt",
+            )
+        return self._executor
+
+    async def run(self, fn: Callable[..., _T], *args: object) -> _T:
+        """Run a blocking bcrypt call on the pool.
+
+        Args:
+            fn (Callable[..., _T]): Blocking function to execute.
+            *args (object): Positional arguments for ``fn``.
+
+        Returns:
+            _T: The function's return value.
+
+        Raises:
+            HTTPException: 503 when every thread is busy and the waiting
+                queue is full.
+        """
+        with self._pending_lock:
+            saturated = self._pending >= self.max_workers + self.max_queue
+            if not saturated:
+                self._pending += 1
+        if saturated:
+            self.rejected += 1
+            logger.warning(f"Password hashing pool saturated ({self._pending} pending)")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication is busy — please try again shortly.",
+                headers={"Retry-After": "1"},
+            )
+
+        # Released when the thread finishes, not when the caller stops waiting:
+        # a cancelled request's bcrypt call keeps its thread busy until it ends.
+        future = self._get_executor().submit(fn, *args)
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        """Stop the executor, waiting for in-flight hashes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+_password_hash_pool: PasswordHashPool | None = None
+
+
+def get_password_hash_pool() -> PasswordHashPool:
+    """Return the shared bcrypt pool configured from settings.
+
+    Returns:
+        PasswordHashPool: Process-wide pool used by the async helpers.
+    """
+    global _password_hash_pool
+    if _password_hash_pool is None:
+        _password_hash_pool = PasswordHashPool(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+        )
+    return _password_hash_pool
+
+
+def shutdown_password_hash_pool() -> None:
+    """Stop the shared bcrypt pool, typically on application shutdown."""
+    global _password_hash_pool
+    if _password_hash_pool is not None:
+        _password_hash_pool.shutdown()
+    _password_hash_pool = None
+
+
+def _collect_queue_depth() -> None:
+    """Publish the password hashing backlog on the metrics endpoint."""
+    depth = _password_hash_pool.pending if _password_hash_pool is not None else 0
+    EXECUTOR_QUEUE_DEPTH.set(depth, executor="bcrypt")
+
+
+registry.add_collector(_collect_queue_depth)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hashes a plaintext password on the bounded bcrypt pool.
+
+    Args:
+        password (str): The plaintext password to be hashed.
+
+    Returns:
+        str: The securely hashed and salted password string.
+
+    Raises:
+        HTTPException: 503 when the bcrypt pool is saturated.
+    """
+    return await get_password_hash_pool().run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verifies a plaintext password on the bounded bcrypt pool.
+
+    Args:
+        plain_password (str): The unhashed password attempting to authenticate.
+        hashed_password (str): The stored bcrypt hash to compare against.
+
+    Returns:
+        bool: True if the password matches the hash, False otherwise.
+
+    Raises:
+        HTTPException: 503 when the bcrypt pool is saturated.
+    """
+    return await get_password_hash_pool().run(verify_password, plain_password, hashed_password)
@@ -0,0 +1,97 @@
+"""Short-lived in-process cache of authenticated principals.
+
+Every authenticated request used to look its user up in Postgres to confirm
+the account still exists and to read its current role. This cache remembers
+that answer per user id for a few seconds, so the common path only verifies
+the JWT signature. Role changes and deletions made through the admin API
+invalidate the entry immediately in the serving process; other processes
+converge within the TTL.
+"""
+import time
+from collections import OrderedDict
+
+from src.core.config import settings
+
+
+class PrincipalCache:
+    """Bounded LRU map from user id to role with per-entry expiry.
+
+    Attributes:
+        max_entries (int): Maximum number of cached principals. ``0``
+            disables caching.
+        ttl (float): Seconds an entry stays valid after it is stored.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries (int): Maximum number of cached principals.
+            ttl_seconds (float): Seconds an entry stays valid.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    def get(self, user_id: str) -> str | None:
+        """Return the cached role for a user, or None if absent or expired.
+
+        Args:
+            user_id (str): The user's id (the JWT ``sub`` claim).
+
+        Returns:
+            str | None: The user's role at the time it was cached.
+        """
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, role = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(user_id, None)
+            return None
+        self._entries.move_to_end(user_id)
+        return role
+
+    def put(self, user_id: str, role: str) -> None:
+        """Cache a verified principal, evicting the least recently used.
+
+        Args:
+            user_id (str): The user's id.
+            role (str): The user's current role.
+        """
+        if self.max_entries <= 0:
+            return
+        self._entries[user_id] = (time.monotonic() + self.ttl, role)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user's cached principal after a role change or deletion.
+
+        Args:
+            user_id (str): The user's id.
+        """
+        self._entries.pop(str(user_id), None)
+
+    def clear(self) -> None:
+        """Drop every cached principal."""
+        self._entries.clear()
+
+
+_principal_cache: PrincipalCache | None = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Return the shared principal cache configured from settings.
+
+    Returns:
+        PrincipalCache: Process-wide cache used by the auth dependencies.
+    """
+    global _principal_cache
+    if _principal_cache is None:
+        _principal_cache = PrincipalCache(
+            max_entries=settings.PRINCIPAL_CACHE_SIZE,
+            ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+        )
+    return _principal_cache
@@ -9,6 +9,7 @@ from src.core.logger import get_logger
 from src.repo.user_repo import UserRepository
 from src.schemas.admin_schema import AdminUserOut
 from src.security.jwt import AuthenticatedUser
+from src.security.principal_cache import get_principal_cache
 
 logger = get_logger("ADMIN_SERVICE")
 
@@ -37,6 +38,7 @@ class AdminService:
         """Hard delete a user from the database."""
         self._require_admin(auth)
         deleted = await self.repo.delete_user(user_id)
+        get_principal_cache().invalidate(str(user_id))
         if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -53,6 +55,7 @@ class AdminService:
         """Update a persisted user's role."""
         self._require_admin(auth)
         updated_user = await self.repo.update_role(user_id, role)
+        get_principal_cache().invalidate(str(user_id))
         if updated_user is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
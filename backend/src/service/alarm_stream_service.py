@@ -0,0 +1,228 @@
+"""Live delivery of moderation alarms to security dashboards.
+
+Whenever alarms are committed, their ids are announced with Postgres
+``NOTIFY`` inside the inserting transaction. Each API process keeps one
+``LISTEN`` connection, loads the announced alarms once and fans them out
+through the in-process broadcaster to every open Server-Sent Events
+stream. An alarm raised on any worker therefore reaches dashboards
+connected to every worker, and a quiet system costs no queries at all.
+
+Notifications sent while the ``LISTEN`` connection is down are lost, so
+every open stream is closed when it drops and again once it is back; the
+clients reconnect and catch up through the paginated feed's ``since``
+cursor.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from collections.abc import AsyncIterator, Callable
+
+import asyncpg
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.broadcaster import Broadcaster, Subscription, get_alarm_broadcaster
+from src.core.config import settings
+from src.core.cursors import encode_cursor
+from src.core.database import async_session_maker
+from src.core.database_urls import to_asyncpg_dsn
+from src.core.logger import get_logger
+from src.repo.flagged_event_repo import ALARM_NOTIFY_CHANNEL, FlaggedEventRepository
+from src.schemas.chat_schema import SecurityAlarmEventResponse
+
+logger = get_logger("ALARM_STREAM")
+
+# Seconds to wait before reconnecting a dropped LISTEN connection.
+_RECONNECT_DELAY_SECONDS = 5.0
+
+_listener: AlarmNotificationListener | None = None
+
+
+def to_alarm_event(row: dict[str, object]) -> SecurityAlarmEventResponse:
+    """Build the API representation of a dashboard alarm row.
+
+    Args:
+        row (dict[str, object]): Row from ``FlaggedEventRepository``.
+
+    Returns:
+        SecurityAlarmEventResponse: The alarm event.
+    """
+    return SecurityAlarmEventResponse(
+        id=str(row["id"]),
+        user_id=str(row["user_id"]),
+        user_email=str(row["user_email"]),
+        conversation_id=str(row["conversation_id"]),
+        message_content=str(row["message_content"]),
+        filter_type=str(row["filter_type"]),
+        provider=str(row["provider"]),
+        reason=row["reason"],
+        created_at=row["created_at"],
+    )
+
+
+class AlarmNotificationListener:
+    """Relay alarm notifications from Postgres to the local broadcaster.
+
+    Notifications are handled one at a time in arrival order, so streams
+    see alarms in commit order.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        session_factory: Callable[[], AsyncSession],
+        broadcaster: Broadcaster,
+    ) -> None:
+        """Initialize the listener without connecting.
+
+        Args:
+            dsn (str): asyncpg connection string for the LISTEN connection.
+            session_factory (Callable[[], AsyncSession]): Factory for the
+                sessions used to load announced alarms.
+            broadcaster (Broadcaster): Destination for loaded alarm events.
+        """
+        self._dsn = dsn
+        self._session_factory = session_factory
+        self._broadcaster = broadcaster
+        self._payloads: asyncio.Queue[str] = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+        self._connected = asyncio.Event()
+
+    async def start(self) -> None:
+        """Start listening and wait until the first connection is ready."""
+        loop = asyncio.get_running_loop()
+        self._tasks = [
+            loop.create_task(self._listen(), name="alarm-listen"),
+            loop.create_task(self._dispatch(), name="alarm-dispatch"),
+        ]
+        await self._connected.wait()
+
+    async def stop(self) -> None:
+        """Close the LISTEN connection and stop dispatching."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def _on_notify(self, connection: object, pid: int, channel: str, payload: str) -> None:
+        """asyncpg notification callback; hands the payload to the dispatcher."""
+        self._payloads.put_nowait(payload)
+
+    async def _listen(self) -> None:
+        """Hold a LISTEN connection open, reconnecting when it drops.
+
+        Streams are closed on every disconnect and reconnect, since any
+        of them may have missed notifications in between.
+        """
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self._dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(ALARM_NOTIFY_CHANNEL, self._on_notify)
+                logger.info(f"Listening for alarm notifications on '{ALARM_NOTIFY_CHANNEL}'")
+                if self._connected.is_set():
+                    # Streams opened during the outage missed its notifications too.
+                    self._broadcaster.close_all()
+                self._connected.set()
+                await closed.wait()
+                logger.warning("Alarm notification connection closed — reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error(f"Alarm notification listener failed: {exc}")
+                # Do not block startup on an unreachable database.
+                self._connected.set()
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            self._broadcaster.close_all()
+            await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
+
+    async def _dispatch(self) -> None:
+        """Load and publish announced alarms until cancelled."""
+        while True:
+            payload = await self._payloads.get()
+            try:
+                await self.publish([uuid.UUID(alarm_id) for alarm_id in payload.split(",")])
+            except Exception as exc:
+                logger.error(f"Failed to publish alarm notification: {exc}")
+
+    async def publish(self, alarm_ids: list[uuid.UUID]) -> None:
+        """Load alarms and broadcast them to live streams.
+
+        Args:
+            alarm_ids (list[uuid.UUID]): Ids of newly committed alarms.
+        """
+        if self._broadcaster.subscriber_count == 0:
+            return
+        async with self._session_factory() as session:
+            rows = await FlaggedEventRepository(session).get_dashboard_events_by_ids(alarm_ids)
+        for row in rows:
+            self._broadcaster.publish(to_alarm_event(row))
+
+
+async def alarm_event_stream(
+    subscription: Subscription[SecurityAlarmEventResponse],
+    heartbeat_seconds: float,
+) -> AsyncIterator[str]:
+    """Render live alarms from a subscription as Server-Sent Events.
+
+    Each event's ``id`` is the alarm's feed cursor, usable as ``since`` on
+    the paginated alarm endpoint to catch up after a reconnect. Idle
+    streams get a comment line every ``heartbeat_seconds`` so proxies keep
+    them open. The stream ends if the subscriber falls too far behind.
+
+    Args:
+        subscription (Subscription[SecurityAlarmEventResponse]): Source of
+            alarm events.
+        heartbeat_seconds (float): Maximum idle time between writes.
+
+    Yields:
+        str: Encoded SSE frames.
+    """
+    while True:
+        event = await subscription.get(heartbeat_seconds)
+        if event is None:
+            if subscription.lagged:
+                return
+            yield ": keep-alive\n\n"
+            continue
+        cursor = encode_cursor(event.created_at, uuid.UUID(event.id))
+        yield f"id: {cursor}\nevent: alarm\ndata: {json.dumps(event.model_dump(mode='json'))}\n\n"
+
+
+async def live_alarm_stream() -> AsyncIterator[str]:
+    """Subscribe to this process's alarm broadcaster and stream its events.
+
+    The subscription is released when the client disconnects.
+
+    Yields:
+        str: Encoded SSE frames.
+    """
+    with get_alarm_broadcaster().subscribe() as subscription:
+        async for frame in alarm_event_stream(subscription, settings.ALARM_STREAM_HEARTBEAT_SECONDS):
+            yield frame
+
+
+async def start_alarm_listener() -> None:
+    """Start relaying alarm notifications to this process's live streams."""
+    global _listener
+    if _listener is None:
+        _listener = AlarmNotificationListener(
+            to_asyncpg_dsn(settings.DATABASE_URL),
+            async_session_maker,
+            get_alarm_broadcaster(),
+        )
+        await _listener.start()
+
+
+async def stop_alarm_listener() -> None:
+    """Stop the alarm notification listener, typically on shutdown."""
+    global _listener
+    listener = _listener
+    _listener = None
+    if listener is not None:
+        await listener.stop()
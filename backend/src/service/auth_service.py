@@ -9,9 +9,10 @@ from datetime import datetime, timezone
 from fastapi import HTTPException, status
 from src.schemas.auth_schema import SignupRequest, LoginRequest, TokenResponse, DuoLoginResponse, DuoCallbackRequest
 from src.repo.user_repo import UserRepository
-from src.security.password import hash_password, verify_password
+from src.security.password import hash_password_async, verify_password_async
 from src.security.jwt import create_token, decode_token
 from src.security.duo import get_duo_client, DuoException
+from src.security.principal_cache import get_principal_cache
 from src.core.config import settings
 from src.core.logger import get_logger
 
@@ -59,7 +60,7 @@ class AuthService:
                 detail="Email already registered"
             )
         
-        hashed_pwd = hash_password(request.password)
+        hashed_pwd = await hash_password_async(request.password)
         new_user = await self.repo.create_user(request.email, hashed_pwd, role=request.role)
 
         logger.info(f"User created successfully: {new_user.id}")
@@ -86,7 +87,7 @@ class AuthService:
         """
         logger.info(f"Attempting login for email: {request.email}")
         user = await self.repo.get_by_email(request.email)
-        if not user or not verify_password(request.password, user.hashed_password):
+        if not user or not await verify_password_async(request.password, user.hashed_password):
             logger.warning(f"Login failed: Invalid credentials for email: {request.email}")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -94,6 +95,8 @@ class AuthService:
             )
         if not settings.MFA_ENABLED:
             logger.info(f"MFA disabled — issuing token directly for user: {user.id}")
+            # A fresh login always re-reads the principal from the database.
+            get_principal_cache().invalidate(str(user.id))
             await self._update_last_login_safe(str(user.id))
             token = create_token({"sub": str(user.id), "email": user.email, "role": user.role})
             return TokenResponse(access_token=token, token_type="bearer")
@@ -169,6 +172,7 @@ class AuthService:
         token_payload = {"sub": user_id, "email": username}
         if payload.get("role"):
             token_payload["role"] = payload["role"]
+        get_principal_cache().invalidate(user_id)
         await self._update_last_login_safe(user_id)
         token = create_token(token_payload)
         return TokenResponse(access_token=token, token_type="bearer")
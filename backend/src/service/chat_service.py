@@ -3,35 +3,58 @@
 This module orchestrates conversation creation, message persistence,
 and streaming AI responses from the configured provider.
 """
+import asyncio
+import time
+import uuid
 from collections.abc import AsyncIterator
 from collections import defaultdict
+from datetime import datetime, timedelta
 
 from fastapi import HTTPException, status
+from pydantic import BaseModel
 
 from src.schemas.chat_schema import (
     CreateConversationRequest,
     ConversationListItemResponse,
+    ConversationListQuery,
     HistoricChatDashboardQuery,
     HistoricChatDashboardResponse,
     HistoricChatDashboardSummaryResponse,
+    HistoricChatExportConversationRecord,
+    HistoricChatExportEndRecord,
+    HistoricChatExportMessageRecord,
+    HistoricChatExportQuery,
     HistoricChatHistoryItemResponse,
     HistoricChatMessageResponse,
     SecurityAlarmEventResponse,
+    SecurityAlarmQuery,
 )
-from src.repo.conversation_repo import ConversationRepository
+from src.repo.conversation_repo import ConversationRepository, ConversationTurn
 from src.repo.document_repo import DocumentRepository
 from src.repo.flagged_event_repo import FlaggedEventRepository
-from src.models.conversation_model import Conversation
+from src.models.conversation_model import Conversation, Message
 from src.providers import stream_from_provider, validate_provider
+from src.service.alarm_stream_service import to_alarm_event
 from src.service.rag_service import RAGService
-from src.moderation.keyword_filter import is_harmful, MODERATION_RESPONSE
+from src.moderation.keyword_filter import find_harmful_keyword, MODERATION_RESPONSE
 from src.moderation.exceptions import ContentPolicyError
+from src.core.context_window import context_budget, fit_to_budget
+from src.core.config import settings
+from src.core.cursors import decode_cursor, encode_cursor
+from src.core.conversation_cache import ChatMessage, ConversationHistory, get_conversation_cache
+from src.core.database import async_session_maker
 from src.core.logger import get_logger
+from src.core.metrics import EXECUTOR_QUEUE_DEPTH, registry, timed_stage
+from src.core.summary_metrics import get_summary_cache
+from src.core.tokenizer import get_token_counter
+from src.core.write_behind import WriteBehindQueue
 
 logger = get_logger("CHAT_SERVICE")
 
 SUPPORTED_PROVIDERS = {"groq", "gemini", "deepseek"}
 
+_turn_writer: WriteBehindQueue[ConversationTurn] | None = None
+
 
 class ChatService:
     """Service layer holding all chat business logic.
@@ -136,21 +159,189 @@ class ChatService:
         if not convo:
             logger.info(f"No conversation {conversation_id} found for user {user_id} — returning empty list")
             return []
-        messages = await self.repo.get_messages(convo.id)
-        return [{"role": m.role, "content": m.content} for m in messages]
+        history = await self._load_history(convo)
+        return history.messages
+
+    async def _load_history(self, convo: Conversation) -> ConversationHistory:
+        """Return a conversation's serialized history, reading only new rows.
+
+        On a cache hit only messages written after the cached cursor are
+        fetched and appended; otherwise the full history is loaded once and
+        cached for later turns. If the cached rows plus the new ones fall
+        short of the conversation's ``message_count``, a turn committed out
+        of ``display_id`` order was skipped by the cursor and the history is
+        reloaded in full. Messages stored before token counting was
+        introduced are counted as they are loaded.
+
+        Turns still waiting in the write-behind queue are appended after the
+        stored rows. The queue is read before the database, so a turn that
+        commits meanwhile is in the snapshot either way, and any of its
+        messages that were already read back are skipped by id.
+
+        Args:
+            convo (Conversation): The verified conversation model.
+
+        Returns:
+            ConversationHistory: Messages, their token counts, and the cursor.
+        """
+        pending_turns = [turn for turn in get_turn_writer().pending() if turn.conversation_id == convo.id]
+        cache = get_conversation_cache()
+        history = cache.get(str(convo.id))
+        rows: list[Message] = []
+        if history is not None:
+            rows = await self.repo.get_messages_after(convo.id, history.cursor)
+            if history.stored_count + len(rows) < convo.message_count:
+                logger.info(f"Cached history of conversation {convo.id} missed a message — reloading")
+                history = None
+        if history is None:
+            history = ConversationHistory()
+            rows = await self.repo.get_messages(convo.id)
+
+        if rows:
+            counter = get_token_counter()
+            for m in rows:
+                message = {"role": m.role, "content": m.content}
+                history.messages.append(message)
+                history.token_counts.append(
+                    m.token_count if m.token_count is not None else counter.count_message(message)
+                )
+            history.cursor = max(history.cursor, *(m.display_id for m in rows))
+            history.stored_count += len(rows)
+            history.message_ids.update(m.id for m in rows)
+            cache.put(str(convo.id), history)
+
+        # Turns accepted by the write-behind queue but not yet read back
+        for turn in pending_turns:
+            for row in turn.messages:
+                if row["id"] in history.message_ids:
+                    continue
+                history.messages.append({"role": row["role"], "content": row["content"]})
+                history.token_counts.append(int(row["token_count"] or 0))
+        return history
+
+    async def _prepare_context(
+        self, convo: Conversation, content: str, role: str
+    ) -> tuple[ConversationHistory, str | None]:
+        """Load a turn's history and RAG context with independent stages overlapped.
+
+        The query embedding starts first and runs on the embedding workers
+        while the history and the role's documents are read from Postgres.
+        It is cancelled as soon as the document scope turns out to be empty,
+        which usually keeps it from reaching the model at all.
+        Those two reads share the request's session, so they run one after
+        the other. The Chroma search starts once both the document scope and
+        the embedding are ready. Each stage is timed with ``timed_stage``.
+
+        Args:
+            convo (Conversation): The verified conversation model.
+            content (str): The user's message content.
+            role (str): The authenticated user's role for RAG document filtering.
 
-    async def list_conversations(self, user_id: str) -> list[ConversationListItemResponse]:
+        Returns:
+            tuple[ConversationHistory, str | None]: The conversation history
+            before this message, and the retrieved context if any.
+        """
+        started_at = time.perf_counter()
+        # Without a document repository there is nothing to search.
+        embedding = (
+            asyncio.ensure_future(self.rag.embed_query(content)) if self.doc_repo is not None else None
+        )
+        try:
+            with timed_stage("history"):
+                history = await self._load_history(convo)
+
+            # Resolve allowed doc IDs from Postgres then query ChromaDB
+            allowed_doc_ids: list[str] = []
+            chunks_in_scope: int | None = None
+            if self.doc_repo is not None:
+                with timed_stage("documents"):
+                    allowed_docs = [d for d in await self.doc_repo.list_by_role(role) if d.chroma_doc_id]
+                allowed_doc_ids = [str(d.chroma_doc_id) for d in allowed_docs]
+                # Legacy documents without a recorded count force a Chroma lookup
+                chunk_counts = [d.chunk_count for d in allowed_docs]
+                if None not in chunk_counts:
+                    chunks_in_scope = sum(chunk_counts)
+                if embedding is not None and (not allowed_doc_ids or chunks_in_scope == 0):
+                    # Nothing to search: drop the embedding before its batch reaches the model
+                    embedding.cancel()
+
+            with timed_stage("retrieval"):
+                rag_context = await self.rag.get_context(
+                    allowed_doc_ids,
+                    content,
+                    chunks_in_scope=chunks_in_scope,
+                    query_embedding=embedding,
+                )
+        finally:
+            if embedding is not None:
+                if not embedding.done():
+                    # No search needed it, or an earlier stage failed
+                    embedding.cancel()
+                elif not embedding.cancelled():
+                    # Already reported by get_context if it was awaited
+                    embedding.exception()
+
+        logger.info(
+            f"Prepared context for conversation {convo.id} in "
+            f"{(time.perf_counter() - started_at) * 1000:.1f}ms"
+        )
+        return history, rag_context
+
+    async def _save_turn(self, turn: ConversationTurn) -> None:
+        """Persist a completed turn, in the background when possible.
+
+        The turn is stamped with the current time first, so its rows keep
+        their order against turns written inline. Turns without alarms are
+        handed to the write-behind queue without awaiting, so this is safe
+        while a disconnected stream is being torn down. Turns raising an
+        alarm are committed immediately, like keyword-blocked turns, so
+        security dashboards see them at once. The same immediate commit is
+        used when the queue is not running, e.g. during shutdown.
+
+        Args:
+            turn (ConversationTurn): The staged writes.
+        """
+        turn.stamp()
+        writer = get_turn_writer()
+        if writer.running and not turn.alarms:
+            writer.submit(turn)
+            return
+        with timed_stage("persist"):
+            await self.repo.commit_turn(turn)
+
+    async def list_conversations(
+        self,
+        user_id: str,
+        query: ConversationListQuery | None = None,
+    ) -> tuple[list[ConversationListItemResponse], str | None]:
         """Return sidebar-ready conversation summaries for the authenticated user.
 
         Args:
             user_id (str): The UUID string of the requesting user.
+            query (ConversationListQuery | None): Optional page size and
+                cursor. Without a limit every conversation is returned.
 
         Returns:
-            list[ConversationListItemResponse]: Conversation summaries ordered
-            by most recent activity first.
+            tuple[list[ConversationListItemResponse], str | None]: Conversation
+            summaries ordered by most recent activity first, and the cursor
+            for the next page, or None when there are no more rows.
+
+        Raises:
+            HTTPException: 400 if the cursor is malformed.
         """
-        rows = await self.repo.list_conversations(user_id)
-        return [
+        query = query or ConversationListQuery()
+        after = decode_cursor(query.cursor) if query.cursor else None
+        rows = await self.repo.list_conversations(
+            user_id,
+            limit=None if query.limit is None else query.limit + 1,
+            after=after,
+        )
+        next_cursor = None
+        if query.limit is not None and len(rows) > query.limit:
+            rows = rows[: query.limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last["updated_at"], last["id"])
+        items = [
             ConversationListItemResponse(
                 id=str(row["id"]),
                 title=str(row["title"]),
@@ -165,6 +356,7 @@ class ChatService:
             )
             for row in rows
         ]
+        return items, next_cursor
 
     async def delete_conversation(self, conversation_id: str, user_id: str) -> None:
         """Delete a conversation owned by the authenticated user.
@@ -177,6 +369,7 @@ class ChatService:
             HTTPException: 404 if the conversation is missing or not owned by the user.
         """
         deleted = await self.repo.delete_conversation(conversation_id, user_id)
+        get_conversation_cache().invalidate(conversation_id)
         if not deleted:
             logger.warning(f"Conversation {conversation_id} not found for delete by user {user_id}")
             raise HTTPException(
@@ -192,7 +385,10 @@ class ChatService:
         Runs keyword moderation before calling the provider. If the message is
         flagged (keyword or provider content policy), logs the event, saves
         "That's Dangerous" as the assistant reply, and yields it without making
-        or completing a provider API call.
+        or completing a provider API call. The prompt, reply and any alarm of
+        a turn are written in a single transaction; for provider responses
+        without an alarm that write happens on the background write-behind
+        queue.
 
         Provider validation is performed before returning the stream so safe
         messages still fail as clean HTTP errors instead of mid-stream.
@@ -210,14 +406,30 @@ class ChatService:
         """
         logger.info(f"Streaming response for conversation {convo.id} provider={convo.provider}")
 
+        counter = get_token_counter()
+        user_tokens = counter.count_message({"role": "user", "content": content})
+
         # Layer 1: keyword filter — block before calling the provider
-        if is_harmful(content):
+        with timed_stage("moderation"):
+            matched_keyword = find_harmful_keyword(content)
+        if matched_keyword is not None:
             logger.warning(f"Keyword filter triggered for conversation {convo.id}")
-            await self.flagged_event_repo.log_event(
-                str(convo.user_id), str(convo.id), content, "keyword", convo.provider
+            turn = ConversationTurn(convo.id)
+            turn.add_alarm(
+                convo.user_id,
+                content,
+                "keyword",
+                convo.provider,
+                reason=f"Matched keyword '{matched_keyword}'",
+            )
+            turn.add_message("user", content, token_count=user_tokens)
+            turn.add_message(
+                "assistant",
+                MODERATION_RESPONSE,
+                token_count=counter.count_message({"role": "assistant", "content": MODERATION_RESPONSE}),
             )
-            await self.repo.add_message(convo.id, "user", content)
-            await self.repo.add_message(convo.id, "assistant", MODERATION_RESPONSE)
+            # Written before responding so the alarm is visible immediately
+            await self._save_turn(turn)
 
             async def moderation_response() -> AsyncIterator[str]:
                 yield MODERATION_RESPONSE
@@ -226,31 +438,39 @@ class ChatService:
 
         validate_provider(convo.provider)
 
-        await self.repo.add_message(convo.id, "user", content)
+        # The prompt is written together with the reply once the stream ends
+        turn = ConversationTurn(convo.id)
+        turn.add_message("user", content, token_count=user_tokens)
 
-        all_messages = await self.repo.get_messages(convo.id)
-        messages_payload = [{"role": m.role, "content": m.content} for m in all_messages]
+        history, rag_context = await self._prepare_context(convo, content, role)
+        history.messages.append({"role": "user", "content": content})
+        history.token_counts.append(user_tokens)
 
-        # Inject RAG context — resolve allowed doc IDs from Postgres then query ChromaDB
-        allowed_doc_ids: list[str] = []
-        if self.doc_repo is not None:
-            allowed_docs = await self.doc_repo.list_by_role(role)
-            allowed_doc_ids = [str(d.chroma_doc_id) for d in allowed_docs if d.chroma_doc_id]
-        rag_context = await self.rag.get_context(allowed_doc_ids, content)
+        system_msgs: list[ChatMessage] = []
         if rag_context:
-            system_msg = {
+            system_msgs.append({
                 "role": "system",
                 "content": (
                     "Use the following document excerpts as context to answer the user's question. "
                     "If the context is not relevant, answer from your own knowledge.\n\n"
                     f"{rag_context}"
                 ),
-            }
-            messages_payload = [system_msg] + messages_payload
+            })
             logger.info(f"Injected RAG context ({len(rag_context)} chars) for conversation {convo.id}")
 
+        # Keep the most recent turns that fit alongside the RAG context
+        history_budget = context_budget(convo.model) - sum(counter.count_message(m) for m in system_msgs)
+        window = fit_to_budget(history.messages, history.token_counts, history_budget)
+        if len(window) < len(history.messages):
+            logger.info(
+                f"Trimmed {len(history.messages) - len(window)} older messages from conversation "
+                f"{convo.id} to fit the {convo.model} context budget"
+            )
+        messages_payload = system_msgs + window
+
         async def provider_response() -> AsyncIterator[str]:
             full_response = ""
+            blocked = False
             try:
                 async for chunk in stream_from_provider(
                     convo.provider, convo.model, messages_payload
@@ -260,17 +480,30 @@ class ChatService:
             except ContentPolicyError:
                 # Layer 2: provider content policy — block after provider rejects
                 logger.warning(f"Provider content policy triggered for conversation {convo.id}")
-                await self.flagged_event_repo.log_event(
-                    str(convo.user_id), str(convo.id), content, "provider", convo.provider
+                blocked = True
+                turn.add_alarm(convo.user_id, content, "provider", convo.provider)
+                turn.add_message(
+                    "assistant",
+                    MODERATION_RESPONSE,
+                    token_count=counter.count_message({"role": "assistant", "content": MODERATION_RESPONSE}),
                 )
-                await self.repo.add_message(convo.id, "assistant", MODERATION_RESPONSE)
+            else:
+                logger.info(
+                    f"Response complete for conversation {convo.id} — {len(full_response)} chars"
+                )
+            finally:
+                # Runs on completion, provider errors and client disconnects
+                # alike, so whatever was streamed is kept with the prompt.
+                if not blocked and full_response:
+                    turn.add_message(
+                        "assistant",
+                        full_response,
+                        token_count=counter.count_message({"role": "assistant", "content": full_response}),
+                    )
+                await self._save_turn(turn)
+
+            if blocked:
                 yield MODERATION_RESPONSE
-                return
-
-            await self.repo.add_message(convo.id, "assistant", full_response)
-            logger.info(
-                f"Response complete for conversation {convo.id} — {len(full_response)} chars"
-            )
 
         return provider_response()
 
@@ -286,14 +519,26 @@ class ChatService:
         Returns:
             HistoricChatDashboardResponse: Ordered conversation histories and
             summary metrics for the dashboard UI.
+
+        Raises:
+            HTTPException: 400 if the cursor is malformed.
         """
-        total, conversation_rows = await self.repo.get_historic_chat_page(
-            limit=query.limit,
+        after = decode_cursor(query.cursor) if query.cursor else None
+        # One extra row tells us whether another page follows
+        conversation_rows = await self.repo.get_historic_chat_page(
+            limit=query.limit + 1,
             offset=query.offset,
+            after=after,
         )
+        next_cursor = None
+        if len(conversation_rows) > query.limit:
+            conversation_rows = conversation_rows[: query.limit]
+            last = conversation_rows[-1]
+            next_cursor = encode_cursor(last["last_activity_at"], last["conversation_id"])
         conversation_ids = [row["conversation_id"] for row in conversation_rows]
         messages = await self.repo.get_messages_for_conversations(conversation_ids)
-        summary = await self.repo.get_historic_chat_summary()
+        summary = await get_summary_cache().get(_load_summary)
+        total = summary["total_histories"]
 
         messages_by_conversation: dict[str, list[HistoricChatMessageResponse]] = defaultdict(list)
         for message in messages:
@@ -326,24 +571,231 @@ class ChatService:
             items=items,
             total=total,
             limit=query.limit,
-            offset=query.offset,
+            offset=0 if after is not None else query.offset,
+            next_cursor=next_cursor,
             summary=HistoricChatDashboardSummaryResponse(**summary),
         )
 
-    async def get_security_alarm_events(self) -> list[SecurityAlarmEventResponse]:
-        """Return persisted moderation alarms for the live security flagging dashboard."""
-        rows = await self.flagged_event_repo.get_dashboard_events()
-        return [
-            SecurityAlarmEventResponse(
-                id=str(row["id"]),
-                user_id=str(row["user_id"]),
-                user_email=str(row["user_email"]),
-                conversation_id=str(row["conversation_id"]),
-                message_content=str(row["message_content"]),
-                filter_type=str(row["filter_type"]),
-                provider=str(row["provider"]),
-                reason=row["reason"],
-                created_at=row["created_at"],
+    async def export_security_chat_histories(
+        self,
+        query: HistoricChatExportQuery,
+    ) -> AsyncIterator[str]:
+        """Stream historic transcripts as newline-delimited JSON.
+
+        Each conversation is written as a ``conversation`` record followed
+        by one ``message`` record per exported message, and the export ends
+        with an ``end`` record carrying the cursor to continue from. Rows
+        are serialized as they arrive from the database, so memory use does
+        not grow with the size of the export.
+
+        Args:
+            query (HistoricChatExportQuery): Selection and truncation controls.
+
+        Returns:
+            AsyncIterator[str]: NDJSON lines.
+
+        Raises:
+            HTTPException: 400 if the cursor is malformed.
+        """
+        after = decode_cursor(query.cursor) if query.cursor else None
+        max_messages = query.max_messages_per_conversation
+
+        async def records() -> AsyncIterator[str]:
+            current = None
+            exported = 0
+            last_key = None
+            async for row in self.repo.stream_historic_chat_export(
+                limit=query.limit,
+                after=after,
+                max_messages=max_messages,
+                max_chars=query.max_message_chars,
+            ):
+                if row.conversation_id != current:
+                    current = row.conversation_id
+                    exported += 1
+                    last_key = (row.last_activity_at, row.conversation_id)
+                    yield _ndjson(
+                        HistoricChatExportConversationRecord(
+                            conversation_id=str(row.conversation_id),
+                            title=row.title,
+                            user_id=str(row.user_id),
+                            user_email=row.user_email,
+                            provider=row.provider,
+                            model=row.model,
+                            created_at=row.created_at,
+                            last_activity_at=row.last_activity_at,
+                            message_count=int(row.message_count or 0),
+                            messages_truncated=(
+                                max_messages is not None and int(row.message_count or 0) > max_messages
+                            ),
+                        )
+                    )
+                if row.message_id is not None:
+                    yield _ndjson(
+                        HistoricChatExportMessageRecord(
+                            conversation_id=str(row.conversation_id),
+                            id=str(row.message_id),
+                            role=row.role,
+                            content=row.content,
+                            content_truncated=bool(row.content_truncated),
+                            created_at=row.message_created_at,
+                        )
+                    )
+            next_cursor = None
+            if exported == query.limit and last_key is not None:
+                next_cursor = encode_cursor(*last_key)
+            yield _ndjson(HistoricChatExportEndRecord(conversations=exported, next_cursor=next_cursor))
+
+        return records()
+
+    async def get_security_alarm_events(
+        self,
+        query: SecurityAlarmQuery,
+    ) -> tuple[list[SecurityAlarmEventResponse], str | None, str | None]:
+        """Return a page of moderation alarms for the security flagging dashboard.
+
+        Without ``since`` the page holds the newest matching alarms, or those
+        older than ``cursor``. With ``since`` it holds up to ``limit`` alarms
+        newer than that cursor, oldest ones first, so a client polling with
+        the returned latest cursor never skips rows. Items are always
+        ordered newest first.
+
+        Alarms are stamped before their transaction commits, so one can
+        become visible after a newer one was already served. A ``since``
+        poll therefore also re-reads, in a separate query, up to ``limit``
+        of the newest alarms at most ``SECURITY_ALARM_FEED_OVERLAP_SECONDS``
+        older than the cursor. Those may repeat alarms the client already
+        has, so clients dedupe by id. They never move the latest cursor, so
+        a burst inside the window cannot stall the poller.
+
+        Args:
+            query (SecurityAlarmQuery): Applied pagination and filters.
+
+        Returns:
+            tuple[list[SecurityAlarmEventResponse], str | None, str | None]:
+            The alarms, the cursor for the next older page (None when there
+            is none) and the cursor to pass as ``since`` on the next poll.
+
+        Raises:
+            HTTPException: 400 if a cursor is malformed.
+        """
+        filters = {
+            "filter_type": query.filter_type,
+            "provider": query.provider,
+            "user_id": query.user_id,
+            "created_after": query.created_after,
+            "created_before": query.created_before,
+        }
+        next_cursor = None
+        latest_cursor = None
+        if query.since:
+            since = decode_cursor(query.since)
+            rows = await self.flagged_event_repo.get_dashboard_events(
+                limit=query.limit, since=since, **filters
             )
-            for row in rows
-        ]
+            latest_cursor = (
+                encode_cursor(rows[-1]["created_at"], rows[-1]["id"]) if rows else query.since
+            )
+            rows.reverse()
+            rows += await self._reread_alarm_overlap(since, query.limit, filters)
+        else:
+            before = decode_cursor(query.cursor) if query.cursor else None
+            # One extra row tells us whether another page follows
+            rows = await self.flagged_event_repo.get_dashboard_events(
+                limit=query.limit + 1, before=before, **filters
+            )
+            if len(rows) > query.limit:
+                rows = rows[: query.limit]
+                next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+            if before is None and rows:
+                latest_cursor = encode_cursor(rows[0]["created_at"], rows[0]["id"])
+
+        items = [to_alarm_event(row) for row in rows]
+        return items, next_cursor, latest_cursor
+
+    async def _reread_alarm_overlap(
+        self,
+        since: tuple[datetime, uuid.UUID],
+        limit: int,
+        filters: dict[str, object],
+    ) -> list[dict[str, object]]:
+        """Return the newest alarms just behind a ``since`` cursor, newest first.
+
+        Args:
+            since (tuple[datetime, uuid.UUID]): Keyset the client already has.
+            limit (int): Maximum alarms to re-read.
+            filters (dict[str, object]): Feed filters of the poll.
+
+        Returns:
+            list[dict[str, object]]: Alarms older than ``since`` by at most
+            ``SECURITY_ALARM_FEED_OVERLAP_SECONDS``.
+        """
+        window_start = since[0] - timedelta(seconds=settings.SECURITY_ALARM_FEED_OVERLAP_SECONDS)
+        if window_start >= since[0]:
+            return []
+        created_after = filters["created_after"]
+        if created_after is None or created_after < window_start:
+            created_after = window_start
+        return await self.flagged_event_repo.get_dashboard_events(
+            limit=limit, before=since, **{**filters, "created_after": created_after}
+        )
+
+
+def _ndjson(record: BaseModel) -> str:
+    """Serialize one export record as a newline-terminated JSON line."""
+    return record.model_dump_json() + "\n"
+
+
+async def _flush_turns(turns: list[ConversationTurn]) -> None:
+    """Write-behind flush writing a batch of turns in one transaction.
+
+    Args:
+        turns (list[ConversationTurn]): Completed turns, oldest first.
+    """
+    with timed_stage("persist_batch"):
+        async with async_session_maker() as session:
+            await ConversationRepository(session).commit_turns(turns)
+
+
+def get_turn_writer() -> WriteBehindQueue[ConversationTurn]:
+    """Return the shared write-behind queue for completed chat turns.
+
+    Returns:
+        WriteBehindQueue[ConversationTurn]: Process-wide turn writer.
+    """
+    global _turn_writer
+    if _turn_writer is None:
+        _turn_writer = WriteBehindQueue(
+            _flush_turns,
+            max_batch_size=settings.CHAT_WRITE_BEHIND_BATCH_SIZE,
+            flush_interval_ms=settings.CHAT_WRITE_BEHIND_FLUSH_MS,
+        )
+    return _turn_writer
+
+
+def start_turn_writer() -> None:
+    """Start persisting completed chat turns in the background."""
+    get_turn_writer().start()
+
+
+async def stop_turn_writer() -> None:
+    """Flush every pending chat turn and stop the background writer."""
+    global _turn_writer
+    if _turn_writer is not None:
+        await _turn_writer.stop()
+    _turn_writer = None
+
+
+def _collect_queue_depth() -> None:
+    """Publish the chat write-behind backlog on the metrics endpoint."""
+    depth = len(_turn_writer.pending()) if _turn_writer is not None else 0
+    EXECUTOR_QUEUE_DEPTH.set(depth, executor="chat_write_behind")
+
+
+registry.add_collector(_collect_queue_depth)
+
+
+async def _load_summary() -> dict[str, int]:
+    """Compute the security dashboard counters on a dedicated session."""
+    async with async_session_maker() as session:
+        return await ConversationRepository(session).get_historic_chat_summary()
@@ -1,16 +1,30 @@
-"""Service layer for atomic document ingestion.
+"""Service layer for background document ingestion.
 
 Owns the two-step Postgres → ChromaDB write so that no caller can
 create a ChromaDB record without a corresponding Postgres row, and
-vice-versa.
+vice-versa. Uploads are stored as durable ``ingestion_jobs`` rows and
+indexed by the in-process ingestion worker pool.
 """
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+from src.core.config import settings
+from src.core.database import async_session_maker
+from src.core.job_queue import STALE_JOB_AFTER, JobQueue, ProgressCallback, keep_alive
 from src.core.logger import get_logger
+from src.core.metrics import EXECUTOR_QUEUE_DEPTH, registry
 from src.models.document_model import Document
 from src.repo.document_repo import DocumentRepository
+from src.repo.ingestion_job_repo import IngestionJobRepository
 from src.service.rag_service import RAGService
 
 logger = get_logger("DOCUMENT_SERVICE")
 
+_MAX_JOB_ATTEMPTS = 3
+
+_ingestion_queue: JobQueue | None = None
+
 
 class DocumentService:
     """Coordinates Postgres metadata and ChromaDB vector storage for documents.
@@ -18,13 +32,21 @@ class DocumentService:
     Attributes:
         doc_repo (DocumentRepository): Repository for the ``documents`` table.
         rag (RAGService): Service for ChromaDB ingestion and deletion.
+        job_repo (IngestionJobRepository | None): Repository for the
+            ``ingestion_jobs`` queue table.
     """
 
-    def __init__(self, doc_repo: DocumentRepository, rag: RAGService) -> None:
+    def __init__(
+        self,
+        doc_repo: DocumentRepository,
+        rag: RAGService,
+        job_repo: IngestionJobRepository | None = None,
+    ) -> None:
         self.doc_repo = doc_repo
         self.rag = rag
+        self.job_repo = job_repo
 
-    async def ingest_document(
+    async def enqueue_document(
         self,
         title: str,
         description: str,
@@ -33,11 +55,12 @@ class DocumentService:
         uploaded_by: str,
         allowed_roles: list[str],
     ) -> Document:
-        """Create a Postgres record and index the PDF in ChromaDB atomically.
+        """Create a processing document record and queue it for ingestion.
 
         The Postgres record is created first to obtain a stable UUID that is
-        used as the ChromaDB ``doc_id``.  If the ChromaDB write fails, the
-        Postgres record is rolled back so the two stores stay in sync.
+        later used as the ChromaDB ``doc_id``. The PDF is persisted in an
+        ``ingestion_jobs`` row so the upload survives a restart, and the job
+        is handed to the background worker pool.
 
         Args:
             title (str): Display title for the document.
@@ -48,11 +71,7 @@ class DocumentService:
             allowed_roles (list[str]): Roles permitted to access this document.
 
         Returns:
-            Document: The newly created and persisted document record.
-
-        Raises:
-            ValueError: If the PDF contains no extractable text.
-            RuntimeError: If ChromaDB is unavailable during the write path.
+            Document: The newly created document in ``processing`` status.
         """
         doc = await self.doc_repo.create(
             title=title,
@@ -66,16 +85,140 @@ class DocumentService:
         logger.info(f"Created document record {doc.id} for '{filename}'")
 
         try:
-            await self.rag.add_document(
-                doc_id=str(doc.id),
-                filename=filename,
-                pdf_bytes=pdf_bytes,
-            )
+            job = await self.job_repo.create(str(doc.id), pdf_bytes)
         except Exception:
-            logger.error(f"ChromaDB ingestion failed for doc {doc.id} — rolling back Postgres record")
+            logger.error(f"Could not queue ingestion for doc {doc.id} — rolling back Postgres record")
             await self.doc_repo.delete(str(doc.id))
             raise
 
-        updated = await self.doc_repo.update(str(doc.id), status="active", chroma_doc_id=str(doc.id))
-        logger.info(f"Document {doc.id} ingested successfully")
-        return updated or doc
+        get_ingestion_queue().submit(str(job.id))
+        return doc
+
+    async def process_ingestion_job(
+        self,
+        job_id: str,
+        on_progress: ProgressCallback | None = None,
+    ) -> None:
+        """Index a queued upload in ChromaDB and activate its document.
+
+        Failures mark both the job and the document as ``failed`` with the
+        reason recorded on the job; partially written chunks are removed by
+        ``RAGService.add_document``. A job cancelled by a worker shutdown is
+        put back in the queue for the next worker pool, which re-indexes it
+        from the start.
+
+        Args:
+            job_id (str): ``ingestion_jobs.id`` of the job to run.
+            on_progress (ProgressCallback | None): Optional per-page progress
+                callback forwarded to the RAG pipeline.
+        """
+        job = await self.job_repo.claim(job_id)
+        if job is None:
+            logger.info(f"Ingestion job {job_id} already claimed or removed")
+            return
+
+        doc_id = str(job.document_id)
+        doc = await self.doc_repo.get_by_id(doc_id)
+        if doc is None:
+            await self.job_repo.fail_orphaned(job, "Document was deleted before it was indexed")
+            return
+
+        # A failed flush leaves the job unreadable until the session is rolled back.
+        claimed_id = job.id
+        try:
+            async with keep_alive(lambda: self.job_repo.heartbeat(job), f"ingestion job {job.id}"):
+                summary = await self.rag.add_document(
+                    doc_id=doc_id,
+                    filename=doc.filename,
+                    pdf_bytes=job.pdf_bytes,
+                    on_progress=on_progress,
+                )
+        except asyncio.CancelledError:
+            await _release_ingestion_job(claimed_id)
+            raise
+        except Exception as exc:
+            logger.error(f"ChromaDB ingestion failed for doc {doc_id}: {exc}")
+            await self.job_repo.fail(job, str(exc))
+            await self.doc_repo.update(doc_id, status="failed")
+            return
+
+        updated = await self.doc_repo.update(
+            doc_id,
+            status="active",
+            chroma_doc_id=doc_id,
+            chunk_count=summary["chunk_count"],
+        )
+        if updated is None:
+            await self.rag.delete_document(doc_id)
+            await self.job_repo.fail_orphaned(job, "Document was deleted while it was being indexed")
+            return
+        await self.job_repo.complete(job)
+        logger.info(f"Document {doc_id} ingested successfully")
+
+
+async def _run_ingestion_job(job_id: str, on_progress: ProgressCallback) -> None:
+    """Queue handler running one job in its own database session.
+
+    Args:
+        job_id (str): ``ingestion_jobs.id`` of the job to run.
+        on_progress (ProgressCallback): Progress reporter supplied by the queue.
+    """
+    async with async_session_maker() as session:
+        svc = DocumentService(DocumentRepository(session), RAGService(), IngestionJobRepository(session))
+        await svc.process_ingestion_job(job_id, on_progress)
+
+
+async def _release_ingestion_job(job_id: uuid.UUID) -> None:
+    """Requeue a cancelled job on a fresh session, as its own may be mid-call."""
+    try:
+        async with async_session_maker() as session:
+            await IngestionJobRepository(session).release(job_id)
+    except Exception as exc:
+        logger.error(f"Could not requeue cancelled ingestion job {job_id}: {exc}")
+
+
+def get_ingestion_queue() -> JobQueue:
+    """Return the shared ingestion worker pool configured from settings.
+
+    Returns:
+        JobQueue: Process-wide queue running ingestion jobs.
+    """
+    global _ingestion_queue
+    if _ingestion_queue is None:
+        _ingestion_queue = JobQueue(_run_ingestion_job, workers=settings.INGEST_WORKERS, name="ingestion")
+    return _ingestion_queue
+
+
+async def recover_ingestion_jobs() -> int:
+    """Re-submit jobs left queued or stranded by a previous process.
+
+    Returns:
+        int: Number of jobs handed back to the worker pool.
+    """
+    stale_before = datetime.now(timezone.utc) - STALE_JOB_AFTER
+    async with async_session_maker() as session:
+        job_ids = await IngestionJobRepository(session).requeue_recoverable(
+            stale_before,
+            _MAX_JOB_ATTEMPTS,
+        )
+    queue = get_ingestion_queue()
+    for job_id in job_ids:
+        queue.submit(job_id)
+    return len(job_ids)
+
+
+async def shutdown_ingestion_queue() -> None:
+    """Stop the shared ingestion workers, typically on application shutdown."""
+    global _ingestion_queue
+    if _ingestion_queue is not None:
+        await _ingestion_queue.stop()
+    _ingestion_queue = None
+
+
+def _collect_queue_depth() -> None:
+    """Publish the ingestion backlog on the metrics endpoint."""
+    depth = _ingestion_queue.pending if _ingestion_queue is not None else 0
+    EXECUTOR_QUEUE_DEPTH.set(depth, executor="ingestion")
+
+
+registry.add_collector(_collect_queue_depth)
@@ -0,0 +1,362 @@
+"""Service layer for background audit exports.
+
+A security user requests an export of conversations, messages and alarms,
+optionally limited to one user and a time range. The request is stored
+as an ``export_jobs`` row and handed to a small background worker pool,
+so the HTTP call returns immediately however much data is involved.
+
+The worker reads all three record types through server-side cursors in a
+single ``REPEATABLE READ`` transaction, so the file is a consistent
+snapshot, and writes them as gzip-compressed JSON Lines. Each line is one
+object whose ``type`` is ``conversation``, ``message`` or ``alarm``.
+Compression runs on a worker thread in batches, and the record counters on
+the job row are updated after every batch so any API process can report
+progress. The compressed file is stored in Postgres in slices committed
+alongside that progress, so any API process can also serve the download;
+it is only offered once the job has completed.
+"""
+import asyncio
+import gzip
+import io
+import json
+import uuid
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+
+from fastapi import HTTPException, status
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.database import async_session_maker
+from src.core.job_queue import STALE_JOB_AFTER, JobQueue, ProgressCallback
+from src.core.logger import get_logger
+from src.core.metrics import EXECUTOR_QUEUE_DEPTH, registry
+from src.models.export_job_model import ExportJob
+from src.repo.conversation_repo import ConversationRepository
+from src.repo.export_job_repo import ExportJobRepository
+from src.repo.flagged_event_repo import FlaggedEventRepository
+from src.schemas.chat_schema import SecurityExportJobResponse, SecurityExportRequest
+
+logger = get_logger("EXPORT_SERVICE")
+
+# Records compressed and written per batch; progress is saved after each one.
+_EXPORT_BATCH_RECORDS = 1000
+# gzip level trading a little size for much faster compression than the default 9.
+_COMPRESS_LEVEL = 6
+# Compressed bytes stored per export_job_chunks row.
+_EXPORT_CHUNK_BYTES = 1024 * 1024
+_RECENT_EXPORTS_LIMIT = 50
+
+_export_queue: JobQueue | None = None
+
+
+def _json_default(value: object) -> str:
+    """Serialize UUIDs and timestamps in export records."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _encode_record(record_type: str, row: Row) -> bytes:
+    """Render one database row as a JSON Lines export record."""
+    return (json.dumps({"type": record_type, **row._asdict()}, default=_json_default) + "\n").encode()
+
+
+def _drain(buffer: io.BytesIO) -> bytes:
+    """Take everything written to ``buffer`` so far and empty it."""
+    data = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return data
+
+
+def to_export_job_response(job: ExportJob) -> SecurityExportJobResponse:
+    """Build the API representation of an export job.
+
+    Args:
+        job (ExportJob): The export job row.
+
+    Returns:
+        SecurityExportJobResponse: Status and progress of the export.
+    """
+    return SecurityExportJobResponse(
+        id=str(job.id),
+        status=job.status,
+        requested_by=str(job.requested_by),
+        user_id=str(job.user_id) if job.user_id is not None else None,
+        created_from=job.created_from,
+        created_to=job.created_to,
+        conversations_exported=job.conversations_exported,
+        messages_exported=job.messages_exported,
+        alarms_exported=job.alarms_exported,
+        file_size=job.file_size,
+        error=job.error,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+        completed_at=job.completed_at,
+    )
+
+
+class ExportService:
+    """Creates, runs and serves background audit exports.
+
+    Attributes:
+        job_repo (ExportJobRepository): Repository for the ``export_jobs`` table.
+    """
+
+    def __init__(self, job_repo: ExportJobRepository) -> None:
+        self.job_repo = job_repo
+
+    async def request_export(self, requested_by: str, request: SecurityExportRequest) -> SecurityExportJobResponse:
+        """Queue a background export for the requested filters.
+
+        Args:
+            requested_by (str): UUID of the requesting security user.
+            request (SecurityExportRequest): User and time range filters.
+
+        Returns:
+            SecurityExportJobResponse: The queued export.
+
+        Raises:
+            HTTPException: 422 if the time range is empty.
+        """
+        if (
+            request.created_from is not None
+            and request.created_to is not None
+            and request.created_from >= request.created_to
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="created_from must be before created_to",
+            )
+        job = await self.job_repo.create(
+            requested_by,
+            user_id=request.user_id,
+            created_from=request.created_from,
+            created_to=request.created_to,
+        )
+        get_export_queue().submit(str(job.id))
+        return to_export_job_response(job)
+
+    async def _get_job(self, job_id: str) -> ExportJob:
+        """Load an export job or raise 404."""
+        try:
+            job = await self.job_repo.get(uuid.UUID(job_id))
+        except ValueError:
+            job = None
+        if job is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export not found")
+        return job
+
+    async def get_export(self, job_id: str) -> SecurityExportJobResponse:
+        """Return the status and progress of one export.
+
+        Args:
+            job_id (str): UUID of the export job.
+
+        Returns:
+            SecurityExportJobResponse: The export's current state.
+
+        Raises:
+            HTTPException: 404 if the export does not exist.
+        """
+        return to_export_job_response(await self._get_job(job_id))
+
+    async def list_exports(self) -> list[SecurityExportJobResponse]:
+        """Return the most recently requested exports, newest first.
+
+        Returns:
+            list[SecurityExportJobResponse]: Recent exports.
+        """
+        jobs = await self.job_repo.list_recent(_RECENT_EXPORTS_LIMIT)
+        return [to_export_job_response(job) for job in jobs]
+
+    async def stream_export_file(self, job_id: str) -> AsyncIterator[bytes]:
+        """Return the stored file of a completed export, one slice at a time.
+
+        Args:
+            job_id (str): UUID of the export job.
+
+        Returns:
+            AsyncIterator[bytes]: Consecutive slices of the ``.jsonl.gz`` file.
+
+        Raises:
+            HTTPException: 404 if the export or its file does not exist, 409
+            if the export has not completed.
+        """
+        job = await self._get_job(job_id)
+        if job.status != "completed":
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Export is {job.status}")
+        first = await self.job_repo.get_chunk(job.id, 0)
+        if first is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export file no longer exists")
+
+        async def chunks() -> AsyncIterator[bytes]:
+            data, seq = first, 0
+            while data is not None:
+                yield data
+                seq += 1
+                data = await self.job_repo.get_chunk(job.id, seq)
+
+        return chunks()
+
+    async def process_export_job(self, job_id: str, source: AsyncSession) -> None:
+        """Write a queued export to storage and record the outcome on its job.
+
+        Failures mark the job ``failed`` with the reason and remove the
+        partial file. An export cancelled by a worker shutdown is put back
+        in the queue and restarts from the beginning.
+
+        Args:
+            job_id (str): ``export_jobs.id`` of the job to run.
+            source (AsyncSession): Session used only for reading the exported
+                records, separate from the job repository's session so
+                progress commits do not end the read snapshot.
+        """
+        job = await self.job_repo.claim(job_id)
+        if job is None:
+            logger.info(f"Export job {job_id} already claimed or removed")
+            return
+
+        # A failed flush leaves the job unreadable until the session is rolled back.
+        claimed_id = job.id
+        try:
+            file_size = await self._write_export(job, source)
+        except asyncio.CancelledError:
+            await _release_export_job(claimed_id)
+            raise
+        except Exception as exc:
+            logger.error(f"Export job {claimed_id} failed: {exc}", exc_info=True)
+            # Drop the unflushed file slices and reload the job before failing it.
+            await self.job_repo.session.rollback()
+            await self.job_repo.session.refresh(job)
+            await self.job_repo.fail(job, str(exc))
+            return
+        await self.job_repo.complete(job, file_size)
+
+    async def _write_export(self, job: ExportJob, source: AsyncSession) -> int:
+        """Stream the job's records into a stored gzip file, saving progress per batch.
+
+        Args:
+            job (ExportJob): The claimed export job.
+            source (AsyncSession): Session the records are read with.
+
+        Returns:
+            int: Size of the stored file in bytes.
+        """
+        # One snapshot for all three record types, so alarms and messages agree.
+        await source.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        filters = {
+            "user_id": job.user_id,
+            "created_from": job.created_from,
+            "created_to": job.created_to,
+        }
+        conversation_repo = ConversationRepository(source)
+        alarm_repo = FlaggedEventRepository(source)
+        sources = (
+            ("conversation", conversation_repo.stream_audit_conversations(**filters)),
+            ("message", conversation_repo.stream_audit_messages(**filters)),
+            ("alarm", alarm_repo.stream_audit_events(**filters)),
+        )
+        counts = {"conversation": 0, "message": 0, "alarm": 0}
+        lines: list[bytes] = []
+        buffer = io.BytesIO()
+        file_size = 0
+        seq = 0
+
+        def store(data: bytes) -> None:
+            nonlocal file_size, seq
+            self.job_repo.add_chunk(job, seq, data)
+            file_size += len(data)
+            seq += 1
+
+        handle = gzip.GzipFile(fileobj=buffer, mode="wb", compresslevel=_COMPRESS_LEVEL)
+        try:
+            for record_type, rows in sources:
+                async for row in rows:
+                    lines.append(_encode_record(record_type, row))
+                    counts[record_type] += 1
+                    if len(lines) >= _EXPORT_BATCH_RECORDS:
+                        await asyncio.to_thread(handle.write, b"".join(lines))
+                        lines.clear()
+                        if buffer.tell() >= _EXPORT_CHUNK_BYTES:
+                            store(_drain(buffer))
+                        await self.job_repo.update_progress(
+                            job, counts["conversation"], counts["message"], counts["alarm"]
+                        )
+            if lines:
+                await asyncio.to_thread(handle.write, b"".join(lines))
+            await asyncio.to_thread(handle.close)
+        finally:
+            await source.rollback()
+        store(_drain(buffer))
+        await self.job_repo.update_progress(job, counts["conversation"], counts["message"], counts["alarm"])
+        return file_size
+
+
+async def _run_export_job(job_id: str, on_progress: ProgressCallback) -> None:
+    """Queue handler running one export with its own database sessions.
+
+    Progress is persisted on the job row rather than reported through the
+    queue's in-memory callback, so it is visible from every process.
+
+    Args:
+        job_id (str): ``export_jobs.id`` of the job to run.
+        on_progress (ProgressCallback): Unused in-memory progress reporter.
+    """
+    async with async_session_maker() as session, async_session_maker() as source:
+        await ExportService(ExportJobRepository(session)).process_export_job(job_id, source)
+
+
+async def _release_export_job(job_id: uuid.UUID) -> None:
+    """Requeue a cancelled export on a fresh session, as its own may be mid-call."""
+    try:
+        async with async_session_maker() as session:
+            await ExportJobRepository(session).release(job_id)
+    except Exception as exc:
+        logger.error(f"Could not requeue cancelled export job {job_id}: {exc}")
+
+
+def get_export_queue() -> JobQueue:
+    """Return the shared export worker pool configured from settings.
+
+    Returns:
+        JobQueue: Process-wide queue running export jobs.
+    """
+    global _export_queue
+    if _export_queue is None:
+        _export_queue = JobQueue(_run_export_job, workers=settings.EXPORT_WORKERS, name="export")
+    return _export_queue
+
+
+async def recover_export_jobs() -> int:
+    """Re-submit exports left queued or stranded by a previous process.
+
+    Returns:
+        int: Number of exports handed back to the worker pool.
+    """
+    stale_before = datetime.now(timezone.utc) - STALE_JOB_AFTER
+    async with async_session_maker() as session:
+        job_ids = await ExportJobRepository(session).requeue_recoverable(stale_before)
+    queue = get_export_queue()
+    for job_id in job_ids:
+        queue.submit(job_id)
+    return len(job_ids)
+
+
+async def shutdown_export_queue() -> None:
+    """Stop the shared export workers, typically on application shutdown."""
+    global _export_queue
+    if _export_queue is not None:
+        await _export_queue.stop()
+    _export_queue = None
+
+
+def _collect_queue_depth() -> None:
+    """Publish the export backlog on the metrics endpoint."""
+    depth = _export_queue.pending if _export_queue is not None else 0
+    EXECUTOR_QUEUE_DEPTH.set(depth, executor="export")
+
+
+registry.add_collector(_collect_queue_depth)
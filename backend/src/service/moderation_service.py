@@ -0,0 +1,159 @@
+"""Service layer for database-managed moderation keywords.
+
+Admin edits are written to Postgres and bump a version counter. Each
+process keeps its compiled keyword matcher in memory and a background task
+compares the stored version every ``MODERATION_KEYWORDS_REFRESH_SECONDS``,
+recompiling only when it changed, so the chat hot path never queries the
+keyword tables.
+"""
+from __future__ import annotations
+
+import asyncio
+
+from fastapi import HTTPException, status
+
+from src.core.config import settings
+from src.core.database import async_session_maker
+from src.core.logger import get_logger
+from src.moderation.keyword_filter import install_keywords, keyword_version
+from src.repo.moderation_keyword_repo import ModerationKeywordRepository
+from src.schemas.admin_schema import ModerationKeywordListOut
+from src.security.jwt import AuthenticatedUser
+
+logger = get_logger("MODERATION_SERVICE")
+
+_MODERATOR_ROLES = {"admin", "security"}
+_MAX_KEYWORD_LENGTH = 255
+
+_refresh_task: asyncio.Task | None = None
+
+
+def _normalize_keywords(keywords: list[str]) -> list[str]:
+    """Lowercase, strip, and de-duplicate submitted keywords."""
+    normalized = list(dict.fromkeys(k.strip().lower() for k in keywords if k.strip()))
+    too_long = [k for k in normalized if len(k) > _MAX_KEYWORD_LENGTH]
+    if too_long:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=f"Keywords must be at most {_MAX_KEYWORD_LENGTH} characters.",
+        )
+    return normalized
+
+
+async def refresh_keyword_matcher(repo: ModerationKeywordRepository) -> bool:
+    """Recompile the keyword matcher if the stored version has changed.
+
+    Costs a single-row version lookup when nothing changed.
+
+    Args:
+        repo (ModerationKeywordRepository): Repository bound to a session.
+
+    Returns:
+        bool: True if a new keyword list was installed.
+    """
+    version = await repo.get_version()
+    if version is None or version == keyword_version():
+        return False
+    keywords = await repo.list_keywords()
+    installed = await asyncio.to_thread(install_keywords, keywords, version)
+    if installed:
+        logger.info(f"Installed moderation keyword list v{version} ({len(keywords)} keywords)")
+    return installed
+
+
+class ModerationService:
+    """Business logic for managing the moderation keyword list."""
+
+    def __init__(self, repo: ModerationKeywordRepository) -> None:
+        self.repo = repo
+
+    @staticmethod
+    def _require_moderator(auth: AuthenticatedUser) -> None:
+        if auth.role not in _MODERATOR_ROLES:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Admin or security role required",
+            )
+
+    async def _stored(self) -> ModerationKeywordListOut:
+        """Return the stored keyword list and version."""
+        return ModerationKeywordListOut(
+            version=await self.repo.get_version(),
+            keywords=await self.repo.list_keywords(),
+        )
+
+    async def _current(self) -> ModerationKeywordListOut:
+        """Activate the stored list in this process and return it."""
+        await refresh_keyword_matcher(self.repo)
+        return await self._stored()
+
+    async def list_keywords(self, auth: AuthenticatedUser) -> ModerationKeywordListOut:
+        """Return the stored keyword list."""
+        self._require_moderator(auth)
+        return await self._stored()
+
+    async def add_keywords(
+        self,
+        auth: AuthenticatedUser,
+        keywords: list[str],
+    ) -> ModerationKeywordListOut:
+        """Add keywords to the stored list and activate it in this process."""
+        self._require_moderator(auth)
+        added = await self.repo.add_keywords(_normalize_keywords(keywords))
+        logger.info(f"User {auth.user_id} added {len(added)} moderation keywords")
+        return await self._current()
+
+    async def replace_keywords(
+        self,
+        auth: AuthenticatedUser,
+        keywords: list[str],
+    ) -> ModerationKeywordListOut:
+        """Replace the stored list and activate it in this process."""
+        self._require_moderator(auth)
+        normalized = _normalize_keywords(keywords)
+        await self.repo.replace_keywords(normalized)
+        logger.info(f"User {auth.user_id} replaced the moderation keyword list ({len(normalized)} keywords)")
+        return await self._current()
+
+    async def remove_keyword(self, auth: AuthenticatedUser, keyword: str) -> None:
+        """Remove a keyword from the stored list and activate the change."""
+        self._require_moderator(auth)
+        removed = await self.repo.remove_keyword(keyword.strip().lower())
+        if not removed:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Keyword not found",
+            )
+        logger.info(f"User {auth.user_id} removed moderation keyword '{keyword}'")
+        await refresh_keyword_matcher(self.repo)
+
+
+async def _refresh_loop(interval: float) -> None:
+    """Poll the keyword version forever, reloading the matcher on change."""
+    while True:
+        try:
+            async with async_session_maker() as session:
+                await refresh_keyword_matcher(ModerationKeywordRepository(session))
+        except Exception as exc:
+            logger.error(f"Moderation keyword refresh failed: {exc}")
+        await asyncio.sleep(interval)
+
+
+def start_keyword_refresh() -> None:
+    """Start the background keyword version poller if it is not running."""
+    global _refresh_task
+    if _refresh_task is None or _refresh_task.done():
+        _refresh_task = asyncio.get_running_loop().create_task(
+            _refresh_loop(settings.MODERATION_KEYWORDS_REFRESH_SECONDS),
+            name="moderation-keyword-refresh",
+        )
+
+
+async def stop_keyword_refresh() -> None:
+    """Cancel the background keyword poller, typically on application shutdown."""
+    global _refresh_task
+    task = _refresh_task
+    _refresh_task = None
+    if task is not None:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
@@ -7,16 +7,18 @@ remote Chroma collection for injecting context into chat completions.
 Access control is managed entirely via the ``documents`` table in Postgres.
 ChromaDB is a pure vector store — no role or user metadata is stored in chunks.
 """
-import asyncio
-from io import BytesIO
-
-from chromadb.api.async_api import AsyncCollection
-from pypdf import PdfReader
+from collections.abc import AsyncIterator, Awaitable
 
 from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
 
-from src.core.chroma import ChromaManager, get_chroma_manager
+from src.core.chroma import ChromaManager, InstrumentedCollection, get_chroma_manager
+from src.core.config import settings
+from src.core.embedding_cache import cache_key, get_embedding_cache
+from src.core.embedding_scheduler import EmbeddingScheduler
+from src.core.job_queue import ProgressCallback
 from src.core.logger import get_logger
+from src.core.metrics import EXECUTOR_QUEUE_DEPTH, registry, timed_stage
+from src.core.pdf_extractor import PdfExtractor
 
 logger = get_logger("RAG_SERVICE")
 
@@ -25,42 +27,181 @@ _CHUNK_SIZE = 800
 _CHUNK_OVERLAP = 150
 
 _embedding_fn = DefaultEmbeddingFunction()
+_embedding_scheduler: EmbeddingScheduler | None = None
+_pdf_extractor: PdfExtractor | None = None
+
+
+class _TextChunker:
+    """Split a stream of text into overlapping chunks for retrieval.
+
+    Text is fed incrementally (one PDF page at a time) and only the tail
+    that may still belong to an unfinished chunk is buffered, so chunks can
+    span page boundaries without materializing the whole document.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._started = False
+
+    def feed(self, text: str) -> list[str]:
+        """Append text and return every chunk that is now complete.
+
+        Args:
+            text (str): Next segment of extracted document text.
+
+        Returns:
+            list[str]: Non-empty chunks that can no longer grow.
+        """
+        self._buffer = f"{self._buffer}\n{text}" if self._started else text
+        self._started = True
+        chunks: list[str] = []
+        while len(self._buffer) > _CHUNK_SIZE:
+            chunk = self._buffer[:_CHUNK_SIZE].strip()
+            if chunk:
+                chunks.append(chunk)
+            self._buffer = self._buffer[_CHUNK_SIZE - _CHUNK_OVERLAP:]
+        return chunks
+
+    def finish(self) -> list[str]:
+        """Return the final partial chunk, if it contains any text.
+
+        Returns:
+            list[str]: Zero or one trailing chunk.
+        """
+        chunk = self._buffer.strip()
+        self._buffer = ""
+        return [chunk] if chunk else []
+
+
+async def _iter_page_texts(pdf_bytes: bytes) -> AsyncIterator[tuple[int, int, str]]:
+    """Stream PDF page text from the shared extraction process pool.
+
+    Args:
+        pdf_bytes (bytes): Raw PDF content.
+
+    Yields:
+        tuple[int, int, str]: One-based page number, total page count, and
+        the page's extracted text.
+    """
+    async for page in get_pdf_extractor().iter_pages(pdf_bytes):
+        yield page
+
+
+def get_pdf_extractor() -> PdfExtractor:
+    """Return the shared PDF extractor configured from settings.
+
+    Returns:
+        PdfExtractor: Process-wide extractor whose worker pool is shared by
+        every concurrent upload.
+    """
+    global _pdf_extractor
+    if _pdf_extractor is None:
+        _pdf_extractor = PdfExtractor(
+            max_workers=settings.PDF_EXTRACT_WORKERS,
+            pages_per_task=settings.PDF_EXTRACT_PAGES_PER_TASK,
+        )
+    return _pdf_extractor
 
 
-def _chunk_text(text: str) -> list[str]:
-    """Split text into overlapping chunks for retrieval.
+def shutdown_pdf_extractor() -> None:
+    """Stop the shared PDF extraction pool, typically on application shutdown."""
+    global _pdf_extractor
+    if _pdf_extractor is not None:
+        _pdf_extractor.shutdown()
+    _pdf_extractor = None
+
+
+def _run_embedding_model(texts: list[str]) -> list[list[float]]:
+    """Run the ONNX embedding model and convert vectors to plain floats.
+
+    Executed on the embedding scheduler's worker threads.
 
     Args:
-        text (str): Raw extracted document text.
+        texts (list[str]): Text inputs to embed in one model invocation.
 
     Returns:
-        list[str]: Non-empty overlapping chunks suitable for embedding and
-        semantic search.
+        list[list[float]]: Dense embedding vectors aligned with ``texts``.
     """
-    chunks: list[str] = []
-    start = 0
-    while start < len(text):
-        end = min(start + _CHUNK_SIZE, len(text))
-        chunk = text[start:end].strip()
-        if chunk:
-            chunks.append(chunk)
-        if end == len(text):
-            break
-        start = end - _CHUNK_OVERLAP
-    return chunks
+    return [[float(value) for value in v] for v in _embedding_fn(texts)]
+
+
+def get_embedding_scheduler() -> EmbeddingScheduler:
+    """Return the shared embedding scheduler configured from settings.
+
+    Returns:
+        EmbeddingScheduler: Process-wide scheduler that batches concurrent
+        embedding requests onto the dedicated embedding executor.
+    """
+    global _embedding_scheduler
+    if _embedding_scheduler is None:
+        _embedding_scheduler = EmbeddingScheduler(
+            _run_embedding_model,
+            max_workers=settings.EMBEDDING_WORKERS,
+            batch_window_ms=settings.EMBEDDING_BATCH_WINDOW_MS,
+            max_batch_size=settings.EMBEDDING_MAX_BATCH_SIZE,
+        )
+    return _embedding_scheduler
+
+
+def shutdown_embedding_scheduler() -> None:
+    """Stop the shared embedding scheduler, typically on application shutdown."""
+    global _embedding_scheduler
+    if _embedding_scheduler is not None:
+        _embedding_scheduler.shutdown()
+    _embedding_scheduler = None
+
+
+def _collect_queue_depth() -> None:
+    """Publish the embedding backlog on the metrics endpoint."""
+    depth = _embedding_scheduler.pending if _embedding_scheduler is not None else 0
+    EXECUTOR_QUEUE_DEPTH.set(depth, executor="embedding")
+
+
+registry.add_collector(_collect_queue_depth)
 
 
 async def _get_embeddings(texts: list[str]) -> list[list[float]]:
     """Compute embeddings locally via ChromaDB's built-in ONNX model.
 
+    Vectors are served from the shared content-addressed embedding cache when
+    possible; only texts missing from the cache are sent to the model, and
+    duplicate texts within a batch are embedded once. Model calls go through
+    the embedding scheduler so concurrent callers share batched invocations.
+
     Args:
         texts (list[str]): Text inputs to embed in batch.
 
     Returns:
         list[list[float]]: Dense embedding vectors converted to plain floats.
     """
-    result = await asyncio.to_thread(_embedding_fn, texts)
-    return [[float(value) for value in v] for v in result]
+    cache = get_embedding_cache()
+    keys = [cache_key(_EMBEDDING_MODEL, text) for text in texts]
+    vectors = await cache.get_many(keys)
+
+    missing: dict[str, str] = {}
+    for key, text, vector in zip(keys, texts, vectors):
+        if vector is None and key not in missing:
+            missing[key] = text
+
+    if missing:
+        result = await get_embedding_scheduler().embed(list(missing.values()))
+        computed = dict(zip(missing.keys(), result))
+        await cache.put_many(computed)
+        vectors = [
+            vector if vector is not None else computed[key]
+            for key, vector in zip(keys, vectors)
+        ]
+
+    return vectors
+
+
+def embedding_cache_stats() -> dict[str, int]:
+    """Return hit, miss, and occupancy counters for the embedding cache.
+
+    Returns:
+        dict[str, int]: Counters from the shared embedding cache.
+    """
+    return get_embedding_cache().stats()
 
 
 def _document_where(user_id: str, doc_id: str) -> dict:
@@ -102,11 +243,11 @@ class RAGService:
         """
         self.chroma = chroma or get_chroma_manager()
 
-    async def _get_ids(self, collection: AsyncCollection, where: dict) -> list[str]:
+    async def _get_ids(self, collection: InstrumentedCollection, where: dict) -> list[str]:
         """Fetch matching Chroma record IDs for a metadata filter.
 
         Args:
-            collection (AsyncCollection): Active Chroma collection handle.
+            collection (InstrumentedCollection): Active Chroma collection handle.
             where (dict): Metadata filter sent to Chroma.
 
         Returns:
@@ -117,36 +258,49 @@ class RAGService:
 
     async def _query(
         self,
-        collection: AsyncCollection,
+        collection: InstrumentedCollection,
         query: str,
         n_results: int,
         where: dict,
+        chunks_in_scope: int | None = None,
+        query_embedding: Awaitable[list[float]] | None = None,
     ) -> dict:
         """Run a filtered semantic search against the Chroma collection.
 
         Args:
-            collection (AsyncCollection): Active Chroma collection handle.
+            collection (InstrumentedCollection): Active Chroma collection handle.
             query (str): End-user query text to embed and search with.
             n_results (int): Maximum number of chunks to retrieve.
             where (dict): Metadata filter limiting the search scope.
+            chunks_in_scope (int | None): Known number of chunks matching
+                ``where``. When ``None`` the count is fetched from Chroma.
+            query_embedding (Awaitable[list[float]] | None): Embedding of
+                ``query`` already being computed, e.g. by
+                :meth:`embed_query`. When ``None`` it is computed here.
 
         Returns:
             dict: Raw Chroma query payload containing matched documents and
             metadata lists.
         """
         # n_results must not exceed the number of docs in the filtered set
-        ids_in_scope = await self._get_ids(collection, where)
-        if not ids_in_scope:
+        if chunks_in_scope is None:
+            with timed_stage("chroma_count"):
+                chunks_in_scope = len(await self._get_ids(collection, where))
+        if not chunks_in_scope:
             return {"documents": [[]], "metadatas": [[]]}
 
-        capped = min(n_results, len(ids_in_scope))
-        query_embeddings = await _get_embeddings([query])
-        return await collection.query(
-            query_embeddings=query_embeddings,
-            n_results=capped,
-            where=where,
-            include=["documents", "metadatas"],
-        )
+        capped = min(n_results, chunks_in_scope)
+        if query_embedding is None:
+            query_embeddings = [await self.embed_query(query)]
+        else:
+            query_embeddings = [await query_embedding]
+        with timed_stage("chroma_query"):
+            return await collection.query(
+                query_embeddings=query_embeddings,
+                n_results=capped,
+                where=where,
+                include=["documents", "metadatas"],
+            )
 
     # ------------------------------------------------------------------
     # Public async API
@@ -157,14 +311,21 @@ class RAGService:
         doc_id: str,
         filename: str,
         pdf_bytes: bytes,
+        on_progress: ProgressCallback | None = None,
     ) -> dict:
         """Parse a PDF, chunk it, embed it, and store it in ChromaDB.
 
+        Ingestion is a streaming pipeline: pages are extracted in parallel
+        on the PDF extraction process pool, chunked incrementally across
+        page boundaries, and embedded and upserted in batches of
+        ``INGEST_BATCH_SIZE`` chunks, so peak memory does not grow with the
+        size of the document.
+
         The ``doc_id`` must be the UUID of a pre-existing Postgres
         ``documents`` record. Callers should use a service-layer wrapper
-        (e.g. ``DocumentService.ingest_document``) to guarantee the
+        (e.g. ``DocumentService.process_ingestion_job``) to guarantee the
         Postgres record is created before this method is called, and
-        rolled back if this method fails.
+        marked failed if this method fails.
 
         Args:
             doc_id (str): The ``documents.id`` UUID from Postgres, used
@@ -172,6 +333,9 @@ class RAGService:
             filename (str): Original PDF filename, stored in chunk
                 metadata for source attribution.
             pdf_bytes (bytes): Raw PDF content.
+            on_progress (ProgressCallback | None): Optional callback invoked
+                after each page with the pages processed, the total page
+                count, and the number of chunks stored so far.
 
         Returns:
             dict: Upload summary containing doc_id, filename, and chunk_count.
@@ -180,40 +344,64 @@ class RAGService:
             ValueError: If the PDF contains no extractable text.
             RuntimeError: If Chroma is unavailable during the write path.
         """
-        reader = PdfReader(BytesIO(pdf_bytes))
-        full_text = "\n".join(
-            page.extract_text() or "" for page in reader.pages
-        )
-        chunks = _chunk_text(full_text)
-        if not chunks:
+        collection = await self.chroma.get_collection()
+        chunker = _TextChunker()
+        pending: list[str] = []
+        stored = 0
+
+        async def _flush(batch: list[str]) -> None:
+            nonlocal stored
+            embeddings = await _get_embeddings(batch)
+            indices = range(stored, stored + len(batch))
+            try:
+                await collection.upsert(
+                    ids=[f"{doc_id}::{i}" for i in indices],
+                    embeddings=embeddings,
+                    documents=batch,
+                    metadatas=[
+                        {"doc_id": doc_id, "filename": filename, "chunk_index": i}
+                        for i in indices
+                    ],
+                )
+            except Exception as exc:
+                raise self.chroma.unavailable_error("write", exc) from exc
+            stored += len(batch)
+
+        try:
+            async for page_number, page_count, text in _iter_page_texts(pdf_bytes):
+                pending.extend(chunker.feed(text))
+                while len(pending) >= settings.INGEST_BATCH_SIZE:
+                    batch = pending[:settings.INGEST_BATCH_SIZE]
+                    del pending[:settings.INGEST_BATCH_SIZE]
+                    await _flush(batch)
+                if on_progress is not None:
+                    on_progress(page_number, page_count, stored)
+            pending.extend(chunker.finish())
+            if pending:
+                await _flush(pending)
+        except Exception:
+            if stored:
+                await self._delete_partial(collection, doc_id)
+            raise
+
+        if not stored:
             raise ValueError("No extractable text found in the uploaded PDF.")
 
-        logger.info(f"Storing {len(chunks)} chunks for doc {doc_id}")
+        logger.info(f"Stored doc {doc_id} with {stored} chunks")
+        return {"doc_id": doc_id, "filename": filename, "chunk_count": stored}
 
-        ids = [f"{doc_id}::{i}" for i in range(len(chunks))]
-        metadatas = [
-            {
-                "doc_id": doc_id,
-                "filename": filename,
-                "chunk_index": i,
-            }
-            for i in range(len(chunks))
-        ]
-        embeddings = await _get_embeddings(chunks)
+    async def _delete_partial(self, collection: InstrumentedCollection, doc_id: str) -> None:
+        """Best-effort removal of chunks written by a failed ingestion.
 
-        collection = await self.chroma.get_collection()
+        Args:
+            collection (InstrumentedCollection): Active Chroma collection handle.
+            doc_id (str): Document whose already-written batches should be
+                removed.
+        """
         try:
-            await collection.add(
-                ids=ids,
-                embeddings=embeddings,
-                documents=chunks,
-                metadatas=metadatas,
-            )
+            await collection.delete(where={"doc_id": doc_id})
         except Exception as exc:
-            raise self.chroma.unavailable_error("write", exc) from exc
-
-        logger.info(f"Stored doc {doc_id} with {len(chunks)} chunks")
-        return {"doc_id": doc_id, "filename": filename, "chunk_count": len(chunks)}
+            logger.error(f"Failed to remove partial chunks for doc {doc_id}: {exc}")
 
     async def list_documents(self, user_id: str = "") -> list[dict]:
         """Return a deduplicated chunk-count summary from ChromaDB.
@@ -268,11 +456,28 @@ class RAGService:
         except Exception as exc:
             raise self.chroma.unavailable_error("delete", exc) from exc
 
+    async def embed_query(self, query: str) -> list[float]:
+        """Embed a retrieval query ahead of :meth:`get_context`.
+
+        Lets callers start the embedding while they are still resolving
+        which documents the query may search.
+
+        Args:
+            query (str): End-user prompt used for semantic retrieval.
+
+        Returns:
+            list[float]: The query's embedding vector.
+        """
+        with timed_stage("embedding"):
+            return (await _get_embeddings([query]))[0]
+
     async def get_context(
         self,
         allowed_doc_ids: list[str],
         query: str,
         n_results: int = 5,
+        chunks_in_scope: int | None = None,
+        query_embedding: Awaitable[list[float]] | None = None,
     ) -> str | None:
         """Retrieve the most semantically relevant chunks for a query.
 
@@ -289,6 +494,12 @@ class RAGService:
                 user may access.
             query (str): End-user prompt used for semantic retrieval.
             n_results (int): Maximum number of document chunks to retrieve.
+            chunks_in_scope (int | None): Total chunk count of the allowed
+                documents as recorded in Postgres. Supplying it skips the
+                extra Chroma round-trip otherwise needed to cap ``n_results``.
+            query_embedding (Awaitable[list[float]] | None): Pending result of
+                :meth:`embed_query` for ``query``, awaited only if a search
+                is needed. Its failures fail closed like any other.
 
         Returns:
             str | None: Concatenated document context string when matches
@@ -303,6 +514,8 @@ class RAGService:
                 query,
                 n_results,
                 {"doc_id": {"$in": allowed_doc_ids}},
+                chunks_in_scope,
+                query_embedding,
             )
             docs = result.get("documents", [[]])[0]
             metas = result.get("metadatas", [[]])[0]
@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.logger import get_logger
 from src.repo.user_repo import UserRepository
-from src.security.password import hash_password
+from src.security.password import hash_password_async
 
 logger = get_logger("SEED_SERVICE")
 
@@ -64,7 +64,7 @@ class SeedService:
                 )
                 continue
 
-            hashed_password = hash_password(request.password)
+            hashed_password = await hash_password_async(request.password)
             created_user = await self.repo.create_user(
                 request.email,
                 hashed_password,
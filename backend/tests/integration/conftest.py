@@ -16,6 +16,7 @@ from sqlalchemy.pool import NullPool
 from src.main import app
 from src.core.config import settings
 from src.core.database import get_db
+from src.core.summary_metrics import get_summary_cache
 from src.models.registry import Base
 
 TEST_DATABASE_URL = settings.DATABASE_URL
@@ -43,6 +44,8 @@ app.dependency_overrides[get_db] = override_get_db
 @pytest_asyncio.fixture(autouse=True)
 async def setup_database() -> AsyncIterator[None]:
     """Creates all tables before each test and drops them after."""
+    # Counters cached from a previous test's tables would be stale
+    get_summary_cache().clear()
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
@@ -207,6 +207,40 @@ async def test_admin_users_patch_updates_role(
     assert target_user.role == "security"
 
 
+@pytest.mark.asyncio
+async def test_admin_role_change_applies_to_existing_tokens_immediately(
+    client: AsyncClient,
+    db_session: AsyncSession,
+) -> None:
+    await _signup(client, "cache-admin@example.com")
+    await _set_user_fields(db_session, "cache-admin@example.com", role=ROLE_ADMIN)
+    admin_headers = await _login_headers(client, "cache-admin@example.com")
+
+    await _signup(client, "cache-target@example.com")
+    target_headers = await _login_headers(client, "cache-target@example.com")
+    target_user = await _set_user_fields(db_session, "cache-target@example.com")
+
+    # Warm the principal cache with the target's original role.
+    response = await client.get("/api/v1/chat/security/alarms", headers=target_headers)
+    assert response.status_code == 403
+
+    response = await client.patch(
+        f"/api/v1/admin/users/{target_user.id}/role",
+        headers=admin_headers,
+        json={"role": "security"},
+    )
+    assert response.status_code == 200
+
+    response = await client.get("/api/v1/chat/security/alarms", headers=target_headers)
+    assert response.status_code == 200
+
+    response = await client.delete(f"/api/v1/admin/users/{target_user.id}", headers=admin_headers)
+    assert response.status_code == 204
+
+    response = await client.get("/api/v1/chat/security/alarms", headers=target_headers)
+    assert response.status_code == 401
+
+
 @pytest.mark.asyncio
 async def test_admin_users_endpoints_forbid_non_admin_requesters(
     client: AsyncClient,
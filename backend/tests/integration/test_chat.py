@@ -5,12 +5,19 @@ message history retrieval, and cross-user access control. Provider streaming
 is patched so these tests remain deterministic and avoid external dependencies.
 """
 import asyncio
+import uuid
 from collections.abc import AsyncIterator
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.conversation_model import Conversation, Message
+from src.repo.conversation_repo import ConversationRepository, ConversationTurn
 
 
 async def _mock_stream(*args: object, **kwargs: object) -> AsyncIterator[str]:
@@ -193,6 +200,41 @@ async def test_list_conversations_returns_sidebar_summaries_in_activity_order(
     assert conversations[1]["message_count"] == 0
 
 
+@pytest.mark.asyncio
+async def test_list_conversations_pages_with_limit_and_cursor(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+) -> None:
+    """A limited listing should hand out a cursor that resumes without overlap."""
+    for index in range(3):
+        await client.post(
+            "/api/v1/chat/conversations",
+            json={"title": f"Chat {index}", "provider": "groq", "model": "llama-3.3-70b-versatile"},
+            headers=auth_headers,
+        )
+
+    full = await client.get("/api/v1/chat/conversations", headers=auth_headers)
+    expected_ids = [item["id"] for item in full.json()]
+    assert "X-Next-Cursor" not in full.headers
+
+    first_page = await client.get("/api/v1/chat/conversations?limit=2", headers=auth_headers)
+    assert first_page.status_code == 200
+    assert len(first_page.json()) == 2
+    cursor = first_page.headers["X-Next-Cursor"]
+
+    second_page = await client.get(
+        f"/api/v1/chat/conversations?limit=2&cursor={cursor}",
+        headers=auth_headers,
+    )
+    assert second_page.status_code == 200
+    assert "X-Next-Cursor" not in second_page.headers
+    paged_ids = [item["id"] for item in first_page.json() + second_page.json()]
+    assert paged_ids == expected_ids
+
+    bad = await client.get("/api/v1/chat/conversations?cursor=not-a-cursor", headers=auth_headers)
+    assert bad.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_list_conversations_is_scoped_to_authenticated_user(
     client: AsyncClient,
@@ -404,6 +446,73 @@ async def test_send_message_saves_to_history(
     assert messages[1]["content"] == "Hello world!"
 
 
+@pytest.mark.asyncio
+async def test_send_message_records_token_counts(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    db_session: AsyncSession,
+) -> None:
+    """Each stored message should carry a token count summed into tokens_used."""
+    convo_resp = await client.post(
+        "/api/v1/chat/conversations",
+        json={"provider": "groq", "model": "llama-3.3-70b-versatile"},
+        headers=auth_headers,
+    )
+    convo_id = convo_resp.json()["conversation_id"]
+
+    with (
+        patch("src.service.chat_service.validate_provider", return_value=None),
+        patch("src.service.chat_service.stream_from_provider", side_effect=_mock_stream),
+    ):
+        await client.post(
+            f"/api/v1/chat/conversations/{convo_id}/messages/send",
+            json={"content": "Hello!"},
+            headers=auth_headers,
+        )
+
+    messages = (await db_session.execute(select(Message))).scalars().all()
+    convo = (await db_session.execute(select(Conversation))).scalars().one()
+
+    assert len(messages) == 2
+    assert all(message.token_count and message.token_count > 0 for message in messages)
+    assert convo.tokens_used == sum(message.token_count for message in messages)
+
+
+@pytest.mark.asyncio
+async def test_turn_flushed_late_keeps_its_submission_time(
+    client: AsyncClient,
+    auth_headers: dict[str, str],
+    db_session: AsyncSession,
+) -> None:
+    """A queued turn written after a newer one must not reorder the conversation."""
+    convo_resp = await client.post(
+        "/api/v1/chat/conversations",
+        json={"provider": "groq", "model": "llama-3.3-70b-versatile"},
+        headers=auth_headers,
+    )
+    convo_id = uuid.UUID(convo_resp.json()["conversation_id"])
+    submitted_at = datetime.now(timezone.utc) - timedelta(minutes=5)
+    queued = ConversationTurn(convo_id)
+    queued.add_message("user", "queued question")
+    queued.add_message("assistant", "queued answer")
+    queued.stamp(submitted_at)
+    inline = ConversationTurn(convo_id)
+    inline.add_message("user", "later question")
+    inline.stamp()
+
+    repo = ConversationRepository(db_session)
+    await repo.commit_turn(inline)
+    committed = await repo.commit_turn(queued)
+
+    messages = await repo.get_messages(convo_id)
+    convo = await db_session.get(Conversation, convo_id, populate_existing=True)
+
+    assert [m.content for m in committed] == ["queued question", "queued answer"]
+    assert [m.content for m in messages] == ["queued question", "queued answer", "later question"]
+    assert messages[0].created_at == submitted_at
+    assert convo.last_activity_at == inline.created_at
+
+
 @pytest.mark.asyncio
 async def test_send_message_to_other_users_conversation_returns_404(
     client: AsyncClient,
@@ -1,5 +1,6 @@
 """Integration tests for the security historic chat dashboard endpoint."""
 from datetime import datetime, timedelta, timezone
+import json
 
 import pytest
 from httpx import AsyncClient
@@ -53,6 +54,8 @@ async def _create_conversation_with_messages(
         model="llama-3.1-8b-instant",
         created_at=created_at,
         updated_at=created_at,
+        last_activity_at=max((message_time for _, _, message_time in messages), default=created_at),
+        message_count=len(messages),
     )
     db_session.add(conversation)
     await db_session.flush()
@@ -162,6 +165,123 @@ async def test_security_dashboard_returns_paginated_histories_in_recent_order(
     second_page_data = second_page.json()
     assert [item["title"] for item in second_page_data["items"]] == [older_conversation.title]
     assert second_page_data["items"][0]["user_email"] == "employee-one@example.com"
+    assert second_page_data["next_cursor"] is None
+
+    cursor_page = await client.get(
+        "/api/v1/chat/security/histories",
+        params={"limit": 2, "cursor": first_page_data["next_cursor"]},
+        headers=security_headers,
+    )
+
+    assert cursor_page.status_code == 200
+    assert [item["title"] for item in cursor_page.json()["items"]] == [older_conversation.title]
+    assert cursor_page.json()["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_security_dashboard_rejects_malformed_cursor(
+    client: AsyncClient,
+    db_session: AsyncSession,
+) -> None:
+    """A cursor that was not issued by the API should return 400."""
+    security_headers = await _signup_and_get_headers(client, "security-cursor@example.com")
+    await _set_user_role(db_session, "security-cursor@example.com", ROLE_SECURITY)
+
+    response = await client.get(
+        "/api/v1/chat/security/histories",
+        params={"cursor": "not-a-cursor"},
+        headers=security_headers,
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid pagination cursor"
+
+
+@pytest.mark.asyncio
+async def test_security_export_streams_truncated_transcripts_as_ndjson(
+    client: AsyncClient,
+    db_session: AsyncSession,
+) -> None:
+    """The export should stream records per conversation and message, honoring truncation."""
+    now = datetime.now(timezone.utc)
+
+    security_headers = await _signup_and_get_headers(client, "security-export@example.com")
+    await _set_user_role(db_session, "security-export@example.com", ROLE_SECURITY)
+    await _signup_and_get_headers(client, "export-user@example.com")
+    user = await _set_user_role(db_session, "export-user@example.com", "user")
+
+    older = await _create_conversation_with_messages(
+        db_session,
+        user,
+        title="Older Export",
+        created_at=now - timedelta(days=2),
+        messages=[("user", "Only message here", now - timedelta(days=1))],
+    )
+    newer = await _create_conversation_with_messages(
+        db_session,
+        user,
+        title="Newer Export",
+        created_at=now - timedelta(hours=2),
+        messages=[
+            ("user", "First question", now - timedelta(hours=2)),
+            ("assistant", "First answer", now - timedelta(hours=1, minutes=30)),
+            ("user", "Follow-up question", now - timedelta(hours=1)),
+        ],
+    )
+    empty = await _create_conversation_with_messages(
+        db_session,
+        user,
+        title="Empty Export",
+        created_at=now - timedelta(days=5),
+        messages=[],
+    )
+
+    response = await client.get(
+        "/api/v1/chat/security/histories/export",
+        params={"limit": 2, "max_messages_per_conversation": 2, "max_message_chars": 5},
+        headers=security_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [(record["type"], record.get("conversation_id")) for record in records] == [
+        ("conversation", str(newer.id)),
+        ("message", str(newer.id)),
+        ("message", str(newer.id)),
+        ("conversation", str(older.id)),
+        ("message", str(older.id)),
+        ("end", None),
+    ]
+    assert records[0]["messages_truncated"] is True
+    assert records[0]["message_count"] == 3
+    assert [record["content"] for record in records[1:3]] == ["First", "Follo"]
+    assert all(record["content_truncated"] for record in records[1:3])
+    assert records[3]["messages_truncated"] is False
+    assert records[-1]["conversations"] == 2
+
+    rest = await client.get(
+        "/api/v1/chat/security/histories/export",
+        params={"cursor": records[-1]["next_cursor"]},
+        headers=security_headers,
+    )
+    rest_records = [json.loads(line) for line in rest.text.splitlines()]
+    assert rest_records == [
+        {**rest_records[0], "type": "conversation", "conversation_id": str(empty.id)},
+        {"type": "end", "conversations": 1, "next_cursor": None},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_security_export_forbids_standard_users(
+    client: AsyncClient,
+) -> None:
+    """Only security users may export transcripts."""
+    user_headers = await _signup_and_get_headers(client, "standard-export@example.com")
+
+    response = await client.get("/api/v1/chat/security/histories/export", headers=user_headers)
+
+    assert response.status_code == 403
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,167 @@
+"""Integration tests for background document ingestion endpoints."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import src.service.document_service as document_service
+from src.models.ingestion_job_model import IngestionJob
+from src.models.user_model import ROLE_ADMIN, User
+from src.repo.document_repo import DocumentRepository
+from src.repo.ingestion_job_repo import IngestionJobRepository
+
+
+async def _admin_headers(client: AsyncClient, db_session: AsyncSession) -> dict[str, str]:
+    email = "docs-admin@example.com"
+    response = await client.post(
+        "/api/v1/auth/signup",
+        json={"email": email, "password": "password123"},
+    )
+    assert response.status_code == 201
+    result = await db_session.execute(select(User).where(User.email == email))
+    user = result.scalars().one()
+    user.role = ROLE_ADMIN
+    await db_session.commit()
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": email, "password": "password123"},
+    )
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_upload_is_accepted_and_queued_for_background_ingestion(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    queue = Mock()
+    queue.progress = Mock(return_value=None)
+    monkeypatch.setattr(document_service, "_ingestion_queue", queue)
+    headers = await _admin_headers(client, db_session)
+
+    response = await client.post(
+        "/api/v1/documents",
+        headers=headers,
+        files={"file": ("handbook.pdf", b"%PDF-1.4 fake", "application/pdf")},
+        data={"title": "Handbook", "allowed_roles": "user"},
+    )
+
+    assert response.status_code == 202
+    body = response.json()
+    assert body["status"] == "processing"
+    assert body["chroma_doc_id"] is None
+
+    result = await db_session.execute(select(IngestionJob))
+    job = result.scalars().one()
+    assert str(job.document_id) == body["id"]
+    assert job.pdf_bytes == b"%PDF-1.4 fake"
+    queue.submit.assert_called_once_with(str(job.id))
+
+    status_response = await client.get(f"/api/v1/documents/{body['id']}/ingestion", headers=headers)
+    assert status_response.status_code == 200
+    assert status_response.json() == {
+        "document_id": body["id"],
+        "document_status": "processing",
+        "job_status": "queued",
+        "attempts": 0,
+        "error": None,
+        "pages_processed": None,
+        "page_count": None,
+        "chunks_stored": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_ingestion_jobs_are_claimed_once_and_recovered_when_stale(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    queue = Mock()
+    monkeypatch.setattr(document_service, "_ingestion_queue", queue)
+    headers = await _admin_headers(client, db_session)
+    response = await client.post(
+        "/api/v1/documents",
+        headers=headers,
+        files={"file": ("handbook.pdf", b"%PDF-1.4 fake", "application/pdf")},
+    )
+    assert response.status_code == 202
+    job_id = queue.submit.call_args.args[0]
+    repo = IngestionJobRepository(db_session)
+
+    claimed = await repo.claim(job_id)
+    assert claimed is not None and claimed.status == "running" and claimed.attempts == 1
+    assert await repo.claim(job_id) is None
+
+    assert await repo.requeue_recoverable(datetime.now(timezone.utc) - timedelta(minutes=15), 3) == []
+    assert await repo.requeue_recoverable(datetime.now(timezone.utc) + timedelta(minutes=1), 3) == [job_id]
+    assert (await repo.claim(job_id)).attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_ingestion_jobs_are_released_and_failed_when_orphaned(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    queue = Mock()
+    monkeypatch.setattr(document_service, "_ingestion_queue", queue)
+    headers = await _admin_headers(client, db_session)
+    response = await client.post(
+        "/api/v1/documents",
+        headers=headers,
+        files={"file": ("handbook.pdf", b"%PDF-1.4 fake", "application/pdf")},
+    )
+    assert response.status_code == 202
+    job_id = queue.submit.call_args.args[0]
+    repo = IngestionJobRepository(db_session)
+
+    claimed = await repo.claim(job_id)
+    await repo.release(claimed.id)
+    await db_session.refresh(claimed)
+    assert claimed.status == "queued"
+
+    claimed = await repo.claim(job_id)
+    await repo.fail_orphaned(claimed, "Document was deleted before it was indexed")
+    await db_session.refresh(claimed)
+    assert claimed.status == "failed" and claimed.pdf_bytes is None
+
+    assert await DocumentRepository(db_session).delete(response.json()["id"])
+    await repo.fail_orphaned(claimed, "Document was deleted while it was being indexed")
+    assert (await db_session.execute(select(IngestionJob))).scalars().all() == []
+
+
+@pytest.mark.asyncio
+async def test_failed_ingestion_heartbeat_leaves_the_job_usable(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    queue = Mock()
+    monkeypatch.setattr(document_service, "_ingestion_queue", queue)
+    headers = await _admin_headers(client, db_session)
+    response = await client.post(
+        "/api/v1/documents",
+        headers=headers,
+        files={"file": ("handbook.pdf", b"%PDF-1.4 fake", "application/pdf")},
+    )
+    assert response.status_code == 202
+    repo = IngestionJobRepository(db_session)
+    claimed = await repo.claim(queue.submit.call_args.args[0])
+
+    claimed.status = None  # violates NOT NULL on the heartbeat's flush
+    with pytest.raises(IntegrityError):
+        await repo.heartbeat(claimed)
+
+    assert claimed.status == "running"
+    await repo.complete(claimed)
+    await db_session.refresh(claimed)
+    assert claimed.status == "completed"
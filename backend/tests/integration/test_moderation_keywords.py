@@ -0,0 +1,86 @@
+"""Integration tests for database-managed moderation keywords."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.moderation.keyword_filter import find_harmful_keyword, keyword_version, reset_keywords
+from src.models.user_model import User
+
+
+@pytest.fixture(autouse=True)
+def builtin_keywords() -> Iterator[None]:
+    reset_keywords()
+    yield
+    reset_keywords()
+
+
+async def _headers(client: AsyncClient, db_session: AsyncSession, email: str, role: str) -> dict[str, str]:
+    response = await client.post(
+        "/api/v1/auth/signup",
+        json={"email": email, "password": "password123"},
+    )
+    assert response.status_code == 201
+    result = await db_session.execute(select(User).where(User.email == email))
+    user = result.scalars().one()
+    user.role = role
+    await db_session.commit()
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": email, "password": "password123"},
+    )
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_keyword_edits_are_versioned_and_activated_without_restart(
+    client: AsyncClient,
+    db_session: AsyncSession,
+) -> None:
+    headers = await _headers(client, db_session, "keywords-security@example.com", "security")
+
+    response = await client.put(
+        "/api/v1/admin/moderation/keywords",
+        headers=headers,
+        json={"keywords": ["Kill", "  zip gun ", "kill"]},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"version": 1, "keywords": ["kill", "zip gun"]}
+    assert keyword_version() == 1
+    assert find_harmful_keyword("where to get a zip gun") == "zip gun"
+
+    response = await client.post(
+        "/api/v1/admin/moderation/keywords",
+        headers=headers,
+        json={"keywords": ["flamethrower", "kill"]},
+    )
+    assert response.json() == {"version": 2, "keywords": ["flamethrower", "kill", "zip gun"]}
+
+    response = await client.delete("/api/v1/admin/moderation/keywords/zip gun", headers=headers)
+    assert response.status_code == 204
+    assert keyword_version() == 3
+    assert find_harmful_keyword("where to get a zip gun") is None
+    assert find_harmful_keyword("a flamethrower") == "flamethrower"
+
+    response = await client.delete("/api/v1/admin/moderation/keywords/zip gun", headers=headers)
+    assert response.status_code == 404
+
+    response = await client.get("/api/v1/admin/moderation/keywords", headers=headers)
+    assert response.json() == {"version": 3, "keywords": ["flamethrower", "kill"]}
+
+
+@pytest.mark.asyncio
+async def test_regular_users_cannot_manage_keywords(
+    client: AsyncClient,
+    db_session: AsyncSession,
+) -> None:
+    headers = await _headers(client, db_session, "keywords-user@example.com", "user")
+
+    response = await client.get("/api/v1/admin/moderation/keywords", headers=headers)
+
+    assert response.status_code == 403
@@ -4,8 +4,14 @@ import uuid
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.broadcaster import Broadcaster
+from src.core.config import settings
+from src.core.database_urls import to_asyncpg_dsn
+from src.repo.conversation_repo import ConversationRepository, ConversationTurn
+from src.service.alarm_stream_service import AlarmNotificationListener
 
 from src.models.conversation_model import Conversation
 from src.models.flagged_event_model import Alarm
@@ -119,3 +125,267 @@ async def test_security_alarm_dashboard_forbids_standard_users(
 
     assert response.status_code == 403
     assert response.json()["detail"] == "Security role required"
+
+
+async def _seed_alarms(
+    db_session: AsyncSession,
+    user: User,
+    conversation: Conversation,
+    specs: list[tuple[str, str, datetime]],
+) -> None:
+    db_session.add_all(
+        [
+            Alarm(
+                id=uuid.uuid4(),
+                user_id=user.id,
+                conversation_id=conversation.id,
+                message_content=content,
+                filter_type=filter_type,
+                provider="deepseek",
+                created_at=created_at,
+            )
+            for content, filter_type, created_at in specs
+        ]
+    )
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_security_alarm_dashboard_pages_and_filters(
+    client: AsyncClient,
+    db_session: AsyncSession,
+) -> None:
+    now = datetime.now(timezone.utc)
+
+    security_headers = await _signup_and_get_headers(client, "security-pages@example.com")
+    await _set_user_role(db_session, "security-pages@example.com", ROLE_SECURITY)
+    await _signup_and_get_headers(client, "paged-user@example.com")
+    flagged_user = await _set_user_role(db_session, "paged-user@example.com", "user")
+    conversation = await _create_conversation(db_session, flagged_user, "Paged conversation")
+    await _seed_alarms(
+        db_session,
+        flagged_user,
+        conversation,
+        [
+            (f"alarm {index}", "keyword" if index % 2 else "provider", now - timedelta(minutes=index))
+            for index in range(5)
+        ],
+    )
+
+    first = await client.get("/api/v1/chat/security/alarms?limit=2", headers=security_headers)
+    assert first.status_code == 200
+    assert [item["message_content"] for item in first.json()] == ["alarm 0", "alarm 1"]
+
+    second = await client.get(
+        "/api/v1/chat/security/alarms",
+        params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]},
+        headers=security_headers,
+    )
+    assert [item["message_content"] for item in second.json()] == ["alarm 2", "alarm 3"]
+    assert "X-Latest-Cursor" not in second.headers
+
+    keyword_only = await client.get(
+        "/api/v1/chat/security/alarms",
+        params={"filter_type": "keyword", "created_after": (now - timedelta(minutes=3, seconds=30)).isoformat()},
+        headers=security_headers,
+    )
+    assert [item["message_content"] for item in keyword_only.json()] == ["alarm 1", "alarm 3"]
+    assert "X-Next-Cursor" not in keyword_only.headers
+
+    other_user = await client.get(
+        "/api/v1/chat/security/alarms",
+        params={"user_id": str(uuid.uuid4())},
+        headers=security_headers,
+    )
+    assert other_user.json() == []
+
+
+@pytest.mark.asyncio
+async def test_security_alarm_dashboard_since_cursor_returns_only_new_alarms(
+    client: AsyncClient,
+    db_session: AsyncSession,
+) -> None:
+    now = datetime.now(timezone.utc)
+
+    security_headers = await _signup_and_get_headers(client, "security-live@example.com")
+    await _set_user_role(db_session, "security-live@example.com", ROLE_SECURITY)
+    await _signup_and_get_headers(client, "live-user@example.com")
+    flagged_user = await _set_user_role(db_session, "live-user@example.com", "user")
+    conversation = await _create_conversation(db_session, flagged_user, "Live conversation")
+    await _seed_alarms(db_session, flagged_user, conversation, [("existing", "keyword", now - timedelta(minutes=5))])
+
+    initial = await client.get("/api/v1/chat/security/alarms", headers=security_headers)
+    latest = initial.headers["X-Latest-Cursor"]
+
+    empty_poll = await client.get(
+        "/api/v1/chat/security/alarms", params={"since": latest}, headers=security_headers
+    )
+    assert empty_poll.json() == []
+    assert empty_poll.headers["X-Latest-Cursor"] == latest
+
+    await _seed_alarms(
+        db_session,
+        flagged_user,
+        conversation,
+        [
+            ("new one", "keyword", now - timedelta(minutes=2)),
+            ("new two", "provider", now - timedelta(minutes=1)),
+            ("new three", "keyword", now),
+        ],
+    )
+
+    first_poll = await client.get(
+        "/api/v1/chat/security/alarms",
+        params={"since": latest, "limit": 2},
+        headers=security_headers,
+    )
+    assert [item["message_content"] for item in first_poll.json()] == ["new two", "new one"]
+
+    second_poll = await client.get(
+        "/api/v1/chat/security/alarms",
+        params={"since": first_poll.headers["X-Latest-Cursor"], "limit": 2},
+        headers=security_headers,
+    )
+    assert [item["message_content"] for item in second_poll.json()] == ["new three"]
+
+    bad = await client.get(
+        "/api/v1/chat/security/alarms", params={"since": "garbage"}, headers=security_headers
+    )
+    assert bad.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_security_alarm_dashboard_since_cursor_catches_alarms_committed_late(
+    client: AsyncClient,
+    db_session: AsyncSession,
+) -> None:
+    now = datetime.now(timezone.utc)
+
+    security_headers = await _signup_and_get_headers(client, "security-late@example.com")
+    await _set_user_role(db_session, "security-late@example.com", ROLE_SECURITY)
+    await _signup_and_get_headers(client, "late-user@example.com")
+    flagged_user = await _set_user_role(db_session, "late-user@example.com", "user")
+    conversation = await _create_conversation(db_session, flagged_user, "Late conversation")
+    await _seed_alarms(db_session, flagged_user, conversation, [("served", "keyword", now - timedelta(seconds=1))])
+
+    initial = await client.get("/api/v1/chat/security/alarms", headers=security_headers)
+    latest = initial.headers["X-Latest-Cursor"]
+
+    # Stamped before the served alarm, but its transaction committed after.
+    await _seed_alarms(db_session, flagged_user, conversation, [("late", "provider", now - timedelta(seconds=2))])
+
+    poll = await client.get(
+        "/api/v1/chat/security/alarms", params={"since": latest}, headers=security_headers
+    )
+    assert [item["message_content"] for item in poll.json()] == ["late"]
+    assert poll.headers["X-Latest-Cursor"] == latest
+
+
+@pytest.mark.asyncio
+async def test_security_alarm_dashboard_since_cursor_advances_past_a_burst_in_the_overlap(
+    client: AsyncClient,
+    db_session: AsyncSession,
+) -> None:
+    now = datetime.now(timezone.utc)
+
+    security_headers = await _signup_and_get_headers(client, "security-burst@example.com")
+    await _set_user_role(db_session, "security-burst@example.com", ROLE_SECURITY)
+    await _signup_and_get_headers(client, "burst-user@example.com")
+    flagged_user = await _set_user_role(db_session, "burst-user@example.com", "user")
+    conversation = await _create_conversation(db_session, flagged_user, "Burst conversation")
+    await _seed_alarms(
+        db_session,
+        flagged_user,
+        conversation,
+        [(f"burst {index}", "keyword", now - timedelta(seconds=10 - index)) for index in range(5)],
+    )
+
+    initial = await client.get("/api/v1/chat/security/alarms", headers=security_headers)
+    latest = initial.headers["X-Latest-Cursor"]
+    await _seed_alarms(
+        db_session,
+        flagged_user,
+        conversation,
+        [("after one", "keyword", now - timedelta(seconds=2)), ("after two", "keyword", now - timedelta(seconds=1))],
+    )
+
+    first_poll = await client.get(
+        "/api/v1/chat/security/alarms", params={"since": latest, "limit": 2}, headers=security_headers
+    )
+    assert [item["message_content"] for item in first_poll.json()] == [
+        "after two",
+        "after one",
+        "burst 3",
+        "burst 2",
+    ]
+    assert first_poll.headers["X-Latest-Cursor"] != latest
+
+    second_poll = await client.get(
+        "/api/v1/chat/security/alarms",
+        params={"since": first_poll.headers["X-Latest-Cursor"], "limit": 2},
+        headers=security_headers,
+    )
+    assert [item["message_content"] for item in second_poll.json()] == ["after one", "burst 4"]
+    assert second_poll.headers["X-Latest-Cursor"] == first_poll.headers["X-Latest-Cursor"]
+
+
+@pytest.mark.asyncio
+async def test_committed_alarms_are_pushed_to_live_subscribers(
+    client: AsyncClient,
+    db_session: AsyncSession,
+) -> None:
+    await _signup_and_get_headers(client, "live-push@example.com")
+    flagged_user = await _set_user_role(db_session, "live-push@example.com", "user")
+    conversation = await _create_conversation(db_session, flagged_user, "Pushed conversation")
+
+    broadcaster = Broadcaster(max_queue=10)
+    listener = AlarmNotificationListener(
+        to_asyncpg_dsn(settings.DATABASE_URL),
+        async_sessionmaker(db_session.bind, class_=AsyncSession, expire_on_commit=False),
+        broadcaster,
+    )
+    await listener.start()
+    try:
+        with broadcaster.subscribe() as subscription:
+            turn = ConversationTurn(conversation.id)
+            turn.add_alarm(flagged_user.id, "turn harmful request", "keyword", "deepseek", reason="bomb")
+            await ConversationRepository(db_session).commit_turn(turn)
+            committed = await subscription.get(5)
+    finally:
+        await listener.stop()
+
+    assert committed is not None
+    assert committed.user_email == "live-push@example.com"
+    assert committed.message_content == "turn harmful request"
+    assert committed.reason == "bomb"
+
+
+@pytest.mark.asyncio
+async def test_live_subscribers_are_closed_when_the_listen_connection_drops(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("src.service.alarm_stream_service._RECONNECT_DELAY_SECONDS", 0.01)
+    broadcaster = Broadcaster(max_queue=10)
+    listener = AlarmNotificationListener(
+        to_asyncpg_dsn(settings.DATABASE_URL),
+        async_sessionmaker(db_session.bind, class_=AsyncSession, expire_on_commit=False),
+        broadcaster,
+    )
+    await listener.start()
+    try:
+        with broadcaster.subscribe() as subscription:
+            await db_session.execute(
+                text(
+                    "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+                    "WHERE query LIKE 'LISTEN %' AND pid <> pg_backend_pid()"
+                )
+            )
+            await db_session.commit()
+            event = await subscription.get(5)
+    finally:
+        await listener.stop()
+
+    assert event is None
+    assert subscription.lagged
+    assert broadcaster.subscriber_count == 0
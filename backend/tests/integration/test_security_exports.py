@@ -0,0 +1,339 @@
+"""Integration tests for background security audit exports."""
+from datetime import datetime, timedelta, timezone
+import asyncio
+from unittest.mock import Mock
+import gzip
+import json
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+import src.service.export_service as export_service
+from src.models.conversation_model import Conversation, Message
+from src.models.export_job_model import ExportJobChunk
+from src.models.flagged_event_model import Alarm
+from src.models.user_model import ROLE_SECURITY, User
+from src.repo.export_job_repo import ExportJobRepository
+from src.service.export_service import ExportService
+
+
+async def _signup_and_get_headers(
+    client: AsyncClient,
+    email: str,
+    password: str = "password123",
+) -> dict[str, str]:
+    response = await client.post(
+        "/api/v1/auth/signup",
+        json={"email": email, "password": password},
+    )
+    assert response.status_code == 201
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def _set_user_role(
+    db_session: AsyncSession,
+    email: str,
+    role: str,
+) -> User:
+    result = await db_session.execute(select(User).where(User.email == email))
+    user = result.scalars().one()
+    user.role = role
+    await db_session.commit()
+    await db_session.refresh(user)
+    return user
+
+
+async def _create_conversation_with_messages(
+    db_session: AsyncSession,
+    user: User,
+    title: str,
+    message_times: list[datetime],
+) -> Conversation:
+    conversation = Conversation(
+        title=title,
+        user_id=user.id,
+        provider="deepseek",
+        model="deepseek-chat",
+        tokens_used=0,
+        message_count=len(message_times),
+        created_at=message_times[0],
+        last_activity_at=message_times[-1],
+    )
+    db_session.add(conversation)
+    await db_session.flush()
+    db_session.add_all([
+        Message(
+            conversation_id=conversation.id,
+            role="user",
+            content=f"{title} message {index}",
+            created_at=created_at,
+        )
+        for index, created_at in enumerate(message_times)
+    ])
+    await db_session.commit()
+    await db_session.refresh(conversation)
+    return conversation
+
+
+@pytest.fixture
+def export_queue(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Capture submitted export jobs instead of running them in the background."""
+    queue = Mock()
+    monkeypatch.setattr(export_service, "get_export_queue", lambda: queue)
+    return queue
+
+
+async def _run_export(db_session: AsyncSession, job_id: str) -> None:
+    session_factory = async_sessionmaker(db_session.bind, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session, session_factory() as source:
+        await ExportService(ExportJobRepository(session)).process_export_job(job_id, source)
+
+
+@pytest.mark.asyncio
+async def test_security_export_writes_filtered_compressed_file(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    export_queue: Mock,
+) -> None:
+    now = datetime.now(timezone.utc)
+    security_headers = await _signup_and_get_headers(client, "security-export@example.com")
+    await _set_user_role(db_session, "security-export@example.com", ROLE_SECURITY)
+    await _signup_and_get_headers(client, "audited@example.com")
+    audited = await _set_user_role(db_session, "audited@example.com", "user")
+    await _signup_and_get_headers(client, "other@example.com")
+    other = await _set_user_role(db_session, "other@example.com", "user")
+
+    in_range = await _create_conversation_with_messages(
+        db_session,
+        audited,
+        "In range",
+        [now - timedelta(days=3), now - timedelta(days=2), now - timedelta(hours=1)],
+    )
+    await _create_conversation_with_messages(
+        db_session,
+        audited,
+        "Too old",
+        [now - timedelta(days=30), now - timedelta(days=29)],
+    )
+    other_conversation = await _create_conversation_with_messages(
+        db_session,
+        other,
+        "Other user",
+        [now - timedelta(days=2)],
+    )
+    alarm = Alarm(
+        id=uuid.uuid4(),
+        user_id=audited.id,
+        conversation_id=in_range.id,
+        message_content="flagged request",
+        filter_type="keyword",
+        provider="deepseek",
+        created_at=now - timedelta(days=2),
+    )
+    db_session.add_all([
+        alarm,
+        Alarm(
+            id=uuid.uuid4(),
+            user_id=other.id,
+            conversation_id=other_conversation.id,
+            message_content="other flagged request",
+            filter_type="keyword",
+            provider="deepseek",
+            created_at=now - timedelta(days=2),
+        ),
+    ])
+    await db_session.commit()
+
+    response = await client.post(
+        "/api/v1/chat/security/exports",
+        headers=security_headers,
+        json={
+            "user_id": str(audited.id),
+            "created_from": (now - timedelta(days=7)).isoformat(),
+            "created_to": (now - timedelta(days=1)).isoformat(),
+        },
+    )
+
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "queued"
+    export_queue.submit.assert_called_once_with(job["id"])
+
+    await _run_export(db_session, job["id"])
+
+    status_response = await client.get(f"/api/v1/chat/security/exports/{job['id']}", headers=security_headers)
+    assert status_response.status_code == 200
+    finished = status_response.json()
+    assert finished["status"] == "completed"
+    assert finished["conversations_exported"] == 1
+    assert finished["messages_exported"] == 2
+    assert finished["alarms_exported"] == 1
+    assert finished["file_size"] > 0
+
+    download = await client.get(f"/api/v1/chat/security/exports/{job['id']}/download", headers=security_headers)
+    assert download.status_code == 200
+    assert download.headers["content-type"] == "application/gzip"
+    records = [json.loads(line) for line in gzip.decompress(download.content).splitlines()]
+    assert [record["type"] for record in records] == ["conversation", "message", "message", "alarm"]
+    assert records[0]["id"] == str(in_range.id)
+    assert records[0]["user_email"] == "audited@example.com"
+    assert [record["content"] for record in records[1:3]] == ["In range message 0", "In range message 1"]
+    assert records[3]["id"] == str(alarm.id)
+
+    listing = await client.get("/api/v1/chat/security/exports", headers=security_headers)
+    assert [item["id"] for item in listing.json()] == [job["id"]]
+
+
+@pytest.mark.asyncio
+async def test_security_export_file_is_stored_in_slices(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    export_queue: Mock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = datetime.now(timezone.utc)
+    security_headers = await _signup_and_get_headers(client, "security-slices@example.com")
+    await _set_user_role(db_session, "security-slices@example.com", ROLE_SECURITY)
+    await _signup_and_get_headers(client, "sliced@example.com")
+    sliced = await _set_user_role(db_session, "sliced@example.com", "user")
+    await _create_conversation_with_messages(
+        db_session,
+        sliced,
+        "Sliced",
+        [now - timedelta(minutes=minutes) for minutes in range(20, 0, -1)],
+    )
+    monkeypatch.setattr(export_service, "_EXPORT_BATCH_RECORDS", 2)
+    monkeypatch.setattr(export_service, "_EXPORT_CHUNK_BYTES", 1)
+
+    response = await client.post(
+        "/api/v1/chat/security/exports", headers=security_headers, json={"user_id": str(sliced.id)}
+    )
+    job_id = response.json()["id"]
+    await _run_export(db_session, job_id)
+
+    chunks = (
+        await db_session.execute(
+            select(ExportJobChunk.seq).where(ExportJobChunk.job_id == uuid.UUID(job_id)).order_by(ExportJobChunk.seq)
+        )
+    ).scalars().all()
+    assert len(chunks) > 1
+    assert list(chunks) == list(range(len(chunks)))
+
+    finished = await client.get(f"/api/v1/chat/security/exports/{job_id}", headers=security_headers)
+    download = await client.get(f"/api/v1/chat/security/exports/{job_id}/download", headers=security_headers)
+    assert download.status_code == 200
+    assert len(download.content) == finished.json()["file_size"]
+    records = [json.loads(line) for line in gzip.decompress(download.content).splitlines()]
+    assert [record["type"] for record in records] == ["conversation"] + ["message"] * 20
+
+
+@pytest.mark.asyncio
+async def test_security_export_failing_in_its_own_flush_drops_partial_file(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    export_queue: Mock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = datetime.now(timezone.utc)
+    security_headers = await _signup_and_get_headers(client, "security-flush@example.com")
+    await _set_user_role(db_session, "security-flush@example.com", ROLE_SECURITY)
+    await _signup_and_get_headers(client, "flushed@example.com")
+    flushed = await _set_user_role(db_session, "flushed@example.com", "user")
+    await _create_conversation_with_messages(
+        db_session,
+        flushed,
+        "Flushed",
+        [now - timedelta(minutes=minutes) for minutes in range(20, 0, -1)],
+    )
+    monkeypatch.setattr(export_service, "_EXPORT_BATCH_RECORDS", 2)
+    monkeypatch.setattr(export_service, "_EXPORT_CHUNK_BYTES", 1)
+    add_chunk = ExportJobRepository.add_chunk
+    # Every slice claims seq 0, so the second progress commit fails to flush.
+    monkeypatch.setattr(ExportJobRepository, "add_chunk", lambda self, job, seq, data: add_chunk(self, job, 0, data))
+
+    response = await client.post(
+        "/api/v1/chat/security/exports", headers=security_headers, json={"user_id": str(flushed.id)}
+    )
+    job_id = response.json()["id"]
+    await _run_export(db_session, job_id)
+
+    failed = await client.get(f"/api/v1/chat/security/exports/{job_id}", headers=security_headers)
+    chunks = (
+        await db_session.execute(select(ExportJobChunk.seq).where(ExportJobChunk.job_id == uuid.UUID(job_id)))
+    ).scalars().all()
+    assert failed.json()["status"] == "failed"
+    assert chunks == []
+
+
+@pytest.mark.asyncio
+async def test_security_export_cancelled_by_shutdown_is_requeued(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    export_queue: Mock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    security_headers = await _signup_and_get_headers(client, "security-cancel@example.com")
+    await _set_user_role(db_session, "security-cancel@example.com", ROLE_SECURITY)
+
+    async def cancelled(self: ExportService, job: object, source: AsyncSession) -> int:
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(ExportService, "_write_export", cancelled)
+    monkeypatch.setattr(
+        export_service,
+        "async_session_maker",
+        async_sessionmaker(db_session.bind, class_=AsyncSession, expire_on_commit=False),
+    )
+    response = await client.post("/api/v1/chat/security/exports", headers=security_headers, json={})
+    job_id = response.json()["id"]
+
+    with pytest.raises(asyncio.CancelledError):
+        await _run_export(db_session, job_id)
+
+    requeued = await client.get(f"/api/v1/chat/security/exports/{job_id}", headers=security_headers)
+    assert requeued.json()["status"] == "queued"
+
+
+@pytest.mark.asyncio
+async def test_security_export_download_requires_completed_export(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    export_queue: Mock,
+) -> None:
+    security_headers = await _signup_and_get_headers(client, "security-pending@example.com")
+    await _set_user_role(db_session, "security-pending@example.com", ROLE_SECURITY)
+
+    response = await client.post("/api/v1/chat/security/exports", headers=security_headers, json={})
+    job_id = response.json()["id"]
+
+    pending = await client.get(f"/api/v1/chat/security/exports/{job_id}/download", headers=security_headers)
+    missing = await client.get(f"/api/v1/chat/security/exports/{uuid.uuid4()}", headers=security_headers)
+
+    assert pending.status_code == 409
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_security_export_rejects_empty_range_and_non_security_users(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    export_queue: Mock,
+) -> None:
+    now = datetime.now(timezone.utc)
+    security_headers = await _signup_and_get_headers(client, "security-range@example.com")
+    await _set_user_role(db_session, "security-range@example.com", ROLE_SECURITY)
+    user_headers = await _signup_and_get_headers(client, "regular-export@example.com")
+
+    empty_range = await client.post(
+        "/api/v1/chat/security/exports",
+        headers=security_headers,
+        json={"created_from": now.isoformat(), "created_to": now.isoformat()},
+    )
+    forbidden = await client.post("/api/v1/chat/security/exports", headers=user_headers, json={})
+
+    assert empty_range.status_code == 422
+    assert forbidden.status_code == 403
+    export_queue.submit.assert_not_called()
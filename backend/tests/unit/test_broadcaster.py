@@ -0,0 +1,105 @@
+"""Unit tests for live event fan-out and alarm SSE rendering."""
+from datetime import datetime, timezone
+import uuid
+
+import pytest
+
+from src.core.broadcaster import Broadcaster
+from src.schemas.chat_schema import SecurityAlarmEventResponse
+from src.service.alarm_stream_service import alarm_event_stream
+
+
+def _alarm_event() -> SecurityAlarmEventResponse:
+    return SecurityAlarmEventResponse(
+        id=str(uuid.uuid4()),
+        user_id=str(uuid.uuid4()),
+        user_email="flagged@example.com",
+        conversation_id=str(uuid.uuid4()),
+        message_content="harmful request",
+        filter_type="keyword",
+        provider="groq",
+        reason="bomb",
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+@pytest.mark.asyncio
+async def test_publish_reaches_every_subscriber_until_it_leaves() -> None:
+    """Each subscriber should get its own copy while subscribed."""
+    broadcaster: Broadcaster[str] = Broadcaster(max_queue=10)
+
+    with broadcaster.subscribe() as first, broadcaster.subscribe() as second:
+        assert broadcaster.subscriber_count == 2
+        broadcaster.publish("alarm")
+        assert await first.get(1) == "alarm"
+        assert await second.get(1) == "alarm"
+
+    assert broadcaster.subscriber_count == 0
+    broadcaster.publish("ignored")
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_closed_without_affecting_others() -> None:
+    """A subscriber whose queue overflows should be dropped, not block publishing."""
+    broadcaster: Broadcaster[int] = Broadcaster(max_queue=2)
+
+    with broadcaster.subscribe() as slow, broadcaster.subscribe() as fast:
+        broadcaster.publish(1)
+        assert await fast.get(1) == 1
+        broadcaster.publish(2)
+        assert await fast.get(1) == 2
+        broadcaster.publish(3)
+
+        assert slow.lagged
+        assert await slow.get(1) is None
+        assert await fast.get(1) == 3
+        assert broadcaster.subscriber_count == 1
+
+
+@pytest.mark.asyncio
+async def test_close_all_ends_every_subscription() -> None:
+    """Closing all should drop pending events and mark every subscriber lagged."""
+    broadcaster: Broadcaster[int] = Broadcaster(max_queue=10)
+
+    with broadcaster.subscribe() as first, broadcaster.subscribe() as second:
+        broadcaster.publish(1)
+        broadcaster.close_all()
+
+        assert broadcaster.subscriber_count == 0
+        assert first.lagged and second.lagged
+        assert await first.get(1) is None
+        assert await second.get(1) is None
+        broadcaster.publish(2)
+        assert await first.get(0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_alarm_event_stream_renders_events_and_heartbeats() -> None:
+    """Alarms should become SSE frames with a cursor id; idle time a comment."""
+    broadcaster: Broadcaster[SecurityAlarmEventResponse] = Broadcaster(max_queue=10)
+    event = _alarm_event()
+
+    with broadcaster.subscribe() as subscription:
+        stream = alarm_event_stream(subscription, heartbeat_seconds=0.01)
+        assert await anext(stream) == ": keep-alive\n\n"
+
+        broadcaster.publish(event)
+        frame = await anext(stream)
+
+    assert frame.startswith("id: ")
+    assert "\nevent: alarm\n" in frame
+    assert f'"id": "{event.id}"' in frame
+    assert frame.endswith("\n\n")
+
+
+@pytest.mark.asyncio
+async def test_alarm_event_stream_ends_when_subscriber_lags() -> None:
+    """A lagging stream should end so the client reconnects and catches up."""
+    broadcaster: Broadcaster[SecurityAlarmEventResponse] = Broadcaster(max_queue=1)
+
+    with broadcaster.subscribe() as subscription:
+        broadcaster.publish(_alarm_event())
+        broadcaster.publish(_alarm_event())
+        frames = [frame async for frame in alarm_event_stream(subscription, heartbeat_seconds=1)]
+
+    assert frames == []
@@ -1,5 +1,6 @@
 """Unit tests for chat service moderation and streaming orchestration."""
-from collections.abc import AsyncIterator
+import asyncio
+from collections.abc import AsyncIterator, Awaitable
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
@@ -10,10 +11,20 @@ import pytest
 
 from src.moderation.exceptions import ContentPolicyError
 from src.moderation.keyword_filter import MODERATION_RESPONSE
+from src.repo.conversation_repo import ConversationTurn
+from src.core.embedding_scheduler import EmbeddingScheduler
+from src.core.summary_metrics import SummaryMetricsCache
 from src.schemas.chat_schema import HistoricChatDashboardQuery
 from src.service.chat_service import ChatService
 
 
+@pytest.fixture(autouse=True)
+def _fresh_summary_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test an empty dashboard summary cache."""
+    cache = SummaryMetricsCache(max_age_seconds=30)
+    monkeypatch.setattr("src.service.chat_service.get_summary_cache", lambda: cache)
+
+
 async def _collect_chunks(stream: AsyncIterator[str]) -> list[str]:
     """Consume an async iterator into a list of text chunks."""
     return [chunk async for chunk in stream]
@@ -26,6 +37,7 @@ def _build_conversation() -> SimpleNamespace:
         user_id=uuid.uuid4(),
         provider="groq",
         model="llama-3.3-70b-versatile",
+        message_count=0,
     )
 
 
@@ -56,13 +68,14 @@ async def test_list_conversations_maps_sidebar_rows() -> None:
     flagged_event_repo = Mock()
     service = ChatService(repo, rag, flagged_event_repo)
 
-    result = await service.list_conversations(user_id)
+    result, next_cursor = await service.list_conversations(user_id)
 
     assert len(result) == 1
     assert result[0].title == "Operations Review"
     assert result[0].last_message == "Latest response"
     assert result[0].message_count == 4
-    repo.list_conversations.assert_awaited_once_with(user_id)
+    assert next_cursor is None
+    repo.list_conversations.assert_awaited_once_with(user_id, limit=None, after=None)
 
 
 @pytest.mark.asyncio
@@ -104,25 +117,20 @@ async def test_delete_conversation_delegates_to_repo() -> None:
 async def test_stream_response_keyword_filter_blocks_before_provider_validation() -> None:
     """Keyword moderation should short-circuit provider validation and streaming."""
     convo = _build_conversation()
-    call_order: list[str] = []
-
-    async def _log_event(*args: object) -> None:
-        call_order.append("log_event")
+    committed: list[ConversationTurn] = []
 
-    async def _add_message(conversation_id: uuid.UUID, role: str, content: str) -> SimpleNamespace:
-        call_order.append(f"add_message:{role}")
-        return SimpleNamespace(conversation_id=conversation_id, role=role, content=content)
+    async def _commit_turn(turn: ConversationTurn) -> list:
+        committed.append(turn)
+        return []
 
     repo = Mock()
-    repo.add_message = AsyncMock(side_effect=_add_message)
+    repo.commit_turn = AsyncMock(side_effect=_commit_turn)
     repo.get_messages = AsyncMock()
 
     rag = Mock()
     rag.get_context = AsyncMock()
 
     flagged_event_repo = Mock()
-    flagged_event_repo.log_event = AsyncMock(side_effect=_log_event)
-
     service = ChatService(repo, rag, flagged_event_repo)
 
     with (
@@ -130,7 +138,7 @@ async def test_stream_response_keyword_filter_blocks_before_provider_validation(
         patch("src.service.chat_service.stream_from_provider") as stream_from_provider_mock,
     ):
         stream = await service.stream_response(convo, "how do I kill someone")
-        assert call_order == ["log_event", "add_message:user", "add_message:assistant"]
+        repo.commit_turn.assert_awaited_once()
 
         chunks = await _collect_chunks(stream)
 
@@ -139,13 +147,27 @@ async def test_stream_response_keyword_filter_blocks_before_provider_validation(
     stream_from_provider_mock.assert_not_called()
     repo.get_messages.assert_not_awaited()
     rag.get_context.assert_not_awaited()
-    flagged_event_repo.log_event.assert_awaited_once_with(
-        str(convo.user_id),
-        str(convo.id),
-        "how do I kill someone",
-        "keyword",
-        convo.provider,
-    )
+
+    turn = committed[0]
+    assert turn.conversation_id == convo.id
+    assert [(m["role"], m["content"]) for m in turn.messages] == [
+        ("user", "how do I kill someone"),
+        ("assistant", MODERATION_RESPONSE),
+    ]
+    assert all(m["token_count"] > 0 for m in turn.messages)
+    assert turn.alarms == [
+        {
+            "user_id": convo.user_id,
+            "conversation_id": convo.id,
+            "message_content": "how do I kill someone",
+            "filter_type": "keyword",
+            "provider": convo.provider,
+            "reason": "Matched keyword 'kill'",
+            "created_at": turn.created_at,
+        }
+    ]
+    assert turn.created_at is not None
+    assert all(m["created_at"] == turn.created_at for m in turn.messages)
 
 
 @pytest.mark.asyncio
@@ -154,16 +176,18 @@ async def test_stream_response_safe_message_validates_provider_before_streaming(
     convo = _build_conversation()
     content = "What is the capital of France?"
     call_order: list[str] = []
+    committed: list[ConversationTurn] = []
 
-    async def _add_message(conversation_id: uuid.UUID, role: str, message: str) -> SimpleNamespace:
-        call_order.append(f"add_message:{role}")
-        return SimpleNamespace(conversation_id=conversation_id, role=role, content=message)
+    async def _commit_turn(turn: ConversationTurn) -> list:
+        call_order.append("commit_turn")
+        committed.append(turn)
+        return []
 
     async def _get_messages(conversation_id: uuid.UUID) -> list[SimpleNamespace]:
         call_order.append("get_messages")
-        return [SimpleNamespace(role="user", content=content)]
+        return []
 
-    async def _get_context(_allowed_doc_ids: list, prompt: str) -> None:
+    async def _get_context(_allowed_doc_ids: list, prompt: str, **_kwargs: object) -> None:
         call_order.append("get_context")
         assert prompt == content
         return None
@@ -177,16 +201,13 @@ async def test_stream_response_safe_message_validates_provider_before_streaming(
         yield " world!"
 
     repo = Mock()
-    repo.add_message = AsyncMock(side_effect=_add_message)
+    repo.commit_turn = AsyncMock(side_effect=_commit_turn)
     repo.get_messages = AsyncMock(side_effect=_get_messages)
 
     rag = Mock()
     rag.get_context = AsyncMock(side_effect=_get_context)
 
-    flagged_event_repo = Mock()
-    flagged_event_repo.log_event = AsyncMock()
-
-    service = ChatService(repo, rag, flagged_event_repo)
+    service = ChatService(repo, rag, Mock())
 
     def _validate_provider(provider: str) -> None:
         call_order.append("validate_provider")
@@ -199,7 +220,6 @@ async def test_stream_response_safe_message_validates_provider_before_streaming(
         stream = await service.stream_response(convo, content)
         assert call_order == [
             "validate_provider",
-            "add_message:user",
             "get_messages",
             "get_context",
         ]
@@ -209,17 +229,19 @@ async def test_stream_response_safe_message_validates_provider_before_streaming(
     assert chunks == ["Hello", " world!"]
     assert call_order == [
         "validate_provider",
-        "add_message:user",
         "get_messages",
         "get_context",
         "stream_from_provider",
-        "add_message:assistant",
+        "commit_turn",
     ]
     validate_provider_mock.assert_called_once_with(convo.provider)
     stream_from_provider_mock.assert_called_once()
-    repo.add_message.assert_awaited()
     repo.get_messages.assert_awaited_once_with(convo.id)
-    flagged_event_repo.log_event.assert_not_awaited()
+    assert [(m["role"], m["content"]) for m in committed[0].messages] == [
+        ("user", content),
+        ("assistant", "Hello world!"),
+    ]
+    assert committed[0].alarms == []
 
 
 @pytest.mark.asyncio
@@ -228,29 +250,23 @@ async def test_stream_response_provider_policy_error_logs_alarm_and_returns_mode
     convo = _build_conversation()
     content = "something the provider blocks"
 
-    async def _add_message(conversation_id: uuid.UUID, role: str, message: str) -> SimpleNamespace:
-        return SimpleNamespace(conversation_id=conversation_id, role=role, content=message)
-
-    async def _get_messages(conversation_id: uuid.UUID) -> list[SimpleNamespace]:
-        return [SimpleNamespace(role="user", content=content)]
-
     async def _raises_policy(*args: object, **kwargs: object) -> AsyncIterator[str]:
         raise ContentPolicyError("blocked")
         yield ""
 
     repo = Mock()
-    repo.add_message = AsyncMock(side_effect=_add_message)
-    repo.get_messages = AsyncMock(side_effect=_get_messages)
+    repo.commit_turn = AsyncMock(return_value=[])
+    repo.get_messages = AsyncMock(return_value=[])
 
     rag = Mock()
     rag.get_context = AsyncMock(return_value=None)
 
-    flagged_event_repo = Mock()
-    flagged_event_repo.log_event = AsyncMock()
-
-    service = ChatService(repo, rag, flagged_event_repo)
+    service = ChatService(repo, rag, Mock())
+    writer = Mock(running=True)
+    writer.pending.return_value = []
 
     with (
+        patch("src.service.chat_service.get_turn_writer", return_value=writer),
         patch("src.service.chat_service.validate_provider", return_value=None) as validate_provider_mock,
         patch("src.service.chat_service.stream_from_provider", side_effect=_raises_policy),
     ):
@@ -259,23 +275,391 @@ async def test_stream_response_provider_policy_error_logs_alarm_and_returns_mode
 
     assert chunks == [MODERATION_RESPONSE]
     validate_provider_mock.assert_called_once_with(convo.provider)
-    flagged_event_repo.log_event.assert_awaited_once_with(
-        str(convo.user_id),
-        str(convo.id),
-        content,
-        "provider",
-        convo.provider,
+    # Alarm-bearing turns skip the write-behind queue
+    writer.submit.assert_not_called()
+    repo.commit_turn.assert_awaited_once()
+    turn = repo.commit_turn.await_args.args[0]
+    assert [(m["role"], m["content"]) for m in turn.messages] == [
+        ("user", content),
+        ("assistant", MODERATION_RESPONSE),
+    ]
+    assert [(a["filter_type"], a["message_content"]) for a in turn.alarms] == [("provider", content)]
+
+
+@pytest.mark.asyncio
+async def test_stream_response_provider_failure_still_saves_prompt() -> None:
+    """An unexpected provider error should persist the prompt before propagating."""
+    convo = _build_conversation()
+
+    async def _raises(*args: object, **kwargs: object) -> AsyncIterator[str]:
+        raise RuntimeError("upstream reset")
+        yield ""
+
+    repo = Mock()
+    repo.commit_turn = AsyncMock(return_value=[])
+    repo.get_messages = AsyncMock(return_value=[])
+
+    rag = Mock()
+    rag.get_context = AsyncMock(return_value=None)
+
+    service = ChatService(repo, rag, Mock())
+
+    with (
+        patch("src.service.chat_service.validate_provider", return_value=None),
+        patch("src.service.chat_service.stream_from_provider", side_effect=_raises),
+    ):
+        stream = await service.stream_response(convo, "hello")
+        with pytest.raises(RuntimeError):
+            await _collect_chunks(stream)
+
+    turn = repo.commit_turn.await_args.args[0]
+    assert [(m["role"], m["content"]) for m in turn.messages] == [("user", "hello")]
+
+
+@pytest.mark.asyncio
+async def test_stream_response_queues_partial_reply_when_client_disconnects() -> None:
+    """Closing the stream early should hand the partial reply to the write-behind queue."""
+    convo = _build_conversation()
+
+    async def _mock_stream(*args: object, **kwargs: object) -> AsyncIterator[str]:
+        yield "Hello"
+        yield " world!"
+
+    repo = Mock()
+    repo.commit_turn = AsyncMock(return_value=[])
+    repo.get_messages = AsyncMock(return_value=[])
+
+    rag = Mock()
+    rag.get_context = AsyncMock(return_value=None)
+
+    service = ChatService(repo, rag, Mock())
+    writer = Mock(running=True)
+    writer.pending.return_value = []
+
+    with (
+        patch("src.service.chat_service.get_turn_writer", return_value=writer),
+        patch("src.service.chat_service.validate_provider", return_value=None),
+        patch("src.service.chat_service.stream_from_provider", side_effect=_mock_stream),
+    ):
+        stream = await service.stream_response(convo, "hi")
+        assert await stream.__anext__() == "Hello"
+        await stream.aclose()
+
+    repo.commit_turn.assert_not_awaited()
+    writer.submit.assert_called_once()
+    turn = writer.submit.call_args.args[0]
+    assert [(m["role"], m["content"]) for m in turn.messages] == [
+        ("user", "hi"),
+        ("assistant", "Hello"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_response_includes_turns_not_yet_written() -> None:
+    """History should include turns still waiting in the write-behind queue."""
+    convo = _build_conversation()
+    sent_payloads: list[list[dict[str, str]]] = []
+
+    async def _mock_stream(provider: str, model: str, messages: list[dict[str, str]]) -> AsyncIterator[str]:
+        sent_payloads.append(messages)
+        yield "ok"
+
+    pending = ConversationTurn(convo.id)
+    pending.add_message("user", "earlier", token_count=3)
+    pending.add_message("assistant", "answer", token_count=3)
+    other = ConversationTurn(uuid.uuid4())
+    other.add_message("user", "someone else", token_count=3)
+
+    repo = Mock()
+    repo.get_messages = AsyncMock(return_value=[])
+
+    rag = Mock()
+    rag.get_context = AsyncMock(return_value=None)
+
+    service = ChatService(repo, rag, Mock())
+    writer = Mock(running=True)
+    writer.pending.return_value = [pending, other]
+
+    with (
+        patch("src.service.chat_service.get_turn_writer", return_value=writer),
+        patch("src.service.chat_service.validate_provider", return_value=None),
+        patch("src.service.chat_service.stream_from_provider", side_effect=_mock_stream),
+    ):
+        await _collect_chunks(await service.stream_response(convo, "next"))
+
+    assert sent_payloads[0] == [
+        {"role": "user", "content": "earlier"},
+        {"role": "assistant", "content": "answer"},
+        {"role": "user", "content": "next"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_load_history_skips_pending_turns_already_committed() -> None:
+    """A turn committed but not yet released by the queue should appear once."""
+    convo = _build_conversation()
+    pending = ConversationTurn(convo.id)
+    pending.add_message("user", "earlier", token_count=3)
+    pending.add_message("assistant", "answer", token_count=3)
+    stored = [
+        SimpleNamespace(id=row["id"], role=row["role"], content=row["content"], display_id=index, token_count=3)
+        for index, row in enumerate(pending.messages, start=1)
+    ]
+    repo = Mock()
+    repo.get_messages = AsyncMock(return_value=stored)
+    writer = Mock(running=True)
+    writer.pending.return_value = [pending]
+
+    with patch("src.service.chat_service.get_turn_writer", return_value=writer):
+        history = await ChatService(repo, Mock(), Mock())._load_history(convo)
+
+    assert history.messages == [
+        {"role": "user", "content": "earlier"},
+        {"role": "assistant", "content": "answer"},
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("chunk_counts", "expected_scope"),
+    [([2, 3], 5), ([2, None], None)],
+)
+async def test_stream_response_passes_stored_chunk_counts_to_rag(
+    chunk_counts: list[int | None],
+    expected_scope: int | None,
+) -> None:
+    """Stored per-document chunk counts should size retrieval when all are known."""
+    convo = _build_conversation()
+    content = "What does the handbook say?"
+
+    repo = Mock()
+    repo.commit_turn = AsyncMock(return_value=[])
+    repo.get_messages = AsyncMock(return_value=[SimpleNamespace(id=uuid.uuid4(), role="user", content=content, display_id=1, token_count=None)])
+
+    doc_repo = Mock()
+    doc_repo.list_by_role = AsyncMock(
+        return_value=[
+            SimpleNamespace(chroma_doc_id=f"doc-{index}", chunk_count=count)
+            for index, count in enumerate(chunk_counts)
+        ]
+        + [SimpleNamespace(chroma_doc_id=None, chunk_count=None)]
+    )
+
+    rag = Mock()
+    rag.embed_query = AsyncMock(return_value=[0.1, 0.2])
+    rag.get_context = AsyncMock(return_value=None)
+
+    service = ChatService(repo, rag, Mock(), doc_repo)
+
+    with patch("src.service.chat_service.validate_provider", return_value=None):
+        await service.stream_response(convo, content, role="user")
+
+    rag.get_context.assert_awaited_once()
+    args, kwargs = rag.get_context.await_args
+    assert args == (["doc-0", "doc-1"], content)
+    assert kwargs["chunks_in_scope"] == expected_scope
+
+
+@pytest.mark.asyncio
+async def test_stream_response_embeds_query_while_loading_history_and_documents() -> None:
+    """The query embedding should run concurrently with the Postgres reads."""
+    convo = _build_conversation()
+    content = "What does the handbook say?"
+    call_order: list[str] = []
+    embedding_started = asyncio.Event()
+
+    async def _embed_query(query: str) -> list[float]:
+        call_order.append("embed_started")
+        embedding_started.set()
+        await asyncio.sleep(0)
+        call_order.append("embed_finished")
+        return [0.1, 0.2]
+
+    async def _get_messages(conversation_id: uuid.UUID) -> list[SimpleNamespace]:
+        # Only returns once the embedding is already under way
+        await asyncio.wait_for(embedding_started.wait(), timeout=1)
+        call_order.append("get_messages")
+        return []
+
+    async def _list_by_role(role: str) -> list[SimpleNamespace]:
+        call_order.append("list_by_role")
+        return [SimpleNamespace(chroma_doc_id="doc-1", chunk_count=3)]
+
+    async def _get_context(
+        allowed_doc_ids: list[str],
+        query: str,
+        chunks_in_scope: int | None = None,
+        query_embedding: Awaitable[list[float]] | None = None,
+    ) -> str:
+        assert query_embedding is not None
+        assert await query_embedding == [0.1, 0.2]
+        call_order.append("get_context")
+        return "Handbook excerpt"
+
+    repo = Mock()
+    repo.get_messages = AsyncMock(side_effect=_get_messages)
+    doc_repo = Mock()
+    doc_repo.list_by_role = AsyncMock(side_effect=_list_by_role)
+    rag = Mock()
+    rag.embed_query = AsyncMock(side_effect=_embed_query)
+    rag.get_context = AsyncMock(side_effect=_get_context)
+
+    service = ChatService(repo, rag, Mock(), doc_repo)
+
+    history, rag_context = await service._prepare_context(convo, content, "user")
+
+    assert rag_context == "Handbook excerpt"
+    assert history.messages == []
+    assert call_order.index("embed_started") < call_order.index("get_messages")
+    assert call_order[-1] == "get_context"
+    rag.embed_query.assert_awaited_once_with(content)
+
+
+@pytest.mark.asyncio
+async def test_prepare_context_cancels_unused_query_embedding() -> None:
+    """An embedding nobody searches with should never reach the model."""
+    convo = _build_conversation()
+    embed_fn = Mock(return_value=[[0.1]])
+    scheduler = EmbeddingScheduler(embed_fn, max_workers=1, batch_window_ms=20, max_batch_size=64)
+
+    async def _embed_query(query: str) -> list[float]:
+        return (await scheduler.embed([query]))[0]
+
+    async def _get_messages(conversation_id: uuid.UUID) -> list[SimpleNamespace]:
+        # Let the embedding join a batch before it turns out to be unnecessary
+        await asyncio.sleep(0)
+        return []
+
+    repo = Mock()
+    repo.get_messages = AsyncMock(side_effect=_get_messages)
+    doc_repo = Mock()
+    doc_repo.list_by_role = AsyncMock(return_value=[])
+    rag = Mock()
+    rag.embed_query = AsyncMock(side_effect=_embed_query)
+    rag.get_context = AsyncMock(return_value=None)
+
+    service = ChatService(repo, rag, Mock(), doc_repo)
+
+    _, rag_context = await service._prepare_context(convo, "hello", "user")
+    await asyncio.sleep(0.05)
+
+    assert rag_context is None
+    rag.embed_query.assert_awaited_once_with("hello")
+    embed_fn.assert_not_called()
+    assert scheduler.batches == 0
+    scheduler.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_stream_response_reads_only_new_messages_on_later_turns() -> None:
+    """A cached history should be extended from the cursor instead of reloaded."""
+    convo = _build_conversation()
+    sent_payloads: list[list[dict[str, str]]] = []
+
+    async def _mock_stream(provider: str, model: str, messages: list[dict[str, str]]) -> AsyncIterator[str]:
+        sent_payloads.append(messages)
+        yield "ok"
+
+    repo = Mock()
+    repo.commit_turn = AsyncMock(return_value=[])
+    repo.get_messages = AsyncMock(
+        return_value=[
+            SimpleNamespace(id=uuid.uuid4(), role="user", content="first", display_id=10, token_count=2),
+            SimpleNamespace(id=uuid.uuid4(), role="assistant", content="reply", display_id=11, token_count=2),
+        ]
     )
-    assert repo.add_message.await_args_list[0].args == (convo.id, "user", content)
-    assert repo.add_message.await_args_list[1].args == (
-        convo.id,
-        "assistant",
-        MODERATION_RESPONSE,
+    repo.get_messages_after = AsyncMock(
+        return_value=[
+            SimpleNamespace(id=uuid.uuid4(), role="user", content="second", display_id=12, token_count=2),
+            SimpleNamespace(id=uuid.uuid4(), role="assistant", content="ok", display_id=13, token_count=2),
+        ]
+    )
+
+    rag = Mock()
+    rag.get_context = AsyncMock(return_value=None)
+    service = ChatService(repo, rag, Mock())
+
+    with (
+        patch("src.service.chat_service.validate_provider", return_value=None),
+        patch("src.service.chat_service.stream_from_provider", side_effect=_mock_stream),
+    ):
+        await _collect_chunks(await service.stream_response(convo, "second"))
+        await _collect_chunks(await service.stream_response(convo, "third"))
+
+    repo.get_messages.assert_awaited_once_with(convo.id)
+    repo.get_messages_after.assert_awaited_once_with(convo.id, 11)
+    assert sent_payloads[1] == [
+        {"role": "user", "content": "first"},
+        {"role": "assistant", "content": "reply"},
+        {"role": "user", "content": "second"},
+        {"role": "assistant", "content": "ok"},
+        {"role": "user", "content": "third"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_load_history_reloads_when_a_message_committed_below_the_cursor() -> None:
+    """Rows committed out of display_id order should not be lost from the cache."""
+    convo = _build_conversation()
+    first = SimpleNamespace(id=uuid.uuid4(), role="user", content="first", display_id=10, token_count=2)
+    late = SimpleNamespace(id=uuid.uuid4(), role="user", content="late", display_id=11, token_count=2)
+    newer = SimpleNamespace(id=uuid.uuid4(), role="assistant", content="newer", display_id=12, token_count=2)
+    repo = Mock()
+    repo.get_messages = AsyncMock(side_effect=[[first, newer], [first, late, newer]])
+    repo.get_messages_after = AsyncMock(return_value=[])
+    service = ChatService(repo, Mock(), Mock())
+
+    convo.message_count = 2
+    await service._load_history(convo)
+    convo.message_count = 3
+    history = await service._load_history(convo)
+
+    repo.get_messages_after.assert_awaited_once_with(convo.id, 12)
+    assert repo.get_messages.await_count == 2
+    assert [m["content"] for m in history.messages] == ["first", "late", "newer"]
+    assert history.stored_count == 3
+
+
+@pytest.mark.asyncio
+async def test_stream_response_drops_oldest_turns_over_token_budget() -> None:
+    """History beyond the context budget should be trimmed oldest-first."""
+    convo = _build_conversation()
+    sent_payloads: list[list[dict[str, str]]] = []
+
+    async def _mock_stream(provider: str, model: str, messages: list[dict[str, str]]) -> AsyncIterator[str]:
+        sent_payloads.append(messages)
+        yield "ok"
+
+    repo = Mock()
+    repo.commit_turn = AsyncMock(return_value=[])
+    repo.get_messages = AsyncMock(
+        return_value=[
+            SimpleNamespace(id=uuid.uuid4(), role="user", content="a" * 400, display_id=1, token_count=None),
+            SimpleNamespace(id=uuid.uuid4(), role="assistant", content="b" * 400, display_id=2, token_count=None),
+        ]
     )
 
+    rag = Mock()
+    rag.get_context = AsyncMock(return_value=None)
+    service = ChatService(repo, rag, Mock())
+
+    with (
+        patch("src.core.context_window.settings.CHAT_CONTEXT_MAX_TOKENS", 120),
+        patch("src.service.chat_service.validate_provider", return_value=None),
+        patch("src.service.chat_service.stream_from_provider", side_effect=_mock_stream),
+    ):
+        await _collect_chunks(await service.stream_response(convo, "latest"))
+
+    assert sent_payloads[0] == [
+        {"role": "assistant", "content": "b" * 400},
+        {"role": "user", "content": "latest"},
+    ]
+
 
 @pytest.mark.asyncio
-async def test_get_security_chat_histories_assembles_paginated_transcripts() -> None:
+async def test_get_security_chat_histories_assembles_paginated_transcripts(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Historic chat dashboard responses should include nested ordered messages."""
     conversation_id = uuid.uuid4()
     user_id = uuid.uuid4()
@@ -284,22 +668,19 @@ async def test_get_security_chat_histories_assembles_paginated_transcripts() ->
 
     repo = Mock()
     repo.get_historic_chat_page = AsyncMock(
-        return_value=(
-            1,
-            [
-                {
-                    "conversation_id": conversation_id,
-                    "title": "Security Audit Chat",
-                    "user_id": user_id,
-                    "user_email": "auditor@example.com",
-                    "provider": "groq",
-                    "model": "llama-3.1-8b-instant",
-                    "created_at": created_at,
-                    "last_activity_at": last_activity_at,
-                    "message_count": 2,
-                }
-            ],
-        )
+        return_value=[
+            {
+                "conversation_id": conversation_id,
+                "title": "Security Audit Chat",
+                "user_id": user_id,
+                "user_email": "auditor@example.com",
+                "provider": "groq",
+                "model": "llama-3.1-8b-instant",
+                "created_at": created_at,
+                "last_activity_at": last_activity_at,
+                "message_count": 2,
+            }
+        ]
     )
     repo.get_messages_for_conversations = AsyncMock(
         return_value=[
@@ -319,7 +700,7 @@ async def test_get_security_chat_histories_assembles_paginated_transcripts() ->
             ),
         ]
     )
-    repo.get_historic_chat_summary = AsyncMock(
+    load_summary = AsyncMock(
         return_value={
             "total_histories": 1,
             "total_messages": 2,
@@ -327,6 +708,7 @@ async def test_get_security_chat_histories_assembles_paginated_transcripts() ->
             "unique_users": 1,
         }
     )
+    monkeypatch.setattr("src.service.chat_service._load_summary", load_summary)
 
     rag = Mock()
     flagged_event_repo = Mock()
@@ -347,6 +729,51 @@ async def test_get_security_chat_histories_assembles_paginated_transcripts() ->
         "What happened yesterday?",
         "Three incidents were recorded.",
     ]
-    repo.get_historic_chat_page.assert_awaited_once_with(limit=5, offset=0)
+    assert result.next_cursor is None
+    repo.get_historic_chat_page.assert_awaited_once_with(limit=6, offset=0, after=None)
     repo.get_messages_for_conversations.assert_awaited_once_with([conversation_id])
-    repo.get_historic_chat_summary.assert_awaited_once_with()
+    load_summary.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_get_security_chat_histories_round_trips_keyset_cursor(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A full page should return a cursor that resumes after its last row."""
+    last_activity_at = datetime.now(timezone.utc)
+    rows = [
+        {
+            "conversation_id": uuid.uuid4(),
+            "title": f"Chat {index}",
+            "user_id": uuid.uuid4(),
+            "user_email": "user@example.com",
+            "provider": "groq",
+            "model": "llama-3.1-8b-instant",
+            "created_at": last_activity_at,
+            "last_activity_at": last_activity_at - timedelta(minutes=index),
+            "message_count": 0,
+        }
+        for index in range(3)
+    ]
+
+    repo = Mock()
+    repo.get_historic_chat_page = AsyncMock(return_value=rows)
+    repo.get_messages_for_conversations = AsyncMock(return_value=[])
+    monkeypatch.setattr(
+        "src.service.chat_service._load_summary",
+        AsyncMock(return_value={"total_histories": 3, "total_messages": 0, "recent_activity": 0, "unique_users": 3}),
+    )
+    service = ChatService(repo, Mock(), Mock())
+
+    first = await service.get_security_chat_histories(HistoricChatDashboardQuery(limit=2))
+    assert [item.title for item in first.items] == ["Chat 0", "Chat 1"]
+    assert first.next_cursor is not None
+
+    await service.get_security_chat_histories(
+        HistoricChatDashboardQuery(limit=2, cursor=first.next_cursor)
+    )
+    repo.get_historic_chat_page.assert_awaited_with(
+        limit=3,
+        offset=0,
+        after=(rows[1]["last_activity_at"], rows[1]["conversation_id"]),
+    )
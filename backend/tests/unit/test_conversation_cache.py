@@ -0,0 +1,61 @@
+"""Unit tests for the conversation history cache and context window."""
+from src.core.context_window import fit_to_budget
+from src.core.conversation_cache import ConversationContextCache, ConversationHistory
+
+
+def test_cache_returns_copies_with_cursor() -> None:
+    """Callers mutating a cached history should not change the stored entry."""
+    cache = ConversationContextCache(max_conversations=2)
+    stored = ConversationHistory(5, [{"role": "user", "content": "hi"}], [5])
+    cache.put("c1", stored)
+
+    history = cache.get("c1")
+    history.messages.append({"role": "assistant", "content": "hello"})
+    history.token_counts.append(6)
+
+    assert cache.get("c1") == stored
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    """The oldest untouched conversation should be evicted first."""
+    cache = ConversationContextCache(max_conversations=2)
+    cache.put("c1", ConversationHistory(1))
+    cache.put("c2", ConversationHistory(2))
+    cache.get("c1")
+    cache.put("c3", ConversationHistory(3))
+
+    assert cache.get("c2") is None
+    assert cache.get("c1") is not None
+    assert cache.get("c3") is not None
+
+
+def test_cache_invalidate_and_disabled() -> None:
+    """Invalidated entries are dropped and a zero-size cache stores nothing."""
+    cache = ConversationContextCache(max_conversations=2)
+    cache.put("c1", ConversationHistory(1))
+    cache.invalidate("c1")
+    assert cache.get("c1") is None
+
+    disabled = ConversationContextCache(max_conversations=0)
+    disabled.put("c1", ConversationHistory(1))
+    assert disabled.get("c1") is None
+
+
+def test_fit_to_budget_keeps_newest_messages() -> None:
+    """Messages are dropped oldest-first until the rest fit the budget."""
+    messages = [
+        {"role": "user", "content": "a" * 40},
+        {"role": "assistant", "content": "b" * 40},
+        {"role": "user", "content": "c" * 40},
+    ]
+
+    assert fit_to_budget(messages, [10, 10, 10], 30) == messages
+    assert fit_to_budget(messages, [10, 10, 10], 29) == messages[1:]
+
+
+def test_fit_to_budget_always_keeps_latest_prompt() -> None:
+    """The newest message survives even when it alone exceeds the budget."""
+    messages = [{"role": "user", "content": "x" * 1000}]
+
+    assert fit_to_budget(messages, [250], 1) == messages
+    assert fit_to_budget([], [], 10) == []
@@ -5,7 +5,7 @@ import pytest
 
 import src.core.database_migrations as database_migrations
 
-CURRENT_REVISION = "20260413_000002"
+CURRENT_REVISION = "20261018_000011"
 
 
 def test_build_alembic_config_converts_async_database_urls() -> None:
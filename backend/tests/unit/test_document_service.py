@@ -0,0 +1,174 @@
+"""Unit tests for background document ingestion orchestration."""
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+import uuid
+
+import pytest
+
+import src.core.job_queue as job_queue
+import src.service.document_service as document_service
+from src.service.document_service import DocumentService
+
+
+def _build_job(document_id: uuid.UUID) -> SimpleNamespace:
+    """Create a lightweight claimed ingestion job."""
+    return SimpleNamespace(id=uuid.uuid4(), document_id=document_id, pdf_bytes=b"%PDF")
+
+
+@pytest.mark.asyncio
+async def test_enqueue_document_stores_job_and_submits_it(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Uploads should return a processing document once the job is persisted."""
+    doc = SimpleNamespace(id=uuid.uuid4())
+    job = _build_job(doc.id)
+    doc_repo = Mock()
+    doc_repo.create = AsyncMock(return_value=doc)
+    job_repo = Mock()
+    job_repo.create = AsyncMock(return_value=job)
+    queue = Mock()
+    monkeypatch.setattr(document_service, "_ingestion_queue", queue)
+    rag = Mock()
+    rag.add_document = AsyncMock()
+
+    result = await DocumentService(doc_repo, rag, job_repo).enqueue_document(
+        "Handbook", "", "handbook.pdf", b"%PDF", str(uuid.uuid4()), ["user"]
+    )
+
+    assert result is doc
+    assert doc_repo.create.await_args.kwargs["status"] == "processing"
+    job_repo.create.assert_awaited_once_with(str(doc.id), b"%PDF")
+    queue.submit.assert_called_once_with(str(job.id))
+    rag.add_document.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_process_ingestion_job_activates_document() -> None:
+    """A successful job should activate the document and record its chunk count."""
+    doc_id = uuid.uuid4()
+    job = _build_job(doc_id)
+    job_repo = Mock()
+    job_repo.claim = AsyncMock(return_value=job)
+    job_repo.complete = AsyncMock()
+    doc_repo = Mock()
+    doc_repo.get_by_id = AsyncMock(return_value=SimpleNamespace(filename="handbook.pdf"))
+    doc_repo.update = AsyncMock(return_value=SimpleNamespace())
+    rag = Mock()
+    rag.add_document = AsyncMock(return_value={"chunk_count": 7})
+
+    await DocumentService(doc_repo, rag, job_repo).process_ingestion_job(str(job.id))
+
+    doc_repo.update.assert_awaited_once_with(
+        str(doc_id),
+        status="active",
+        chroma_doc_id=str(doc_id),
+        chunk_count=7,
+    )
+    job_repo.complete.assert_awaited_once_with(job)
+
+
+@pytest.mark.asyncio
+async def test_process_ingestion_job_marks_failures() -> None:
+    """Ingestion errors should be recorded on the job and the document."""
+    doc_id = uuid.uuid4()
+    job = _build_job(doc_id)
+    job_repo = Mock()
+    job_repo.claim = AsyncMock(return_value=job)
+    job_repo.fail = AsyncMock()
+    doc_repo = Mock()
+    doc_repo.get_by_id = AsyncMock(return_value=SimpleNamespace(filename="blank.pdf"))
+    doc_repo.update = AsyncMock()
+    rag = Mock()
+    rag.add_document = AsyncMock(side_effect=ValueError("No extractable text found in the uploaded PDF."))
+
+    await DocumentService(doc_repo, rag, job_repo).process_ingestion_job(str(job.id))
+
+    job_repo.fail.assert_awaited_once_with(job, "No extractable text found in the uploaded PDF.")
+    doc_repo.update.assert_awaited_once_with(str(doc_id), status="failed")
+
+
+@pytest.mark.asyncio
+async def test_process_ingestion_job_skips_jobs_claimed_elsewhere() -> None:
+    """Jobs already claimed by another worker should not be ingested twice."""
+    job_repo = Mock()
+    job_repo.claim = AsyncMock(return_value=None)
+    rag = Mock()
+    rag.add_document = AsyncMock()
+
+    await DocumentService(Mock(), rag, job_repo).process_ingestion_job(str(uuid.uuid4()))
+
+    rag.add_document.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_process_ingestion_job_heartbeats_while_indexing(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Long ingestions should keep refreshing their job so they are not requeued."""
+    doc_id = uuid.uuid4()
+    job = _build_job(doc_id)
+    job_repo = Mock()
+    job_repo.claim = AsyncMock(return_value=job)
+    job_repo.heartbeat = AsyncMock()
+    job_repo.complete = AsyncMock()
+    doc_repo = Mock()
+    doc_repo.get_by_id = AsyncMock(return_value=SimpleNamespace(filename="long.pdf"))
+    doc_repo.update = AsyncMock(return_value=SimpleNamespace(id=doc_id))
+    rag = Mock()
+
+    async def slow_add_document(**kwargs: object) -> dict[str, int]:
+        await asyncio.sleep(0.05)
+        return {"chunk_count": 1}
+
+    rag.add_document = slow_add_document
+    monkeypatch.setattr(job_queue, "HEARTBEAT_INTERVAL", timedelta(milliseconds=10))
+
+    await DocumentService(doc_repo, rag, job_repo).process_ingestion_job(str(job.id))
+    heartbeats = job_repo.heartbeat.await_count
+    await asyncio.sleep(0.03)
+
+    assert heartbeats >= 2
+    job_repo.heartbeat.assert_awaited_with(job)
+    assert job_repo.heartbeat.await_count == heartbeats
+    job_repo.complete.assert_awaited_once_with(job)
+
+
+@pytest.mark.asyncio
+async def test_process_ingestion_job_requeues_jobs_cancelled_by_shutdown(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A worker stopped mid-job should hand the job back instead of leaving it running."""
+    doc_id = uuid.uuid4()
+    job = _build_job(doc_id)
+    job_repo = Mock()
+    job_repo.claim = AsyncMock(return_value=job)
+    job_repo.heartbeat = AsyncMock()
+    job_repo.fail = AsyncMock()
+    doc_repo = Mock()
+    doc_repo.get_by_id = AsyncMock(return_value=SimpleNamespace(filename="long.pdf"))
+    doc_repo.update = AsyncMock()
+    rag = Mock()
+    rag.add_document = AsyncMock(side_effect=asyncio.CancelledError)
+    release = AsyncMock()
+    monkeypatch.setattr(document_service, "_release_ingestion_job", release)
+
+    with pytest.raises(asyncio.CancelledError):
+        await DocumentService(doc_repo, rag, job_repo).process_ingestion_job(str(job.id))
+
+    release.assert_awaited_once_with(job.id)
+    job_repo.fail.assert_not_awaited()
+    doc_repo.update.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_process_ingestion_job_fails_jobs_whose_document_is_gone() -> None:
+    """A job claimed after its document was deleted should not stay running."""
+    job = _build_job(uuid.uuid4())
+    job_repo = Mock()
+    job_repo.claim = AsyncMock(return_value=job)
+    job_repo.fail_orphaned = AsyncMock()
+    doc_repo = Mock()
+    doc_repo.get_by_id = AsyncMock(return_value=None)
+    rag = Mock()
+    rag.add_document = AsyncMock()
+
+    await DocumentService(doc_repo, rag, job_repo).process_ingestion_job(str(job.id))
+
+    job_repo.fail_orphaned.assert_awaited_once_with(job, "Document was deleted before it was indexed")
+    rag.add_document.assert_not_awaited()
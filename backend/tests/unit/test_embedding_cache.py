@@ -0,0 +1,58 @@
+"""Unit tests for the content-addressed embedding cache."""
+from pathlib import Path
+
+import pytest
+
+from src.core.embedding_cache import EmbeddingCache, cache_key
+
+
+def test_cache_key_normalizes_whitespace_and_scopes_by_model() -> None:
+    """Whitespace-only differences share a key while model names do not."""
+    assert cache_key("model-a", "  What is  the\npolicy? ") == cache_key("model-a", "What is the policy?")
+    assert cache_key("model-a", "policy") != cache_key("model-b", "policy")
+    assert cache_key("model-a", "Policy") != cache_key("model-a", "policy")
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_counts_hits_and_misses() -> None:
+    """Stored vectors should be served from memory and counted as hits."""
+    cache = EmbeddingCache(max_entries=8)
+
+    assert await cache.get_many(["a", "b"]) == [None, None]
+    await cache.put_many({"a": [0.5, 1.0]})
+
+    assert await cache.get_many(["a", "b"]) == [[0.5, 1.0], None]
+    assert cache.stats() == {
+        "hits": 1,
+        "disk_hits": 0,
+        "misses": 3,
+        "entries": 1,
+        "max_entries": 8,
+    }
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_evicts_least_recently_used_entry() -> None:
+    """The in-process tier should stay bounded and evict the coldest entry."""
+    cache = EmbeddingCache(max_entries=2)
+    await cache.put_many({"a": [1.0], "b": [2.0]})
+    await cache.get_many(["a"])
+    await cache.put_many({"c": [3.0]})
+
+    assert await cache.get_many(["a", "b", "c"]) == [[1.0], None, [3.0]]
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_a_new_cache_instance(tmp_path: Path) -> None:
+    """Vectors written to the SQLite tier should be readable after a restart."""
+    path = tmp_path / "embeddings.sqlite3"
+    first = EmbeddingCache(max_entries=4, disk_path=path)
+    await first.put_many({"a": [0.25, -0.5]})
+    first.close()
+
+    second = EmbeddingCache(max_entries=4, disk_path=path)
+    assert await second.get_many(["a"]) == [[0.25, -0.5]]
+    assert second.stats()["disk_hits"] == 1
+    assert await second.get_many(["a"]) == [[0.25, -0.5]]
+    assert second.stats()["hits"] == 1
+    second.close()
@@ -0,0 +1,109 @@
+"""Unit tests for the micro-batching embedding scheduler."""
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.embedding_scheduler import EmbeddingScheduler
+
+
+def _fake_embed(texts: list[str]) -> list[list[float]]:
+    """Return one deterministic vector per text."""
+    return [[float(len(text))] for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_model_call() -> None:
+    """Requests arriving within the batch window should be embedded together."""
+    embed_fn = Mock(side_effect=_fake_embed)
+    scheduler = EmbeddingScheduler(embed_fn, max_workers=1, batch_window_ms=20, max_batch_size=64)
+
+    results = await asyncio.gather(
+        scheduler.embed(["a"]),
+        scheduler.embed(["bb", "ccc"]),
+        scheduler.embed(["dddd"]),
+    )
+
+    assert results == [[[1.0]], [[2.0], [3.0]], [[4.0]]]
+    embed_fn.assert_called_once_with(["a", "bb", "ccc", "dddd"])
+    assert scheduler.batches == 1
+    assert scheduler.texts == 4
+    scheduler.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_without_waiting_for_window() -> None:
+    """Reaching the batch size should dispatch immediately instead of sleeping."""
+    embed_fn = Mock(side_effect=_fake_embed)
+    scheduler = EmbeddingScheduler(embed_fn, max_workers=1, batch_window_ms=60_000, max_batch_size=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(scheduler.embed(["a"]), scheduler.embed(["bb"])),
+        timeout=5,
+    )
+
+    assert results == [[[1.0]], [[2.0]]]
+    embed_fn.assert_called_once_with(["a", "bb"])
+    scheduler.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_requests_are_dropped_before_the_model_call() -> None:
+    """Callers that gave up while batching should not be embedded."""
+    embed_fn = Mock(side_effect=_fake_embed)
+    scheduler = EmbeddingScheduler(embed_fn, max_workers=1, batch_window_ms=20, max_batch_size=64)
+
+    abandoned = asyncio.ensure_future(scheduler.embed(["abandoned"]))
+    kept = asyncio.ensure_future(scheduler.embed(["kept"]))
+    await asyncio.sleep(0)
+    abandoned.cancel()
+
+    assert await kept == [[4.0]]
+    embed_fn.assert_called_once_with(["kept"])
+    assert scheduler.texts == 1
+
+    only = asyncio.ensure_future(scheduler.embed(["gone"]))
+    await asyncio.sleep(0)
+    only.cancel()
+    await asyncio.sleep(0.05)
+
+    assert embed_fn.call_count == 1
+    assert scheduler.batches == 1
+    scheduler.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_model_runs_on_dedicated_embedding_threads() -> None:
+    """Embedding work should not run on the event loop or the default executor."""
+    thread_names: list[str] = []
+
+    def embed_fn(texts: list[str]) -> list[list[float]]:
+        thread_names.append(threading.current_thread().name)
+        return _fake_embed(texts)
+
+    scheduler = EmbeddingScheduler(embed_fn, max_workers=1, batch_window_ms=0, max_batch_size=64)
+    await scheduler.embed(["a"])
+
+    assert thread_names[0].startswith("embedding")
+    scheduler.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_propagates_to_every_caller() -> None:
+    """A failed model call should fail each request in the batch."""
+    scheduler = EmbeddingScheduler(
+        Mock(side_effect=RuntimeError("model crashed")),
+        max_workers=1,
+        batch_window_ms=10,
+        max_batch_size=64,
+    )
+
+    results = await asyncio.gather(
+        scheduler.embed(["a"]),
+        scheduler.embed(["b"]),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    scheduler.shutdown()
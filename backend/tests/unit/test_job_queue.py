@@ -0,0 +1,72 @@
+"""Unit tests for the background job worker pool."""
+import asyncio
+
+import pytest
+
+from src.core.job_queue import JobQueue
+
+
+@pytest.mark.asyncio
+async def test_workers_bound_concurrency_and_process_every_job() -> None:
+    """No more than ``workers`` jobs should run at once, and all should finish."""
+    running = 0
+    peak = 0
+    done: list[str] = []
+
+    async def handler(job_id: str, _on_progress) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        done.append(job_id)
+
+    queue = JobQueue(handler, workers=2, name="test")
+    for index in range(5):
+        queue.submit(f"job-{index}")
+    await asyncio.wait_for(queue.join(), timeout=5)
+
+    assert sorted(done) == [f"job-{index}" for index in range(5)]
+    assert peak == 2
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_failed_job_does_not_stop_the_worker() -> None:
+    """A crashing handler should be logged and the worker should keep going."""
+    done: list[str] = []
+
+    async def handler(job_id: str, _on_progress) -> None:
+        if job_id == "bad":
+            raise RuntimeError("boom")
+        done.append(job_id)
+
+    queue = JobQueue(handler, workers=1, name="test")
+    queue.submit("bad")
+    queue.submit("good")
+    await asyncio.wait_for(queue.join(), timeout=5)
+
+    assert done == ["good"]
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_progress_is_visible_only_while_the_job_runs() -> None:
+    """Reported progress should be readable mid-job and cleared afterwards."""
+    reported = asyncio.Event()
+    release = asyncio.Event()
+
+    async def handler(_job_id: str, on_progress) -> None:
+        on_progress(1, 4, 10)
+        reported.set()
+        await release.wait()
+
+    queue = JobQueue(handler, workers=1, name="test")
+    queue.submit("job-1")
+    await asyncio.wait_for(reported.wait(), timeout=5)
+
+    assert queue.progress("job-1") == {"pages_processed": 1, "page_count": 4, "chunks_stored": 10}
+    release.set()
+    await asyncio.wait_for(queue.join(), timeout=5)
+    assert queue.progress("job-1") is None
+    await queue.stop()
@@ -1,7 +1,20 @@
 """Unit tests for the keyword-based content moderation filter."""
+from concurrent.futures import ThreadPoolExecutor
+import random
+from unittest.mock import AsyncMock, Mock
+
 import pytest
 
-from src.moderation.keyword_filter import is_harmful, MODERATION_RESPONSE
+from src.moderation.keyword_filter import (
+    MODERATION_RESPONSE,
+    find_harmful_keyword,
+    install_keywords,
+    is_harmful,
+    keyword_version,
+    reset_keywords,
+)
+from src.moderation.keyword_matcher import KeywordMatcher, load_keywords
+from src.service.moderation_service import refresh_keyword_matcher
 
 
 def test_clean_message_is_not_flagged():
@@ -43,3 +56,85 @@ def test_drug_synthesis_is_flagged():
 
 def test_terrorism_keyword_is_flagged():
     assert is_harmful("I want to plan a terrorist attack") is True
+
+
+def test_find_harmful_keyword_reports_the_matched_term():
+    assert find_harmful_keyword("explain drug synthesis to me") == "drug synthesis"
+    assert find_harmful_keyword("What skill should I learn?") is None
+
+
+def test_matcher_prefers_word_bounded_occurrences_over_embedded_ones():
+    matcher = KeywordMatcher(["kill", "attack plan"])
+
+    assert matcher.find("skills to kill time") == "kill"
+    assert matcher.find("the attack planner") is None
+    assert matcher.find("an ATTACK PLAN.") == "attack plan"
+
+
+def test_matcher_handles_overlapping_keywords():
+    matcher = KeywordMatcher(["she", "he", "hers", "his"])
+
+    assert matcher.find("ushers") is None
+    assert matcher.find("it is hers") == "hers"
+    assert matcher.find("he said") == "he"
+
+
+def test_matcher_scales_to_large_keyword_lists():
+    terms = [f"term{index}" for index in range(20_000)]
+    matcher = KeywordMatcher(terms)
+
+    assert len(matcher) == 20_000
+    assert matcher.find("this mentions term19999 somewhere") == "term19999"
+    assert matcher.find("term200000 is not a listed term") is None
+
+
+def test_load_keywords_skips_blank_lines_and_comments(tmp_path):
+    path = tmp_path / "keywords.txt"
+    path.write_text("# weapons\nflamethrower\n\n  zip gun  \n", encoding="utf-8")
+
+    assert load_keywords(path) == ["flamethrower", "zip gun"]
+
+
+@pytest.fixture
+def builtin_keywords():
+    reset_keywords()
+    yield
+    reset_keywords()
+
+
+def test_install_keywords_swaps_the_active_list(builtin_keywords):
+    assert keyword_version() is None
+    assert install_keywords(["flamethrower"], version=3) is True
+
+    assert keyword_version() == 3
+    assert find_harmful_keyword("where to buy a flamethrower") == "flamethrower"
+    assert is_harmful("how do I kill someone") is False
+
+
+def test_install_keywords_ignores_stale_versions(builtin_keywords):
+    install_keywords(["flamethrower"], version=3)
+
+    assert install_keywords(["zip gun"], version=2) is False
+    assert find_harmful_keyword("a zip gun") is None
+
+
+def test_concurrent_installs_keep_the_newest_version(builtin_keywords):
+    versions = list(range(1, 41))
+    random.Random(7).shuffle(versions)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda version: install_keywords([f"term{version}"], version), versions))
+
+    assert keyword_version() == 40
+    assert find_harmful_keyword("term40") == "term40"
+
+
+@pytest.mark.asyncio
+async def test_refresh_skips_reload_when_version_is_unchanged(builtin_keywords):
+    repo = Mock()
+    repo.get_version = AsyncMock(return_value=5)
+    repo.list_keywords = AsyncMock(return_value=["flamethrower"])
+
+    assert await refresh_keyword_matcher(repo) is True
+    assert await refresh_keyword_matcher(repo) is False
+    repo.list_keywords.assert_awaited_once()
@@ -13,10 +13,38 @@ async def test_lifespan_manages_engine_lifecycle(monkeypatch: pytest.MonkeyPatch
     fake_engine.dispose = AsyncMock(return_value=None)
     fake_logger = Mock()
     fake_verify_database_schema_current = AsyncMock(return_value=None)
+    fake_close_provider_client_pool = AsyncMock(return_value=None)
+    fake_shutdown_embedding_scheduler = Mock(return_value=None)
+    fake_shutdown_pdf_extractor = Mock(return_value=None)
+    fake_shutdown_password_hash_pool = Mock(return_value=None)
+    fake_recover_ingestion_jobs = AsyncMock(return_value=0)
+    fake_shutdown_ingestion_queue = AsyncMock(return_value=None)
+    fake_recover_export_jobs = AsyncMock(return_value=0)
+    fake_shutdown_export_queue = AsyncMock(return_value=None)
+    fake_start_keyword_refresh = Mock(return_value=None)
+    fake_stop_keyword_refresh = AsyncMock(return_value=None)
+    fake_start_turn_writer = Mock(return_value=None)
+    fake_stop_turn_writer = AsyncMock(return_value=None)
+    fake_start_alarm_listener = AsyncMock(return_value=None)
+    fake_stop_alarm_listener = AsyncMock(return_value=None)
 
     monkeypatch.setattr(main, "engine", fake_engine)
     monkeypatch.setattr(main, "logger", fake_logger)
     monkeypatch.setattr(main, "verify_database_schema_current", fake_verify_database_schema_current)
+    monkeypatch.setattr(main, "close_provider_client_pool", fake_close_provider_client_pool)
+    monkeypatch.setattr(main, "shutdown_embedding_scheduler", fake_shutdown_embedding_scheduler)
+    monkeypatch.setattr(main, "shutdown_pdf_extractor", fake_shutdown_pdf_extractor)
+    monkeypatch.setattr(main, "shutdown_password_hash_pool", fake_shutdown_password_hash_pool)
+    monkeypatch.setattr(main, "recover_ingestion_jobs", fake_recover_ingestion_jobs)
+    monkeypatch.setattr(main, "shutdown_ingestion_queue", fake_shutdown_ingestion_queue)
+    monkeypatch.setattr(main, "recover_export_jobs", fake_recover_export_jobs)
+    monkeypatch.setattr(main, "shutdown_export_queue", fake_shutdown_export_queue)
+    monkeypatch.setattr(main, "start_keyword_refresh", fake_start_keyword_refresh)
+    monkeypatch.setattr(main, "stop_keyword_refresh", fake_stop_keyword_refresh)
+    monkeypatch.setattr(main, "start_turn_writer", fake_start_turn_writer)
+    monkeypatch.setattr(main, "stop_turn_writer", fake_stop_turn_writer)
+    monkeypatch.setattr(main, "start_alarm_listener", fake_start_alarm_listener)
+    monkeypatch.setattr(main, "stop_alarm_listener", fake_stop_alarm_listener)
     monkeypatch.setattr(
         main,
         "settings",
@@ -39,6 +67,20 @@ async def test_lifespan_manages_engine_lifecycle(monkeypatch: pytest.MonkeyPatch
         "postgresql+asyncpg://postgres:postgres@db:5432/auth_db",
     )
     fake_engine.dispose.assert_awaited_once_with()
+    fake_close_provider_client_pool.assert_awaited_once_with()
+    fake_shutdown_embedding_scheduler.assert_called_once_with()
+    fake_shutdown_pdf_extractor.assert_called_once_with()
+    fake_shutdown_password_hash_pool.assert_called_once_with()
+    fake_recover_ingestion_jobs.assert_awaited_once_with()
+    fake_shutdown_ingestion_queue.assert_awaited_once_with()
+    fake_recover_export_jobs.assert_awaited_once_with()
+    fake_shutdown_export_queue.assert_awaited_once_with()
+    fake_start_keyword_refresh.assert_called_once_with()
+    fake_stop_keyword_refresh.assert_awaited_once_with()
+    fake_start_turn_writer.assert_called_once_with()
+    fake_stop_turn_writer.assert_awaited_once_with()
+    fake_start_alarm_listener.assert_awaited_once_with()
+    fake_stop_alarm_listener.assert_awaited_once_with()
 
 
 @pytest.mark.asyncio
@@ -50,10 +92,12 @@ async def test_lifespan_skips_schema_verification_in_test_environment(
     fake_engine.dispose = AsyncMock(return_value=None)
     fake_logger = Mock()
     fake_verify_database_schema_current = AsyncMock(return_value=None)
+    fake_recover_ingestion_jobs = AsyncMock(return_value=0)
 
     monkeypatch.setattr(main, "engine", fake_engine)
     monkeypatch.setattr(main, "logger", fake_logger)
     monkeypatch.setattr(main, "verify_database_schema_current", fake_verify_database_schema_current)
+    monkeypatch.setattr(main, "recover_ingestion_jobs", fake_recover_ingestion_jobs)
     monkeypatch.setattr(
         main,
         "settings",
@@ -68,6 +112,7 @@ async def test_lifespan_skips_schema_verification_in_test_environment(
         fake_logger.info.assert_any_call("Starting up application, connecting to database...")
 
     fake_verify_database_schema_current.assert_not_called()
+    fake_recover_ingestion_jobs.assert_not_called()
     fake_engine.dispose.assert_awaited_once_with()
 
 
@@ -86,4 +131,5 @@ def test_get_cors_middleware_kwargs_uses_settings_origins(
         "allow_credentials": False,
         "allow_methods": ["*"],
         "allow_headers": ["*"],
+        "expose_headers": ["X-Next-Cursor", "X-Latest-Cursor"],
     }
@@ -0,0 +1,176 @@
+"""Unit tests for the in-process Prometheus metrics."""
+from unittest.mock import AsyncMock, Mock
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+import pytest
+
+import src.main as main
+from src.core.chroma import InstrumentedCollection
+from src.core.metrics import (
+    CHAT_STAGE_SECONDS,
+    CHROMA_ERRORS_TOTAL,
+    CHROMA_REQUEST_SECONDS,
+    HTTP_REQUEST_SECONDS,
+    HTTP_REQUESTS_TOTAL,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    RequestMetricsMiddleware,
+    ServerTimingMiddleware,
+    record_stage,
+    timed_stage,
+)
+
+
+def test_histogram_renders_cumulative_buckets_sum_and_count() -> None:
+    """Observations should land in cumulative buckets per label set."""
+    registry = MetricsRegistry()
+    histogram = registry.register(Histogram("test_seconds", "Test durations.", ("stage",), buckets=(0.1, 1.0)))
+
+    histogram.observe(0.05, stage="db")
+    histogram.observe(0.5, stage="db")
+    histogram.observe(5.0, stage="db")
+
+    assert registry.render().splitlines() == [
+        "# HELP test_seconds Test durations.",
+        "# TYPE test_seconds histogram",
+        'test_seconds_bucket{stage="db",le="0.1"} 1',
+        'test_seconds_bucket{stage="db",le="1"} 2',
+        'test_seconds_bucket{stage="db",le="+Inf"} 3',
+        'test_seconds_sum{stage="db"} 5.55',
+        'test_seconds_count{stage="db"} 3',
+    ]
+
+
+def test_counter_escapes_label_values_and_rejects_unknown_labels() -> None:
+    """Label values must be escaped and label names must match the family."""
+    counter = Counter("test_total", "Test events.", ("route",))
+
+    counter.inc(route='/a"b')
+    counter.inc(2, route='/a"b')
+
+    assert list(counter.samples()) == ['test_total{route="/a\\"b"} 3']
+    with pytest.raises(ValueError):
+        counter.inc(path="/a")
+
+
+def test_registry_rejects_duplicate_names() -> None:
+    """Two families cannot share a name."""
+    registry = MetricsRegistry()
+    registry.register(Counter("dup_total", "First."))
+
+    with pytest.raises(ValueError):
+        registry.register(Counter("dup_total", "Second."))
+
+
+def test_collectors_refresh_gauges_before_each_render() -> None:
+    """Gauges set by a collector should reflect the value at scrape time."""
+    registry = MetricsRegistry()
+    gauge = registry.register(Gauge("test_depth", "Test depth.", ("executor",)))
+    depth = iter([3, 1])
+    registry.add_collector(lambda: gauge.set(next(depth), executor="bcrypt"))
+
+    assert 'test_depth{executor="bcrypt"} 3' in registry.render()
+    assert 'test_depth{executor="bcrypt"} 1' in registry.render()
+
+
+def test_timed_stage_records_even_when_the_block_raises() -> None:
+    """Failed stages still report how long they took."""
+    before = CHAT_STAGE_SECONDS.count(stage="unit_test_failure")
+
+    with pytest.raises(RuntimeError):
+        with timed_stage("unit_test_failure"):
+            raise RuntimeError("boom")
+
+    assert CHAT_STAGE_SECONDS.count(stage="unit_test_failure") == before + 1
+
+
+@pytest.mark.asyncio
+async def test_server_timing_middleware_lists_recorded_stages() -> None:
+    """Stages recorded while handling a request should appear in Server-Timing."""
+    app = FastAPI()
+
+    @app.get("/timed")
+    async def timed() -> dict[str, str]:
+        record_stage("history", 0.0031)
+        record_stage("retrieval", 0.0125)
+        return {"status": "ok"}
+
+    @app.get("/untimed")
+    async def untimed() -> dict[str, str]:
+        return {"status": "ok"}
+
+    app.add_middleware(ServerTimingMiddleware)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        timed_response = await client.get("/timed")
+        untimed_response = await client.get("/untimed")
+
+    assert timed_response.headers["server-timing"] == "history;dur=3.1, retrieval;dur=12.5"
+    assert "server-timing" not in untimed_response.headers
+
+
+@pytest.mark.asyncio
+async def test_request_metrics_middleware_labels_requests_by_route_template() -> None:
+    """Requests should be counted per path template, never per raw path."""
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: str) -> dict[str, str]:
+        return {"id": item_id}
+
+    app.add_middleware(RequestMetricsMiddleware)
+    ok_before = HTTP_REQUESTS_TOTAL.value(method="GET", route="/items/{item_id}", status="200")
+    missing_before = HTTP_REQUESTS_TOTAL.value(method="GET", route="unmatched", status="404")
+    timed_before = HTTP_REQUEST_SECONDS.count(method="GET", route="/items/{item_id}")
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/items/1")
+        await client.get("/items/2")
+        await client.get("/nowhere")
+
+    assert HTTP_REQUESTS_TOTAL.value(method="GET", route="/items/{item_id}", status="200") == ok_before + 2
+    assert HTTP_REQUESTS_TOTAL.value(method="GET", route="unmatched", status="404") == missing_before + 1
+    assert HTTP_REQUEST_SECONDS.count(method="GET", route="/items/{item_id}") == timed_before + 2
+
+
+@pytest.mark.asyncio
+async def test_instrumented_collection_times_calls_and_counts_failures() -> None:
+    """Chroma data calls should be timed, failures counted, other attributes untouched."""
+    collection = Mock()
+    collection.name = "documents"
+    collection.query = AsyncMock(return_value={"ids": [["a"]]})
+    collection.delete = AsyncMock(side_effect=RuntimeError("chroma down"))
+    instrumented = InstrumentedCollection(collection)
+    queries = CHROMA_REQUEST_SECONDS.count(operation="query")
+    deletes = CHROMA_REQUEST_SECONDS.count(operation="delete")
+    delete_errors = CHROMA_ERRORS_TOTAL.value(operation="delete")
+
+    result = await instrumented.query(query_embeddings=[[0.1]], n_results=1)
+    with pytest.raises(RuntimeError):
+        await instrumented.delete(ids=["a"])
+
+    assert result == {"ids": [["a"]]}
+    collection.query.assert_awaited_once_with(query_embeddings=[[0.1]], n_results=1)
+    assert instrumented.name == "documents"
+    assert CHROMA_REQUEST_SECONDS.count(operation="query") == queries + 1
+    assert CHROMA_REQUEST_SECONDS.count(operation="delete") == deletes + 1
+    assert CHROMA_ERRORS_TOTAL.value(operation="delete") == delete_errors + 1
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_serves_prometheus_text() -> None:
+    """The scrape endpoint should expose the chat stage histogram."""
+    record_stage("unit_test_scrape", 0.01)
+
+    async with AsyncClient(transport=ASGITransport(app=main.app), base_url="http://test") as client:
+        response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE aegis_chat_stage_seconds histogram" in response.text
+    assert 'aegis_chat_stage_seconds_count{stage="unit_test_scrape"}' in response.text
+    assert 'aegis_executor_queue_depth{executor="bcrypt"}' in response.text
+    assert 'aegis_executor_queue_depth{executor="chat_write_behind"}' in response.text
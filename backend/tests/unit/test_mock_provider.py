@@ -4,11 +4,13 @@ This module verifies that the provider layer can switch into the local mock
 response path used by automated tests, allowing chat streaming behavior to be
 validated without requiring live third-party model credentials.
 """
+import httpx
 import pytest
 from pytest import MonkeyPatch
 
 from src.core.config import settings
-from src.providers import stream_from_provider, validate_provider
+from src.core.metrics import PROVIDER_ERRORS_TOTAL, PROVIDER_FIRST_CHUNK_SECONDS, PROVIDER_STREAM_SECONDS
+from src.providers import mock_provider, stream_from_provider, validate_provider
 
 
 @pytest.mark.asyncio
@@ -47,3 +49,43 @@ async def test_mock_provider_streams_uploaded_context(monkeypatch: MonkeyPatch)
     response = "".join(chunks)
     assert "handbook.pdf" in response
     assert "AEGIS-2026-SECURE" in response
+
+
+@pytest.mark.asyncio
+async def test_stream_from_provider_records_first_chunk_and_stream_durations(monkeypatch: MonkeyPatch) -> None:
+    """Verify provider streams report time to first chunk and total duration.
+
+    Args:
+        monkeypatch (MonkeyPatch): Pytest fixture used to enable mock responses.
+    """
+    monkeypatch.setattr(settings, "MOCK_PROVIDER_RESPONSES", True)
+    first_chunks = PROVIDER_FIRST_CHUNK_SECONDS.count(provider="deepseek")
+    streams = PROVIDER_STREAM_SECONDS.count(provider="deepseek")
+
+    async for _ in stream_from_provider("deepseek", "deepseek-chat", [{"role": "user", "content": "hi"}]):
+        pass
+
+    assert PROVIDER_FIRST_CHUNK_SECONDS.count(provider="deepseek") == first_chunks + 1
+    assert PROVIDER_STREAM_SECONDS.count(provider="deepseek") == streams + 1
+
+
+@pytest.mark.asyncio
+async def test_stream_from_provider_counts_errors_by_kind(monkeypatch: MonkeyPatch) -> None:
+    """Verify a failed provider stream is counted with its error kind and re-raised.
+
+    Args:
+        monkeypatch (MonkeyPatch): Pytest fixture used to make the mock provider time out.
+    """
+    async def timing_out_stream(messages: list[dict[str, str]]):
+        yield "partial"
+        raise httpx.ReadTimeout("provider stalled")
+
+    monkeypatch.setattr(settings, "MOCK_PROVIDER_RESPONSES", True)
+    monkeypatch.setattr(mock_provider, "stream", timing_out_stream)
+    before = PROVIDER_ERRORS_TOTAL.value(provider="groq", error="timeout")
+
+    with pytest.raises(httpx.ReadTimeout):
+        async for _ in stream_from_provider("groq", "llama", [{"role": "user", "content": "hi"}]):
+            pass
+
+    assert PROVIDER_ERRORS_TOTAL.value(provider="groq", error="timeout") == before + 1
@@ -9,6 +9,11 @@ def test_model_registry_registers_all_expected_tables() -> None:
         "alarm",
         "conversations",
         "documents",
+        "export_job_chunks",
+        "export_jobs",
+        "ingestion_jobs",
         "messages",
+        "moderation_keyword_version",
+        "moderation_keywords",
         "users",
     }
@@ -1,6 +1,6 @@
 """Unit tests for provider-level content policy error detection."""
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 
@@ -41,14 +41,9 @@ async def test_groq_raises_content_policy_error_on_400_with_policy_marker():
     mock_client = AsyncMock()
     mock_client.stream = MagicMock(return_value=mock_stream_ctx)
 
-    mock_client_ctx = AsyncMock()
-    mock_client_ctx.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client_ctx.__aexit__ = AsyncMock(return_value=False)
-
-    with patch("src.providers.groq.httpx.AsyncClient", return_value=mock_client_ctx):
-        with pytest.raises(ContentPolicyError):
-            async for _ in stream([{"role": "user", "content": "test"}], "model", "key"):
-                pass
+    with pytest.raises(ContentPolicyError):
+        async for _ in stream([{"role": "user", "content": "test"}], "model", "key", mock_client):
+            pass
 
 
 @pytest.mark.asyncio
@@ -74,14 +69,9 @@ async def test_groq_does_not_raise_content_policy_error_on_400_without_marker():
     mock_client = AsyncMock()
     mock_client.stream = MagicMock(return_value=mock_stream_ctx)
 
-    mock_client_ctx = AsyncMock()
-    mock_client_ctx.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client_ctx.__aexit__ = AsyncMock(return_value=False)
-
-    with patch("src.providers.groq.httpx.AsyncClient", return_value=mock_client_ctx):
-        with pytest.raises(httpx.HTTPStatusError):
-            async for _ in stream([{"role": "user", "content": "test"}], "model", "key"):
-                pass
+    with pytest.raises(httpx.HTTPStatusError):
+        async for _ in stream([{"role": "user", "content": "test"}], "model", "key", mock_client):
+            pass
 
 
 # ---------------------------------------------------------------------------
@@ -108,14 +98,9 @@ async def test_deepseek_raises_content_policy_error_on_400_with_policy_marker():
     mock_client = AsyncMock()
     mock_client.stream = MagicMock(return_value=mock_stream_ctx)
 
-    mock_client_ctx = AsyncMock()
-    mock_client_ctx.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client_ctx.__aexit__ = AsyncMock(return_value=False)
-
-    with patch("src.providers.deepseek.httpx.AsyncClient", return_value=mock_client_ctx):
-        with pytest.raises(ContentPolicyError):
-            async for _ in stream([{"role": "user", "content": "test"}], "model", "key"):
-                pass
+    with pytest.raises(ContentPolicyError):
+        async for _ in stream([{"role": "user", "content": "test"}], "model", "key", mock_client):
+            pass
 
 
 # ---------------------------------------------------------------------------
@@ -142,11 +127,6 @@ async def test_gemini_raises_content_policy_error_on_400_with_safety_marker():
     mock_client = AsyncMock()
     mock_client.stream = MagicMock(return_value=mock_stream_ctx)
 
-    mock_client_ctx = AsyncMock()
-    mock_client_ctx.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client_ctx.__aexit__ = AsyncMock(return_value=False)
-
-    with patch("src.providers.gemini.httpx.AsyncClient", return_value=mock_client_ctx):
-        with pytest.raises(ContentPolicyError):
-            async for _ in stream([{"role": "user", "content": "test"}], "model", "key"):
-                pass
+    with pytest.raises(ContentPolicyError):
+        async for _ in stream([{"role": "user", "content": "test"}], "model", "key", mock_client):
+            pass
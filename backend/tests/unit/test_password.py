@@ -3,8 +3,19 @@
 This module contains unit tests verifying the behavior of bcrypt password hashing
 and verification functions inside the `src.security.password` module.
 """
+import asyncio
+import threading
+
 import pytest
-from src.security.password import hash_password, verify_password
+from fastapi import HTTPException
+
+from src.security.password import (
+    PasswordHashPool,
+    hash_password,
+    hash_password_async,
+    verify_password,
+    verify_password_async,
+)
 
 def test_hash_password() -> None:
     """Tests that a password hashes successfully and uniquely.
@@ -77,3 +88,71 @@ def test_password_truncation() -> None:
     # because the excess chars were thrown out during hashing!
     result2 = verify_password("a" * 72, hashed)
     assert result2 is True
+
+
+@pytest.mark.asyncio
+async def test_async_variants_round_trip() -> None:
+    """Tests that the pooled helpers hash and verify like the sync functions."""
+    hashed = await hash_password_async("supersecurepassword123")
+
+    assert await verify_password_async("supersecurepassword123", hashed) is True
+    assert await verify_password_async("wrongpassword123", hashed) is False
+    assert verify_password("supersecurepassword123", hashed) is True
+
+
+@pytest.mark.asyncio
+async def test_pool_runs_on_dedicated_bcrypt_threads() -> None:
+    """Tests that bcrypt work runs off the event loop on the named pool."""
+    pool = PasswordHashPool(max_workers=1, max_queue=0)
+
+    thread_name = await pool.run(lambda: threading.current_thread().name)
+
+    assert thread_name.startswith("bcrypt")
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_saturated_pool_rejects_with_503() -> None:
+    """Tests that work beyond workers plus queue fails fast with 503."""
+    pool = PasswordHashPool(max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    blocked = [asyncio.create_task(pool.run(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await pool.run(hash_password, "password")
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers == {"Retry-After": "1"}
+    assert pool.rejected == 1
+
+    release.set()
+    assert await asyncio.gather(*blocked) == [True, True]
+    assert isinstance(await pool.run(hash_password, "password"), str)
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_callers_hold_their_slot_until_bcrypt_finishes() -> None:
+    """Tests that cancelling a waiter does not free capacity its thread still uses."""
+    pool = PasswordHashPool(max_workers=1, max_queue=0)
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocking() -> bool:
+        started.set()
+        return release.wait()
+
+    waiter = asyncio.create_task(pool.run(blocking))
+    await asyncio.to_thread(started.wait)
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+
+    assert pool.pending == 1
+    with pytest.raises(HTTPException):
+        await pool.run(hash_password, "password")
+
+    release.set()
+    await asyncio.to_thread(pool.shutdown)
+    assert pool.pending == 0
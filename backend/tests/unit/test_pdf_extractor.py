@@ -0,0 +1,79 @@
+"""Unit tests for process-pool PDF text extraction."""
+from io import BytesIO
+
+import pytest
+from pypdf import PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+import src.core.pdf_extractor as pdf_extractor
+from src.core.pdf_extractor import PdfExtractor
+
+
+def _build_pdf(page_texts: list[str]) -> bytes:
+    """Create an in-memory PDF with one line of Helvetica text per page."""
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for text in page_texts:
+        page = writer.add_blank_page(width=300, height=200)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        content = DecodedStreamObject()
+        content.set_data(f"BT /F1 12 Tf 20 100 Td ({text}) Tj ET".encode())
+        page[NameObject("/Contents")] = writer._add_object(content)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_workers", [0, 2])
+async def test_iter_pages_yields_every_page_in_order(max_workers: int) -> None:
+    """Page ranges extracted in parallel should be streamed back in page order."""
+    texts = [f"Page number {index}" for index in range(7)]
+    extractor = PdfExtractor(max_workers=max_workers, pages_per_task=2)
+
+    pages = [page async for page in extractor.iter_pages(_build_pdf(texts))]
+    extractor.shutdown()
+
+    assert [(number, count) for number, count, _ in pages] == [(n, 7) for n in range(1, 8)]
+    assert [text.strip() for _, _, text in pages] == texts
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_propagates_parse_errors() -> None:
+    """Malformed uploads should surface the parser error to the caller."""
+    extractor = PdfExtractor(max_workers=0, pages_per_task=8)
+
+    with pytest.raises(Exception):
+        [page async for page in extractor.iter_pages(b"not a pdf")]
+    extractor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_parses_each_upload_once_per_worker(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Page ranges of one upload should reuse the worker's parsed reader."""
+    parses = 0
+    real_reader = pdf_extractor.PdfReader
+
+    def counting_reader(stream: BytesIO) -> object:
+        nonlocal parses
+        parses += 1
+        return real_reader(stream)
+
+    monkeypatch.setattr(pdf_extractor, "PdfReader", counting_reader)
+    extractor = PdfExtractor(max_workers=0, pages_per_task=1)
+
+    pages = [page async for page in extractor.iter_pages(_build_pdf(["one", "two", "three", "four"]))]
+    extractor.shutdown()
+
+    assert len(pages) == 4
+    assert parses == 1
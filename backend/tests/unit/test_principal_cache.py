@@ -0,0 +1,78 @@
+"""Unit tests for the authenticated principal cache and its use in auth dependencies."""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+import pytest
+
+from src.security import jwt as jwt_module
+from src.security.jwt import create_token, get_current_user_with_role
+from src.security.principal_cache import PrincipalCache
+
+
+def test_entries_expire_after_ttl() -> None:
+    """Cached roles should stop being served once their TTL elapses."""
+    cache = PrincipalCache(max_entries=10, ttl_seconds=30)
+    with patch("src.security.principal_cache.time.monotonic", return_value=100.0):
+        cache.put("user-1", "admin")
+    with patch("src.security.principal_cache.time.monotonic", return_value=129.0):
+        assert cache.get("user-1") == "admin"
+    with patch("src.security.principal_cache.time.monotonic", return_value=131.0):
+        assert cache.get("user-1") is None
+
+
+def test_cache_is_bounded_and_evicts_least_recently_used() -> None:
+    """The cache should never hold more than max_entries principals."""
+    cache = PrincipalCache(max_entries=2, ttl_seconds=30)
+    cache.put("a", "user")
+    cache.put("b", "user")
+    cache.get("a")
+    cache.put("c", "user")
+
+    assert cache.get("a") == "user"
+    assert cache.get("b") is None
+    assert cache.get("c") == "user"
+
+
+def test_invalidate_and_disabled_cache() -> None:
+    """Invalidated users and a zero-size cache should always miss."""
+    cache = PrincipalCache(max_entries=2, ttl_seconds=30)
+    cache.put("a", "admin")
+    cache.invalidate("a")
+    assert cache.get("a") is None
+
+    disabled = PrincipalCache(max_entries=0, ttl_seconds=30)
+    disabled.put("a", "admin")
+    assert disabled.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_repeat_requests_skip_the_user_lookup(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Only the first request for a user should query the database."""
+    monkeypatch.setattr(jwt_module, "get_principal_cache", lambda: cache)
+    cache = PrincipalCache(max_entries=10, ttl_seconds=30)
+    get_by_id = AsyncMock(return_value=SimpleNamespace(role="security"))
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_token({"sub": "user-1"}))
+
+    with patch("src.repo.user_repo.UserRepository.get_by_id", get_by_id):
+        first = await get_current_user_with_role(credentials, db=None)
+        second = await get_current_user_with_role(credentials, db=None)
+
+    assert first.role == second.role == "security"
+    get_by_id.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_deleted_users_are_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A token for a missing user should be rejected every time."""
+    monkeypatch.setattr(jwt_module, "get_principal_cache", lambda: cache)
+    cache = PrincipalCache(max_entries=10, ttl_seconds=30)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_token({"sub": "gone"}))
+
+    with patch("src.repo.user_repo.UserRepository.get_by_id", AsyncMock(return_value=None)):
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user_with_role(credentials, db=None)
+
+    assert exc_info.value.status_code == 401
+    assert cache.get("gone") is None
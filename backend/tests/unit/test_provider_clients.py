@@ -0,0 +1,86 @@
+"""Unit tests for the pooled provider HTTP client manager."""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+import src.core.provider_clients as provider_clients
+from src.core.provider_clients import ProviderClientPool
+
+
+def _pool_settings(**overrides: object) -> SimpleNamespace:
+    """Build a settings stand-in with the provider pool configuration."""
+    values = {
+        "PROVIDER_HTTP_MAX_CONNECTIONS": 50,
+        "PROVIDER_HTTP_MAX_KEEPALIVE_CONNECTIONS": 10,
+        "PROVIDER_HTTP_KEEPALIVE_EXPIRY": 15.0,
+        "PROVIDER_HTTP_TIMEOUT": 45.0,
+        "PROVIDER_HTTP2": False,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_one_client_per_provider(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Repeated lookups for a provider should return the same long-lived client."""
+    monkeypatch.setattr(provider_clients, "settings", _pool_settings())
+    pool = ProviderClientPool()
+
+    groq_first = await pool.get_client("groq")
+    groq_second = await pool.get_client("groq")
+    gemini = await pool.get_client("gemini")
+
+    assert groq_first is groq_second
+    assert gemini is not groq_first
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pool_builds_clients_from_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pool limits, keep-alive expiry, timeout, and HTTP/2 should come from settings."""
+    monkeypatch.setattr(provider_clients, "settings", _pool_settings(PROVIDER_HTTP2=True))
+    pool = ProviderClientPool()
+
+    with patch("src.core.provider_clients.httpx.AsyncClient") as client_factory:
+        await pool.get_client("deepseek")
+
+    kwargs = client_factory.call_args.kwargs
+    assert kwargs["http2"] is True
+    assert kwargs["timeout"] == 45.0
+    assert kwargs["limits"] == httpx.Limits(
+        max_connections=50,
+        max_keepalive_connections=10,
+        keepalive_expiry=15.0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_pool_close_releases_clients_and_reopens_on_demand(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Closing the pool should close open clients while keeping the pool reusable."""
+    monkeypatch.setattr(provider_clients, "settings", _pool_settings())
+    pool = ProviderClientPool()
+
+    client = await pool.get_client("groq")
+    await pool.aclose()
+
+    assert client.is_closed
+    reopened = await pool.get_client("groq")
+    assert reopened is not client
+    assert not reopened.is_closed
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_close_provider_client_pool_resets_shared_instance() -> None:
+    """The lifespan shutdown helper should close and discard the shared pool."""
+    pool = provider_clients.get_provider_client_pool()
+    pool.aclose = AsyncMock()
+
+    await provider_clients.close_provider_client_pool()
+
+    pool.aclose.assert_awaited_once_with()
+    assert provider_clients.get_provider_client_pool() is not pool
@@ -3,7 +3,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from src.core.chroma import ChromaManager
+from src.core.chroma import ChromaManager, InstrumentedCollection
 from src.core.config import settings
 
 
@@ -25,8 +25,9 @@ async def test_rag_sets_up_chroma_collection_from_settings(monkeypatch) -> None:
     first = await chroma.get_collection()
     second = await chroma.get_collection()
 
-    assert first is collection
-    assert second is collection
+    assert isinstance(first, InstrumentedCollection)
+    assert first.wrapped is collection
+    assert second is first
     async_client_factory.assert_awaited_once()
     assert async_client_factory.await_args.kwargs["host"] == settings.CHROMA_HOST
     assert async_client_factory.await_args.kwargs["port"] == settings.CHROMA_PORT
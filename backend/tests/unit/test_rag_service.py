@@ -3,6 +3,8 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+import src.service.rag_service as rag_service
+from src.core.embedding_cache import EmbeddingCache
 from src.service.rag_service import RAGService
 
 
@@ -50,3 +52,153 @@ async def test_get_context_returns_none_when_chroma_is_unavailable() -> None:
 
     assert await rag.get_context(["doc-1", "doc-2"], "what is in my document?") is None
     chroma.reset.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_context_uses_known_chunk_count_instead_of_collection_get(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A caller-supplied chunk count should cap n_results without a Chroma lookup."""
+    monkeypatch.setattr(rag_service, "_get_embeddings", AsyncMock(return_value=[[0.1, 0.2]]))
+    collection = AsyncMock()
+    collection.query = AsyncMock(
+        return_value={
+            "documents": [["Chunk text"]],
+            "metadatas": [[{"filename": "handbook.pdf"}]],
+        }
+    )
+    chroma = Mock()
+    chroma.get_collection = AsyncMock(return_value=collection)
+
+    rag = RAGService(chroma=chroma)
+    context = await rag.get_context(["doc-1"], "policy?", n_results=5, chunks_in_scope=3)
+
+    assert context == "[Source: handbook.pdf]\nChunk text"
+    collection.get.assert_not_awaited()
+    assert collection.query.await_args.kwargs["n_results"] == 3
+
+
+@pytest.mark.asyncio
+async def test_get_context_searches_with_precomputed_query_embedding(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A pending query embedding should be awaited instead of embedding again."""
+    get_embeddings = AsyncMock(return_value=[[0.9]])
+    monkeypatch.setattr(rag_service, "_get_embeddings", get_embeddings)
+    collection = AsyncMock()
+    collection.query = AsyncMock(return_value={"documents": [[]], "metadatas": [[]]})
+    chroma = Mock()
+    chroma.get_collection = AsyncMock(return_value=collection)
+
+    async def _pending_embedding() -> list[float]:
+        return [0.1, 0.2]
+
+    rag = RAGService(chroma=chroma)
+    await rag.get_context(["doc-1"], "policy?", chunks_in_scope=3, query_embedding=_pending_embedding())
+
+    get_embeddings.assert_not_awaited()
+    assert collection.query.await_args.kwargs["query_embeddings"] == [[0.1, 0.2]]
+
+
+@pytest.mark.asyncio
+async def test_get_context_skips_query_when_known_chunk_count_is_zero() -> None:
+    """Documents with no indexed chunks should not trigger any Chroma calls."""
+    collection = AsyncMock()
+    chroma = Mock()
+    chroma.get_collection = AsyncMock(return_value=collection)
+
+    rag = RAGService(chroma=chroma)
+
+    assert await rag.get_context(["doc-1"], "policy?", chunks_in_scope=0) is None
+    collection.get.assert_not_awaited()
+    collection.query.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_embeddings_only_embeds_uncached_texts(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Repeated texts should be served from the embedding cache instead of the model."""
+    monkeypatch.setattr(
+        "src.core.embedding_cache._embedding_cache",
+        EmbeddingCache(max_entries=16),
+    )
+    embedding_fn = Mock(side_effect=lambda texts: [[float(len(text))] for text in texts])
+    monkeypatch.setattr(rag_service, "_embedding_fn", embedding_fn)
+
+    first = await rag_service._get_embeddings(["alpha", "beta", "alpha"])
+    second = await rag_service._get_embeddings(["beta", "gamma"])
+
+    assert first == [[5.0], [4.0], [5.0]]
+    assert second == [[4.0], [5.0]]
+    assert embedding_fn.call_args_list[0].args == (["alpha", "beta"],)
+    assert embedding_fn.call_args_list[1].args == (["gamma"],)
+
+
+def _fake_pages(*pages: str):
+    """Build a stand-in for the off-loop PDF page extractor."""
+
+    async def _iter(_pdf_bytes: bytes):
+        for index, text in enumerate(pages):
+            yield index + 1, len(pages), text
+
+    return _iter
+
+
+@pytest.mark.asyncio
+async def test_add_document_upserts_chunks_in_bounded_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ingestion should stream pages into fixed-size embed and upsert batches."""
+    monkeypatch.setattr(rag_service, "_iter_page_texts", _fake_pages("a" * 1000, "b" * 1000, "c" * 1200))
+    monkeypatch.setattr(rag_service.settings, "INGEST_BATCH_SIZE", 2)
+    embed = AsyncMock(side_effect=lambda texts: [[0.0] for _ in texts])
+    monkeypatch.setattr(rag_service, "_get_embeddings", embed)
+    collection = AsyncMock()
+    chroma = Mock()
+    chroma.get_collection = AsyncMock(return_value=collection)
+    progress: list[tuple[int, int, int]] = []
+
+    rag = RAGService(chroma=chroma)
+    summary = await rag.add_document(
+        "doc-1",
+        "big.pdf",
+        b"%PDF",
+        on_progress=lambda *args: progress.append(args),
+    )
+
+    upserts = collection.upsert.await_args_list
+    assert summary == {"doc_id": "doc-1", "filename": "big.pdf", "chunk_count": 5}
+    assert [len(call.kwargs["ids"]) for call in upserts] == [2, 2, 1]
+    assert [max(len(texts) for texts in call.args) for call in embed.await_args_list] == [2, 2, 1]
+    assert upserts[0].kwargs["ids"] == ["doc-1::0", "doc-1::1"]
+    assert upserts[2].kwargs["metadatas"] == [{"doc_id": "doc-1", "filename": "big.pdf", "chunk_index": 4}]
+    # The second chunk straddles the first page boundary
+    assert "a" in upserts[0].kwargs["documents"][1] and "b" in upserts[0].kwargs["documents"][1]
+    assert progress == [(1, 3, 0), (2, 3, 2), (3, 3, 4)]
+
+
+@pytest.mark.asyncio
+async def test_add_document_rejects_pdfs_without_text(monkeypatch: pytest.MonkeyPatch) -> None:
+    """PDFs with no extractable text should fail without writing to Chroma."""
+    monkeypatch.setattr(rag_service, "_iter_page_texts", _fake_pages("", "  "))
+    collection = AsyncMock()
+    chroma = Mock()
+    chroma.get_collection = AsyncMock(return_value=collection)
+
+    with pytest.raises(ValueError):
+        await RAGService(chroma=chroma).add_document("doc-1", "blank.pdf", b"%PDF")
+    collection.upsert.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_add_document_removes_partial_batches_on_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A failed batch should not leave earlier batches orphaned in Chroma."""
+    monkeypatch.setattr(rag_service, "_iter_page_texts", _fake_pages("a" * 3000))
+    monkeypatch.setattr(rag_service.settings, "INGEST_BATCH_SIZE", 2)
+    monkeypatch.setattr(rag_service, "_get_embeddings", AsyncMock(side_effect=lambda texts: [[0.0] for _ in texts]))
+    collection = AsyncMock()
+    collection.upsert = AsyncMock(side_effect=[None, Exception("chroma offline")])
+    chroma = Mock()
+    chroma.get_collection = AsyncMock(return_value=collection)
+    chroma.unavailable_error = Mock(side_effect=lambda action, exc: RuntimeError(f"{action}: {exc}"))
+
+    with pytest.raises(RuntimeError, match="write"):
+        await RAGService(chroma=chroma).add_document("doc-1", "big.pdf", b"%PDF")
+    collection.delete.assert_awaited_once_with(where={"doc_id": "doc-1"})
@@ -13,16 +13,16 @@ async def test_async_main_noops_when_higher_tier_seeding_disabled(
 ) -> None:
     """Verify disabled seeding exits before any database work begins."""
     create_engine_mock = Mock()
-    hash_password_mock = Mock()
+    hash_password_mock = AsyncMock()
 
     monkeypatch.setattr(seed_script, "create_async_engine", create_engine_mock)
-    monkeypatch.setattr(seed_service, "hash_password", hash_password_mock)
+    monkeypatch.setattr(seed_service, "hash_password_async", hash_password_mock)
 
     result = await seed_script.async_main(env={})
 
     assert result == 0
     create_engine_mock.assert_not_called()
-    hash_password_mock.assert_not_called()
+    hash_password_mock.assert_not_awaited()
 
 
 @pytest.mark.asyncio
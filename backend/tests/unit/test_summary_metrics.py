@@ -0,0 +1,111 @@
+"""Unit tests for the cached security dashboard summary counters."""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.core.summary_metrics import SummaryMetricsCache
+
+COUNTS = {"total_histories": 3, "total_messages": 8, "recent_activity": 2, "unique_users": 2}
+
+
+@pytest.mark.asyncio
+async def test_get_serves_snapshot_until_it_exceeds_max_age() -> None:
+    """Counters should be reused within the bound and recomputed after it."""
+    cache = SummaryMetricsCache(max_age_seconds=30)
+    load = AsyncMock(return_value=COUNTS)
+
+    with patch("src.core.summary_metrics.time.monotonic", return_value=100.0):
+        assert await cache.get(load) == COUNTS
+    with patch("src.core.summary_metrics.time.monotonic", return_value=114.0):
+        assert await cache.get(load) == COUNTS
+    assert load.await_count == 1
+
+    with patch("src.core.summary_metrics.time.monotonic", return_value=131.0):
+        await cache.get(load)
+    assert load.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_revalidates_ageing_snapshot_in_the_background() -> None:
+    """Past half the bound the snapshot is served while a refresh runs."""
+    cache = SummaryMetricsCache(max_age_seconds=30)
+    release = asyncio.Event()
+    newer = {**COUNTS, "total_messages": 9}
+
+    with patch("src.core.summary_metrics.time.monotonic", return_value=100.0):
+        await cache.get(AsyncMock(return_value=COUNTS))
+
+    async def slow_load() -> dict[str, int]:
+        await release.wait()
+        return newer
+
+    with patch("src.core.summary_metrics.time.monotonic", return_value=120.0):
+        assert await cache.get(slow_load) == COUNTS
+        assert await cache.get(slow_load) == COUNTS
+        release.set()
+        await cache._refreshing
+        assert cache.peek() == newer
+
+
+@pytest.mark.asyncio
+async def test_failed_background_refresh_keeps_serving_the_snapshot() -> None:
+    """A refresh error should be logged, not raised into later requests."""
+    cache = SummaryMetricsCache(max_age_seconds=30)
+
+    with patch("src.core.summary_metrics.time.monotonic", return_value=100.0):
+        await cache.get(AsyncMock(return_value=COUNTS))
+
+    failing = AsyncMock(side_effect=RuntimeError("db down"))
+    with (
+        patch("src.core.summary_metrics.time.monotonic", return_value=120.0),
+        patch("src.core.summary_metrics.logger") as logger,
+    ):
+        assert await cache.get(failing) == COUNTS
+        await asyncio.gather(cache._refreshing, return_exceptions=True)
+        assert await cache.get(AsyncMock(return_value=COUNTS)) == COUNTS
+
+    logger.error.assert_called_once()
+    failing.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_stale_reads_share_one_computation() -> None:
+    """Requests arriving during a refresh should wait for it, not repeat it."""
+    cache = SummaryMetricsCache(max_age_seconds=30)
+    calls = 0
+
+    async def load() -> dict[str, int]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return COUNTS
+
+    results = await asyncio.gather(*(cache.get(load) for _ in range(5)))
+
+    assert results == [COUNTS] * 5
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_zero_max_age_recomputes_every_time() -> None:
+    """A zero staleness bound should disable caching."""
+    cache = SummaryMetricsCache(max_age_seconds=0)
+    load = AsyncMock(return_value=COUNTS)
+
+    await cache.get(load)
+    await cache.get(load)
+
+    assert load.await_count == 2
+    assert cache.peek() is None
+
+
+@pytest.mark.asyncio
+async def test_returned_counters_are_copies() -> None:
+    """Callers mutating a result must not corrupt the cached snapshot."""
+    cache = SummaryMetricsCache(max_age_seconds=30)
+
+    first = await cache.get(AsyncMock(return_value=dict(COUNTS)))
+    first["total_histories"] = 0
+
+    assert cache.peek() == COUNTS
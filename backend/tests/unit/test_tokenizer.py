@@ -0,0 +1,39 @@
+"""Unit tests for chat token counting."""
+from pathlib import Path
+
+from tokenizers import Tokenizer
+from tokenizers.models import WordLevel
+from tokenizers.pre_tokenizers import Whitespace
+
+from src.core.tokenizer import MESSAGE_OVERHEAD_TOKENS, TokenCounter
+
+
+def test_estimates_from_character_length_without_tokenizer() -> None:
+    """Without a tokenizer file, counts are estimated at four characters per token."""
+    counter = TokenCounter()
+
+    assert counter.count_text("") == 0
+    assert counter.count_text("abcd") == 1
+    assert counter.count_text("abcde") == 2
+    assert counter.count_message({"role": "user", "content": "abcd"}) == 1 + MESSAGE_OVERHEAD_TOKENS
+
+
+def test_uses_configured_tokenizer_file(tmp_path: Path) -> None:
+    """A tokenizer.json on disk should be used for exact counts."""
+    tokenizer = Tokenizer(WordLevel({"hello": 0, "world": 1, "[UNK]": 2}, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = Whitespace()
+    path = tmp_path / "tokenizer.json"
+    tokenizer.save(str(path))
+
+    counter = TokenCounter(str(path))
+
+    assert counter.tokenizer_file == str(path)
+    assert counter.count_text("hello world again") == 3
+
+
+def test_unreadable_tokenizer_falls_back_to_estimate(tmp_path: Path) -> None:
+    """A missing tokenizer file should not break counting."""
+    counter = TokenCounter(str(tmp_path / "missing.json"))
+
+    assert counter.tokenizer_file == ""
+    assert counter.count_text("abcdefgh") == 2
@@ -0,0 +1,72 @@
+"""Unit tests for the write-behind batching queue."""
+import asyncio
+
+import pytest
+
+from src.core.write_behind import WriteBehindQueue
+
+
+@pytest.mark.asyncio
+async def test_items_submitted_together_flush_in_one_batch() -> None:
+    """Items arriving within the flush window should be written together."""
+    batches: list[list[int]] = []
+
+    async def _flush(items: list[int]) -> None:
+        batches.append(items)
+
+    queue = WriteBehindQueue(_flush, max_batch_size=10, flush_interval_ms=20)
+    queue.start()
+    for item in range(3):
+        queue.submit(item)
+    assert queue.pending() == [0, 1, 2]
+
+    await queue.join()
+
+    assert batches == [[0, 1, 2]]
+    assert queue.pending() == []
+    assert queue.flushed == 3
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_everything_still_queued() -> None:
+    """Shutdown should not return until accepted items are persisted."""
+    flushed: list[int] = []
+
+    async def _flush(items: list[int]) -> None:
+        await asyncio.sleep(0.01)
+        flushed.extend(items)
+
+    queue = WriteBehindQueue(_flush, max_batch_size=2, flush_interval_ms=60_000)
+    queue.start()
+    for item in range(5):
+        queue.submit(item)
+
+    await queue.stop()
+
+    assert flushed == [0, 1, 2, 3, 4]
+    assert not queue.running
+    with pytest.raises(RuntimeError):
+        queue.submit(5)
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried_item_by_item() -> None:
+    """One bad item should not drop the rest of its batch."""
+    flushed: list[int] = []
+
+    async def _flush(items: list[int]) -> None:
+        if 1 in items:
+            raise RuntimeError("constraint violation")
+        flushed.extend(items)
+
+    queue = WriteBehindQueue(_flush, max_batch_size=10, flush_interval_ms=20)
+    queue.start()
+    for item in range(3):
+        queue.submit(item)
+    await queue.join()
+
+    assert flushed == [0, 2]
+    assert queue.failed == 1
+    assert queue.pending() == []
+    await queue.stop()